@@ -1,16 +1,25 @@
 import asyncio
-import datetime
 import logging
 import sys
-from typing import Optional, Set
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Set
 
 import discord
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 
 from ironforgedcore.cache.score_cache import SCORE_CACHE
 from ironforgedbot.common.helpers import get_text_channel
 from ironforgedbot.config import CONFIG
+from ironforgedbot.services.job_coordinator import (
+    JOB_COORDINATOR,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    JobPolicy,
+    JobTicket,
+)
+from ironforgedbot.services.job_schedule import JOB_SCHEDULE, ScheduleRequest
+from ironforgedbot.state import STATE
+from ironforgedbot.storage.job_history import JOB_HISTORY, JobRun
 from ironforgedbot.tasks.job_check_activity import (
     job_check_activity,
 )
@@ -23,15 +32,88 @@ from ironforgedbot.tasks.job_refresh_ranks import job_refresh_ranks
 
 logger = logging.getLogger(__name__)
 
+# Keyed by job function name. Jobs calling hiscores or WOM share the network
+# budget, the short discord/database jobs never wait on it.
+JOB_POLICIES: Dict[str, JobPolicy] = {
+    job_sync_members.__name__: JobPolicy(priority=PRIORITY_HIGH, jitter_s=120),
+    job_refresh_ranks.__name__: JobPolicy(
+        priority=PRIORITY_LOW,
+        uses_network=True,
+        jitter_s=600,
+        estimated_duration_s=20 * 60,
+    ),
+    job_check_activity.__name__: JobPolicy(
+        uses_network=True, jitter_s=600, estimated_duration_s=10 * 60
+    ),
+    job_check_membership_discrepancies.__name__: JobPolicy(
+        uses_network=True, jitter_s=600, estimated_duration_s=2 * 60
+    ),
+    job_payroll.__name__: JobPolicy(
+        priority=PRIORITY_HIGH, misfire_grace_time=24 * 60 * 60
+    ),
+    "_clear_caches": JobPolicy(
+        priority=PRIORITY_HIGH, misfire_grace_time=60, estimated_duration_s=5
+    ),
+}
+
+
+@dataclass(frozen=True)
+class JobHandle:
+    """A submitted job run.
+
+    `duplicate` is set when the submission matched a run that was already in
+    flight, in which case the handle points at that earlier run.
+    """
+
+    job: str
+    task: asyncio.Task
+    ticket: JobTicket
+    duplicate: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.task.done():
+            if self.task.cancelled():
+                return "cancelled"
+            return "failed" if self.task.exception() else "completed"
+        return "running" if self.ticket.started_at is not None else "queued"
+
+    @property
+    def wait_s(self) -> float:
+        """Time spent queued, so far if the job has not started yet."""
+        return self.ticket.wait_s
+
+    @property
+    def progress(self) -> Optional[JobRun]:
+        """The live run record with items and errors, while the job runs."""
+        return JOB_HISTORY.running(self.job)
+
+    def describe(self) -> str:
+        if self.status == "queued":
+            return f"queued for **{self.wait_s:.0f}s**, waiting for a free slot"
+
+        run = self.progress
+        if self.status == "running" and run is not None:
+            return (
+                f"running for **{run.duration_s:.0f}s** "
+                f"(waited {self.wait_s:.0f}s), **{run.items}** items processed"
+            )
+        return self.status
+
 
 class IronForgedAutomations:
     def __init__(self, discord_guild: Optional[discord.Guild]):
         self._running_jobs: Set[asyncio.Task] = set()
+        self._handles: Dict[str, JobHandle] = {}
         self._job_lock = asyncio.Lock()
         self._shutdown_timeout = 30.0
         self._setup_done = False
         self._setup_task: Optional[asyncio.Task] = None
 
+        JOB_COORDINATOR.network_slots = CONFIG.JOB_NETWORK_CONCURRENCY
+        for job_name, policy in JOB_POLICIES.items():
+            JOB_COORDINATOR.register(job_name, policy)
+
         # Configure scheduler with proper executor for async jobs
         from apscheduler.executors.asyncio import AsyncIOExecutor
 
@@ -112,24 +194,61 @@ class IronForgedAutomations:
         except Exception as e:
             logger.error(f"Error waiting for jobs to complete: {e}")
 
-    async def track_job(self, job_func, *args, **kwargs):
-        """Track a running job by wrapping it in a task and storing the reference."""
+    async def submit_job(self, job_func, *args, **kwargs) -> Optional[JobHandle]:
+        """Queues a job run and returns its handle.
+
+        Scheduled and manually triggered runs all come through here, so they
+        are tracked for shutdown and never overlap. If the job is already
+        queued or running the existing run's handle is returned with
+        `duplicate` set. Returns None if the job could not be submitted.
+        """
+        job_name = getattr(job_func, "__name__", str(job_func))
+
+        if STATE.state.get("is_shutting_down"):
+            logger.info(f"Not starting {job_name}, shutting down")
+            return None
+
+        ticket = JOB_COORDINATOR.reserve(job_name)
+        if ticket is None:
+            existing = self._handles.get(job_name)
+            return replace(existing, duplicate=True) if existing else None
+
         try:
-            task = asyncio.create_task(
-                self._safe_job_wrapper(job_func, *args, **kwargs)
-            )
+            task = asyncio.create_task(self._run_job(ticket, job_func, *args, **kwargs))
+            handle = JobHandle(job=job_name, task=task, ticket=ticket)
 
             async with self._job_lock:
                 self._running_jobs.add(task)
+                self._handles[job_name] = handle
 
             task.add_done_callback(self._job_done_callback)
 
-            logger.debug(f"Started job: {job_func.__name__}")
-            return task
+            logger.debug(f"Submitted job: {job_name}")
+            return handle
         except Exception as e:
-            logger.error(f"Error starting job {job_func.__name__}: {e}")
+            JOB_COORDINATOR.release(ticket)
+            logger.error(f"Error starting job {job_name}: {e}")
             raise
 
+    async def track_job(self, job_func, *args, **kwargs):
+        """Track a running job by wrapping it in a task and storing the reference.
+
+        Returns None without starting anything if a run of the same job is
+        already queued or running.
+        """
+        handle = await self.submit_job(job_func, *args, **kwargs)
+        if handle is None or handle.duplicate:
+            return None
+        return handle.task
+
+    async def _run_job(self, ticket: JobTicket, job_func, *args, **kwargs):
+        """Waits for the coordinator to let the job run, then runs it."""
+        async with JOB_COORDINATOR.run(ticket):
+            if ticket.wait_s >= 1:
+                logger.info(f"{ticket.job} started after {ticket.wait_s:.1f}s queued")
+            async with JOB_HISTORY.track(ticket.job, ticket.wait_s):
+                await self._safe_job_wrapper(job_func, *args, **kwargs)
+
     def _setup_done_callback(self, task: asyncio.Task):
         """Log any exception raised during automation setup."""
         if not task.cancelled():
@@ -145,6 +264,12 @@ class IronForgedAutomations:
         self._running_jobs.discard(task)
         active_count = len(self._running_jobs)
 
+        # Covers tasks cancelled before they got to run
+        for job_name, handle in list(self._handles.items()):
+            if handle.task is task:
+                del self._handles[job_name]
+                JOB_COORDINATOR.release(handle.ticket)
+
         if not task.cancelled():
             exc = task.exception()
             if exc:
@@ -200,7 +325,6 @@ class IronForgedAutomations:
             if score_cache_output:
                 logger.info(score_cache_output)
 
-            from ironforgedbot.state import STATE
             import time
 
             expired_count = 0
@@ -221,10 +345,21 @@ class IronForgedAutomations:
                     f"Cleared {expired_count} expired double-or-nothing offer(s)"
                 )
 
+            from ironforgedbot.decorators.rate_limit import RATE_LIMITER
+
+            swept_count = RATE_LIMITER.sweep(current_time)
+            if swept_count > 0:
+                logger.info(f"Cleared {swept_count} expired rate limit window(s)")
+
         except Exception as e:
             logger.error(f"Error clearing caches: {e}")
             raise
 
+    def _scheduler_options(self, job_func) -> dict:
+        """APScheduler coalescing and misfire settings from the job's policy."""
+        job_name = getattr(job_func, "__name__", str(job_func))
+        return JOB_COORDINATOR.policy(job_name).scheduler_kwargs()
+
     async def setup_automations(self):
         """Add jobs to scheduler."""
         if self._setup_done:
@@ -233,78 +368,76 @@ class IronForgedAutomations:
 
         self.scheduler.remove_all_jobs()
 
-        self.scheduler.add_job(
-            self._job_wrapper(
-                job_sync_members, self.discord_guild, self.report_channel
+        jobs = [
+            (
+                "sync_members",
+                "Member Sync Job",
+                CONFIG.CRON_SYNC_MEMBERS,
+                job_sync_members,
+                (self.discord_guild, self.report_channel),
             ),
-            CronTrigger.from_crontab(
-                CONFIG.CRON_SYNC_MEMBERS, timezone=datetime.timezone.utc
+            (
+                "refresh_ranks",
+                "Rank Refresh Job",
+                CONFIG.CRON_REFRESH_RANKS,
+                job_refresh_ranks,
+                (self.discord_guild, self.report_channel),
             ),
-            id="sync_members",
-            name="Member Sync Job",
-        )
-
-        self.scheduler.add_job(
-            self._job_wrapper(
-                job_refresh_ranks, self.discord_guild, self.report_channel
-            ),
-            CronTrigger.from_crontab(
-                CONFIG.CRON_REFRESH_RANKS, timezone=datetime.timezone.utc
-            ),
-            id="refresh_ranks",
-            name="Rank Refresh Job",
-        )
-
-        self.scheduler.add_job(
-            self._job_wrapper(
+            (
+                "check_activity",
+                "Activity Check Job",
+                CONFIG.CRON_CHECK_ACTIVITY,
                 job_check_activity,
-                self.report_channel,
-                CONFIG.WOM_API_KEY,
-                CONFIG.WOM_GROUP_ID,
-            ),
-            CronTrigger.from_crontab(
-                CONFIG.CRON_CHECK_ACTIVITY, timezone=datetime.timezone.utc
+                (self.report_channel,),
             ),
-            id="check_activity",
-            name="Activity Check Job",
-        )
-
-        self.scheduler.add_job(
-            self._job_wrapper(
+            (
+                "check_membership_discrepancies",
+                "Membership Discrepancy Check Job",
+                CONFIG.CRON_CHECK_DISCREPANCIES,
                 job_check_membership_discrepancies,
-                self.discord_guild,
-                self.report_channel,
-                CONFIG.WOM_API_KEY,
-                CONFIG.WOM_GROUP_ID,
+                (
+                    self.discord_guild,
+                    self.report_channel,
+                    CONFIG.WOM_API_KEY,
+                    CONFIG.WOM_GROUP_ID,
+                ),
             ),
-            CronTrigger.from_crontab(
-                CONFIG.CRON_CHECK_DISCREPANCIES, timezone=datetime.timezone.utc
+            (
+                "clear_caches",
+                "Cache Cleanup Job",
+                CONFIG.CRON_CLEAR_CACHES,
+                self._clear_caches,
+                (),
             ),
-            id="check_membership_discrepancies",
-            name="Membership Discrepancy Check Job",
-        )
-
-        self.scheduler.add_job(
-            self._job_wrapper(self._clear_caches),
-            CronTrigger.from_crontab(
-                CONFIG.CRON_CLEAR_CACHES, timezone=datetime.timezone.utc
-            ),
-            id="clear_caches",
-            name="Cache Cleanup Job",
-        )
-
-        self.scheduler.add_job(
-            self._job_wrapper(
+            (
+                "job_payroll",
+                "Monthly Payroll Job",
+                CONFIG.CRON_PAYROLL,
                 job_payroll,
-                self.report_channel,
+                (self.report_channel,),
             ),
-            CronTrigger.from_crontab(
-                CONFIG.CRON_PAYROLL, timezone=datetime.timezone.utc
-            ),
-            id="job_payroll",
-            name="Monthly Payroll Job",
+        ]
+
+        planned = JOB_SCHEDULE.plan(
+            ScheduleRequest(
+                job_id=job_id,
+                name=name,
+                cron=cron,
+                job=job_func.__name__,
+                policy=JOB_COORDINATOR.policy(job_func.__name__),
+            )
+            for job_id, name, cron, job_func, _ in jobs
         )
 
+        for (job_id, name, _, job_func, args), plan in zip(jobs, planned):
+            self.scheduler.add_job(
+                self._job_wrapper(job_func, *args),
+                plan.trigger(),
+                id=job_id,
+                name=name,
+                **self._scheduler_options(job_func),
+            )
+
         await self.report_channel.send(f"### 🟢 **v{CONFIG.BOT_VERSION}** now online")
 
         await self.track_job(job_sync_members, self.discord_guild, self.report_channel)
@@ -2,18 +2,27 @@ import asyncio
 import logging
 import signal
 import sys
+from typing import Optional
 
 import discord
 
 from ironforgedbot.automations import IronForgedAutomations
 from ironforgedbot.common.helpers import get_text_channel, populate_emoji_cache
+from ironforgedbot.common.spans import install_db_timing
 from ironforgedbot.config import CONFIG
+from ironforgedbot.decorators.command_price import refund_open_reservations
 from ironforgedcore.config import ENVIRONMENT
 from ironforgedcore.event_emitter import event_emitter
 from ironforgedbot.events.member_events import MemberUpdateContext
+from ironforgedbot.events.member_update_debouncer import member_update_debouncer
 from ironforgedbot.events.member_update_emitter import member_update_emitter
+from ironforgedbot.services.loop_monitor import LOOP_MONITOR
+from ironforgedbot.services.metrics_server import MetricsServer
+from ironforgedbot.services.render_service import RENDER_SERVICE
 from ironforgedbot.state import STATE
+from ironforgedbot.storage.job_history import JOB_HISTORY
 from ironforgedcore.database import db
+from ironforgedcore.storage.data import load_and_set
 
 # Import handlers to trigger self-registration
 import ironforgedbot.events.handlers  # noqa: F401
@@ -59,6 +68,9 @@ class DiscordClient(discord.Client):
         self.loop = None  # bound in setup_hook
         self._emoji_cache_loaded = False
         self._setup_complete = False
+        self._render_warmup: Optional[asyncio.Task] = None
+        self._data_load: Optional[asyncio.Task] = None
+        self.metrics_server: Optional[MetricsServer] = None
 
     @property
     def tree(self):
@@ -97,6 +109,17 @@ class DiscordClient(discord.Client):
         if self.automations:
             await self.automations.stop()
 
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        await LOOP_MONITOR.stop()
+
+        # Handlers need the database, so drain merged member updates first
+        await member_update_debouncer.flush()
+
+        # Open price prompts won't survive the restart, refund them while
+        # the database is still available
+        await refund_open_reservations()
+
         logger.info("Closing database connection...")
         await db.dispose()
 
@@ -137,6 +160,10 @@ class DiscordClient(discord.Client):
             return
 
         self.loop = asyncio.get_running_loop()
+
+        # Data files are parsed in a thread while we sync and connect
+        self._data_load = asyncio.create_task(asyncio.to_thread(load_and_set, "data"))
+
         self.loop.add_signal_handler(
             signal.SIGINT,
             lambda: self.loop.call_soon_threadsafe(
@@ -150,12 +177,24 @@ class DiscordClient(discord.Client):
             ),
         )
 
+        LOOP_MONITOR.start(CONFIG.LOOP_LAG_THRESHOLD_MS, self._report_loop_stall)
+        install_db_timing()
+
         await STATE.load_state()
+        await JOB_HISTORY.load()
+        await refund_open_reservations()
+
+        # Worker processes spawn in the background while we connect
+        self._render_warmup = asyncio.create_task(RENDER_SERVICE.start())
+
+        if CONFIG.METRICS_ENABLED:
+            self.metrics_server = MetricsServer(
+                CONFIG.METRICS_HOST, CONFIG.METRICS_PORT
+            )
+            await self.metrics_server.start(self)
 
         if self.upload:
-            self._tree.copy_global_to(guild=self.guild)
-            await self._tree.sync(guild=self.guild)
-            logger.info("Command tree synced to guild")
+            await self.sync_commands()
 
         # Load emoji cache only once during initial setup
         if not self._emoji_cache_loaded:
@@ -164,6 +203,38 @@ class DiscordClient(discord.Client):
 
         self._setup_complete = True
 
+    async def sync_commands(self, force: bool = False) -> bool:
+        """Uploads the command tree to the guild if it changed since the last sync.
+
+        Syncing is a rate limited REST call, so the schema hash of the last
+        upload to each guild is kept in state and unchanged trees are skipped
+        unless `force`. Returns whether the tree was uploaded.
+        """
+        self._tree.copy_global_to(guild=self.guild)
+        schema_hash = self._tree.schema_hash(self.guild)
+        guild_id = str(self.guild.id)
+
+        if not force and STATE.state["command_tree_hash"].get(guild_id) == schema_hash:
+            logger.info("Command tree unchanged, skipping sync")
+            return False
+
+        await self._tree.sync(guild=self.guild)
+        STATE.state["command_tree_hash"][guild_id] = schema_hash
+        logger.info("Command tree synced to guild")
+        return True
+
+    async def wait_for_data(self) -> None:
+        """Waits for the data files to finish loading, raising if they failed."""
+        if self._data_load is not None:
+            await asyncio.shield(self._data_load)
+
+    async def _report_loop_stall(self, message: str) -> None:
+        report_channel = get_text_channel(
+            self.get_guild(CONFIG.GUILD_ID), CONFIG.AUTOMATION_CHANNEL_ID
+        )
+        if report_channel:
+            await report_channel.send(message)
+
     async def on_connect(self):
         logger.debug("Bot connected to Discord")
 
@@ -181,6 +252,12 @@ class DiscordClient(discord.Client):
 
         logger.info(f"Logged in as {self.user.display_name} (ID: {self.user.id})")
 
+        try:
+            await self.wait_for_data()
+        except Exception as e:
+            logger.critical(f"Unable to load data files: {e}")
+            sys.exit(1)
+
         await self.change_presence(
             activity=discord.Activity(
                 type=discord.ActivityType.listening, name="Sea Shanty 2"
@@ -193,6 +270,10 @@ class DiscordClient(discord.Client):
             self.automations = IronForgedAutomations(self.get_guild(CONFIG.GUILD_ID))
 
     async def on_member_update(self, before: discord.Member, after: discord.Member):
+        # Bulk role changes fire several updates per member, merge them first
+        member_update_debouncer.submit(before, after, self._emit_member_update)
+
+    async def _emit_member_update(self, before: discord.Member, after: discord.Member):
         report_channel = get_text_channel(before.guild, CONFIG.AUTOMATION_CHANNEL_ID)
         if not report_channel:
             logger.error("Unable to select report channel")
@@ -1,29 +1,14 @@
+import hashlib
+import importlib
+import json
 import logging
 import traceback
+from dataclasses import dataclass
+from typing import Callable
 
 import discord
 
 from ironforgedbot.client import DiscordClient
-from ironforgedbot.commands.admin.cmd_admin import cmd_admin
-from ironforgedbot.commands.help.cmd_help import cmd_help
-from ironforgedbot.commands.admin.cmd_get_role_members import cmd_get_role_members
-from ironforgedbot.commands.check.cmd_check import cmd_check
-from ironforgedbot.commands.gains.cmd_gains import cmd_gains
-from ironforgedbot.commands.debug.cmd_debug_commands import cmd_debug_commands
-from ironforgedbot.commands.debug.cmd_debug_error_report import cmd_debug_error_report
-from ironforgedbot.commands.debug.cmd_stress_test import cmd_stress_test
-from ironforgedbot.commands.hiscore.cmd_breakdown import cmd_breakdown
-from ironforgedbot.commands.leaderboard.cmd_leaderboard import cmd_leaderboard
-from ironforgedbot.commands.hiscore.cmd_score import cmd_score
-from ironforgedbot.commands.trickortreat.cmd_trick_or_treat import cmd_trick_or_treat
-from ironforgedbot.commands.ingots.cmd_add_remove_ingots import cmd_add_remove_ingots
-from ironforgedbot.commands.ingots.cmd_view_ingots import cmd_view_ingots
-from ironforgedbot.commands.lookup.cmd_whois import cmd_whois
-from ironforgedbot.commands.raffle.cmd_raffle import cmd_raffle
-from ironforgedbot.commands.reset_rng.cmd_reset_rng import cmd_reset_rng
-from ironforgedbot.commands.roster.cmd_roster import cmd_roster
-from ironforgedbot.commands.eight_ball.cmd_eight_ball import cmd_eight_ball
-from ironforgedbot.commands.spin.cmd_spin import cmd_spin
 from ironforgedbot.common.responses import send_error_response
 from ironforgedbot.common.text_formatters import text_bold
 from ironforgedbot.config import CONFIG
@@ -32,7 +17,152 @@ from ironforgedcore.config import ENVIRONMENT
 logger = logging.getLogger(__name__)
 
 
+def _debug_enabled() -> bool:
+    return CONFIG.ENVIRONMENT in [ENVIRONMENT.DEVELOPMENT, ENVIRONMENT.STAGING]
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """A slash command, registered only if `enabled()` when the tree is built.
+
+    `callback` is "module:function". The module is imported at registration,
+    so disabled commands (and everything they import) are never loaded.
+    """
+
+    name: str
+    description: str
+    callback: str
+    enabled: Callable[[], bool] = lambda: True
+
+    def load(self) -> Callable:
+        module, _, attribute = self.callback.partition(":")
+        return getattr(importlib.import_module(module), attribute)
+
+
+COMMANDS = [
+    CommandSpec(
+        "score",
+        "Show your score, rank, and progress to the next rank.",
+        "ironforgedbot.commands.hiscore.cmd_score:cmd_score",
+    ),
+    CommandSpec(
+        "breakdown",
+        "Show a breakdown of your score across skills, bosses, raids, and clues.",
+        "ironforgedbot.commands.hiscore.cmd_breakdown:cmd_breakdown",
+    ),
+    CommandSpec(
+        "leaderboard",
+        "View a clan leaderboard.",
+        "ironforgedbot.commands.leaderboard.cmd_leaderboard:cmd_leaderboard",
+    ),
+    CommandSpec(
+        "check",
+        "Check if you meet the monthly activity requirement.",
+        "ironforgedbot.commands.check.cmd_check:cmd_check",
+    ),
+    CommandSpec(
+        "gains",
+        "Show your daily XP gains over the past 30 days.",
+        "ironforgedbot.commands.gains.cmd_gains:cmd_gains",
+    ),
+    CommandSpec(
+        "ingots",
+        "Show your ingot balance and recent transaction history.",
+        "ironforgedbot.commands.ingots.cmd_view_ingots:cmd_view_ingots",
+    ),
+    CommandSpec(
+        "add_remove_ingots",
+        "🔒 Add or remove ingots for one or more members.",
+        "ironforgedbot.commands.ingots.cmd_add_remove_ingots:cmd_add_remove_ingots",
+    ),
+    CommandSpec(
+        "roster",
+        "🔒 Generate an event roster from a message's reactions.",
+        "ironforgedbot.commands.roster.cmd_roster:cmd_roster",
+    ),
+    CommandSpec(
+        "whois",
+        "Show a player's RSN history.",
+        "ironforgedbot.commands.lookup.cmd_whois:cmd_whois",
+    ),
+    CommandSpec(
+        "get_role_members",
+        "🔒 List all members assigned to a given role.",
+        "ironforgedbot.commands.admin.cmd_get_role_members:cmd_get_role_members",
+    ),
+    CommandSpec(
+        "help",
+        "Show all available commands and what they do.",
+        "ironforgedbot.commands.help.cmd_help:cmd_help",
+    ),
+    CommandSpec(
+        "raffle",
+        "Participate in the clan raffle.",
+        "ironforgedbot.commands.raffle.cmd_raffle:cmd_raffle",
+    ),
+    CommandSpec(
+        "reset_rng",
+        "💰 Sacrifice ingots to the RNG gods. Results may vary.",
+        "ironforgedbot.commands.reset_rng.cmd_reset_rng:cmd_reset_rng",
+    ),
+    CommandSpec(
+        "eight_ball",
+        "💰 Ask the magic 8-ball a yes or no question.",
+        "ironforgedbot.commands.eight_ball.cmd_eight_ball:cmd_eight_ball",
+    ),
+    CommandSpec(
+        "spin",
+        "💰 Spin a wheel and let fate decide.",
+        "ironforgedbot.commands.spin.cmd_spin:cmd_spin",
+    ),
+    CommandSpec(
+        "admin",
+        "🔒 Open the admin menu.",
+        "ironforgedbot.commands.admin.cmd_admin:cmd_admin",
+    ),
+    CommandSpec(
+        "trick_or_treat",
+        "💰 Feeling lucky, punk?",
+        "ironforgedbot.commands.trickortreat.cmd_trick_or_treat:cmd_trick_or_treat",
+        enabled=lambda: CONFIG.TRICK_OR_TREAT_ENABLED,
+    ),
+    CommandSpec(
+        "debug_cmds",
+        "Show the debug menu.",
+        "ironforgedbot.commands.debug.cmd_debug_commands:cmd_debug_commands",
+        enabled=_debug_enabled,
+    ),
+    CommandSpec(
+        "debug_err",
+        "Test error reporting system.",
+        "ironforgedbot.commands.debug.cmd_debug_error_report:cmd_debug_error_report",
+        enabled=_debug_enabled,
+    ),
+    CommandSpec(
+        "debug_stress",
+        "Starts a stress test.",
+        "ironforgedbot.commands.debug.cmd_stress_test:cmd_stress_test",
+        enabled=_debug_enabled,
+    ),
+]
+
+
 class IronForgedCommandTree(discord.app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Data files load alongside the gateway connect, commands need them
+        await self.client.wait_for_data()
+        return True
+
+    def schema_hash(self, guild: discord.abc.Snowflake) -> str:
+        """Stable hash of the command payloads `sync(guild=guild)` would upload."""
+        payload = sorted(
+            (command.to_dict(self) for command in self.get_commands(guild=guild)),
+            key=lambda command: (command["type"], command["name"]),
+        )
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
     async def on_error(
         self,
         interaction: discord.Interaction,
@@ -66,145 +196,13 @@ class IronForgedCommands:
         self._tree = tree
         self._discord_client = discord_client
 
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="score",
-                description="Show your score, rank, and progress to the next rank.",
-                callback=cmd_score,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="breakdown",
-                description="Show a breakdown of your score across skills, bosses, raids, and clues.",
-                callback=cmd_breakdown,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="leaderboard",
-                description="View a clan leaderboard.",
-                callback=cmd_leaderboard,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="check",
-                description="Check if you meet the monthly activity requirement.",
-                callback=cmd_check,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="gains",
-                description="Show your daily XP gains over the past 30 days.",
-                callback=cmd_gains,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="ingots",
-                description="Show your ingot balance and recent transaction history.",
-                callback=cmd_view_ingots,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="add_remove_ingots",
-                description="🔒 Add or remove ingots for one or more members.",
-                callback=cmd_add_remove_ingots,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="roster",
-                description="🔒 Generate an event roster from a message's reactions.",
-                callback=cmd_roster,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="whois",
-                description="Show a player's RSN history.",
-                callback=cmd_whois,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="get_role_members",
-                description="🔒 List all members assigned to a given role.",
-                callback=cmd_get_role_members,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="help",
-                description="Show all available commands and what they do.",
-                callback=cmd_help,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="raffle",
-                description="Participate in the clan raffle.",
-                callback=cmd_raffle,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="reset_rng",
-                description="💰 Sacrifice ingots to the RNG gods. Results may vary.",
-                callback=cmd_reset_rng,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="eight_ball",
-                description="💰 Ask the magic 8-ball a yes or no question.",
-                callback=cmd_eight_ball,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="spin",
-                description="💰 Spin a wheel and let fate decide.",
-                callback=cmd_spin,
-            )
-        )
-        self._tree.add_command(
-            discord.app_commands.Command(
-                name="admin",
-                description="🔒 Open the admin menu.",
-                callback=cmd_admin,
-            )
-        )
-        if CONFIG.TRICK_OR_TREAT_ENABLED:
-            self._tree.add_command(
-                discord.app_commands.Command(
-                    name="trick_or_treat",
-                    description="💰 Feeling lucky, punk?",
-                    callback=cmd_trick_or_treat,
-                )
-            )
-        if CONFIG.ENVIRONMENT in [ENVIRONMENT.DEVELOPMENT, ENVIRONMENT.STAGING]:
-            self._tree.add_command(
-                discord.app_commands.Command(
-                    name="debug_cmds",
-                    description="Show the debug menu.",
-                    callback=cmd_debug_commands,
-                )
-            )
-            self._tree.add_command(
-                discord.app_commands.Command(
-                    name="debug_err",
-                    description="Test error reporting system.",
-                    callback=cmd_debug_error_report,
-                )
-            )
+        for spec in COMMANDS:
+            if not spec.enabled():
+                continue
             self._tree.add_command(
                 discord.app_commands.Command(
-                    name="debug_stress",
-                    description="Starts a stress test.",
-                    callback=cmd_stress_test,
+                    name=spec.name,
+                    description=spec.description,
+                    callback=spec.load(),
                 )
             )
@@ -11,6 +11,7 @@ from ironforgedbot.commands.admin.refresh_ranks import cmd_refresh_ranks
 from ironforgedbot.commands.admin.spin_members_view import SpinMembersView
 from ironforgedbot.commands.admin.spin_options import get_botw_options, get_sotw_options
 from ironforgedbot.commands.admin.spin_options_modal import SpinOptionsModal
+from ironforgedbot.commands.admin.sync_commands import cmd_sync_commands
 from ironforgedbot.commands.admin.sync_members import cmd_sync_members
 from ironforgedbot.commands.admin.view_logs import cmd_view_logs
 from ironforgedbot.commands.admin.view_state import cmd_view_state
@@ -116,6 +117,19 @@ class AdminMenuView(View):
         await self.clear_parent()
         await cmd_view_state(interaction)
 
+    @discord.ui.button(
+        label="Sync Commands",
+        style=discord.ButtonStyle.blurple,
+        custom_id="sync_commands",
+        emoji="🔃",
+        row=1,
+    )
+    async def sync_commands_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.clear_parent()
+        await cmd_sync_commands(interaction)
+
     @discord.ui.button(
         label="Process Absentee List",
         style=discord.ButtonStyle.grey,
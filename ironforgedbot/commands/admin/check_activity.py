@@ -2,8 +2,8 @@ import logging
 
 import discord
 
+from ironforgedbot.commands.admin.manual_job import submit_manual_job
 from ironforgedbot.common.logging_utils import log_command_execution
-from ironforgedbot.config import CONFIG
 from ironforgedbot.tasks.job_check_activity import job_check_activity
 
 logger = logging.getLogger(__name__)
@@ -14,10 +14,10 @@ async def cmd_check_activity(
     interaction: discord.Interaction, report_channel: discord.TextChannel
 ):
     """Execute member activity check job manually."""
-    await interaction.response.send_message(
-        "## Manually initiating activity check job...\n"
-        f"View <#{report_channel.id}> for output.",
-        ephemeral=True,
+    await submit_manual_job(
+        interaction,
+        report_channel,
+        "activity check",
+        job_check_activity,
+        report_channel,
     )
-
-    await job_check_activity(report_channel)
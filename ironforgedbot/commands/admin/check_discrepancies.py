@@ -2,6 +2,7 @@ import logging
 
 import discord
 
+from ironforgedbot.commands.admin.manual_job import submit_manual_job
 from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.config import CONFIG
 from ironforgedbot.tasks.job_membership_discrepancies import (
@@ -18,13 +19,11 @@ async def cmd_check_discrepancies(
     """Execute member discrepancy check job manually."""
     assert interaction.guild
 
-    await interaction.response.send_message(
-        "## Manually initiating member discrepancy job...\n"
-        f"View <#{report_channel.id}> for output.",
-        ephemeral=True,
-    )
-
-    await job_check_membership_discrepancies(
+    await submit_manual_job(
+        interaction,
+        report_channel,
+        "member discrepancy",
+        job_check_membership_discrepancies,
         interaction.guild,
         report_channel,
         CONFIG.WOM_API_KEY,
@@ -3,7 +3,18 @@ import json
 
 import discord
 
+from ironforgedbot.common.latency import COMMAND_LATENCIES, TASK_LATENCIES
+from ironforgedbot.common.spans import format_slowest_report
+from ironforgedbot.decorators.rate_limit import RATE_LIMITER
+from ironforgedbot.events.member_update_debouncer import member_update_debouncer
+from ironforgedbot.events.member_update_emitter import member_update_emitter
+from ironforgedbot.services.job_coordinator import JOB_COORDINATOR
+from ironforgedbot.services.job_schedule import JOB_SCHEDULE
+from ironforgedbot.services.loop_monitor import LOOP_MONITOR
+from ironforgedbot.services.render_service import RENDER_SERVICE
 from ironforgedbot.state import STATE
+from ironforgedbot.storage.data_files import DATA_FILES
+from ironforgedbot.storage.job_history import JOB_HISTORY
 
 
 def get_internal_state() -> discord.File:
@@ -12,3 +23,47 @@ def get_internal_state() -> discord.File:
     json_bytes.seek(0)
 
     return discord.File(json_bytes, "state.json")
+
+
+def get_runtime_stats() -> discord.File:
+    """Returns in-memory runtime statistics as discord.File object"""
+    stats = {
+        "rate_limit": RATE_LIMITER.stats(),
+        "data_files": DATA_FILES.stats(),
+        "render": RENDER_SERVICE.stats(),
+        "member_updates": member_update_debouncer.stats(),
+        "handler_latency": member_update_emitter.latencies.snapshot(),
+        "command_latency": COMMAND_LATENCIES.snapshot(),
+        "job_latency": TASK_LATENCIES.snapshot(),
+        "jobs": JOB_COORDINATOR.stats(),
+        "loop_lag": LOOP_MONITOR.stats(),
+    }
+
+    json_bytes = io.BytesIO(json.dumps(stats, indent=2).encode("utf-8"))
+    json_bytes.seek(0)
+
+    return discord.File(json_bytes, "runtime_stats.json")
+
+
+def get_slowest_commands(count: int = 20) -> discord.File:
+    """Returns the slowest recent commands, broken down by phase, as discord.File"""
+    report = io.BytesIO(format_slowest_report(count).encode("utf-8"))
+    report.seek(0)
+
+    return discord.File(report, "slowest_commands.txt")
+
+
+def get_job_history(last: int = 20) -> discord.File:
+    """Returns scheduled job run trends as discord.File object"""
+    report = io.BytesIO(JOB_HISTORY.format_trends(last).encode("utf-8"))
+    report.seek(0)
+
+    return discord.File(report, "job_history.txt")
+
+
+def get_job_schedule() -> discord.File:
+    """Returns the planned scheduled job timetable as discord.File object"""
+    report = io.BytesIO(JOB_SCHEDULE.format_timetable().encode("utf-8"))
+    report.seek(0)
+
+    return discord.File(report, "job_schedule.txt")
@@ -3,6 +3,7 @@ import os
 
 import discord
 
+from ironforgedbot.common.log_tail import CURRENT_LOG_FILE
 from ironforgedcore.logging_config import get_logger_instance
 
 logger = logging.getLogger(__name__)
@@ -11,6 +12,11 @@ logger = logging.getLogger(__name__)
 def get_latest_log_file() -> discord.File | None:
     """Returns most recent log file as discord.File object"""
     try:
+        current_file = CURRENT_LOG_FILE.path
+        if current_file:
+            logger.debug("Retrieved current log file: %s", current_file)
+            return discord.File(current_file)
+
         log_dir = get_logger_instance().log_dir
         files = [os.path.join(log_dir, f) for f in os.listdir(log_dir)]
         files = [f for f in files if os.path.isfile(f)]
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+from typing import Optional
+
+import discord
+
+from ironforgedbot.automations import JobHandle
+
+logger = logging.getLogger(__name__)
+
+
+async def submit_manual_job(
+    interaction: discord.Interaction,
+    report_channel: discord.TextChannel,
+    title: str,
+    job_func,
+    *args,
+) -> Optional[JobHandle]:
+    """Runs a job on request through the automations job tracker.
+
+    The job runs in the background like a scheduled one, so graceful shutdown
+    waits for it and a second request while it is in flight reports on the
+    existing run instead of starting another.
+    """
+    automations = getattr(interaction.client, "automations", None)
+    if automations is None:
+        await interaction.response.send_message(
+            f"## Unable to start {title} job\n"
+            "Automations are not running yet, try again shortly.",
+            ephemeral=True,
+        )
+        return None
+
+    handle = await automations.submit_job(job_func, *args)
+
+    if handle is None:
+        await interaction.response.send_message(
+            f"## Unable to start {title} job\nThe bot is shutting down.",
+            ephemeral=True,
+        )
+        return None
+
+    # Let a new run claim a free slot so its reported status is accurate
+    await asyncio.sleep(0)
+
+    if handle.duplicate:
+        header = f"## {title.capitalize()} job is already in progress\n"
+    else:
+        header = f"## Manually initiating {title} job...\n"
+
+    await interaction.response.send_message(
+        header
+        + f"Status: {handle.describe()}.\n"
+        + f"View <#{report_channel.id}> for output.",
+        ephemeral=True,
+    )
+    return handle
@@ -2,6 +2,7 @@ import logging
 
 import discord
 
+from ironforgedbot.commands.admin.manual_job import submit_manual_job
 from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.tasks.job_refresh_ranks import job_refresh_ranks
 
@@ -15,10 +16,11 @@ async def cmd_refresh_ranks(
     """Execute member rank refresh job manually."""
     assert interaction.guild
 
-    await interaction.response.send_message(
-        "## Manually initiating rank check job...\n"
-        f"View <#{report_channel.id}> for output.",
-        ephemeral=True,
+    await submit_manual_job(
+        interaction,
+        report_channel,
+        "rank check",
+        job_refresh_ranks,
+        interaction.guild,
+        report_channel,
     )
-
-    await job_refresh_ranks(interaction.guild, report_channel)
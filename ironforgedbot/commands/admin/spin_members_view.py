@@ -8,6 +8,7 @@ from ironforgedbot.commands.spin.cmd_spin import MINIMUM_SPIN_OPTIONS
 from ironforgedbot.commands.spin.spin_result_handler import send_spin_result
 from ironforgedcore.common.normalize import normalize_discord_string
 from ironforgedbot.common.responses import send_error_response
+from ironforgedbot.services.render_service import RenderBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +55,9 @@ class SpinMembersView(discord.ui.View):
 
         try:
             file, winner_display_name = await build_spin_gif_file(display_names)
+        except RenderBusyError as e:
+            await send_error_response(interaction, e.message)
+            return
         except Exception as e:
             logger.error(f"Error generating spin GIF: {e}")
             await send_error_response(
@@ -7,6 +7,7 @@ from ironforgedbot.commands.spin.build_spin_gif import build_spin_gif_file
 from ironforgedbot.commands.spin.cmd_spin import MINIMUM_SPIN_OPTIONS
 from ironforgedcore.common.normalize import normalize_discord_string
 from ironforgedbot.common.responses import send_error_response
+from ironforgedbot.services.render_service import RenderBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,9 @@ class SpinOptionsModal(discord.ui.Modal):
 
         try:
             file, winner = await build_spin_gif_file(options)
+        except RenderBusyError as e:
+            await send_error_response(interaction, e.message)
+            return
         except Exception as e:
             logger.error(f"Error generating spin GIF: {e}")
             await send_error_response(
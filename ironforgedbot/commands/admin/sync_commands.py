@@ -0,0 +1,22 @@
+import logging
+
+import discord
+
+from ironforgedbot.common.logging_utils import log_command_execution
+from ironforgedbot.common.responses import send_error_response
+
+logger = logging.getLogger(__name__)
+
+
+@log_command_execution(logger)
+async def cmd_sync_commands(interaction: discord.Interaction):
+    """Upload the command tree to the guild, even if it looks unchanged."""
+    await interaction.response.defer(thinking=True, ephemeral=True)
+
+    try:
+        await interaction.client.sync_commands(force=True)
+    except discord.HTTPException as e:
+        logger.error(f"Failed to sync command tree: {e}")
+        return await send_error_response(interaction, "Error syncing commands.")
+
+    return await interaction.followup.send(content="## Command Tree Synced")
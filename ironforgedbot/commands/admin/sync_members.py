@@ -207,13 +207,15 @@ async def cmd_sync_members(
     """Execute member sync job manually."""
     assert interaction.guild
 
-    await interaction.response.send_message(
-        "## Manually initiating member sync job...\n"
-        f"View <#{report_channel.id}> for output.",
-        ephemeral=True,
-    )
-
     # Import here to avoid circular import
+    from ironforgedbot.commands.admin.manual_job import submit_manual_job
     from ironforgedbot.tasks.job_sync_members import job_sync_members
 
-    await job_sync_members(interaction.guild, report_channel)
+    await submit_manual_job(
+        interaction,
+        report_channel,
+        "member sync",
+        job_sync_members,
+        interaction.guild,
+        report_channel,
+    )
@@ -2,7 +2,13 @@ import logging
 
 import discord
 
-from ironforgedbot.commands.admin.internal_state import get_internal_state
+from ironforgedbot.commands.admin.internal_state import (
+    get_internal_state,
+    get_job_history,
+    get_job_schedule,
+    get_runtime_stats,
+    get_slowest_commands,
+)
 from ironforgedbot.common.logging_utils import log_command_execution
 
 logger = logging.getLogger(__name__)
@@ -13,8 +19,14 @@ async def cmd_view_state(interaction: discord.Interaction):
     """Send internal bot state."""
     await interaction.response.defer(thinking=True, ephemeral=True)
 
-    file = get_internal_state()
+    files = [
+        get_internal_state(),
+        get_runtime_stats(),
+        get_slowest_commands(),
+        get_job_history(),
+        get_job_schedule(),
+    ]
 
     return await interaction.followup.send(
-        content="## Current Internal State", file=file
+        content="## Current Internal State", files=files
     )
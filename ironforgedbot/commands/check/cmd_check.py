@@ -15,6 +15,7 @@ from ironforgedcore.common.normalize import normalize_discord_string, normalize_
 from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.common.ranks_discord import get_rank_from_member
 from ironforgedbot.common.responses import build_response_embed, send_error_response
+from ironforgedbot.common.spans import PHASE_HTTP, span_phase
 from ironforgedcore.common.roles import ROLE
 from ironforgedbot.config import CONFIG
 from ironforgedcore.database import db
@@ -22,9 +23,9 @@ from ironforgedbot.decorators.require_role import require_role
 from ironforgedbot.services.service_factory import (
     create_absent_service,
     create_member_service,
+    get_wom_service,
 )
 from ironforgedcore.services.wom_service import (
-    get_wom_service,
     WomService,
     WomServiceError,
     WomRateLimitError,
@@ -93,19 +94,23 @@ async def cmd_check(interaction: discord.Interaction, player: Optional[str] = No
     try:
         async with get_wom_service() as wom_service:
             try:
-                player_gains = await wom_service.get_player_monthly_gains(
-                    db_member.nickname
-                )
+                with span_phase(PHASE_HTTP):
+                    player_gains = await wom_service.get_player_monthly_gains(
+                        db_member.nickname
+                    )
 
-                wom_group = await wom_service.get_group_membership_data()
+                    wom_group = await wom_service.get_group_membership_data()
 
                 try:
                     # Snapshot fetch is intentionally isolated: a failure here
                     # degrades the /check output gracefully (no buffer field)
                     # rather than failing the entire command.
-                    snapshot_timeline = await wom_service.get_player_snapshot_timeline(
-                        db_member.nickname
-                    )
+                    with span_phase(PHASE_HTTP):
+                        snapshot_timeline = (
+                            await wom_service.get_player_snapshot_timeline(
+                                db_member.nickname
+                            )
+                        )
                 except Exception as e:
                     logger.warning(
                         f"Failed to fetch snapshot timeline for {player}: {e}"
@@ -146,9 +151,10 @@ async def cmd_check(interaction: discord.Interaction, player: Optional[str] = No
                 base_url=CONFIG.WOM_LTM_BASE_URL,
                 group_id=CONFIG.WOM_LTM_GROUP_ID,
             ) as ltm_wom_service:
-                ltm_player_gains = await ltm_wom_service.get_player_monthly_gains(
-                    db_member.nickname
-                )
+                with span_phase(PHASE_HTTP):
+                    ltm_player_gains = await ltm_wom_service.get_player_monthly_gains(
+                        db_member.nickname
+                    )
                 ltm_xp_gained = int(extract_overall_xp_gained(ltm_player_gains))
         except Exception as e:
             logger.warning(f"Failed to fetch LTM gains for {player}: {e}")
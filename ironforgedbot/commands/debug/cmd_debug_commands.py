@@ -4,6 +4,7 @@ import discord
 from discord.ui import Button, View
 
 from ironforgedbot.commands.admin.cmd_get_role_members import cmd_get_role_members
+from ironforgedbot.commands.admin.manual_job import submit_manual_job
 from ironforgedbot.commands.hiscore.cmd_breakdown import cmd_breakdown
 from ironforgedbot.commands.hiscore.cmd_score import cmd_score
 from ironforgedbot.commands.trickortreat.cmd_trick_or_treat import cmd_trick_or_treat
@@ -60,7 +61,11 @@ async def cmd_debug_commands(original_interaction: discord.Interaction):
                 interaction, interaction.user.display_name
             )
         },
-        "run payroll": {"callback": lambda interaction: job_payroll(report_channel)},
+        "run payroll": {
+            "callback": lambda interaction: submit_manual_job(
+                interaction, report_channel, "payroll", job_payroll, report_channel
+            )
+        },
     }
 
     view = View()
@@ -5,7 +5,6 @@ import discord
 from discord.ui import Button, View
 
 from ironforgedbot.common.helpers import get_text_channel
-from ironforgedbot.common.text_formatters import text_bold
 from ironforgedbot.config import CONFIG
 from ironforgedbot.tasks.job_check_activity import job_check_activity
 from ironforgedbot.tasks.job_sync_members import job_sync_members
@@ -21,9 +20,6 @@ logger = logging.getLogger(__name__)
 @log_command_execution(logger)
 async def cmd_stress_test(interaction: discord.Interaction):
     commands = {
-        "message spam": {
-            "callback": lambda interaction: message_request_spam(interaction)
-        },
         "run all automations": {
             "callback": lambda interaction: run_all_automations(interaction)
         },
@@ -44,44 +40,44 @@ async def cmd_stress_test(interaction: discord.Interaction):
     )
 
 
-async def message_request_spam(
-    interaction: discord.Interaction, users: int = 5, request_per_user: int = 10
-):
-    await interaction.response.send_message("Starting...")
-
-    async def send_message(channel, user_id):
-        for i in range(request_per_user):
-            await channel.send(f"Simulated message from user {user_id} #{i}")
-            await asyncio.sleep(0.2)
-
-    tasks = []
-    channel = interaction.channel
-
-    for user_id in range(users):
-        tasks.append(send_message(channel, user_id))
-
-    await asyncio.gather(*tasks)
-    await channel.send(
-        f"## Complete\nSimulated {text_bold(str(request_per_user))} requests for {text_bold(str(users))} users."
-    )
-
-
 async def run_all_automations(interaction: discord.Interaction):
     assert interaction.guild
     assert interaction.channel_id
     channel = get_text_channel(interaction.guild, interaction.channel_id)
     assert channel
 
-    tasks = []
-    tasks.append(job_sync_members(interaction.guild, channel))
-    tasks.append(job_refresh_ranks(interaction.guild, channel))
-    tasks.append(job_check_activity(channel))
-    tasks.append(
-        job_check_membership_discrepancies(
-            interaction.guild, channel, CONFIG.WOM_API_KEY, CONFIG.WOM_GROUP_ID
+    automations = getattr(interaction.client, "automations", None)
+    if automations is None:
+        return await interaction.response.send_message(
+            "Automations are not running yet, try again shortly."
         )
-    )
 
-    await asyncio.gather(*tasks)
+    jobs = [
+        (job_sync_members, interaction.guild, channel),
+        (job_refresh_ranks, interaction.guild, channel),
+        (job_check_activity, channel),
+        (
+            job_check_membership_discrepancies,
+            interaction.guild,
+            channel,
+            CONFIG.WOM_API_KEY,
+            CONFIG.WOM_GROUP_ID,
+        ),
+    ]
+
+    handles = [await automations.submit_job(*job) for job in jobs]
+    await asyncio.sleep(0)
+
+    lines = []
+    for (job_func, *_), handle in zip(jobs, handles):
+        if handle is None:
+            status = "not started"
+        elif handle.duplicate:
+            status = f"already in progress, {handle.describe()}"
+        else:
+            status = handle.describe()
+        lines.append(f"- `{job_func.__name__}`: {status}")
 
-    await interaction.response.send_message(f"Starting {len(tasks)} jobs...")
+    await interaction.response.send_message(
+        f"Submitted {len(jobs)} jobs:\n" + "\n".join(lines)
+    )
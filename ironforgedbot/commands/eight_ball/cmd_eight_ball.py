@@ -13,6 +13,7 @@ from ironforgedbot.common.responses import build_response_embed, send_error_resp
 from ironforgedcore.common.roles import ROLE
 from ironforgedbot.decorators.command_price import command_price
 from ironforgedbot.decorators.require_role import require_role
+from ironforgedbot.storage.data_files import DATA_FILES
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +80,7 @@ async def cmd_eight_ball(interaction: discord.Interaction, question: str) -> Non
         question: The question to ask the Magic 8-Ball.
     """
     try:
-        data = _load_eight_ball_data()
+        data = DATA_FILES.get(DATA_FILE, _load_eight_ball_data)
 
         loading_msg = random.choice(data["loading_messages"])
 
@@ -16,14 +16,17 @@ from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.common.responses import build_response_embed, send_error_response
 from ironforgedcore.common.roles import ROLE
 from ironforgedbot.common.text_formatters import text_code_block
+from ironforgedbot.common.spans import PHASE_HTTP, span_phase
 from ironforgedcore.database import db
 from ironforgedbot.decorators.require_role import require_role
-from ironforgedbot.services.service_factory import create_member_service
+from ironforgedbot.services.service_factory import (
+    create_member_service,
+    get_wom_service,
+)
 from ironforgedcore.services.wom_service import (
     WomRateLimitError,
     WomServiceError,
     WomTimeoutError,
-    get_wom_service,
 )
 
 logger = logging.getLogger(__name__)
@@ -120,9 +123,10 @@ async def cmd_gains(interaction: discord.Interaction, player: Optional[str] = No
     try:
         async with get_wom_service() as wom_service:
             try:
-                snapshots = await wom_service.get_player_snapshot_timeline(
-                    db_member.nickname
-                )
+                with span_phase(PHASE_HTTP):
+                    snapshots = await wom_service.get_player_snapshot_timeline(
+                        db_member.nickname
+                    )
             except WomRateLimitError:
                 return await send_error_response(
                     interaction,
@@ -2,7 +2,6 @@ import logging
 
 import discord
 from discord import app_commands
-from reactionmenu import ViewButton, ViewMenu
 
 from ironforgedbot.commands.hiscore.score_utils import _calculate_points
 from ironforgedbot.common.constants import EMPTY_SPACE
@@ -32,11 +31,12 @@ from ironforgedcore.common.roles import ROLE
 from ironforgedbot.common.roles_discord import has_prospect_role
 from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.common.text_formatters import text_italic
+from ironforgedbot.common.spans import PHASE_HTTP, span_phase
 from ironforgedbot.decorators.require_role import require_role
 from ironforgedcore.exceptions.score_exceptions import HiscoresError, HiscoresNotFound
 from ironforgedcore.http import HTTP, HttpException
 from ironforgedcore.models.score import ActivityScore, ScoreBreakdown
-from ironforgedcore.services.score_service import get_score_service
+from ironforgedbot.services.service_factory import get_score_service
 
 logger = logging.getLogger(__name__)
 
@@ -313,7 +313,8 @@ async def cmd_breakdown(interaction: discord.Interaction, player: str | None = N
     service = get_score_service(HTTP)
 
     try:
-        data = await service.get_player_score(player)
+        with span_phase(PHASE_HTTP):
+            data = await service.get_player_score(player)
     except (HiscoresError, HttpException):
         return await send_error_response(
             interaction,
@@ -407,6 +408,8 @@ async def cmd_breakdown(interaction: discord.Interaction, player: str | None = N
         + [raid_breakdown_embed, clue_breakdown_embed, rank_ladder_embed]
     )
 
+    from reactionmenu import ViewButton, ViewMenu
+
     menu = ViewMenu(
         interaction,
         menu_type=ViewMenu.TypeEmbed,
@@ -30,6 +30,7 @@ from ironforgedbot.common.responses import (
 )
 from ironforgedcore.common.roles import ROLE
 from ironforgedbot.common.roles_discord import check_member_has_role, has_prospect_role
+from ironforgedbot.common.spans import PHASE_DISCORD, PHASE_HTTP, span_phase
 from ironforgedbot.config import CONFIG
 from ironforgedcore.database import db
 from ironforgedbot.decorators.require_role import require_role
@@ -37,7 +38,7 @@ from ironforgedcore.exceptions.score_exceptions import HiscoresError, HiscoresNo
 from ironforgedcore.http import HTTP, HttpException
 from ironforgedcore.models.score import ScoreBreakdown
 from ironforgedcore.services.score_history_service import ScoreHistoryService
-from ironforgedcore.services.score_service import get_score_service
+from ironforgedbot.services.service_factory import get_score_service
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +108,8 @@ async def cmd_score(interaction: discord.Interaction, player: str | None = None)
 
     try:
         service = get_score_service(HTTP)
-        data = await service.get_player_score(player)
+        with span_phase(PHASE_HTTP):
+            data = await service.get_player_score(player)
     except (HiscoresError, HttpException):
         return await send_error_response(
             interaction,
@@ -231,4 +233,5 @@ async def cmd_score(interaction: discord.Interaction, player: str | None = None)
             inline=False,
         )
 
-    await interaction.followup.send(embed=embed)
+    with span_phase(PHASE_DISCORD):
+        await interaction.followup.send(embed=embed)
@@ -8,10 +8,6 @@ from ironforgedbot.commands.leaderboard.leaderboard_embeds import (
     build_staff_leaderboard_embeds,
     find_caller_page,
 )
-from ironforgedbot.commands.leaderboard.leaderboard_menu import (
-    LeaderboardMenu,
-    build_leaderboard_menu,
-)
 from ironforgedbot.commands.leaderboard.leaderboard_registry import LEADERBOARD_TYPES
 from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.common.responses import send_error_response
@@ -50,6 +46,10 @@ async def cmd_leaderboard(
         caller_page = find_caller_page(entries, interaction.user.id)
         embeds = build_leaderboard_embeds(entries, config)
 
+    from ironforgedbot.commands.leaderboard.leaderboard_menu import (
+        build_leaderboard_menu,
+    )
+
     menu = build_leaderboard_menu(interaction, embeds, caller_page)
 
     try:
@@ -11,9 +11,10 @@ from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.common.responses import build_response_embed, send_error_response
 from ironforgedcore.common.roles import ROLE
 from ironforgedbot.common.text_formatters import text_bold
+from ironforgedbot.common.spans import PHASE_HTTP, span_phase
 from ironforgedbot.decorators.require_role import require_role
+from ironforgedbot.services.service_factory import get_wom_service
 from ironforgedcore.services.wom_service import (
-    get_wom_service,
     WomServiceError,
     WomRateLimitError,
     WomTimeoutError,
@@ -45,8 +46,9 @@ async def cmd_whois(interaction: discord.Interaction, player: str):
     display_name = member.display_name if member is not None else player
 
     try:
-        async with get_wom_service() as wom_service:
-            name_changes = await wom_service.get_player_name_history(player)
+        with span_phase(PHASE_HTTP):
+            async with get_wom_service() as wom_service:
+                name_changes = await wom_service.get_player_name_history(player)
     except WomRateLimitError:
         return await send_error_response(
             interaction,
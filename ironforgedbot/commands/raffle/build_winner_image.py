@@ -1,8 +1,25 @@
+import functools
 import io
 from typing import Any, Tuple
-from PIL import Image, ImageDraw, ImageFont
 import discord
 
+from ironforgedbot.common.lazy_import import lazy_module
+from ironforgedbot.services.render_service import RENDER_SERVICE
+
+# Pillow loads on the first render, not when the raffle command is imported
+Image = lazy_module("PIL.Image")
+ImageDraw = lazy_module("PIL.ImageDraw")
+ImageFont = lazy_module("PIL.ImageFont")
+
+IMAGE_PATH = "data/img/raffle_winner.jpeg"
+ICON_PATH = "data/img/ingot_icon.png"
+FONT_PATH = "data/fonts/runescape.ttf"
+NAME_FONT_SIZE = 85
+WINNINGS_FONT_SIZE = 40
+ICON_SIZE = (35, 35)
+IMAGE_FORMATS = ("png", "webp")
+WEBP_QUALITY = 85
+
 
 def _calculate_position(
     text, font: ImageFont.FreeTypeFont, image_width: int, image_height: int
@@ -41,50 +58,101 @@ def _draw_text_with_outline(
     draw.text((x, y), text, font=font, fill=fill_color)
 
 
-async def build_winner_image_file(winner_name: str, winnings: int) -> discord.File:
-    image_path = "data/img/raffle_winner.jpeg"
+@functools.lru_cache(maxsize=1)
+def _get_base_image() -> Image.Image:
+    """Decoded announcement background, copied for each render."""
+    with Image.open(IMAGE_PATH) as img:
+        img.load()
+        return img.copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font(size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(FONT_PATH, size=size)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ingot_icon() -> Image.Image:
+    with Image.open(ICON_PATH) as icon:
+        return icon.convert("RGBA").resize(ICON_SIZE)
+
+
+def preload_assets() -> None:
+    """Loads every asset into the cache so the first render is not slower."""
+    _get_base_image()
+    _get_font(NAME_FONT_SIZE)
+    _get_font(WINNINGS_FONT_SIZE)
+    _get_ingot_icon()
+
+
+def _encode_image(img: Image.Image, image_format: str) -> bytes:
+    with io.BytesIO() as image_binary:
+        if image_format == "webp":
+            img.save(image_binary, "WEBP", quality=WEBP_QUALITY, method=4)
+        else:
+            img.save(image_binary, "PNG", optimize=True)
+        return image_binary.getvalue()
+
+
+async def build_winner_image_file(
+    winner_name: str, winnings: int, image_format: str = "png"
+) -> discord.File:
+    """Renders the raffle winner announcement image in the render process pool.
+
+    `image_format` is either "png" (lossless, optimized) or "webp" (lossy,
+    a fraction of the size). Raises RenderBusyError when too many renders are
+    already queued.
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+
+    image_bytes = await RENDER_SERVICE.run(
+        _build_winner_image_sync, winner_name, winnings, image_format
+    )
+    return discord.File(
+        fp=io.BytesIO(image_bytes), filename=f"raffle_winner.{image_format}"
+    )
+
 
-    with Image.open(image_path) as img:
-        draw = ImageDraw.Draw(img)
+def _build_winner_image_sync(
+    winner_name: str, winnings: int, image_format: str = "png"
+) -> bytes:
+    img = _get_base_image().copy()
+    draw = ImageDraw.Draw(img)
 
-        # draw winner name
-        font = ImageFont.truetype("data/fonts/runescape.ttf", size=85)
-        img_height, img_width = img.size
-        x, y = _calculate_position(winner_name, font, img_height, img_width)
-        y = y - 65  # offset
+    # draw winner name
+    font = _get_font(NAME_FONT_SIZE)
+    img_height, img_width = img.size
+    x, y = _calculate_position(winner_name, font, img_height, img_width)
+    y = y - 65  # offset
 
-        _draw_text_with_outline(draw, x, y, winner_name, font)
+    _draw_text_with_outline(draw, x, y, winner_name, font)
 
-        # draw winner quantity with icon
-        spacing = 10
-        offset = 90
-        winnings_text = f"{winnings:,}"
-        font = ImageFont.truetype("data/fonts/runescape.ttf", size=40)
+    # draw winner quantity with icon
+    spacing = 10
+    offset = 90
+    winnings_text = f"{winnings:,}"
+    font = _get_font(WINNINGS_FONT_SIZE)
 
-        icon = Image.open("data/img/ingot_icon.png").convert("RGBA")
-        icon = icon.resize((35, 35))
-        icon_width, icon_height = icon.size
+    icon = _get_ingot_icon()
+    icon_width, icon_height = icon.size
 
-        text_bbox = font.getbbox(winnings_text)
-        text_width, text_height = (
-            text_bbox[2] - text_bbox[0],
-            text_bbox[3] - text_bbox[1],
-        )
+    text_bbox = font.getbbox(winnings_text)
+    text_width, text_height = (
+        text_bbox[2] - text_bbox[0],
+        text_bbox[3] - text_bbox[1],
+    )
 
-        total_width = text_width + spacing + icon_width
-        x_start = (img.width - total_width) // 2
+    total_width = text_width + spacing + icon_width
+    x_start = (img.width - total_width) // 2
 
-        # Calculate positions
-        icon_x = x_start
-        icon_y = (y + (text_height - icon_height) // 2) + offset
-        text_x = x_start + icon_width + spacing
-        text_y = y + offset
+    # Calculate positions
+    icon_x = x_start
+    icon_y = (y + (text_height - icon_height) // 2) + offset
+    text_x = x_start + icon_width + spacing
+    text_y = y + offset
 
-        _draw_text_with_outline(draw, text_x, text_y, winnings_text, font)
-        img.paste(icon, (icon_x, icon_y), mask=icon)
+    _draw_text_with_outline(draw, text_x, text_y, winnings_text, font)
+    img.paste(icon, (icon_x, icon_y), mask=icon)
 
-        # Return discord.File
-        with io.BytesIO() as image_binary:
-            img.save(image_binary, "PNG")
-            image_binary.seek(0)
-            return discord.File(fp=image_binary, filename="raffle_winner.png")
+    return _encode_image(img, image_format)
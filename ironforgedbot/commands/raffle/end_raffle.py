@@ -105,15 +105,26 @@ async def handle_end_raffle(
                 parent_message, interaction, result.message
             )
 
-        # Announce winner
         winner_spent = winner_qty * STATE.state["raffle_price"]
         winner_profit = winnings - winner_spent
 
+        # Close the raffle as soon as it's paid out, so a failure announcing
+        # the winner can't leave it open to be ended and paid out again
+        STATE.state["raffle_on"] = False
+        STATE.state["raffle_price"] = 0
+        await raffle_service.delete_all_tickets()
+
+        # Announce winner
         winning_discord_member = interaction.guild.get_member(winning_member.discord_id)
         assert winning_discord_member
 
         ingot_icon = find_emoji("Ingot")
-        file = await build_winner_image_file(winning_member.nickname, int(winnings))
+        try:
+            file = await build_winner_image_file(winning_member.nickname, int(winnings))
+        except Exception as e:
+            # Winnings are already paid out, announce without the image
+            logger.warning(f"Unable to render winner image, announcing without: {e}")
+            file = discord.utils.MISSING
 
         tickets_sold_string = (
             (
@@ -150,10 +161,5 @@ async def handle_end_raffle(
             file=file,
         )
 
-        # Cleanup
-        STATE.state["raffle_on"] = False
-        STATE.state["raffle_price"] = 0
-        await raffle_service.delete_all_tickets()
-
         if parent_message:
             parent_message = await parent_message.delete()
@@ -10,6 +10,7 @@ from ironforgedbot.common.responses import build_response_embed, send_error_resp
 from ironforgedcore.common.roles import ROLE
 from ironforgedbot.decorators.command_price import command_price
 from ironforgedbot.decorators.require_role import require_role
+from ironforgedbot.storage.data_files import DATA_FILES
 
 logger = logging.getLogger(__name__)
 RESET_RNG_DATA_FILE = "data/reset_rng.json"
@@ -70,7 +71,7 @@ async def cmd_reset_rng(interaction: discord.Interaction):
         interaction: Discord Interaction from CommandTree.
     """
     try:
-        data = _load_reset_rng_data()
+        data = DATA_FILES.get(RESET_RNG_DATA_FILE, _load_reset_rng_data)
     except Exception as e:
         logger.error(f"Failed to load reset RNG data: {e}")
         return await send_error_response(
@@ -1,12 +1,21 @@
-import asyncio
+import functools
 import io
 import logging
 import math
 import random
 import time
+from dataclasses import dataclass
 
 import discord
-from PIL import Image, ImageDraw, ImageFont
+
+from ironforgedbot.common.lazy_import import lazy_module
+from ironforgedbot.services.render_service import RENDER_SERVICE
+
+# Pillow loads on the first spin, not when the spin command is imported
+Image = lazy_module("PIL.Image")
+ImageChops = lazy_module("PIL.ImageChops")
+ImageDraw = lazy_module("PIL.ImageDraw")
+ImageFont = lazy_module("PIL.ImageFont")
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +49,81 @@ CONFETTI_COLORS = [
 ]
 
 MAX_GIF_SIZE = 25 * 1024 * 1024  # 25 MB
+GIF_BACKGROUND_COLOR = (43, 45, 49, 255)  # Discord dark theme, flattens alpha
+PALETTE_COLORS = 255  # one index left free to mark unchanged pixels
+TRANSPARENT_INDEX = PALETTE_COLORS
+OUTLINE_WIDTH = 2
+SPRITE_CACHE_SIZE = 512  # outlined option names kept between spins
+
+# Quality controller. Predictions use a linear model fitted to every tier of
+# the spin benchmark with 24 character names, from 3 up to 3000 options; they
+# only need to pick a sensible tier. The slowest case measured, 3000 options at
+# high quality, took ~4.2s and encoded to ~2.5 MB.
+RENDER_TIME_BUDGET = 3.0  # seconds a member waits before the spin starts
+SECONDS_PER_FRAME = 0.005  # composite + quantize one frame
+SECONDS_PER_SPRITE = 0.006  # first render of an outlined option name
+VISIBLE_ITEMS = GIF_HEIGHT // ITEM_HEIGHT + 1  # names on screen in one frame
+BYTES_PER_PIXEL_FRAME = 0.25  # worst case measured across tiers, at 8-bit
 
 BACKGROUND_IMAGE_PATH = "data/img/spin_background.png"
 FONT_PATH = "data/fonts/runescape.ttf"
 
 
+@dataclass(frozen=True)
+class SpinQuality:
+    """Output settings for one quality tier.
+
+    Frames are always rendered at full size on the full timeline; a tier
+    keeps every `frame_step`-th frame, scales them and shrinks the palette.
+    """
+
+    name: str
+    frame_step: int
+    palette_colors: int
+    scale: float
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return round(GIF_WIDTH * self.scale), round(GIF_HEIGHT * self.scale)
+
+    @property
+    def frame_duration_ms(self) -> int:
+        return FRAME_DURATION_MS * self.frame_step
+
+    @property
+    def frame_indices(self) -> range:
+        return range(0, FRAME_COUNT, self.frame_step)
+
+    def predict(self, option_count: int) -> tuple[int, float]:
+        """Returns (estimated bytes, estimated render seconds)."""
+        width, height = self.size
+        bits = (self.palette_colors + 1).bit_length() - 1
+        frames = len(self.frame_indices)
+
+        size = frames * width * height * BYTES_PER_PIXEL_FRAME * bits / 8
+        # Only names that scroll past a kept frame are ever drawn
+        sprites = min(option_count, SPIN_FRAMES // self.frame_step * VISIBLE_ITEMS)
+        seconds = frames * SECONDS_PER_FRAME + sprites * SECONDS_PER_SPRITE
+        return int(size), seconds
+
+
+QUALITY_TIERS = (
+    SpinQuality("high", frame_step=1, palette_colors=PALETTE_COLORS, scale=1.0),
+    SpinQuality("medium", frame_step=2, palette_colors=127, scale=1.0),
+    SpinQuality("low", frame_step=2, palette_colors=63, scale=0.8),
+    SpinQuality("minimal", frame_step=3, palette_colors=31, scale=0.6),
+)
+
+
+def select_quality(option_count: int) -> int:
+    """Returns the index of the best tier predicted to fit size and time."""
+    for index, quality in enumerate(QUALITY_TIERS):
+        size, seconds = quality.predict(option_count)
+        if size <= MAX_GIF_SIZE and seconds <= RENDER_TIME_BUDGET:
+            return index
+    return len(QUALITY_TIERS) - 1
+
+
 def _ease_out_cubic(t: float) -> float:
     """Cubic ease-out curve: fast at the start, decelerates to a stop at t=1."""
     return 1 - (1 - t) ** 3
@@ -74,68 +153,143 @@ def _load_background() -> Image.Image:
         return Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT), (20, 20, 40, 255))
 
 
-def _draw_text_with_outline_rgba(
-    draw: ImageDraw.Draw,
-    x: float,
-    y: float,
-    text: str,
-    font: ImageFont.FreeTypeFont,
-    alpha: int,
-    outline_width: int = 2,
-):
-    """Draw text with an 8-direction stroke outline onto an RGBA draw context.
-
-    The outline is rendered first by drawing the text eight times, once in
-    each diagonal and cardinal direction offset by `outline_width` pixels,
-    then the filled text is drawn on top. This gives crisp edges without
-    requiring a separate mask or blur pass.
+@functools.cache
+def _get_background() -> Image.Image:
+    """Background flattened onto the GIF colour once, shared by every frame.
+
+    GIF does not support true alpha transparency, so any transparency in the
+    background is composited onto a solid colour up front. Callers must not
+    mutate the returned image.
     """
-    outline_color = (0, 0, 0, alpha)
-    fill_color = (255, 255, 0, alpha)
+    solid = Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT), GIF_BACKGROUND_COLOR)
+    return Image.alpha_composite(solid, _load_background())
 
-    for offset_x, offset_y in [
-        (-outline_width, 0),
-        (outline_width, 0),
-        (0, -outline_width),
-        (0, outline_width),
-        (-outline_width, -outline_width),
-        (-outline_width, outline_width),
-        (outline_width, -outline_width),
-        (outline_width, outline_width),
-    ]:
-        draw.text((x + offset_x, y + offset_y), text, font=font, fill=outline_color)
 
-    draw.text((x, y), text, font=font, fill=fill_color)
+@functools.cache
+def _get_font() -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(FONT_PATH, size=FONT_SIZE)
 
 
-def build_spin_frames(options: list[str], selected_index: int) -> list[Image.Image]:
-    """Build all animation frames for the spin.
+@functools.lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _get_text_sprite(text: str) -> tuple[Image.Image, int, int]:
+    """Rasterise outlined text once at full opacity.
+
+    Returns the sprite plus the x offset from the centred position and the
+    y offset from the vertical centre of the text, so frames only need to
+    blit it. Callers must not mutate the returned image.
+    """
+    font = _get_font()
+    left, top, right, bottom = font.getbbox(text)
+    pad = OUTLINE_WIDTH
+
+    sprite = Image.new(
+        "RGBA", (right - left + pad * 2, bottom - top + pad * 2), (0, 0, 0, 0)
+    )
+    # A single stroked draw gives the same outline as drawing the text at
+    # eight offsets, at a fraction of the glyph rendering cost.
+    ImageDraw.Draw(sprite).text(
+        (pad - left, pad - top),
+        text,
+        font=font,
+        fill=(255, 255, 0, 255),
+        stroke_width=OUTLINE_WIDTH,
+        stroke_fill=(0, 0, 0, 255),
+    )
+
+    offset_x = (GIF_WIDTH - (right - left)) // 2 - pad
+    offset_y = -(bottom - top) // 2 - pad
+    return sprite, offset_x, offset_y
 
-    Returns a list of FRAME_COUNT RGBA images across four phases:
+
+@functools.cache
+def _alpha_lut(alpha: int) -> list[int]:
+    return [value * alpha // 255 for value in range(256)]
+
+
+def _blit_text(buffer: Image.Image, text: str, center_y: float, alpha: int) -> None:
+    """Composite a cached text sprite centred on `center_y` at `alpha`."""
+    sprite, x, offset_y = _get_text_sprite(text)
+    y = int(round(center_y)) + offset_y
+
+    if alpha < 255:
+        faded = sprite.copy()
+        faded.putalpha(sprite.getchannel("A").point(_alpha_lut(alpha)))
+        sprite = faded
+
+    # Clip to the buffer, alpha_composite needs non-negative coordinates
+    source_x, source_y = max(0, -x), max(0, -y)
+    right = min(sprite.width, GIF_WIDTH - x)
+    bottom = min(sprite.height, GIF_HEIGHT - y)
+    if right <= source_x or bottom <= source_y:
+        return
+
+    buffer.alpha_composite(
+        sprite,
+        dest=(x + source_x, y + source_y),
+        source=(source_x, source_y, right, bottom),
+    )
+
+
+class _SpinRenderer:
+    """Renders individual spin frames into a caller supplied buffer.
+
+    Frames are a pure function of their index, so the palette can be sampled
+    from a few frames before the rest are rendered and quantized one at a
+    time instead of holding every RGBA frame in memory.
+
+    The animation has four phases:
     - Phase 1 (SPIN_FRAMES): spinning slot animation (text fades in over FADEIN_FRAMES)
     - Phase 2 (FADEOUT_FRAMES): non-winners fade out
     - Phase 3 (CONFETTI_FRAMES): confetti rain while winner stays centred
     - Phase 4 (OUTRO_FRAMES): everything fades out to pure background (loop point)
     """
-    total_scroll_items = (
-        math.ceil(FIXED_SCROLL_ITEMS / len(options)) * len(options) + selected_index
-    )
-    total_scroll_px = total_scroll_items * ITEM_HEIGHT
 
-    font = ImageFont.truetype(FONT_PATH, size=FONT_SIZE)
-    center_y = GIF_HEIGHT / 2
-    background = _load_background()
-
-    frames: list[Image.Image] = []
+    def __init__(self, options: list[str], selected_index: int):
+        self.options = options
+        self.selected_index = selected_index
+        self.background = _get_background()
+        self.center_y = GIF_HEIGHT / 2
 
-    # Phase 1: spin
-    for i in range(SPIN_FRAMES):
+        self.total_scroll_items = (
+            math.ceil(FIXED_SCROLL_ITEMS / len(options)) * len(options) + selected_index
+        )
+        self.total_scroll_px = self.total_scroll_items * ITEM_HEIGHT
+
+        # Particle physics are seeded once; the time index runs continuously
+        # across the confetti and outro phases so motion is uninterrupted.
+        rng = random.Random(selected_index)
+        self.particles = [
+            (
+                rng.randint(0, GIF_WIDTH - CONFETTI_SIZE),  # px0
+                rng.uniform(-GIF_HEIGHT, 0),  # py0 (starts above screen)
+                rng.uniform(-2.0, 2.0),  # vx
+                rng.uniform(3.0, 6.0),  # vy
+                rng.choice(CONFETTI_COLORS),  # color
+            )
+            for _ in range(CONFETTI_COUNT)
+        ]
+
+    def new_buffer(self) -> Image.Image:
+        return Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT))
+
+    def render(self, index: int, buffer: Image.Image) -> None:
+        """Draw frame `index` into `buffer`, overwriting its contents."""
+        buffer.paste(self.background, (0, 0))
+
+        if index < SPIN_FRAMES:
+            self._render_spin(index, buffer)
+        elif index < SPIN_FRAMES + FADEOUT_FRAMES:
+            self._render_fadeout(index - SPIN_FRAMES, buffer)
+        else:
+            self._render_confetti(index - SPIN_FRAMES - FADEOUT_FRAMES, buffer)
+
+    def _render_spin(self, i: int, buffer: Image.Image) -> None:
         t = i / (SPIN_FRAMES - 1)
-        scroll = total_scroll_px * _ease_out_cubic(t)
+        scroll = self.total_scroll_px * _ease_out_cubic(t)
 
         # Snap last 5 frames to exact final position to eliminate end-of-spin jitter
         if i >= SPIN_FRAMES - 5:
-            scroll = total_scroll_px
+            scroll = self.total_scroll_px
 
         scroll_items = scroll / ITEM_HEIGHT
         base_index = int(scroll_items)
@@ -148,110 +302,70 @@ def build_spin_frames(options: list[str], selected_index: int) -> list[Image.Ima
         # Fade-in multiplier: 0.0 at i=0, 1.0 at i>=FADEIN_FRAMES-1
         fadein_alpha = min(1.0, i / (FADEIN_FRAMES - 1))
 
-        bg_copy = background.copy()
-        overlay = Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
-
         for n in range(-3, 4):
-            item_y = center_y + (n - frac) * ITEM_HEIGHT
-            item_index = (base_index + n) % len(options)
-            text = options[item_index]
-
-            alpha = _get_text_alpha(abs(item_y - center_y), ITEM_HEIGHT)
+            item_y = self.center_y + (n - frac) * ITEM_HEIGHT
+            alpha = _get_text_alpha(abs(item_y - self.center_y), ITEM_HEIGHT)
             alpha = int(alpha * fadein_alpha)
             if alpha == 0:
                 continue
 
-            bbox = font.getbbox(text)
-            text_width = bbox[2] - bbox[0]
-            x = (GIF_WIDTH - text_width) // 2
-            text_y = item_y - (bbox[3] - bbox[1]) / 2 - bbox[1]
-
-            _draw_text_with_outline_rgba(draw, x, text_y, text, font, alpha)
+            text = self.options[(base_index + n) % len(self.options)]
+            _blit_text(buffer, text, item_y, alpha)
 
-        composite = Image.alpha_composite(bg_copy, overlay)
-        frames.append(composite)
-
-    # Phase 2: fade-out
-    final_base_index = total_scroll_items  # frac = 0 at final position
-
-    for f in range(FADEOUT_FRAMES):
+    def _render_fadeout(self, f: int, buffer: Image.Image) -> None:
         progress = f / (FADEOUT_FRAMES - 1)  # 0.0 -> 1.0
-        bg_copy = background.copy()
-        overlay = Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
 
         for n in range(-3, 4):
-            item_y = center_y + n * ITEM_HEIGHT  # frac = 0 -> exact slot positions
-            item_index = (final_base_index + n) % len(options)
-            text = options[item_index]
+            item_y = self.center_y + n * ITEM_HEIGHT  # frac = 0 at final position
+            item_index = (self.total_scroll_items + n) % len(self.options)
 
-            if item_index == selected_index:
+            if item_index == self.selected_index:
                 alpha = 255
             else:
-                base_alpha = _get_text_alpha(abs(item_y - center_y), ITEM_HEIGHT)
+                base_alpha = _get_text_alpha(abs(item_y - self.center_y), ITEM_HEIGHT)
                 alpha = int(base_alpha * (1.0 - progress))
 
             if alpha == 0:
                 continue
 
-            bbox = font.getbbox(text)
-            x = (GIF_WIDTH - (bbox[2] - bbox[0])) // 2
-            text_y = item_y - (bbox[3] - bbox[1]) / 2 - bbox[1]
-            _draw_text_with_outline_rgba(draw, x, text_y, text, font, alpha)
-
-        composite = Image.alpha_composite(bg_copy, overlay)
-        frames.append(composite)
-
-    # Phases 3 & 4: confetti then outro
-    # Particle physics and winner text are seeded once; the time index f runs
-    # continuously across both phases so confetti motion is uninterrupted.
-    rng = random.Random(selected_index)
-    particles = [
-        (
-            rng.randint(0, GIF_WIDTH - CONFETTI_SIZE),  # px0
-            rng.uniform(-GIF_HEIGHT, 0),  # py0 (starts above screen)
-            rng.uniform(-2.0, 2.0),  # vx
-            rng.uniform(3.0, 6.0),  # vy
-            rng.choice(CONFETTI_COLORS),  # color
-        )
-        for _ in range(CONFETTI_COUNT)
-    ]
-
-    # Pre-compute winner text layout (constant for all confetti frames)
-    winner_text = options[selected_index]
-    w_bbox = font.getbbox(winner_text)
-    winner_x = (GIF_WIDTH - (w_bbox[2] - w_bbox[0])) // 2
-    winner_ty = center_y - (w_bbox[3] - w_bbox[1]) / 2 - w_bbox[1]
+            _blit_text(buffer, self.options[item_index], item_y, alpha)
 
-    # Phase 3 (f < CONFETTI_FRAMES): winner text + confetti at full opacity.
-    # Phase 4 (f >= CONFETTI_FRAMES): same, but both fade out linearly to 0.
-    for f in range(CONFETTI_FRAMES + OUTRO_FRAMES):
+    def _render_confetti(self, f: int, buffer: Image.Image) -> None:
+        # Phase 3 (f < CONFETTI_FRAMES): winner text + confetti at full opacity.
+        # Phase 4 (f >= CONFETTI_FRAMES): same, but both fade out linearly to 0.
         outro_f = f - CONFETTI_FRAMES  # negative during phase 3
         fade = 1.0 if outro_f < 0 else 1.0 - outro_f / (OUTRO_FRAMES - 1)
         alpha = int(255 * fade)
+        if alpha == 0:
+            return
 
-        bg_copy = background.copy()
+        _blit_text(buffer, self.options[self.selected_index], self.center_y, alpha)
 
-        text_overlay = Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT), (0, 0, 0, 0))
-        _draw_text_with_outline_rgba(
-            ImageDraw.Draw(text_overlay), winner_x, winner_ty, winner_text, font, alpha
-        )
-
-        confetti_overlay = Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT), (0, 0, 0, 0))
-        cd = ImageDraw.Draw(confetti_overlay)
-        for px0, py0, vx, vy, color in particles:
+        # Drawing in RGBA mode blends each square onto the frame directly
+        draw = ImageDraw.Draw(buffer, "RGBA")
+        for px0, py0, vx, vy, color in self.particles:
             px = int((px0 + vx * f) % GIF_WIDTH)
             py = int(py0 + vy * f)
             if 0 <= py < GIF_HEIGHT:
-                cd.rectangle(
+                draw.rectangle(
                     [px, py, px + CONFETTI_SIZE - 1, py + CONFETTI_SIZE - 1],
                     fill=(*color, alpha),
                 )
 
-        composite = Image.alpha_composite(bg_copy, text_overlay)
-        composite = Image.alpha_composite(composite, confetti_overlay)
-        frames.append(composite)
+
+def build_spin_frames(options: list[str], selected_index: int) -> list[Image.Image]:
+    """Build all animation frames for the spin.
+
+    Returns a list of FRAME_COUNT RGBA images, see `_SpinRenderer` for the
+    animation phases.
+    """
+    renderer = _SpinRenderer(options, selected_index)
+
+    frames: list[Image.Image] = []
+    for index in range(FRAME_COUNT):
+        buffer = renderer.new_buffer()
+        renderer.render(index, buffer)
+        frames.append(buffer)
 
     return frames
 
@@ -259,18 +373,19 @@ def build_spin_frames(options: list[str], selected_index: int) -> list[Image.Ima
 async def build_spin_gif_file(options: list[str]) -> tuple[discord.File, str]:
     """Build an animated GIF of the spin animation (non-blocking).
 
-    Offloads CPU-intensive image processing to thread pool.
+    Offloads CPU-intensive image processing to the render process pool.
     Returns (discord.File of GIF, winning option string).
+    Raises RenderBusyError when too many renders are already queued.
     """
     start_time = time.perf_counter()
-    result = await asyncio.to_thread(_build_spin_gif_sync, options)
+    gif_bytes, winner = await RENDER_SERVICE.run(_build_spin_gif_sync, options)
     elapsed = time.perf_counter() - start_time
     logger.debug(f"GIF generation completed in {elapsed:.2f}s ({len(options)} options)")
-    return result
+    return discord.File(fp=io.BytesIO(gif_bytes), filename="spin.gif"), winner
 
 
-def _build_spin_gif_sync(options: list[str]) -> tuple[discord.File, str]:
-    """Synchronous GIF generation - runs in thread pool.
+def _build_spin_gif_sync(options: list[str]) -> tuple[bytes, str]:
+    """Synchronous GIF generation - runs in a render worker process.
 
     All PIL operations happen here to avoid blocking the event loop.
     """
@@ -278,17 +393,35 @@ def _build_spin_gif_sync(options: list[str]) -> tuple[discord.File, str]:
     options = rng.sample(options, len(options))  # shuffle options
     selected_index = rng.randint(0, len(options) - 1)
 
-    # build_spin_frames returns RGBA images so each phase can composite
-    # transparent overlays (text, confetti) onto the background independently.
-    frames = build_spin_frames(options, selected_index)
+    start = select_quality(len(options))
+    for quality in QUALITY_TIERS[start:]:
+        gif_buffer = _encode_spin_gif(options, selected_index, quality)
+
+        file_size = gif_buffer.getbuffer().nbytes
+        if file_size <= MAX_GIF_SIZE:
+            return gif_buffer.getvalue(), options[selected_index]
+
+        # Re-encode smaller rather than fail a paid command
+        logger.warning(
+            f"Spin GIF at {quality.name} quality was "
+            f"{file_size / (1024 * 1024):.1f} MB, retrying at a lower tier"
+        )
+
+    raise ValueError(
+        f"Generated GIF size ({file_size / (1024 * 1024):.1f} MB) "
+        f"exceeds Discord's free tier limit ({MAX_GIF_SIZE / (1024 * 1024):.0f} MB)"
+    )
 
-    # GIF does not support true alpha transparency; every pixel must be fully
-    # opaque. Composite each RGBA frame onto a solid background colour now,
-    # before palette quantization, to flatten the alpha channel into RGB.
-    _solid = Image.new("RGBA", (GIF_WIDTH, GIF_HEIGHT), (43, 45, 49, 255))
-    gif_frames = [
-        Image.alpha_composite(_solid, frame).convert("RGB") for frame in frames
-    ]
+
+def _encode_spin_gif(
+    options: list[str],
+    selected_index: int,
+    quality: SpinQuality = QUALITY_TIERS[0],
+) -> io.BytesIO:
+    """Render and encode the spin at `quality`, returning the GIF bytes."""
+    start_time = time.perf_counter()
+    renderer = _SpinRenderer(options, selected_index)
+    buffer = renderer.new_buffer()
 
     # We sample one frame from each animation phase (spin, fadeout, confetti,
     # outro) and tile them side-by-side before quantizing. This ensures palette
@@ -302,39 +435,91 @@ def _build_spin_gif_sync(options: list[str]) -> tuple[discord.File, str]:
     ]
     palette_strip = Image.new("RGB", (GIF_WIDTH * len(sample_indices), GIF_HEIGHT))
     for i, idx in enumerate(sample_indices):
-        palette_strip.paste(gif_frames[idx], (i * GIF_WIDTH, 0))
+        renderer.render(idx, buffer)
+        palette_strip.paste(buffer.convert("RGB"), (i * GIF_WIDTH, 0))
 
     # MEDIANCUT distributes palette entries by colour population, giving the
-    # best coverage within the 256-colour GIF limit without biasing towards any
-    # single hue.
-    palette_source = palette_strip.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+    # best coverage within the GIF colour limit without biasing towards any
+    # single hue. One entry is left unused so the encoder always has a spare
+    # index to mark unchanged pixels as transparent in delta frames.
+    palette_source = palette_strip.quantize(
+        colors=quality.palette_colors, method=Image.Quantize.MEDIANCUT
+    )
 
     # All frames are quantized to the same palette so the colour mapping is
     # identical across every frame. A per-frame palette would cause visible
     # colour shifting between frames (palette flicker). Dither=NONE produces
     # clean, hard edges on text and confetti squares; ordered or error-diffusion
     # dithering would add noise patterns that are distracting on flat regions.
-    quantized = [
-        f.quantize(palette=palette_source, dither=Image.Dither.NONE) for f in gif_frames
-    ]
+    quantized = []
+    for index in quality.frame_indices:
+        renderer.render(index, buffer)
+        frame = buffer.convert("RGB")
+        if quality.scale != 1.0:
+            frame = frame.resize(quality.size, Image.Resampling.BILINEAR)
+        quantized.append(
+            frame.quantize(palette=palette_source, dither=Image.Dither.NONE)
+        )
+
+    frames, durations = _delta_frames(
+        quantized, quality.frame_duration_ms, quality.palette_colors
+    )
 
     gif_buffer = io.BytesIO()
-    quantized[0].save(
+    frames[0].save(
         gif_buffer,
         format="GIF",
         save_all=True,
-        append_images=quantized[1:],
-        duration=FRAME_DURATION_MS,
+        append_images=frames[1:],
+        duration=durations,
         loop=0,
+        disposal=1,
+        transparency=quality.palette_colors,
+        optimize=False,
     )
     gif_buffer.seek(0)
 
-    # Validate file size before returning
-    file_size = gif_buffer.getbuffer().nbytes
-    if file_size > MAX_GIF_SIZE:
-        raise ValueError(
-            f"Generated GIF size ({file_size / (1024 * 1024):.1f} MB) "
-            f"exceeds Discord's free tier limit ({MAX_GIF_SIZE / (1024 * 1024):.0f} MB)"
+    elapsed = time.perf_counter() - start_time
+    if elapsed > RENDER_TIME_BUDGET:
+        logger.warning(
+            f"Spin GIF at {quality.name} quality took {elapsed:.1f}s "
+            f"for {len(options)} options, over the {RENDER_TIME_BUDGET}s budget"
         )
 
-    return discord.File(fp=gif_buffer, filename="spin.gif"), options[selected_index]
+    return gif_buffer
+
+
+def _delta_frames(
+    frames: list[Image.Image],
+    frame_duration_ms: int = FRAME_DURATION_MS,
+    transparent_index: int = TRANSPARENT_INDEX,
+) -> tuple[list[Image.Image], list[int]]:
+    """Replace pixels unchanged since the previous frame with transparency.
+
+    Frames are drawn over the previous one (disposal 1), so only changed
+    pixels need real colours. Runs of transparent pixels compress far better
+    than repeated background, and the encoder crops each frame to the box
+    that still holds visible pixels. Identical frames are merged by extending
+    the previous frame's duration. All frames must share one palette.
+    """
+    output = [frames[0]]
+    durations = [frame_duration_ms]
+    previous = Image.frombytes("L", frames[0].size, frames[0].tobytes())
+
+    for frame in frames[1:]:
+        current = Image.frombytes("L", frame.size, frame.tobytes())
+        changed = ImageChops.difference(previous, current).point(
+            lambda value: 255 if value else 0
+        )
+        previous = current
+
+        if changed.getbbox() is None:
+            durations[-1] += frame_duration_ms
+            continue
+
+        delta = frame.copy()
+        delta.paste(transparent_index, mask=ImageChops.invert(changed))
+        output.append(delta)
+        durations.append(frame_duration_ms)
+
+    return output, durations
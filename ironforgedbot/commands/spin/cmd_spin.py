@@ -8,8 +8,9 @@ from ironforgedcore.common.normalize import normalize_discord_string
 from ironforgedbot.common.logging_utils import log_command_execution
 from ironforgedbot.common.responses import send_error_response
 from ironforgedcore.common.roles import ROLE
-from ironforgedbot.decorators.command_price import command_price
+from ironforgedbot.decorators.command_price import CommandRefundError, command_price
 from ironforgedbot.decorators.require_role import require_role
+from ironforgedbot.services.render_service import RenderBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -42,14 +43,15 @@ async def cmd_spin(interaction: discord.Interaction, options: str) -> None:
         )
         return
 
+    # The price is already taken, so a failed render is refunded
     try:
         file, _ = await build_spin_gif_file(parsed)
+    except RenderBusyError as e:
+        raise CommandRefundError(e.message)
     except Exception as e:
         logger.error(f"Error generating spin GIF: {e}")
-        await send_error_response(
-            interaction,
-            "Failed to generate spin animation. Please try again later.",
+        raise CommandRefundError(
+            "Failed to generate spin animation. Please try again later."
         )
-        return
 
     await interaction.followup.send(file=file)
@@ -2,6 +2,8 @@ import logging
 import yaml
 from enum import Enum
 
+from ironforgedbot.storage.data_files import DATA_FILES
+
 logger = logging.getLogger(__name__)
 
 TRICK_OR_TREAT_DATA_DIR = "data/trick_or_treat"
@@ -162,7 +164,7 @@ def _validate_values(values: dict) -> None:
         )
 
 
-_values = _load_values_file()
+_values = DATA_FILES.get(VALUES_FILE, _load_values_file)
 
 LOW_INGOT_MIN = _values["ingot_ranges"]["low_min"]
 LOW_INGOT_MAX = _values["ingot_ranges"]["low_max"]
@@ -298,7 +300,7 @@ def _validate_weights(weights: dict) -> None:
         )
 
 
-_weights = _load_weights_file()
+_weights = DATA_FILES.get(WEIGHTS_FILE, _load_weights_file)
 
 
 class TrickOrTreat(Enum):
@@ -0,0 +1,124 @@
+"""Startup import profile, from `python -X importtime`.
+
+Imports a module in a fresh interpreter and parses the per-module timings
+the interpreter writes to stderr, so the test suite can check which
+dependencies a module pulls in at startup and report what it costs.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from tabulate import tabulate
+
+_LINE_PREFIX = "import time:"
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # nesting below the module that imported it, 0 for top level
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parses `-X importtime` stderr, skipping the header and other lines."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith(_LINE_PREFIX):
+            continue
+
+        fields = line[len(_LINE_PREFIX) :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # the header row
+
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=stripped,
+                self_us=self_us,
+                cumulative_us=cumulative_us,
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return timings
+
+
+@dataclass
+class ImportProfile:
+    target: str
+    timings: List[ImportTiming]
+
+    @property
+    def modules(self) -> Dict[str, ImportTiming]:
+        return {timing.module: timing for timing in self.timings}
+
+    @property
+    def total_ms(self) -> float:
+        return sum(timing.self_us for timing in self.timings) / 1000
+
+    def cumulative_ms(self, module: str) -> Optional[float]:
+        timing = self.modules.get(module)
+        return timing.cumulative_us / 1000 if timing else None
+
+    def format_report(self, top: int = 15) -> str:
+        """Total import time and the top-level packages that cost the most.
+
+        Only packages imported from outside their own package are listed,
+        so each one's cumulative time is not counted again by its parent.
+        """
+        packages: Dict[str, int] = {}
+        for timing in self.timings:
+            root = timing.module.partition(".")[0]
+            packages[root] = max(packages.get(root, 0), timing.cumulative_us)
+
+        rows = [
+            [package, f"{cumulative_us / 1000:.1f}"]
+            for package, cumulative_us in sorted(
+                packages.items(), key=lambda item: item[1], reverse=True
+            )[:top]
+        ]
+        return (
+            f"import {self.target}: {self.total_ms:.0f}ms over "
+            f"{len(self.timings)} modules\n"
+            + tabulate(rows, headers=["Package", "Cumulative ms"])
+        )
+
+
+def profile_import(
+    module: str,
+    env: Optional[Dict[str, str]] = None,
+    timeout: float = 120.0,
+    then: Optional[str] = None,
+) -> ImportProfile:
+    """Imports `module` in a new interpreter and returns its import timings.
+
+    `then` is extra code run after the import, so imports it triggers, such
+    as command modules loaded while building the command tree, are profiled
+    too. Raises RuntimeError with the interpreter's output if either fails.
+    """
+    code = f"import {module}" + (f"\n{then}" if then else "")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        errors = "\n".join(
+            line
+            for line in result.stderr.splitlines()
+            if not line.startswith(_LINE_PREFIX)
+        )
+        raise RuntimeError(f"import {module} failed:\n{errors[-4000:]}")
+
+    return ImportProfile(target=module, timings=parse_importtime(result.stderr))
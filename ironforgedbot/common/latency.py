@@ -0,0 +1,102 @@
+import bisect
+import math
+import threading
+from collections import deque
+from typing import Any, Dict, Optional, Sequence
+
+DEFAULT_WINDOW = 512  # most recent samples used for percentiles
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Latency samples for one operation.
+
+    Keeps cumulative bucket counts, count and sum for the whole process
+    lifetime, and a rolling window of recent samples for percentiles.
+    """
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS,
+    ):
+        self.buckets_ms = tuple(buckets_ms)
+        self.bucket_counts = [0] * (len(self.buckets_ms) + 1)  # last is +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def record(self, duration_ms: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets_ms, duration_ms)] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self._recent.append(duration_ms)
+
+    @property
+    def window_size(self) -> int:
+        return len(self._recent)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Nearest-rank percentile over the recent window."""
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        def _round(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean_ms": _round(self.sum_ms / self.count if self.count else None),
+            "p50_ms": _round(self.percentile(50)),
+            "p95_ms": _round(self.percentile(95)),
+            "p99_ms": _round(self.percentile(99)),
+            "max_ms": _round(max(self._recent) if self._recent else None),
+            "buckets": {
+                **{
+                    f"le_{bound:g}": count
+                    for bound, count in zip(self.buckets_ms, self.bucket_counts)
+                },
+                "le_inf": self.bucket_counts[-1],
+            },
+        }
+
+
+class LatencyRegistry:
+    """Named LatencyHistograms, created on first record."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._window = window
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, name: str, duration_ms: float) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = LatencyHistogram(self._window)
+                self._histograms[name] = histogram
+            histogram.record(duration_ms)
+            return histogram
+
+    def get(self, name: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get(name)
+
+    def items(self) -> list[tuple[str, LatencyHistogram]]:
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: histogram.snapshot() for name, histogram in self.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+# Filled by the logging decorators, exported in runtime stats and /metrics
+COMMAND_LATENCIES = LatencyRegistry()
+TASK_LATENCIES = LatencyRegistry()
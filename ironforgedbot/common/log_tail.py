@@ -0,0 +1,183 @@
+"""Reading the end of the bot's log file without reading all of it.
+
+`tail_lines` seeks backwards from the end of the file in fixed size blocks,
+so the cost depends on how much is returned rather than how large the log
+has grown. `CURRENT_LOG_FILE` remembers which file the log handler writes
+to, so callers don't have to list and stat the log directory.
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+TAIL_BLOCK_SIZE = 8192
+
+_LEVEL_PATTERN = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+
+
+def _reverse_lines(file: BinaryIO, block_size: int) -> Iterator[bytes]:
+    """Yields the lines of `file` last first, without their newlines."""
+    file.seek(0, os.SEEK_END)
+    position = file.tell()
+    pending = b""
+    at_end = True
+
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        file.seek(position)
+        block = file.read(read_size) + pending
+
+        if at_end:
+            at_end = False
+            if block.endswith(b"\n"):
+                block = block[:-1]
+
+        lines = block.split(b"\n")
+        # The first line may continue in the previous block
+        pending = lines[0]
+        for line in reversed(lines[1:]):
+            yield line
+
+    if not at_end:
+        yield pending
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def _resolve_level(level: Union[int, str]) -> int:
+    if isinstance(level, int):
+        return level
+    try:
+        return logging.getLevelNamesMapping()[level.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {level}")
+
+
+class _RecordFilter:
+    """Matches log records by logger name and minimum level.
+
+    A line naming a level starts a record; lines without one, such as
+    traceback frames, belong to the record above them. Works for both the
+    plain text and the JSON log formats.
+    """
+
+    def __init__(
+        self, logger_name: Optional[str], min_level: Optional[Union[int, str]]
+    ):
+        self.min_level = _resolve_level(min_level) if min_level is not None else None
+        self.name_pattern = (
+            re.compile(rf"(?<![\w.]){re.escape(logger_name)}(?![\w])")
+            if logger_name
+            else None
+        )
+
+    @staticmethod
+    def record_level(line: str) -> Optional[int]:
+        match = _LEVEL_PATTERN.search(line)
+        return logging.getLevelNamesMapping()[match.group(1)] if match else None
+
+    def matches(self, line: str, level: int) -> bool:
+        if self.min_level is not None and level < self.min_level:
+            return False
+        if self.name_pattern is not None and not self.name_pattern.search(line):
+            return False
+        return True
+
+
+def tail_lines(
+    path: str,
+    count: int,
+    logger_name: Optional[str] = None,
+    min_level: Optional[Union[int, str]] = None,
+    block_size: int = TAIL_BLOCK_SIZE,
+) -> List[str]:
+    """Returns the last `count` lines of `path`, oldest first.
+
+    With `logger_name` or `min_level`, only lines of records from that logger
+    (or its children) at or above that level are counted, keeping each
+    record's continuation lines.
+    """
+    if count <= 0:
+        return []
+
+    record_filter = (
+        _RecordFilter(logger_name, min_level)
+        if logger_name or min_level is not None
+        else None
+    )
+
+    lines: List[str] = []
+    continuation: List[str] = []
+    with open(path, "rb") as file:
+        for raw in _reverse_lines(file, block_size):
+            line = _decode(raw)
+
+            if record_filter is None:
+                lines.append(line)
+            else:
+                level = record_filter.record_level(line)
+                if level is None:
+                    continuation.append(line)
+                    continue
+                if record_filter.matches(line, level):
+                    lines.extend(continuation)
+                    lines.append(line)
+                continuation = []
+
+            if len(lines) >= count:
+                break
+
+    lines.reverse()
+    return lines[-count:]
+
+
+class CurrentLogFile:
+    """Path of the file the root logger's file handler is writing to.
+
+    Looked up from the handler on first use and refreshed by the handler
+    itself after each rollover, so reading the current log never has to
+    list the log directory.
+    """
+
+    def __init__(self):
+        self._path: Optional[str] = None
+        self._watched: set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Optional[str]:
+        """The current log file, or None when logging to a file isn't set up."""
+        path = self._path
+        if path is None or not os.path.exists(path):
+            path = self.refresh()
+        return path
+
+    def refresh(self) -> Optional[str]:
+        with self._lock:
+            self._path = None
+            for handler in logging.getLogger().handlers:
+                if isinstance(handler, logging.FileHandler):
+                    self._watch(handler)
+                    self._path = handler.baseFilename
+                    break
+            return self._path
+
+    def _watch(self, handler: logging.FileHandler) -> None:
+        rollover = getattr(handler, "doRollover", None)
+        if rollover is None or id(handler) in self._watched:
+            return
+
+        def do_rollover():
+            rollover()
+            self._path = handler.baseFilename
+
+        handler.doRollover = do_rollover  # type: ignore[method-assign]
+        self._watched.add(id(handler))
+
+
+CURRENT_LOG_FILE = CurrentLogFile()
@@ -5,12 +5,19 @@ import logging
 import time
 from typing import Callable, Optional
 
+from ironforgedbot.common.latency import COMMAND_LATENCIES, TASK_LATENCIES
+from ironforgedbot.common.spans import command_span
+
 
 def log_command_execution(
     logger: Optional[logging.Logger] = None, interaction_position: int = 0
 ):
     """Decorator to log Discord command execution.
 
+    Each invocation runs inside a command span (see common.spans), so time
+    spent in role checks, DB, HTTP, rendering and Discord responses is
+    broken down in the slowest commands report.
+
     Args:
         logger: Logger instance to use. If None, creates one from the function module.
         interaction_position: Position of the interaction parameter in the function signature (0-indexed).
@@ -24,11 +31,13 @@ def log_command_execution(
             actual_logger = (
                 logger if logger is not None else logging.getLogger(func.__module__)
             )
-            start_time = time.time()
+            start_time = time.perf_counter()
+            user = "unknown"
 
             if len(args) > interaction_position:
                 interaction = args[interaction_position]
                 if isinstance(interaction, discord.Interaction):
+                    user = str(interaction.user)
                     user_info = f"{interaction.user} (ID: {interaction.user.id})"
                     actual_logger.info(
                         f"Command {func.__name__} started by {user_info}"
@@ -40,20 +49,23 @@ def log_command_execution(
             else:
                 actual_logger.info(f"Command {func.__name__} started (no interaction)")
 
-            try:
-                result = await func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                actual_logger.info(
-                    f"Command {func.__name__} completed successfully in {elapsed:.2f}s"
-                )
-                return result
-            except Exception as e:
-                elapsed = time.time() - start_time
-                actual_logger.error(
-                    f"Command {func.__name__} failed after {elapsed:.2f}s: {e}",
-                    exc_info=True,
-                )
-                raise
+            with command_span(func.__name__, user):
+                try:
+                    result = await func(*args, **kwargs)
+                    elapsed = time.perf_counter() - start_time
+                    COMMAND_LATENCIES.record(func.__name__, elapsed * 1000)
+                    actual_logger.info(
+                        f"Command {func.__name__} completed successfully in {elapsed:.2f}s"
+                    )
+                    return result
+                except Exception as e:
+                    elapsed = time.perf_counter() - start_time
+                    COMMAND_LATENCIES.record(func.__name__, elapsed * 1000)
+                    actual_logger.error(
+                        f"Command {func.__name__} failed after {elapsed:.2f}s: {e}",
+                        exc_info=True,
+                    )
+                    raise
 
         return wrapper
 
@@ -112,6 +124,7 @@ def log_task_execution(logger: Optional[logging.Logger] = None):
                 logger if logger is not None else logging.getLogger(func.__module__)
             )
             actual_logger.info(f"Task {func.__name__} started")
+            start_time = time.perf_counter()
 
             try:
                 result = await func(*args, **kwargs)
@@ -120,6 +133,10 @@ def log_task_execution(logger: Optional[logging.Logger] = None):
             except Exception as e:
                 actual_logger.error(f"Task {func.__name__} failed: {e}", exc_info=True)
                 raise
+            finally:
+                TASK_LATENCIES.record(
+                    func.__name__, (time.perf_counter() - start_time) * 1000
+                )
 
         return wrapper
 
@@ -2,15 +2,19 @@ from datetime import datetime, timedelta, timezone
 import io
 import logging
 import os
+from typing import Optional, Union
+
 import discord
 
 from ironforgedbot.common.helpers import find_emoji, get_text_channel
+from ironforgedbot.common.log_tail import CURRENT_LOG_FILE, tail_lines
 from ironforgedbot.common.ranks_discord import get_rank_color_from_points
 from ironforgedcore.common.ranks import get_rank_from_points
 from ironforgedcore.common.roles import ROLE
 from ironforgedcore.common.role_names import PROSPECT_ROLE_NAME
 from ironforgedbot.common.roles_discord import check_member_has_role
 from ironforgedbot.common.text_formatters import text_bold, text_sub
+from ironforgedbot.common.spans import PHASE_DISCORD, span_phase
 from ironforgedbot.config import CONFIG
 from ironforgedcore.logging_config import get_logger_instance
 from ironforgedbot.services.service_factory import create_member_service
@@ -28,7 +32,8 @@ async def send_error_response(
         title=":exclamation: Error", description=message, color=discord.Colour.red()
     )
 
-    await interaction.followup.send(embed=embed)
+    with span_phase(PHASE_DISCORD):
+        await interaction.followup.send(embed=embed)
 
     if report_to_channel:
         await _send_error_report(interaction, message)
@@ -45,14 +50,16 @@ async def send_ephemeral_error(interaction: discord.Interaction, message: str):
     )
 
     if not interaction.response.is_done():
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        with span_phase(PHASE_DISCORD):
+            await interaction.response.send_message(embed=embed, ephemeral=True)
     else:
         try:
             await interaction.delete_original_response()
         except Exception:
             pass  # Ignore if already deleted or doesn't exist
 
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        with span_phase(PHASE_DISCORD):
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
 
 async def _send_error_report(interaction: discord.Interaction, error_message: str):
@@ -152,41 +159,43 @@ async def _send_error_report(interaction: discord.Interaction, error_message: st
         logger.error(f"Failed to send error report: {e}")
 
 
-def _get_latest_log_lines_file(line_count: int = 50) -> discord.File | None:
+def _get_latest_log_lines_file(
+    line_count: int = 50,
+    logger_name: Optional[str] = None,
+    min_level: Optional[Union[int, str]] = None,
+) -> discord.File | None:
     """Extract the latest N lines from the log file and return as Discord file.
 
     Args:
         line_count: Number of lines to extract from the end of the log file
+        logger_name: Only include records from this logger and its children
+        min_level: Only include records at or above this level
 
     Returns:
         Discord File object with log lines, or None if unavailable
     """
     try:
-        # Find all log files in the log directory
-        log_dir = get_logger_instance().log_dir
-        files = [os.path.join(log_dir, f) for f in os.listdir(log_dir)]
-        files = [f for f in files if os.path.isfile(f) and f.endswith(".log")]
+        latest_file = CURRENT_LOG_FILE.path
+        if latest_file is None:
+            # Not logging to a file through a handler we know, scan the log dir
+            log_dir = get_logger_instance().log_dir
+            files = [os.path.join(log_dir, f) for f in os.listdir(log_dir)]
+            files = [f for f in files if os.path.isfile(f) and f.endswith(".log")]
 
-        if not files:
-            logger.warning("No log files found for error report attachment")
-            return None
+            if not files:
+                logger.warning("No log files found for error report attachment")
+                return None
 
-        # Get the most recent log file
-        latest_file = max(files, key=os.path.getmtime)
+            latest_file = max(files, key=os.path.getmtime)
 
-        # Read the last N lines efficiently
-        lines = []
-        with open(latest_file, "r", encoding="utf-8") as file:
-            # Read all lines and get the last N
-            all_lines = file.readlines()
-            lines = all_lines[-line_count:]
+        # Seeks back from the end, the log can be large on a busy day
+        lines = tail_lines(latest_file, line_count, logger_name, min_level)
 
         if not lines:
             logger.warning("No log lines found in latest log file")
             return None
 
-        # Create file content preserving original formatting
-        log_content = "".join(lines)
+        log_content = "\n".join(lines) + "\n"
 
         # Create filename with timestamp
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
@@ -277,7 +286,8 @@ async def send_prospect_response(
             discord.Color.from_str("#df781c"),
         )
 
-        await interaction.followup.send(embed=embed)
+        with span_phase(PHASE_DISCORD):
+            await interaction.followup.send(embed=embed)
 
 
 async def send_member_no_hiscore_values(interaction: discord.Interaction, name: str):
@@ -298,7 +308,8 @@ async def send_member_no_hiscore_values(interaction: discord.Interaction, name:
         rank_color,
     )
 
-    await interaction.followup.send(embed=embed)
+    with span_phase(PHASE_DISCORD):
+        await interaction.followup.send(embed=embed)
 
 
 async def send_not_clan_member(
@@ -330,4 +341,5 @@ async def send_not_clan_member(
         eligible_rank_color,
     )
 
-    await interaction.followup.send(embed=embed)
+    with span_phase(PHASE_DISCORD):
+        await interaction.followup.send(embed=embed)
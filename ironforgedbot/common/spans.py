@@ -0,0 +1,201 @@
+"""Per-command timing spans.
+
+`log_command_execution` opens a span for each command invocation. Code
+running inside the command attributes its time to a phase with
+`span_phase`, without having the span passed to it. Finished spans are kept
+in a ring buffer for the slowest commands report.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Set
+
+from tabulate import tabulate
+
+PHASE_ROLES = "roles"
+PHASE_DB = "db"
+PHASE_HTTP = "http"
+PHASE_RENDER = "render"
+PHASE_DISCORD = "discord"
+PHASES = (PHASE_ROLES, PHASE_DB, PHASE_HTTP, PHASE_RENDER, PHASE_DISCORD)
+
+SPAN_BUFFER_SIZE = 256
+
+
+@dataclass
+class CommandSpan:
+    command: str
+    user: str
+    started_at: float = field(default_factory=time.time)
+    total_ms: float = 0.0
+    outcome: str = "running"
+    phases: Dict[str, float] = field(default_factory=dict)
+    calls: Dict[str, int] = field(default_factory=dict)
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+    _active: Set[str] = field(default_factory=set, repr=False)
+
+    def add(self, phase: str, duration_ms: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration_ms
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    @property
+    def other_ms(self) -> float:
+        """Time not attributed to any phase, mostly command logic."""
+        return max(self.total_ms - sum(self.phases.values()), 0.0)
+
+
+_current_span: ContextVar[Optional[CommandSpan]] = ContextVar(
+    "command_span", default=None
+)
+
+
+class SpanBuffer:
+    """Ring buffer of the most recent finished spans."""
+
+    def __init__(self, size: int = SPAN_BUFFER_SIZE):
+        self._spans: deque[CommandSpan] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, span: CommandSpan) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def slowest(self, count: int = 20) -> List[CommandSpan]:
+        with self._lock:
+            spans = list(self._spans)
+        return sorted(spans, key=lambda s: s.total_ms, reverse=True)[:count]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
+SPANS = SpanBuffer()
+
+
+def current_span() -> Optional[CommandSpan]:
+    return _current_span.get()
+
+
+@contextmanager
+def command_span(command: str, user: str = "unknown") -> Iterator[CommandSpan]:
+    """Opens the span for a command, or joins one an outer decorator opened."""
+    span = _current_span.get()
+    if span is not None:
+        yield span
+        return
+
+    span = CommandSpan(command=command, user=user)
+    token = _current_span.set(span)
+    try:
+        yield span
+        span.outcome = "ok"
+    except asyncio.CancelledError:
+        span.outcome = "cancelled"
+        raise
+    except BaseException:
+        span.outcome = "error"
+        raise
+    finally:
+        span.total_ms = (time.perf_counter() - span._start) * 1000
+        _current_span.reset(token)
+        SPANS.add(span)
+
+
+@contextmanager
+def span_phase(phase: str) -> Iterator[None]:
+    """Attributes the enclosed time to `phase` of the current command, if any.
+
+    Nested or concurrent sections of the same phase count once.
+    """
+    span = _current_span.get()
+    if span is None or phase in span._active:
+        yield
+        return
+
+    span._active.add(phase)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        span._active.discard(phase)
+        span.add(phase, (time.perf_counter() - start) * 1000)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    context._span_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    span = _current_span.get()
+    started = getattr(context, "_span_started", None)
+    if span is not None and started is not None:
+        span.add(PHASE_DB, (time.perf_counter() - started) * 1000)
+
+
+def install_db_timing() -> None:
+    """Times every SQL statement into the current command's db phase.
+
+    Listens on the Engine class, so it covers the engine ironforgedcore
+    creates without needing a reference to it.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def format_slowest_report(count: int = 20) -> str:
+    """Table of the slowest recent commands with their phase breakdown."""
+    spans = SPANS.slowest(count)
+    if not spans:
+        return "No commands recorded yet."
+
+    rows = [
+        [
+            span.command,
+            span.user,
+            datetime.fromtimestamp(span.started_at, timezone.utc).strftime(
+                "%m-%d %H:%M:%S"
+            ),
+            f"{span.total_ms:.0f}",
+            *(
+                (
+                    f"{span.phases[phase]:.0f} ({span.calls[phase]})"
+                    if phase in span.phases
+                    else "-"
+                )
+                for phase in PHASES
+            ),
+            f"{span.other_ms:.0f}",
+            span.outcome,
+        ]
+        for span in spans
+    ]
+    headers = [
+        "Command",
+        "User",
+        "Started (UTC)",
+        "Total ms",
+        *PHASES,
+        "other",
+        "Outcome",
+    ]
+
+    return (
+        f"Slowest {len(spans)} of the last {len(SPANS)} commands. "
+        "Phase columns are ms (calls).\n\n" + tabulate(rows, headers=headers)
+    )
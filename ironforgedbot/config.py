@@ -45,6 +45,29 @@ class Config(BaseConfig):
             os.getenv("TRICK_OR_TREAT_COOLDOWN_SECONDS") or 3600
         )
 
+        # Member update handlers whose p95 exceeds this are reported
+        self.HANDLER_P95_BUDGET_MS: int = int(
+            os.getenv("HANDLER_P95_BUDGET_MS") or 2000
+        )
+
+        # Scheduled and manual jobs calling hiscores/WOM that may run at once
+        self.JOB_NETWORK_CONCURRENCY: int = int(
+            os.getenv("JOB_NETWORK_CONCURRENCY") or 1
+        )
+
+        # Event loop stalls longer than this are logged and reported
+        self.LOOP_LAG_THRESHOLD_MS: int = int(os.getenv("LOOP_LAG_THRESHOLD_MS") or 250)
+
+        # Prometheus style /metrics and /health endpoint, off unless enabled
+        self.METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "False") == "True"
+        self.METRICS_HOST: str = os.getenv("METRICS_HOST") or "127.0.0.1"
+        self.METRICS_PORT: int = int(os.getenv("METRICS_PORT") or 9108)
+
+        # Upstream overrides (optional), e.g. the loadtest stand-in server.
+        # HISCORES_URL must contain "{rsn}" where the player name goes.
+        self.HISCORES_URL: str = os.getenv("HISCORES_URL", "")
+        self.WOM_BASE_URL: str = os.getenv("WOM_BASE_URL", "")
+
         # Limited Time Mode (LTM) tracker (optional)
         # Both must be set for LTM tracking to be enabled.
         self.WOM_LTM_BASE_URL: str = os.getenv("WOM_LTM_BASE_URL", "")
@@ -69,6 +92,8 @@ class Config(BaseConfig):
 
     def validate_config(self) -> None:
         optional_keys = {
+            "HISCORES_URL",
+            "WOM_BASE_URL",
             "WOM_LTM_BASE_URL",
             "WOM_LTM_GROUP_ID",
             "TRICK_OR_TREAT_CHANNEL_ID",
@@ -88,6 +113,9 @@ class Config(BaseConfig):
             if isinstance(value, int) and value <= 0:
                 raise ValueError(f"Configuration key '{key}' (int) is missing or empty")
 
+        if self.HISCORES_URL and "{rsn}" not in self.HISCORES_URL:
+            raise ValueError("Configuration key 'HISCORES_URL' must contain '{rsn}'")
+
 
 try:
     CONFIG = Config()
@@ -3,14 +3,82 @@ import json
 import logging
 import random
 import time
+import uuid
 
 import discord
 
 from ironforgedcore.database import db
-from ironforgedcore.services.member_service import MemberService
+from ironforgedbot.services.ingot_reservation_service import (
+    IngotReservationService,
+)
+from ironforgedbot.state import STATE
+from ironforgedbot.storage.data_files import DATA_FILES
 
 logger = logging.getLogger(__name__)
 COMMAND_PRICE_DATA_FILE = "data/command_price.json"
+CONFIRMATION_TIMEOUT = 30  # seconds before an unanswered prompt is refunded
+
+
+class CommandRefundError(Exception):
+    """Raised by a priced command that failed before delivering anything.
+
+    The price is refunded and `message` is shown to the member instead.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+def open_reservation(user_id: int, cost: int, command_name: str) -> str:
+    """Records a reserved price in state so it can be refunded after a restart."""
+    reservation_id = uuid.uuid4().hex
+    STATE.state["command_reservations"][reservation_id] = {
+        "user_id": user_id,
+        "cost": cost,
+        "command": command_name,
+        "expires_at": time.time() + CONFIRMATION_TIMEOUT,
+    }
+    return reservation_id
+
+
+def close_reservation(reservation_id: str) -> bool:
+    """Claims an open reservation, returning False if it was already settled.
+
+    Confirming, cancelling, timing out and the shutdown refund all claim the
+    reservation first, so its price is only ever charged or refunded once.
+    """
+    return STATE.state["command_reservations"].pop(reservation_id, None) is not None
+
+
+async def refund_open_reservations() -> int:
+    """Refunds every reservation whose prompt can no longer be answered.
+
+    Prompts live in memory, so on start up every recorded reservation belongs
+    to a previous process, and on shutdown the open prompts are about to go.
+    Returns how many reservations were refunded.
+    """
+    refunded = 0
+    for reservation_id, reservation in list(
+        STATE.state["command_reservations"].items()
+    ):
+        if not close_reservation(reservation_id):
+            continue
+
+        try:
+            async with db.get_session() as session:
+                await IngotReservationService(session).refund(
+                    reservation["user_id"],
+                    reservation["cost"],
+                    f"Command refund: {reservation['command']}",
+                )
+            refunded += 1
+        except Exception as e:
+            logger.error(f"Unable to refund reservation {reservation}: {e}")
+
+    if refunded:
+        logger.info(f"Refunded {refunded} unanswered command price reservation(s)")
+    return refunded
 
 
 def _load_flavor_text(file_path: str = COMMAND_PRICE_DATA_FILE) -> list[str]:
@@ -54,6 +122,11 @@ def command_price(amount: int):
     The @require_role decorator should be applied first (outermost) to check permissions
     and defer the interaction, then @command_price sends the confirmation message.
 
+    The price is reserved up front with a single conditional update, so members who
+    can't afford the command are told immediately. Cancelling or letting the prompt
+    expire refunds the reservation. Open reservations are kept in state, so prompts
+    lost to a restart are refunded by `refund_open_reservations`.
+
     The confirmation message is sent to the channel (visible to everyone) but is deleted
     after the user responds. This keeps the original interaction clean so the command's
     response can replace the original "thinking" message.
@@ -86,19 +159,37 @@ def command_price(amount: int):
                 )
 
             async with db.get_session() as session:
-                member_service = MemberService(session)
-                member = await member_service.get_member_by_discord_id(
-                    interaction.user.id
+                reservation = await IngotReservationService(session).reserve(
+                    interaction.user.id, amount, f"Command usage: {func.__name__}"
                 )
-                current_balance = member.ingots if member else 0
 
             ingot_icon = find_emoji("Ingot")
 
-            expire_timestamp = int(time.time() + 30)
+            if not reservation.status:
+                you_have_string = (
+                    f"And you only have {ingot_icon} **{reservation.new_total:,}**."
+                    if reservation.new_total > 0
+                    else "You're skint mate 🤷‍♂️"
+                )
+                error_embed = build_response_embed(
+                    title="❌ Insufficient Funds",
+                    description=f"This command costs {ingot_icon} **{amount:,}**.\n\n{you_have_string}",
+                    color=discord.Colour.red(),
+                )
+                return await interaction.followup.send(embed=error_embed)
+
+            current_balance = reservation.new_total + amount
+            reservation_id = open_reservation(
+                interaction.user.id, amount, func.__name__
+            )
+
+            expire_timestamp = int(time.time() + CONFIRMATION_TIMEOUT)
             expires_formatted = f"<t:{expire_timestamp}:R>"
 
             try:
-                flavor_text_options = _load_flavor_text()
+                flavor_text_options = DATA_FILES.get(
+                    COMMAND_PRICE_DATA_FILE, _load_flavor_text
+                )
                 flavor_text = f"*{random.choice(flavor_text_options)}*\n"
             except Exception as e:
                 logger.error(e)
@@ -135,15 +226,21 @@ def command_price(amount: int):
                 original_kwargs=kwargs,
                 command_name=func.__name__,
                 user_id=interaction.user.id,
+                reservation_id=reservation_id,
             )
 
-            original_message = await interaction.original_response()
-            confirmation_message = await interaction.channel.send(
-                content=interaction.user.mention,
-                embed=embed,
-                view=view,
-                reference=original_message,
-            )
+            try:
+                original_message = await interaction.original_response()
+                confirmation_message = await interaction.channel.send(
+                    content=interaction.user.mention,
+                    embed=embed,
+                    view=view,
+                    reference=original_message,
+                )
+            except Exception:
+                view.stop()
+                await view.refund()
+                raise
 
             view.confirmation_message = confirmation_message
 
@@ -1,6 +1,8 @@
 import functools
 import logging
 import time
+from collections import Counter, OrderedDict, deque
+from typing import Optional
 
 import discord
 
@@ -9,6 +11,132 @@ from ironforgedbot.state import STATE
 logger = logging.getLogger(__name__)
 
 
+def _persisted_timestamps(entry: dict | list) -> list[float]:
+    # Entries saved before expiry was stored are bare timestamp lists
+    return entry.get("timestamps", []) if isinstance(entry, dict) else entry
+
+
+class RateLimiter:
+    """Sliding window rate limiter keyed by (command, user).
+
+    Each key holds a deque of at most `rate` call timestamps, so a check is
+    O(1) amortised. Keys are kept in least recently used order and capped at
+    `max_keys`, and idle keys are dropped by `sweep`, which runs from the clear
+    caches automation. Allowed calls are mirrored into
+    `STATE.state["rate_limit"]` with the time the window expires, so cooldowns
+    survive a restart and can be swept without the command being run again.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._windows: OrderedDict[tuple[str, str], deque[float]] = OrderedDict()
+        self._periods: dict[str, int] = {}
+        self._allowed: Counter[str] = Counter()
+        self._throttled: Counter[str] = Counter()
+
+    def _get_window(self, command: str, user_id: str, rate: int) -> deque[float]:
+        key = (command, user_id)
+        window = self._windows.get(key)
+
+        if window is not None:
+            self._windows.move_to_end(key)
+            return window
+
+        # Evicted or not seen since start up, seed from persisted state
+        persisted = STATE.state["rate_limit"].get(command, {}).get(user_id, [])
+        window = deque(_persisted_timestamps(persisted), maxlen=rate)
+        self._windows[key] = window
+
+        if len(self._windows) > self.max_keys:
+            self._windows.popitem(last=False)
+
+        return window
+
+    def hit(
+        self, command: str, user_id: str, rate: int, seconds: int, now: float
+    ) -> Optional[float]:
+        """Records a call, returning None if allowed or the retry time if not."""
+        self._periods[command] = seconds
+        window = self._get_window(command, user_id, rate)
+
+        while window and now - window[0] >= seconds:
+            window.popleft()
+
+        if len(window) >= rate:
+            self._throttled[command] += 1
+            return window[0] + seconds
+
+        window.append(now)
+        self._allowed[command] += 1
+
+        if command not in STATE.state["rate_limit"]:
+            STATE.state["rate_limit"][command] = {}
+        STATE.state["rate_limit"][command][user_id] = {
+            "timestamps": list(window),
+            "expires_at": now + seconds,
+        }
+
+        return None
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drops expired windows, returning how many persisted entries were removed."""
+        now = now or time.time()
+        removed = 0
+
+        for key, window in list(self._windows.items()):
+            seconds = self._periods.get(key[0])
+            if seconds is not None and (not window or now - window[-1] >= seconds):
+                del self._windows[key]
+
+        rate_state = STATE.state["rate_limit"]
+        for command in list(rate_state.keys()):
+            seconds = self._periods.get(command)
+            users = rate_state[command]
+
+            for user_id in list(users.keys()):
+                entry = users[user_id]
+                if isinstance(entry, dict):
+                    expires_at = entry.get("expires_at", 0)
+                elif not entry:
+                    expires_at = 0
+                elif seconds is not None:
+                    expires_at = max(entry) + seconds
+                else:
+                    # Saved before expiry was stored, kept until its period is known
+                    continue
+
+                if now >= expires_at:
+                    del users[user_id]
+                    removed += 1
+
+            if not users:
+                del rate_state[command]
+
+        return removed
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Returns allowed and throttled counts per command since start up."""
+        tracked: Counter[str] = Counter(command for command, _ in self._windows)
+
+        return {
+            command: {
+                "allowed": self._allowed[command],
+                "throttled": self._throttled[command],
+                "tracked_users": tracked[command],
+            }
+            for command in sorted(set(self._allowed) | set(self._throttled))
+        }
+
+    def reset(self) -> None:
+        self._windows.clear()
+        self._periods.clear()
+        self._allowed.clear()
+        self._throttled.clear()
+
+
+RATE_LIMITER = RateLimiter()
+
+
 def rate_limit(rate: int = 1, seconds: int = 3600):
     """Limits how often a command can be called by an individual user"""
 
@@ -32,24 +160,13 @@ def rate_limit(rate: int = 1, seconds: int = 3600):
             user_id = str(interaction.user.id)
             now = time.time()
 
-            if command_name not in STATE.state["rate_limit"]:
-                STATE.state["rate_limit"][command_name] = {}
-
-            command_limits = STATE.state["rate_limit"][command_name]
+            retry_at = RATE_LIMITER.hit(command_name, user_id, rate, seconds, now)
 
-            if user_id not in command_limits:
-                command_limits[user_id] = []
-
-            timestamps = command_limits[user_id]
-            timestamps = [t for t in timestamps if now - t < seconds]
-            command_limits[user_id] = timestamps
-
-            if len(timestamps) >= rate:
+            if retry_at is not None:
                 if not interaction.response.is_done():
                     await interaction.response.defer(thinking=True)
 
-                retry_after = seconds - (now - timestamps[0])
-                retry_timestamp = int(now + retry_after)
+                retry_timestamp = int(retry_at)
 
                 logger.debug(
                     f"Rate limit hit: {interaction.user.display_name} for {func.__name__} "
@@ -62,8 +179,6 @@ def rate_limit(rate: int = 1, seconds: int = 3600):
                 )
                 return await send_ephemeral_error(interaction, message)
 
-            timestamps.append(now)
-
             return await func(*args, **kwargs)
 
         return wrapper
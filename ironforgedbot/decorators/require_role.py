@@ -5,6 +5,12 @@ import discord
 
 from ironforgedcore.common.roles import ROLE
 from ironforgedbot.common.roles_discord import check_member_has_role
+from ironforgedbot.common.spans import (
+    PHASE_DISCORD,
+    PHASE_ROLES,
+    command_span,
+    span_phase,
+)
 from ironforgedbot.state import STATE
 
 logger = logging.getLogger(__name__)
@@ -46,25 +52,32 @@ def require_role(role: ROLE, ephemeral: bool = False):
                     )
                 )
 
-            member = interaction.guild.get_member(interaction.user.id)
-            if not member:
-                raise ValueError(
-                    f"Unable to verify caller's guild membership ({func.__name__})"
-                )
-
-            if not check_member_has_role(member, role, or_higher=True):
-                logger.warning(
-                    f"Access denied: {interaction.user.display_name} tried {func.__name__} without {role} role"
-                )
-                raise discord.app_commands.CheckFailure(
-                    f"Member '{normalize_discord_string(interaction.user.display_name)}' "
-                    f"tried using '{func.__name__}' but does not have permission"
-                )
+            # Joined by log_command_execution, so role checks count towards
+            # the command's span even though this decorator runs first
+            with command_span(func.__name__, str(interaction.user)):
+                with span_phase(PHASE_ROLES):
+                    member = interaction.guild.get_member(interaction.user.id)
+                    if not member:
+                        raise ValueError(
+                            f"Unable to verify caller's guild membership ({func.__name__})"
+                        )
+
+                    has_role = check_member_has_role(member, role, or_higher=True)
+
+                if not has_role:
+                    logger.warning(
+                        f"Access denied: {interaction.user.display_name} tried {func.__name__} without {role} role"
+                    )
+                    raise discord.app_commands.CheckFailure(
+                        f"Member '{normalize_discord_string(interaction.user.display_name)}' "
+                        f"tried using '{func.__name__}' but does not have permission"
+                    )
 
-            if not interaction.response.is_done():
-                await interaction.response.defer(ephemeral=ephemeral)
+                if not interaction.response.is_done():
+                    with span_phase(PHASE_DISCORD):
+                        await interaction.response.defer(ephemeral=ephemeral)
 
-            return await func(*args, **kwargs)
+                return await func(*args, **kwargs)
 
         return wrapper
 
@@ -3,15 +3,27 @@ import logging
 import discord
 from discord.ui import Button, View
 
-from ironforgedbot.common.helpers import find_emoji
-from ironforgedbot.common.responses import build_response_embed
 from ironforgedcore.database import db
-from ironforgedcore.services.ingot_service import IngotService
+from ironforgedbot.decorators.command_price import (
+    CONFIRMATION_TIMEOUT,
+    CommandRefundError,
+    close_reservation,
+)
+from ironforgedbot.services.ingot_reservation_service import (
+    IngotReservationService,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class CommandPriceConfirmationView(View):
+    """Confirms a command whose price has already been reserved.
+
+    Confirming runs the command, cancelling or timing out refunds the price.
+    Each outcome first claims the reservation recorded in state, so a prompt
+    already refunded at shutdown can't also be confirmed or refunded again.
+    """
+
     def __init__(
         self,
         cost: int,
@@ -20,8 +32,9 @@ class CommandPriceConfirmationView(View):
         original_kwargs: dict,
         command_name: str,
         user_id: int,
+        reservation_id: str,
     ):
-        super().__init__(timeout=30)
+        super().__init__(timeout=CONFIRMATION_TIMEOUT)
         self.cost = cost
         self.wrapped_function = wrapped_function
         self.original_args = original_args
@@ -29,6 +42,7 @@ class CommandPriceConfirmationView(View):
         self.command_name = command_name
         self.original_interaction = original_args[0]
         self.user_id = user_id
+        self.reservation_id = reservation_id
         self.confirmation_message = None
 
         confirm_button = Button(
@@ -51,40 +65,28 @@ class CommandPriceConfirmationView(View):
             return
 
         self.stop()
-
-        async with db.get_session() as session:
-            ingot_service = IngotService(session)
-            result = await ingot_service.try_remove_ingots(
-                button_interaction.user.id,
-                -self.cost,
-                None,
-                f"Command usage: {self.command_name}",
-            )
-
         self.clear_items()
 
-        ingot_icon = find_emoji("Ingot")
-
-        if not result.status:
-            await button_interaction.response.defer(ephemeral=True)
-            you_have_string = (
-                f"And you only have {ingot_icon} **{result.new_total:,}**."
-                if result.new_total > 0
-                else "You're skint mate 🤷‍♂️"
-            )
-            error_embed = build_response_embed(
-                title="❌ Insufficient Funds",
-                description=f"This command costs {ingot_icon} **{self.cost:,}**.\n\n{you_have_string}",
-                color=discord.Colour.red(),
+        if not close_reservation(self.reservation_id):
+            await button_interaction.response.send_message(
+                "This confirmation has expired and your ingots were refunded.",
+                ephemeral=True,
             )
-            await self.original_interaction.followup.send(embed=error_embed)
-            await self.confirmation_message.delete()
             return
 
         await button_interaction.response.defer(ephemeral=True)
         await self.confirmation_message.delete()
 
-        await self.wrapped_function(*self.original_args, **self.original_kwargs)
+        try:
+            await self.wrapped_function(*self.original_args, **self.original_kwargs)
+        except CommandRefundError as e:
+            from ironforgedbot.common.responses import send_error_response
+
+            await self._return_ingots()
+            await send_error_response(
+                self.original_interaction,
+                f"{e.message}\nYour {self.cost:,} ingots have been refunded.",
+            )
 
     async def on_cancel(self, button_interaction: discord.Interaction):
         if button_interaction.user.id != self.user_id:
@@ -96,9 +98,22 @@ class CommandPriceConfirmationView(View):
         self.stop()
         await button_interaction.response.defer(ephemeral=True)
 
+        await self.refund()
         await self.confirmation_message.delete()
         await self.original_interaction.delete_original_response()
 
     async def on_timeout(self):
+        await self.refund()
         await self.confirmation_message.delete()
         await self.original_interaction.delete_original_response()
+
+    async def refund(self):
+        """Refunds the reservation unless it was already settled."""
+        if close_reservation(self.reservation_id):
+            await self._return_ingots()
+
+    async def _return_ingots(self):
+        async with db.get_session() as session:
+            await IngotReservationService(session).refund(
+                self.user_id, self.cost, f"Command refund: {self.command_name}"
+            )
@@ -0,0 +1,90 @@
+import asyncio
+import functools
+import inspect
+from typing import Any, AsyncContextManager, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ironforgedcore.services.member_service import MemberService
+
+
+class _SerializedMemberService(MemberService):
+    """MemberService whose public coroutines hold the event's session lock.
+
+    An AsyncSession does not allow concurrent operations, so handlers running
+    side by side take turns per service call. Each call runs in its own
+    savepoint, so a failing call only discards its own writes; a full rollback
+    would expire the objects other handlers of the event still hold. Calls
+    made while the current task already holds the lock (a service method
+    calling another) run straight through.
+    """
+
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock):
+        super().__init__(session)
+        self._session = session
+        self._lock = lock
+        self._owner: Optional[asyncio.Task] = None
+
+    def __getattribute__(self, name: str) -> Any:
+        attr = super().__getattribute__(name)
+        if name.startswith("_") or not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def serialized(*args, **kwargs):
+            if self._owner is asyncio.current_task():
+                return await attr(*args, **kwargs)
+
+            async with self._lock:
+                self._owner = asyncio.current_task()
+                savepoint = await self._session.begin_nested()
+                try:
+                    result = await attr(*args, **kwargs)
+                    # A commit inside the call already released the savepoint
+                    if savepoint.is_active:
+                        await savepoint.commit()
+                    return result
+                except BaseException:
+                    if savepoint.is_active:
+                        await savepoint.rollback()
+                    raise
+                finally:
+                    self._owner = None
+
+        return serialized
+
+
+class EventSession:
+    """One database session shared by every handler of a single event.
+
+    Used as an async context manager. The session is opened on first use,
+    so events that no handler acts on never touch the connection pool.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], AsyncContextManager[AsyncSession]]
+    ):
+        self._session_factory = session_factory
+        self._open_lock = asyncio.Lock()
+        self._lock = asyncio.Lock()
+        self._session_context = None
+        self.session: Optional[AsyncSession] = None
+        self.service: Optional[MemberService] = None
+
+    async def open(self) -> tuple[AsyncSession, MemberService]:
+        async with self._open_lock:
+            if self.session is None:
+                self._session_context = self._session_factory()
+                self.session = await self._session_context.__aenter__()
+                self.service = _SerializedMemberService(self.session, self._lock)
+        return self.session, self.service
+
+    async def __aenter__(self) -> "EventSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._session_context is None:
+            return
+        context, self._session_context = self._session_context, None
+        self.session = self.service = None
+        await context.__aexit__(exc_type, exc, tb)
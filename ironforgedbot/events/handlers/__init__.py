@@ -1,8 +1,9 @@
 """Member update event handlers.
 
 Importing this module triggers registration of all handlers with the
-member_update_emitter. Handlers are sorted by priority and executed
-in order when a member update event is emitted.
+member_update_emitter. Handlers are grouped by priority and the groups run
+in order when a member update event is emitted; handlers sharing a priority
+run concurrently, so they must not depend on each other.
 """
 
 # Import all handlers to trigger their self-registration
@@ -24,6 +24,7 @@ class AddBannedRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 20
+    watched_roles = frozenset({BANNED_ROLE_NAME})
 
     @property
     def name(self) -> str:
@@ -21,6 +21,7 @@ class AddBlacklistedRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 20
+    watched_roles = frozenset({BLACKLISTED_ROLE_NAME})
 
     @property
     def name(self) -> str:
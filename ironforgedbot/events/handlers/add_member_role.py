@@ -28,6 +28,7 @@ logger = logging.getLogger(__name__)
 
 class AddMemberRoleHandler(BaseMemberUpdateHandler):
     priority = 10
+    watched_roles = frozenset({ROLE.MEMBER})
 
     @property
     def name(self) -> str:
@@ -24,6 +24,7 @@ class AddProspectRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 20
+    watched_roles = frozenset({PROSPECT_ROLE_NAME})
 
     @property
     def name(self) -> str:
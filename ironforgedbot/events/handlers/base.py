@@ -1,11 +1,12 @@
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ironforgedcore.database import db
+from ironforgedbot.events.event_session import EventSession
 from ironforgedbot.events.member_events import MemberUpdateContext
 from ironforgedcore.services.member_service import MemberService
 
@@ -14,6 +15,10 @@ logger = logging.getLogger(__name__)
 
 class BaseMemberUpdateHandler(ABC):
     priority: int = 50  # Lower runs first
+    # Role names whose addition or removal this handler reacts to. The
+    # emitter only asks should_handle when one of them changed; None means
+    # it is asked for every event.
+    watched_roles: Optional[FrozenSet[str]] = None
 
     @property
     @abstractmethod
@@ -70,26 +75,36 @@ class BaseMemberUpdateHandler(ABC):
         logger.error(f"Handler {self.name} failed: {error}")
         return f":warning: **{self.name}** encountered an error: {error}"
 
-    async def handle(self, context: MemberUpdateContext) -> None:
+    async def handle(
+        self,
+        context: MemberUpdateContext,
+        event_session: Optional[EventSession] = None,
+    ) -> None:
         """Execute the handler with timing, session management, and error handling.
 
+        `event_session` is shared with the other handlers of the same event;
+        without one the handler opens and closes its own session.
+
         Do not override this method. Implement _execute() instead.
         """
-        start_time = time.perf_counter()
+        if event_session is None:
+            async with EventSession(db.get_session) as event_session:
+                return await self.handle(context, event_session)
 
-        async with db.get_session() as session:
-            service = MemberService(session)
-
-            try:
-                message = await self._execute(context, session, service)
-                if message:
-                    await context.report_channel.send(message)
-            except Exception as e:
-                error_message = await self._on_error(context, e)
-                if error_message:
-                    end_time = time.perf_counter()
-                    duration_ms = (end_time - start_time) * 1000
-                    await context.report_channel.send(
-                        f"{error_message} ({duration_ms:.0f}ms)"
-                    )
-                raise
+        start_time = time.perf_counter()
+        session, service = await event_session.open()
+
+        try:
+            message = await self._execute(context, session, service)
+            if message:
+                await context.report_channel.send(message)
+        except Exception as e:
+            # The failed service call already rolled back its own savepoint
+            error_message = await self._on_error(context, e)
+            if error_message:
+                end_time = time.perf_counter()
+                duration_ms = (end_time - start_time) * 1000
+                await context.report_channel.send(
+                    f"{error_message} ({duration_ms:.0f}ms)"
+                )
+            raise
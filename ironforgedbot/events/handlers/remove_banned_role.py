@@ -21,6 +21,7 @@ class RemoveBannedRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 20
+    watched_roles = frozenset({BANNED_ROLE_NAME})
 
     @property
     def name(self) -> str:
@@ -20,6 +20,7 @@ class RemoveBlacklistedRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 20
+    watched_roles = frozenset({BLACKLISTED_ROLE_NAME})
 
     @property
     def name(self) -> str:
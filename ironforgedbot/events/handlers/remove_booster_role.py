@@ -20,6 +20,7 @@ class RemoveBoosterRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 20
+    watched_roles = frozenset({BOOSTER_ROLE_NAME})
 
     @property
     def name(self) -> str:
@@ -24,6 +24,7 @@ class RemoveMemberRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 10
+    watched_roles = frozenset({ROLE.MEMBER})
 
     @property
     def name(self) -> str:
@@ -20,6 +20,7 @@ class RemoveProspectRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 20
+    watched_roles = frozenset({PROSPECT_ROLE_NAME})
 
     @property
     def name(self) -> str:
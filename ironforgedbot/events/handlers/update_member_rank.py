@@ -24,17 +24,15 @@ class UpdateMemberRankHandler(BaseMemberUpdateHandler):
     """
 
     priority = 30
+    watched_roles = frozenset(RANK.list())
 
     @property
     def name(self) -> str:
         return "UpdateMemberRank"
 
     def should_handle(self, context: MemberUpdateContext) -> bool:
-        rank_roles = set(RANK.list())
-        has_rank_change = bool(
-            rank_roles & (context.roles_added | context.roles_removed)
-        )
-        return has_rank_change and check_member_has_role(context.after, ROLE.MEMBER)
+        has_change = bool(self.watched_roles & context.roles_touched)
+        return has_change and check_member_has_role(context.after, ROLE.MEMBER)
 
     async def _execute(
         self,
@@ -24,17 +24,15 @@ class UpdateMemberRoleHandler(BaseMemberUpdateHandler):
     """
 
     priority = 40
+    watched_roles = frozenset(ROLE.list())
 
     @property
     def name(self) -> str:
         return "UpdateMemberRole"
 
     def should_handle(self, context: MemberUpdateContext) -> bool:
-        role_values = set(ROLE.list())
-        has_role_change = bool(
-            role_values & (context.roles_added | context.roles_removed)
-        )
-        return has_role_change and check_member_has_role(context.after, ROLE.MEMBER)
+        has_change = bool(self.watched_roles & context.roles_touched)
+        return has_change and check_member_has_role(context.after, ROLE.MEMBER)
 
     async def _execute(
         self,
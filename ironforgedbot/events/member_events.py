@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, Set
+from functools import cached_property
+from typing import FrozenSet, Optional
 
 import discord
 
@@ -17,24 +18,35 @@ class MemberUpdateContext:
         """Discord ID of the member being updated"""
         return self.after.id
 
-    @property
-    def roles_added(self) -> Set[str]:
+    # Role diffs are computed on first use and cached; every handler's
+    # should_handle reads them for each event.
+    @cached_property
+    def _before_role_names(self) -> FrozenSet[str]:
+        return frozenset(r.name for r in self.before.roles)
+
+    @cached_property
+    def _after_role_names(self) -> FrozenSet[str]:
+        return frozenset(r.name for r in self.after.roles)
+
+    @cached_property
+    def roles_added(self) -> FrozenSet[str]:
         """Set of role names that were added"""
-        before_roles = {r.name for r in self.before.roles}
-        after_roles = {r.name for r in self.after.roles}
-        return after_roles - before_roles
+        return self._after_role_names - self._before_role_names
 
-    @property
-    def roles_removed(self) -> Set[str]:
+    @cached_property
+    def roles_removed(self) -> FrozenSet[str]:
         """Set of role names that were removed"""
-        before_roles = {r.name for r in self.before.roles}
-        after_roles = {r.name for r in self.after.roles}
-        return before_roles - after_roles
+        return self._before_role_names - self._after_role_names
+
+    @cached_property
+    def roles_touched(self) -> FrozenSet[str]:
+        """Set of role names that were added or removed"""
+        return self.roles_added | self.roles_removed
 
     @property
     def roles_changed(self) -> bool:
         """Whether any roles were added or removed"""
-        return bool(self.roles_added or self.roles_removed)
+        return bool(self.roles_touched)
 
     @property
     def nickname_changed(self) -> bool:
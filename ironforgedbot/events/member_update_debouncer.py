@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 300
+DEFAULT_MAX_DELAY_MS = 1500
+
+Dispatch = Callable[[discord.Member, discord.Member], Awaitable[None]]
+
+
+@dataclass
+class _PendingUpdate:
+    before: discord.Member
+    after: discord.Member
+    dispatch: Dispatch
+    first_seen: float
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+def _has_net_change(before: discord.Member, after: discord.Member) -> bool:
+    """Whether anything member update handlers look at differs."""
+    if before.nick != after.nick:
+        return True
+    return {r.id for r in before.roles} != {r.id for r in after.roles}
+
+
+class MemberUpdateDebouncer:
+    """Merges bursts of on_member_update events into one net change per member.
+
+    Bulk role assignment makes Discord fire several updates for a member
+    within milliseconds. Each update restarts a short per-member window; when
+    it expires the first `before` and latest `after` are dispatched once.
+    A member that keeps changing is dispatched after `max_delay_ms` at the
+    latest. Bursts that cancel out (a role added then removed) are dropped.
+    """
+
+    def __init__(
+        self,
+        window_ms: int = DEFAULT_WINDOW_MS,
+        max_delay_ms: int = DEFAULT_MAX_DELAY_MS,
+    ):
+        self.window = window_ms / 1000
+        self.max_delay = max_delay_ms / 1000
+        self._pending: Dict[int, _PendingUpdate] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._received = 0
+        self._merged = 0
+        self._dispatched = 0
+        self._dropped = 0
+
+    def submit(
+        self, before: discord.Member, after: discord.Member, dispatch: Dispatch
+    ) -> None:
+        """Queues an update, merging it with any pending update for the member."""
+        self._received += 1
+        now = time.monotonic()
+
+        pending = self._pending.get(after.id)
+        if pending is None:
+            pending = _PendingUpdate(before, after, dispatch, first_seen=now)
+            self._pending[after.id] = pending
+        else:
+            self._merged += 1
+            pending.after = after
+            pending.dispatch = dispatch
+            pending.timer.cancel()
+
+        delay = min(self.window, pending.first_seen + self.max_delay - now)
+        pending.timer = asyncio.get_running_loop().call_later(
+            max(delay, 0), self._fire, after.id
+        )
+
+    def _fire(self, discord_id: int) -> None:
+        pending = self._pending.pop(discord_id, None)
+        if pending is None:
+            return
+
+        task = asyncio.create_task(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: _PendingUpdate) -> None:
+        if not _has_net_change(pending.before, pending.after):
+            self._dropped += 1
+            logger.debug(f"Dropped member update with no net change: {pending.after}")
+            return
+
+        self._dispatched += 1
+        try:
+            await pending.dispatch(pending.before, pending.after)
+        except Exception as e:
+            logger.exception(f"Member update dispatch failed: {e}")
+
+    async def flush(self) -> None:
+        """Dispatches every pending update now and waits for all dispatches."""
+        for discord_id, pending in list(self._pending.items()):
+            pending.timer.cancel()
+            self._fire(discord_id)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        """Returns counts of received, merged, dispatched and dropped events."""
+        return {
+            "received": self._received,
+            "merged": self._merged,
+            "dispatched": self._dispatched,
+            "dropped": self._dropped,
+            "pending": len(self._pending),
+        }
+
+
+member_update_debouncer = MemberUpdateDebouncer()
@@ -1,8 +1,16 @@
 import asyncio
+import itertools
 import logging
 import time
-from typing import TYPE_CHECKING, Dict, List
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Set
 
+import discord
+
+from ironforgedbot.common.latency import LatencyRegistry
+from ironforgedbot.config import CONFIG
+from ironforgedcore.database import db
+from ironforgedbot.events.event_session import EventSession
 from ironforgedbot.events.member_events import HandlerResult, MemberUpdateContext
 
 if TYPE_CHECKING:
@@ -11,12 +19,33 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 DEFAULT_SUPPRESSION_DURATION_MS = 2000
+SLOW_HANDLER_MIN_SAMPLES = 20  # p95 of fewer runs is too noisy to alert on
+SLOW_HANDLER_ALERT_COOLDOWN_SECONDS = 3600
 
 
 class MemberUpdateEmitter:
+    """Dispatches member update events to registered handlers.
+
+    Events for the same member are handled one at a time, events for
+    different members run concurrently. Within an event, handlers sharing a
+    priority form a tier and run concurrently; tiers run in priority order.
+    All handlers of an event share one database session. Handlers are
+    indexed by their watched roles, so should_handle is only asked of those
+    watching a role that changed, plus those watching no role in particular.
+
+    Handler durations are recorded in `latencies`; a handler whose p95 goes
+    over CONFIG.HANDLER_P95_BUDGET_MS is reported to the event's report
+    channel, at most once per cooldown.
+    """
+
     def __init__(self):
         self._handlers: List["BaseMemberUpdateHandler"] = []
-        self._lock = asyncio.Lock()
+        self._role_index: Dict[str, List["BaseMemberUpdateHandler"]] = {}
+        self._unindexed: List["BaseMemberUpdateHandler"] = []
+        self._member_locks: Dict[int, asyncio.Lock] = {}
+        self._member_lock_users: Dict[int, int] = {}
+        self.latencies = LatencyRegistry()
+        self._last_slow_alert: Dict[str, float] = {}
         self._suppressions: Dict[int, float] = {}  # discord_id -> expiry time
         self._sorted = False
 
@@ -59,43 +88,131 @@ class MemberUpdateEmitter:
     def _ensure_sorted(self) -> None:
         if not self._sorted:
             self._handlers.sort(key=lambda h: h.priority)
+            self._role_index = {}
+            self._unindexed = []
+            for handler in self._handlers:
+                if handler.watched_roles is None:
+                    self._unindexed.append(handler)
+                    continue
+                for role in handler.watched_roles:
+                    self._role_index.setdefault(role, []).append(handler)
             self._sorted = True
 
+    def _candidates(
+        self, context: MemberUpdateContext
+    ) -> List["BaseMemberUpdateHandler"]:
+        """Handlers that may care about this event, in priority order."""
+        if not context.roles_touched:
+            return self._unindexed
+
+        selected: Set[int] = {id(h) for h in self._unindexed}
+        for role in context.roles_touched:
+            selected.update(id(h) for h in self._role_index.get(role, ()))
+        return [h for h in self._handlers if id(h) in selected]
+
+    @asynccontextmanager
+    async def _member_lock(self, discord_id: int) -> AsyncIterator[None]:
+        """Serializes events per member, dropping the lock once unused."""
+        lock = self._member_locks.setdefault(discord_id, asyncio.Lock())
+        self._member_lock_users[discord_id] = (
+            self._member_lock_users.get(discord_id, 0) + 1
+        )
+        try:
+            async with lock:
+                yield
+        finally:
+            self._member_lock_users[discord_id] -= 1
+            if self._member_lock_users[discord_id] == 0:
+                del self._member_lock_users[discord_id]
+                del self._member_locks[discord_id]
+
+    async def _run_handler(
+        self,
+        handler: "BaseMemberUpdateHandler",
+        context: MemberUpdateContext,
+        event_session: EventSession,
+    ) -> HandlerResult:
+        start_time = time.perf_counter()
+        try:
+            await handler.handle(context, event_session)
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            return HandlerResult(
+                handler_name=handler.name,
+                success=True,
+                duration_ms=duration_ms,
+            )
+        except Exception as e:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            logger.exception(f"Handler {handler.name} failed: {e}")
+            return HandlerResult(
+                handler_name=handler.name,
+                success=False,
+                duration_ms=duration_ms,
+                error=e,
+            )
+
     async def emit(self, context: MemberUpdateContext) -> List[HandlerResult]:
-        async with self._lock:
+        async with self._member_lock(context.discord_id):
             if self._is_suppressed(context.discord_id):
                 return []
             self._ensure_sorted()
             results: List[HandlerResult] = []
 
-            for handler in self._handlers:
-                if not handler.should_handle(context):
-                    continue
-
-                start_time = time.perf_counter()
-                try:
-                    await handler.handle(context)
-                    duration_ms = (time.perf_counter() - start_time) * 1000
-                    results.append(
-                        HandlerResult(
-                            handler_name=handler.name,
-                            success=True,
-                            duration_ms=duration_ms,
-                        )
-                    )
-                except Exception as e:
-                    duration_ms = (time.perf_counter() - start_time) * 1000
-                    logger.exception(f"Handler {handler.name} failed: {e}")
-                    results.append(
-                        HandlerResult(
-                            handler_name=handler.name,
-                            success=False,
-                            duration_ms=duration_ms,
-                            error=e,
+            async with EventSession(db.get_session) as event_session:
+                for _, tier in itertools.groupby(
+                    self._candidates(context), key=lambda h: h.priority
+                ):
+                    matching = [h for h in tier if h.should_handle(context)]
+                    results.extend(
+                        await asyncio.gather(
+                            *(
+                                self._run_handler(handler, context, event_session)
+                                for handler in matching
+                            )
                         )
                     )
 
+            for result in results:
+                self.latencies.record(result.handler_name, result.duration_ms)
+            await self._alert_slow_handlers(context, results)
+
             return results
 
+    async def _alert_slow_handlers(
+        self, context: MemberUpdateContext, results: List[HandlerResult]
+    ) -> None:
+        budget_ms = CONFIG.HANDLER_P95_BUDGET_MS
+        now = time.time()
+
+        for result in results:
+            histogram = self.latencies.get(result.handler_name)
+            if histogram is None or histogram.window_size < SLOW_HANDLER_MIN_SAMPLES:
+                continue
+
+            p95 = histogram.percentile(95)
+            if p95 is None or p95 <= budget_ms:
+                continue
+
+            last_alert = self._last_slow_alert.get(result.handler_name)
+            if (
+                last_alert is not None
+                and now - last_alert < SLOW_HANDLER_ALERT_COOLDOWN_SECONDS
+            ):
+                continue
+
+            self._last_slow_alert[result.handler_name] = now
+            logger.warning(
+                f"Handler {result.handler_name} p95 {p95:.0f}ms exceeds "
+                f"{budget_ms}ms budget"
+            )
+            try:
+                await context.report_channel.send(
+                    f":warning: Member update handler **{result.handler_name}** "
+                    f"is slow: p95 **{p95:.0f}ms** over the last "
+                    f"{histogram.window_size} runs (budget {budget_ms}ms)."
+                )
+            except discord.HTTPException as e:
+                logger.error(f"Unable to send slow handler alert: {e}")
+
 
 member_update_emitter = MemberUpdateEmitter()
@@ -0,0 +1,184 @@
+"""Run a load test against the command callbacks, entirely offline.
+
+    python -m ironforgedbot.loadtest --rate 10 --duration 120 --scale 2
+
+Needs the data files (see `--data-dir`) for score calculation but no Discord
+token, database, hiscores or WOM access. Any configuration missing from the
+environment or `.env` is filled with placeholders.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+OFFLINE_DEFAULTS = {
+    "ENVIRONMENT": "dev",
+    "TEMP_DIR": "./temp",
+    "SHEET_ID": "loadtest",
+    "GUILD_ID": "1",
+    "BOT_TOKEN": "loadtest",
+    "WOM_API_KEY": "loadtest",
+    "WOM_GROUP_ID": "1",
+    "AUTOMATION_CHANNEL_ID": "1",
+    "RAFFLE_CHANNEL_ID": "1",
+    "INGOT_SHOP_CHANNEL_ID": "1",
+    "RULES_CHANNEL_ID": "1",
+    "RANKINGS_CHANNEL_ID": "1",
+    "BOT_COMMANDS_CHANNEL_ID": "1",
+    "BOT_CHANGELOG_CHANNEL_ID": "1",
+    "CREATE_TICKET_CHANNEL_ID": "1",
+    "DB_ROOT": "loadtest",
+    "DB_USER": "loadtest",
+    "DB_PASS": "loadtest",
+    "DB_NAME": "loadtest",
+}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """`score=5,check=1` to {"score": 5.0, "check": 1.0}."""
+    mix = {}
+    for part in filter(None, (part.strip() for part in value.split(","))):
+        name, sep, weight = part.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Expected name=weight, got '{part}'")
+        try:
+            mix[name.strip()] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight in '{part}'")
+    return mix
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m ironforgedbot.loadtest",
+        description="Drive the score, check, leaderboard and autocomplete "
+        "callbacks with simulated members and local stand-ins for hiscores, "
+        "Wise Old Man and the database.",
+    )
+    parser.add_argument("--rate", type=float, default=5.0, help="requests/second")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="member count multiplier, 1.0 is the clan's current size",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default={},
+        help="scenario weights, e.g. score=5,check=2,leaderboard=1,autocomplete=2",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hiscores-latency-ms", type=float, default=250.0)
+    parser.add_argument("--wom-latency-ms", type=float, default=400.0)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    parser.add_argument("--discord-latency-ms", type=float, default=80.0)
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="share of hiscores/WOM calls that fail",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=0.0,
+        help="share of hiscores/WOM calls that are rate limited",
+    )
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument(
+        "--spans",
+        type=int,
+        default=5,
+        help="slowest requests to break down by phase, 0 to skip",
+    )
+    parser.add_argument("--json", help="also write the summary to this file")
+    parser.add_argument("--log-level", default="ERROR")
+    return parser
+
+
+async def _run(args: argparse.Namespace):
+    from reactionmenu import ViewMenu
+
+    from ironforgedbot.loadtest.fakes import build_guild
+    from ironforgedbot.loadtest.harness import (
+        LoadTestOptions,
+        default_scenarios,
+        run_load,
+    )
+    from ironforgedbot.loadtest.standins import install_standins
+    from ironforgedbot.loadtest.upstream import UpstreamProfile
+
+    options = LoadTestOptions(
+        rate=args.rate,
+        duration_s=args.duration,
+        discord_latency_ms=args.discord_latency_ms,
+        mix=args.mix,
+        seed=args.seed,
+    )
+
+    def profile(latency_ms: float, salt: int) -> UpstreamProfile:
+        return UpstreamProfile(
+            latency_ms=latency_ms,
+            latency_jitter_ms=latency_ms * 0.5,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=args.seed + salt,
+        )
+
+    guild = build_guild(args.scale)
+    with install_standins(
+        guild,
+        hiscores=profile(args.hiscores_latency_ms, 1),
+        wom=profile(args.wom_latency_ms, 2),
+        db_latency_ms=args.db_latency_ms,
+    ) as standins:
+        try:
+            result = await run_load(guild, default_scenarios(guild), options)
+        finally:
+            await ViewMenu.stop_all_sessions()
+
+    return result, standins
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    load_dotenv()
+    for key, value in OFFLINE_DEFAULTS.items():
+        if not os.getenv(key):
+            os.environ[key] = value
+    logging.basicConfig(level=args.log_level.upper())
+
+    from ironforgedbot.common.spans import SPANS, format_slowest_report
+    from ironforgedcore.storage.data import load_and_set
+
+    load_and_set(args.data_dir)
+    SPANS.clear()
+
+    result, standins = asyncio.run(_run(args))
+
+    print(result.format_report())
+    print(
+        f"\nUpstream calls: hiscores {standins.hiscores.calls}, "
+        f"WOM {standins.wom.calls}, database {standins.db.queries}"
+    )
+    if args.spans > 0:
+        print("\n" + format_slowest_report(args.spans))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result.summary(), f, indent=2)
+
+    return 1 if result.exceptions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
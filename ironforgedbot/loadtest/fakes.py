@@ -0,0 +1,246 @@
+"""Minimal Discord objects for driving command callbacks without a gateway."""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import discord
+
+from ironforgedcore.common.ranks import RANK
+from ironforgedcore.common.role_names import PROSPECT_ROLE_NAME
+from ironforgedcore.common.roles import ROLE
+from ironforgedbot.loadtest.upstream import member_nickname, player_rng
+
+BASE_MEMBER_COUNT = 500  # roughly the clan's current Discord membership
+PROSPECT_SHARE = 0.05
+LEADERSHIP_SHARE = 0.02
+
+_ids = itertools.count(10_000_000)
+
+
+@dataclass(eq=False)
+class FakeRole:
+    name: str
+    position: int = 0
+    id: int = field(default_factory=lambda: next(_ids))
+
+    @property
+    def mention(self) -> str:
+        return f"<@&{self.id}>"
+
+    def is_bot_managed(self) -> bool:
+        return False
+
+
+@dataclass(eq=False)
+class FakeMember:
+    name: str
+    nick: Optional[str]
+    roles: List[FakeRole]
+    bot: bool = False
+    id: int = field(default_factory=lambda: next(_ids))
+
+    @property
+    def display_name(self) -> str:
+        return self.nick or self.name
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class FakeGuild:
+    def __init__(self, members: List[FakeMember], roles: List[FakeRole]):
+        self.id = next(_ids)
+        self.name = "Iron Forged (load test)"
+        self.members = members
+        self.roles = roles
+        self.default_role = FakeRole("@everyone")
+        self.emojis: List[Any] = []
+        self.channels: List[Any] = []
+        self.text_channels: List[Any] = []
+        self.voice_channels: List[Any] = []
+        self.threads: List[Any] = []
+        self._by_id = {member.id: member for member in members}
+
+    @property
+    def member_count(self) -> int:
+        return len(self.members)
+
+    def get_member(self, member_id: int) -> Optional[FakeMember]:
+        return self._by_id.get(member_id)
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return next((role for role in self.roles if role.id == role_id), None)
+
+    def get_channel(self, channel_id: int) -> None:
+        return None
+
+
+def build_guild(scale: float = 1.0) -> FakeGuild:
+    """A guild of BASE_MEMBER_COUNT * scale members with a spread of ranks."""
+    member_roles = {
+        name: FakeRole(name, position=i)
+        for i, name in enumerate(
+            [ROLE.MEMBER, PROSPECT_ROLE_NAME, ROLE.LEADERSHIP, *[r.value for r in RANK]]
+        )
+    }
+    ranks = [rank.value for rank in RANK]
+
+    members = []
+    for i in range(max(int(BASE_MEMBER_COUNT * scale), 1)):
+        nick = member_nickname(i)
+        rng = player_rng(nick, "discord")
+        roles = [member_roles[ROLE.MEMBER], member_roles[rng.choice(ranks)]]
+        roll = rng.random()
+        if roll < PROSPECT_SHARE:
+            roles.append(member_roles[PROSPECT_ROLE_NAME])
+        elif roll < PROSPECT_SHARE + LEADERSHIP_SHARE:
+            roles.append(member_roles[ROLE.LEADERSHIP])
+        members.append(FakeMember(name=nick.lower(), nick=nick, roles=roles))
+
+    return FakeGuild(members, list(member_roles.values()))
+
+
+class FakeMessage:
+    def __init__(self, sent: "SentMessages"):
+        self.id = next(_ids)
+        self._sent = sent
+
+    async def edit(self, **kwargs) -> "FakeMessage":
+        await self._sent.round_trip()
+        self._sent.record("edit", kwargs)
+        return self
+
+    async def delete(self, **kwargs) -> None:
+        await self._sent.round_trip()
+
+
+class SentMessages:
+    """Everything a command sent back, with a simulated Discord round trip."""
+
+    def __init__(self, latency_ms: float):
+        self.latency_ms = latency_ms
+        self.messages: List[Dict[str, Any]] = []
+        self.first_response_at: Optional[float] = None
+
+    async def round_trip(self) -> None:
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+    def record(self, kind: str, kwargs: Dict[str, Any]) -> None:
+        if self.first_response_at is None:
+            self.first_response_at = time.perf_counter()
+        self.messages.append({"kind": kind, **kwargs})
+
+    @property
+    def embeds(self) -> List[discord.Embed]:
+        embeds = []
+        for message in self.messages:
+            if message.get("embed") is not None:
+                embeds.append(message["embed"])
+            embeds.extend(message.get("embeds") or [])
+        return embeds
+
+
+class FakeResponse:
+    def __init__(self, sent: SentMessages):
+        self._sent = sent
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, **kwargs) -> None:
+        await self._sent.round_trip()
+        self._done = True
+        self._sent.record("defer", kwargs)
+
+    async def send_message(self, content: Optional[str] = None, **kwargs) -> None:
+        await self._sent.round_trip()
+        self._done = True
+        self._sent.record("response", {"content": content, **kwargs})
+
+    async def edit_message(self, **kwargs) -> None:
+        await self._sent.round_trip()
+        self._done = True
+        self._sent.record("edit", kwargs)
+
+
+class FakeFollowup:
+    def __init__(self, sent: SentMessages):
+        self._sent = sent
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> FakeMessage:
+        await self._sent.round_trip()
+        self._sent.record("followup", {"content": content, **kwargs})
+        return FakeMessage(self._sent)
+
+
+class FakeInteraction(discord.Interaction):
+    """A slash command interaction from `user`, answered by SentMessages.
+
+    Subclasses discord.Interaction so the isinstance checks in the command
+    decorators pass, but never touches the gateway or HTTP state.
+    """
+
+    def __init__(
+        self,
+        guild: FakeGuild,
+        user: FakeMember,
+        discord_latency_ms: float = 0.0,
+        data: Optional[Dict[str, Any]] = None,
+    ):
+        self.id = next(_ids)
+        self.type = discord.InteractionType.application_command
+        self.guild_id = guild.id
+        self.channel = None
+        self.data = data
+        self.application_id = 0
+        self.message = None
+        self.user = user
+        self.token = ""
+        self.extras = {}
+        self.command_failed = False
+        self._guild = guild
+        self.sent = SentMessages(discord_latency_ms)
+        self._response = FakeResponse(self.sent)
+        self._followup = FakeFollowup(self.sent)
+
+    @property
+    def guild(self) -> FakeGuild:  # type: ignore[override]
+        return self._guild
+
+    @property
+    def channel_id(self) -> int:  # type: ignore[override]
+        return 0
+
+    @property
+    def client(self) -> Any:  # type: ignore[override]
+        return None
+
+    @property
+    def command(self) -> None:  # type: ignore[override]
+        return None
+
+    @property
+    def response(self) -> FakeResponse:  # type: ignore[override]
+        return self._response
+
+    @property
+    def followup(self) -> FakeFollowup:  # type: ignore[override]
+        return self._followup
+
+    async def original_response(self) -> FakeMessage:  # type: ignore[override]
+        return FakeMessage(self.sent)
+
+    async def delete_original_response(self) -> None:
+        await self.sent.round_trip()
+
+    def __repr__(self) -> str:
+        return f"<FakeInteraction id={self.id} user={self.user}>"
@@ -0,0 +1,298 @@
+"""Open-model load generator for the slash command callbacks.
+
+Requests arrive as a Poisson process at a fixed rate regardless of how fast
+earlier ones finish, so a slow command shows up as growing latency and in
+flight counts, the way it would with real users, instead of quietly lowering
+the request rate like a closed loop of virtual users does.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from tabulate import tabulate
+
+from ironforgedbot.common.latency import LatencyRegistry
+from ironforgedbot.loadtest.fakes import FakeGuild, FakeInteraction
+
+logger = logging.getLogger(__name__)
+
+ACK_DEADLINE_MS = 3000  # Discord invalidates interactions not answered in 3s
+ERROR_EMBED_TITLE = ":exclamation: Error"
+RESULT_WINDOW = 100_000  # keep every sample of a run for exact percentiles
+
+RESULT_OK = "ok"
+RESULT_ERROR_RESPONSE = "error_response"
+RESULT_EXCEPTION = "exception"
+
+OUTSIDER_SHARE = 0.1  # lookups of players who are not in the Discord server
+
+ScenarioRun = Callable[[FakeInteraction, random.Random], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    weight: float
+    run: ScenarioRun
+
+
+def default_scenarios(guild: FakeGuild) -> List[Scenario]:
+    """The commands members use most, weighted by how often they run."""
+    from discord import app_commands
+
+    from ironforgedbot.commands.check.cmd_check import cmd_check
+    from ironforgedbot.commands.hiscore.cmd_score import cmd_score
+    from ironforgedbot.commands.leaderboard.cmd_leaderboard import cmd_leaderboard
+    from ironforgedbot.common.autocompletes import member_nickname_autocomplete
+
+    nicknames = [member.display_name for member in guild.members if member.nick]
+    leaderboards = [
+        app_commands.Choice(name="Score Leaderboard", value="score"),
+        app_commands.Choice(name="Ingot Leaderboard", value="ingots"),
+        app_commands.Choice(name="Staff Leaderboard", value="staff"),
+    ]
+
+    def pick_player(rng: random.Random) -> Optional[str]:
+        roll = rng.random()
+        if roll < OUTSIDER_SHARE:
+            return f"Outsider{rng.randint(0, 9999)}"
+        if roll < 0.5:
+            return rng.choice(nicknames)
+        return None  # the caller's own nickname
+
+    async def score(interaction: FakeInteraction, rng: random.Random) -> None:
+        await cmd_score(interaction, pick_player(rng))
+
+    async def check(interaction: FakeInteraction, rng: random.Random) -> None:
+        await cmd_check(interaction, pick_player(rng))
+
+    async def leaderboard(interaction: FakeInteraction, rng: random.Random) -> None:
+        await cmd_leaderboard(
+            interaction, rng.choices(leaderboards, weights=(6, 3, 1))[0]
+        )
+
+    async def autocomplete(interaction: FakeInteraction, rng: random.Random) -> Any:
+        typed = rng.choice(nicknames)[: rng.randint(0, 8)]
+        return await member_nickname_autocomplete(interaction, typed)
+
+    return [
+        Scenario("score", 50, score),
+        Scenario("check", 20, check),
+        Scenario("leaderboard", 15, leaderboard),
+        Scenario("autocomplete", 15, autocomplete),
+    ]
+
+
+@dataclass
+class LoadTestOptions:
+    rate: float = 5.0  # requests per second
+    duration_s: float = 60.0
+    discord_latency_ms: float = 80.0
+    mix: Dict[str, float] = field(default_factory=dict)  # overrides weights
+    seed: Optional[int] = 0
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.duration_s <= 0:
+            raise ValueError(f"duration must be positive, got {self.duration_s}")
+
+
+@dataclass
+class LoadTestResult:
+    rate: float
+    members: int
+    elapsed_s: float = 0.0
+    max_in_flight: int = 0
+    latencies: LatencyRegistry = field(
+        default_factory=lambda: LatencyRegistry(window=RESULT_WINDOW)
+    )
+    ack_latencies: LatencyRegistry = field(
+        default_factory=lambda: LatencyRegistry(window=RESULT_WINDOW)
+    )
+    start_lag: LatencyRegistry = field(
+        default_factory=lambda: LatencyRegistry(window=RESULT_WINDOW)
+    )
+    results: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    late_acks: Counter = field(default_factory=Counter)
+    exceptions: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(sum(counts.values()) for counts in self.results.values())
+
+    def record(
+        self,
+        scenario: str,
+        result: str,
+        duration_ms: float,
+        ack_ms: float,
+    ) -> None:
+        self.results[scenario][result] += 1
+        self.latencies.record(scenario, duration_ms)
+        self.ack_latencies.record(scenario, ack_ms)
+        if ack_ms > ACK_DEADLINE_MS:
+            self.late_acks[scenario] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        lag = self.start_lag.get("start")
+        return {
+            "target_rate": self.rate,
+            "achieved_rate": (
+                round(self.total / self.elapsed_s, 2) if self.elapsed_s else 0.0
+            ),
+            "members": self.members,
+            "requests": self.total,
+            "elapsed_s": round(self.elapsed_s, 2),
+            "max_in_flight": self.max_in_flight,
+            "max_start_lag_ms": lag.snapshot()["max_ms"] if lag else None,
+            "scenarios": {
+                name: {
+                    **dict(self.results[name]),
+                    "late_acks": self.late_acks[name],
+                    "latency": histogram.snapshot(),
+                    "ack": self.ack_latencies.get(name).snapshot(),
+                }
+                for name, histogram in self.latencies.items()
+            },
+            "exceptions": dict(self.exceptions),
+        }
+
+    def format_report(self) -> str:
+        summary = self.summary()
+
+        def _ms(value: Optional[float]) -> str:
+            return f"{value:.0f}" if value is not None else "-"
+
+        rows = []
+        for name, histogram in self.latencies.items():
+            counts = self.results[name]
+            ack = self.ack_latencies.get(name)
+            rows.append(
+                [
+                    name,
+                    histogram.count,
+                    (
+                        f"{histogram.count / self.elapsed_s:.2f}"
+                        if self.elapsed_s
+                        else "-"
+                    ),
+                    counts[RESULT_OK],
+                    counts[RESULT_ERROR_RESPONSE],
+                    counts[RESULT_EXCEPTION],
+                    _ms(histogram.percentile(50)),
+                    _ms(histogram.percentile(95)),
+                    _ms(histogram.percentile(99)),
+                    _ms(histogram.percentile(100)),
+                    _ms(ack.percentile(95)),
+                    self.late_acks[name],
+                ]
+            )
+
+        lines = [
+            f"{summary['requests']} requests in {summary['elapsed_s']}s "
+            f"({summary['achieved_rate']}/s, target {self.rate}/s) "
+            f"against {self.members} members",
+            f"Peak in flight: {self.max_in_flight}, "
+            f"worst start lag: {_ms(summary['max_start_lag_ms'])}ms",
+            "",
+            tabulate(
+                rows,
+                headers=[
+                    "Scenario",
+                    "Requests",
+                    "Req/s",
+                    "OK",
+                    "Error reply",
+                    "Exception",
+                    "p50 ms",
+                    "p95 ms",
+                    "p99 ms",
+                    "Max ms",
+                    "Ack p95 ms",
+                    f"Ack > {ACK_DEADLINE_MS // 1000}s",
+                ],
+            ),
+        ]
+        if self.exceptions:
+            lines += ["", "Exceptions:"]
+            lines += [
+                f"  {count} x {name}" for name, count in self.exceptions.most_common()
+            ]
+        return "\n".join(lines)
+
+
+def _classify(interaction: FakeInteraction) -> str:
+    for embed in interaction.sent.embeds:
+        if embed.title == ERROR_EMBED_TITLE:
+            return RESULT_ERROR_RESPONSE
+    return RESULT_OK
+
+
+async def run_load(
+    guild: FakeGuild,
+    scenarios: List[Scenario],
+    options: LoadTestOptions,
+) -> LoadTestResult:
+    """Fires scenarios at `options.rate` for `options.duration_s`.
+
+    Waits for everything started within the duration to finish, so the
+    elapsed time includes the tail of slow requests.
+    """
+    weights = [
+        options.mix.get(scenario.name, scenario.weight) for scenario in scenarios
+    ]
+    if not any(weight > 0 for weight in weights):
+        raise ValueError("At least one scenario needs a positive weight")
+
+    rng = random.Random(options.seed)
+    members = [member for member in guild.members if member.nick]
+    result = LoadTestResult(rate=options.rate, members=len(guild.members))
+    in_flight: set[asyncio.Task] = set()
+
+    async def _one(scenario: Scenario, interaction: FakeInteraction) -> None:
+        start = time.perf_counter()
+        try:
+            await scenario.run(interaction, random.Random(rng.random()))
+            outcome = _classify(interaction)
+        except Exception as e:
+            logger.debug(f"{scenario.name} raised", exc_info=True)
+            result.exceptions[f"{scenario.name}: {type(e).__name__}"] += 1
+            outcome = RESULT_EXCEPTION
+        end = time.perf_counter()
+        acked = interaction.sent.first_response_at or end
+        result.record(
+            scenario.name, outcome, (end - start) * 1000, (acked - start) * 1000
+        )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    due = started
+    while True:
+        due += rng.expovariate(options.rate)
+        if due - started > options.duration_s:
+            break
+
+        delay = due - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        result.start_lag.record("start", max(loop.time() - due, 0.0) * 1000)
+
+        scenario = rng.choices(scenarios, weights=weights)[0]
+        interaction = FakeInteraction(
+            guild, rng.choice(members), options.discord_latency_ms
+        )
+        task = asyncio.create_task(_one(scenario, interaction))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+        result.max_in_flight = max(result.max_in_flight, len(in_flight))
+
+    if in_flight:
+        await asyncio.gather(*in_flight, return_exceptions=True)
+    result.elapsed_s = loop.time() - started
+    return result
@@ -0,0 +1,230 @@
+"""Local HTTP stand-in for OSRS hiscores and the Wise Old Man API.
+
+Serves the same deterministic data as the in-process stand-ins, over real
+HTTP, so the bot's own HTTP client and WOM service can be pointed at it with
+`HISCORES_URL` and `WOM_BASE_URL` and jobs like rank refresh and the activity
+check can be measured end to end:
+
+    python -m ironforgedbot.loadtest.server --port 8765 --members 500
+"""
+
+import argparse
+import asyncio
+import datetime
+from collections import Counter
+from typing import Any, List, Optional, Sequence
+
+from aiohttp import web
+
+from ironforgedbot.loadtest import upstream
+from ironforgedbot.loadtest.upstream import (
+    OUTCOME_ERROR,
+    OUTCOME_NOT_FOUND,
+    OUTCOME_RATE_LIMITED,
+    UpstreamProfile,
+)
+
+HISCORES_PATH = "/m=hiscore_oldschool/index_lite.json"
+WOM_PREFIX = "/v2"
+WOM_DEFAULT_LIMIT = 20
+WOM_MAX_LIMIT = 50
+
+
+class UpstreamServer:
+    """aiohttp app serving hiscores and WOM, with injected latency and errors.
+
+    `usernames` are the members of every WOM group. Player endpoints answer
+    for any name, so the bot's real member list works too.
+    """
+
+    def __init__(
+        self,
+        usernames: Sequence[str],
+        hiscores: Optional[UpstreamProfile] = None,
+        wom: Optional[UpstreamProfile] = None,
+    ):
+        self.usernames = list(usernames)
+        self.hiscores = hiscores or UpstreamProfile()
+        self.wom = wom or UpstreamProfile()
+        self.requests: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.add_routes(
+            [
+                web.get(HISCORES_PATH, self.hiscore),
+                web.get(f"{WOM_PREFIX}/groups/{{group_id}}", self.group_details),
+                web.get(f"{WOM_PREFIX}/groups/{{group_id}}/gained", self.group_gains),
+                web.get(f"{WOM_PREFIX}/players/{{username}}/gained", self.player_gains),
+                web.get(
+                    f"{WOM_PREFIX}/players/{{username}}/snapshots/timeline",
+                    self.snapshot_timeline,
+                ),
+                web.get(f"{WOM_PREFIX}/players/{{username}}/names", self.name_changes),
+            ]
+        )
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Starts serving and returns the base URL (port 0 picks a free one)."""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        return f"http://{host}:{bound_port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @staticmethod
+    def hiscores_url(base_url: str) -> str:
+        """Value for HISCORES_URL when the server runs at `base_url`."""
+        return f"{base_url}{HISCORES_PATH}?player={{rsn}}"
+
+    @staticmethod
+    def wom_base_url(base_url: str) -> str:
+        """Value for WOM_BASE_URL when the server runs at `base_url`."""
+        return f"{base_url}{WOM_PREFIX}"
+
+    @staticmethod
+    def _now() -> datetime.datetime:
+        return datetime.datetime.now(datetime.timezone.utc)
+
+    @staticmethod
+    def _wom_error(status: int, message: str) -> web.Response:
+        return web.json_response({"message": message}, status=status)
+
+    async def _wom_outcome(
+        self, route: str, username: Optional[str] = None
+    ) -> Optional[web.Response]:
+        """Waits the WOM latency, then returns an error response or None."""
+        self.requests[route] += 1
+        outcome = await self.wom.respond(can_be_missing=username is not None)
+        if outcome == OUTCOME_RATE_LIMITED:
+            return self._wom_error(429, "Too many requests, please try again later.")
+        if outcome == OUTCOME_ERROR:
+            return self._wom_error(500, "Internal server error.")
+        if outcome == OUTCOME_NOT_FOUND:
+            return self._wom_error(404, "Player not found.")
+        return None
+
+    @staticmethod
+    def _encoded(obj: Any) -> web.Response:
+        return web.Response(body=upstream.encode(obj), content_type="application/json")
+
+    async def hiscore(self, request: web.Request) -> web.Response:
+        self.requests["hiscores"] += 1
+        rsn = request.query.get("player", "")
+        outcome = await self.hiscores.respond(can_be_missing=True)
+        if outcome == OUTCOME_RATE_LIMITED:
+            return web.Response(status=429, text="Too many requests")
+        if outcome == OUTCOME_ERROR:
+            return web.Response(status=503, text="Service unavailable")
+        if outcome == OUTCOME_NOT_FOUND or not rsn:
+            return web.Response(status=404, text="Not found")
+        return web.json_response(upstream.hiscore_payload(rsn))
+
+    async def group_details(self, request: web.Request) -> web.Response:
+        error = await self._wom_outcome("group_details")
+        if error:
+            return error
+        group_id = int(request.match_info["group_id"])
+        return self._encoded(
+            upstream.wom_group_details(group_id, self.usernames, self._now())
+        )
+
+    async def group_gains(self, request: web.Request) -> web.Response:
+        error = await self._wom_outcome("group_gains")
+        if error:
+            return error
+        limit = min(int(request.query.get("limit", WOM_DEFAULT_LIMIT)), WOM_MAX_LIMIT)
+        offset = int(request.query.get("offset", 0))
+        gains = upstream.wom_group_gains(self.usernames, self._now())
+        return self._encoded(gains[offset : offset + limit])
+
+    async def player_gains(self, request: web.Request) -> web.Response:
+        username = request.match_info["username"]
+        error = await self._wom_outcome("player_gains", username)
+        if error:
+            return error
+        return self._encoded(upstream.wom_player_gains(username, self._now()))
+
+    async def snapshot_timeline(self, request: web.Request) -> web.Response:
+        username = request.match_info["username"]
+        error = await self._wom_outcome("snapshot_timeline", username)
+        if error:
+            return error
+        return self._encoded(upstream.wom_snapshot_timeline(username, self._now()))
+
+    async def name_changes(self, request: web.Request) -> web.Response:
+        username = request.match_info["username"]
+        error = await self._wom_outcome("name_changes", username)
+        if error:
+            return error
+        return self._encoded(upstream.wom_name_changes(username, self._now()))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m ironforgedbot.loadtest.server",
+        description="Serve deterministic hiscores and Wise Old Man data locally.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--members", type=int, default=500, help="WOM group size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hiscores-latency-ms", type=float, default=250.0)
+    parser.add_argument("--wom-latency-ms", type=float, default=400.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--not-found-rate",
+        type=float,
+        default=0.0,
+        help="share of players reported missing",
+    )
+    return parser
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    def profile(latency_ms: float, salt: int) -> UpstreamProfile:
+        return UpstreamProfile(
+            latency_ms=latency_ms,
+            latency_jitter_ms=latency_ms * 0.5,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            not_found_rate=args.not_found_rate,
+            seed=args.seed + salt,
+        )
+
+    server = UpstreamServer(
+        [upstream.member_nickname(i) for i in range(args.members)],
+        hiscores=profile(args.hiscores_latency_ms, 1),
+        wom=profile(args.wom_latency_ms, 2),
+    )
+    base_url = await server.start(args.host, args.port)
+    print(f"Serving on {base_url}, point the bot at it with:")
+    print(f"HISCORES_URL={UpstreamServer.hiscores_url(base_url)}")
+    print(f"WOM_BASE_URL={UpstreamServer.wom_base_url(base_url)}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print(f"Requests served: {dict(server.requests)}")
+        await server.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""In-process stand-ins for hiscores, Wise Old Man and the database.
+
+`install_standins` patches them in where the command callbacks look them up,
+so a load test exercises the real command code, score calculation and WOM
+model decoding while every upstream call stays on this machine.
+"""
+
+import asyncio
+import contextlib
+import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from wom import models
+
+from ironforgedcore.common.normalize import normalize_discord_string
+from ironforgedcore.common.ranks import RANK
+from ironforgedcore.common.role_names import PROSPECT_ROLE_NAME
+from ironforgedcore.common.roles import ROLE
+from ironforgedbot.loadtest import upstream
+from ironforgedbot.loadtest.fakes import FakeGuild, FakeMember
+from ironforgedbot.loadtest.upstream import (
+    OUTCOME_ERROR,
+    OUTCOME_NOT_FOUND,
+    OUTCOME_RATE_LIMITED,
+    UpstreamProfile,
+)
+
+ABSENT_SHARE = 0.02
+SCORE_PER_XP = 1 / 100_000  # close enough to the real skill points for ranking
+
+_RANKS = {rank.value for rank in RANK}
+
+
+class StandInHiscores:
+    """Replaces HTTP.get, answering index_lite.json lookups like hiscores does."""
+
+    def __init__(self, profile: UpstreamProfile):
+        self.profile = profile
+        self.calls = 0
+
+    async def get(self, url: str, *args, **kwargs) -> Dict[str, Any]:
+        self.calls += 1
+        rsn = parse_qs(urlsplit(url).query).get("player", [""])[0]
+
+        outcome = await self.profile.respond(can_be_missing=True)
+        if outcome == OUTCOME_RATE_LIMITED:
+            return {"status": 429}
+        if outcome == OUTCOME_ERROR:
+            return {"status": 503}
+        if outcome == OUTCOME_NOT_FOUND or not rsn:
+            return {"status": 404}
+        return {"status": 200, "body": upstream.hiscore_payload(rsn)}
+
+
+class StandInWomService:
+    """Same interface as core's WomService for the calls commands make.
+
+    Payloads go through wom.py's serializer in both directions, so decoding
+    costs what it does against the real API.
+    """
+
+    def __init__(
+        self,
+        profile: UpstreamProfile,
+        usernames: List[str],
+        group_id: int = 0,
+        base_url: Optional[str] = None,
+        **kwargs,
+    ):
+        self.profile = profile
+        self.usernames = usernames
+        self.group_id = group_id
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs) -> "StandInWomService":
+        """Lets the instance stand in for get_wom_service and WomService."""
+        return self
+
+    async def __aenter__(self) -> "StandInWomService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def _respond(self, payload: Any, model_type: Any) -> Any:
+        from ironforgedcore.services.wom_service import (
+            WomRateLimitError,
+            WomServiceError,
+        )
+
+        self.calls += 1
+        outcome = await self.profile.respond()
+        if outcome == OUTCOME_RATE_LIMITED:
+            raise WomRateLimitError("Rate limited by stand-in WOM")
+        if outcome == OUTCOME_ERROR:
+            raise WomServiceError("Stand-in WOM returned an error")
+        return upstream.decode(upstream.encode(payload), model_type)
+
+    @staticmethod
+    def _now() -> datetime.datetime:
+        return datetime.datetime.now(datetime.timezone.utc)
+
+    async def get_player_monthly_gains(self, username: str) -> models.PlayerGains:
+        return await self._respond(
+            upstream.wom_player_gains(username, self._now()), models.PlayerGains
+        )
+
+    async def get_group_membership_data(self) -> models.GroupDetail:
+        return await self._respond(
+            upstream.wom_group_details(self.group_id, self.usernames, self._now()),
+            models.GroupDetail,
+        )
+
+    async def get_monthly_activity_data(
+        self,
+    ) -> tuple[models.GroupDetail, List[models.GroupMemberGains]]:
+        group = await self.get_group_membership_data()
+        gains = await self._respond(
+            upstream.wom_group_gains(self.usernames, self._now()),
+            List[models.GroupMemberGains],
+        )
+        return group, gains
+
+    async def get_player_snapshot_timeline(
+        self, username: str
+    ) -> List[models.SnapshotTimelineEntry]:
+        return await self._respond(
+            upstream.wom_snapshot_timeline(username, self._now()),
+            List[models.SnapshotTimelineEntry],
+        )
+
+    async def get_player_name_history(self, username: str) -> List[models.NameChange]:
+        return await self._respond(
+            upstream.wom_name_changes(username, self._now()),
+            List[models.NameChange],
+        )
+
+
+def _member_rank(member: FakeMember) -> str:
+    return next((role.name for role in member.roles if role.name in _RANKS), "")
+
+
+def _member_record(member: FakeMember) -> SimpleNamespace:
+    nickname = normalize_discord_string(member.display_name)
+    rng = upstream.player_rng(nickname, "ingots")
+    return SimpleNamespace(
+        id=str(member.id),
+        discord_id=member.id,
+        nickname=nickname,
+        rank=_member_rank(member),
+        ingots=rng.randint(0, 250_000),
+        active=True,
+        is_prospect=any(role.name == PROSPECT_ROLE_NAME for role in member.roles),
+    )
+
+
+def _member_score(nickname: str) -> int:
+    return int(upstream.overall_xp(nickname) * SCORE_PER_XP)
+
+
+class StandInDatabase:
+    """Replaces db.get_session, with the members table built from the guild."""
+
+    def __init__(self, guild: FakeGuild, latency_ms: float = 2.0):
+        self.latency_ms = latency_ms
+        self.queries = 0
+        self.members = [
+            _member_record(member) for member in guild.members if member.nick
+        ]
+        self.by_nickname = {record.nickname.lower(): record for record in self.members}
+        self.by_discord_id = {record.discord_id: record for record in self.members}
+        self.leadership_ids = {
+            member.id
+            for member in guild.members
+            if any(role.name == ROLE.LEADERSHIP for role in member.roles)
+        }
+
+    async def query(self) -> None:
+        self.queries += 1
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+    @contextlib.asynccontextmanager
+    async def get_session(self):
+        yield self
+
+
+class StandInMemberService:
+    def __init__(self, session: StandInDatabase):
+        self.db = session
+
+    async def get_member_by_nickname(self, nickname: str) -> Optional[SimpleNamespace]:
+        await self.db.query()
+        return self.db.by_nickname.get(nickname.lower())
+
+    async def get_all_active_members(
+        self, include_prospects: bool = True
+    ) -> List[SimpleNamespace]:
+        await self.db.query()
+        return [
+            record
+            for record in self.db.members
+            if include_prospects or not record.is_prospect
+        ]
+
+
+class StandInAbsentService:
+    def __init__(self, session: StandInDatabase):
+        self.db = session
+
+    async def process_absent_members(self) -> List[SimpleNamespace]:
+        await self.db.query()
+        return [
+            SimpleNamespace(nickname=record.nickname)
+            for record in self.db.members
+            if upstream.player_rng(record.nickname, "absent").random() < ABSENT_SHARE
+        ]
+
+
+class StandInScoreHistoryService:
+    def __init__(self, session: StandInDatabase):
+        self.db = session
+
+    async def get_score_history(
+        self, discord_id: int, periods: List[int]
+    ) -> Dict[int, int]:
+        await self.db.query()
+        record = self.db.by_discord_id.get(discord_id)
+        if record is None:
+            return {}
+        score = _member_score(record.nickname)
+        rng = upstream.player_rng(record.nickname, "score-history")
+        return {days: max(score - rng.randint(0, days * 20), 0) for days in periods}
+
+    async def get_latest_score_snapshot(self) -> List[tuple]:
+        await self.db.query()
+        return [
+            (record.discord_id, record.nickname, _member_score(record.nickname))
+            for record in self.db.members
+        ]
+
+    async def get_staff_score_snapshot(self) -> List[tuple]:
+        await self.db.query()
+        return [
+            (
+                record.discord_id,
+                record.nickname,
+                _member_score(record.nickname),
+                record.rank,
+            )
+            for record in self.db.members
+            if record.discord_id in self.db.leadership_ids
+        ]
+
+
+@contextlib.contextmanager
+def install_standins(
+    guild: FakeGuild,
+    hiscores: UpstreamProfile,
+    wom: UpstreamProfile,
+    db_latency_ms: float = 2.0,
+) -> Iterator[SimpleNamespace]:
+    """Patches the stand-ins in for the duration of the block.
+
+    Yields the stand-in instances so a report can include their call counts.
+    """
+    from ironforgedcore.database import db
+    from ironforgedcore.http import HTTP
+
+    database = StandInDatabase(guild, db_latency_ms)
+    standins = SimpleNamespace(
+        hiscores=StandInHiscores(hiscores),
+        wom=StandInWomService(wom, [record.nickname for record in database.members]),
+        db=database,
+    )
+
+    patches = [
+        patch.object(HTTP, "get", standins.hiscores.get),
+        patch.object(db, "get_session", standins.db.get_session),
+        patch(
+            "ironforgedbot.commands.hiscore.cmd_score.ScoreHistoryService",
+            StandInScoreHistoryService,
+        ),
+        patch(
+            "ironforgedbot.commands.check.cmd_check.create_member_service",
+            StandInMemberService,
+        ),
+        patch(
+            "ironforgedbot.commands.check.cmd_check.create_absent_service",
+            StandInAbsentService,
+        ),
+        patch("ironforgedbot.commands.check.cmd_check.get_wom_service", standins.wom),
+        patch("ironforgedbot.commands.check.cmd_check.WomService", standins.wom),
+        patch(
+            "ironforgedbot.commands.leaderboard.leaderboard_score.create_score_history_service",
+            StandInScoreHistoryService,
+        ),
+        patch(
+            "ironforgedbot.commands.leaderboard.leaderboard_staff.create_score_history_service",
+            StandInScoreHistoryService,
+        ),
+        patch(
+            "ironforgedbot.commands.leaderboard.leaderboard_ingots.create_member_service",
+            StandInMemberService,
+        ),
+    ]
+
+    with contextlib.ExitStack() as stack:
+        for patcher in patches:
+            stack.enter_context(patcher)
+        yield standins
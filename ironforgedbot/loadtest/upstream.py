@@ -0,0 +1,391 @@
+"""Deterministic hiscores and Wise Old Man data for load tests and benchmarks.
+
+Every value is derived from the player name, so the same name always gets the
+same levels, gains and history no matter which stand-in serves it. WOM data
+is built from wom.py's own models and encoded with its serializer, so it
+decodes exactly like a real API response.
+"""
+
+import asyncio
+import datetime
+import functools
+import random
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import wom
+from wom import models
+from wom.serializer import Serializer
+
+# Order of the OSRS hiscores index_lite.json "skills" list
+HISCORE_SKILLS = (
+    "Overall",
+    "Attack",
+    "Defence",
+    "Strength",
+    "Hitpoints",
+    "Ranged",
+    "Prayer",
+    "Magic",
+    "Cooking",
+    "Woodcutting",
+    "Fletching",
+    "Fishing",
+    "Firemaking",
+    "Crafting",
+    "Smithing",
+    "Mining",
+    "Herblore",
+    "Agility",
+    "Thieving",
+    "Slayer",
+    "Farming",
+    "Runecrafting",
+    "Hunter",
+    "Construction",
+    "Sailing",
+)
+
+# Used when the data files are not loaded, a representative slice of the
+# hiscores "activities" list
+DEFAULT_ACTIVITIES = (
+    "Clue Scrolls (all)",
+    "Clue Scrolls (beginner)",
+    "Clue Scrolls (easy)",
+    "Clue Scrolls (medium)",
+    "Clue Scrolls (hard)",
+    "Clue Scrolls (elite)",
+    "Clue Scrolls (master)",
+    "Abyssal Sire",
+    "Chambers of Xeric",
+    "Chambers of Xeric: Challenge Mode",
+    "General Graardor",
+    "Theatre of Blood",
+    "Tombs of Amascut",
+    "Vorkath",
+    "Zulrah",
+)
+
+MAX_SKILL_XP = 200_000_000
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_RATE_LIMITED = "rate_limited"
+OUTCOME_NOT_FOUND = "not_found"
+
+_EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+_SERIALIZER = Serializer()
+
+
+def _xp_table() -> List[int]:
+    table, points = [0], 0
+    for level in range(1, 99):
+        points += int(level + 300 * 2 ** (level / 7))
+        table.append(points // 4)
+    return table
+
+
+_XP_FOR_LEVEL = _xp_table()  # index n is the xp needed for level n + 1
+
+
+def level_for_xp(xp: int) -> int:
+    level = 1
+    while level < 99 and xp >= _XP_FOR_LEVEL[level]:
+        level += 1
+    return level
+
+
+def member_nickname(index: int) -> str:
+    """Nickname of the index-th simulated clan member."""
+    return f"Member{index:05d}"
+
+
+def player_rng(name: str, salt: str = "") -> random.Random:
+    """A random generator seeded by the (case insensitive) player name."""
+    return random.Random(zlib.crc32(f"{name.lower()}:{salt}".encode("utf-8")))
+
+
+def activity_names() -> Sequence[str]:
+    """Hiscore activity names the bot scores, from the data files if loaded."""
+    try:
+        from ironforgedcore.storage import data
+
+        names = [
+            entry["name"]
+            for source in (data.CLUES, data.RAIDS, data.BOSSES)
+            for entry in source or []
+        ]
+    except Exception:
+        names = []
+    return names or DEFAULT_ACTIVITIES
+
+
+def hiscore_payload(rsn: str) -> Dict[str, Any]:
+    """index_lite.json body for `rsn`, in the shape ScoreService parses."""
+    rng = player_rng(rsn, "hiscores")
+    skills, total_xp, total_level = [], 0, 0
+    for skill_id, name in enumerate(HISCORE_SKILLS[1:], start=1):
+        xp = min(int(rng.paretovariate(1.2) * 400_000), MAX_SKILL_XP)
+        total_xp += xp
+        total_level += level_for_xp(xp)
+        skills.append(
+            {
+                "id": skill_id,
+                "name": name,
+                "rank": rng.randint(1, 2_000_000),
+                "level": level_for_xp(xp),
+                "xp": xp,
+            }
+        )
+    skills.insert(
+        0,
+        {
+            "id": 0,
+            "name": "Overall",
+            "rank": rng.randint(1, 2_000_000),
+            "level": total_level,
+            "xp": total_xp,
+        },
+    )
+
+    activities = []
+    for activity_id, name in enumerate(activity_names()):
+        if rng.random() < 0.3:
+            rank, score = -1, -1
+        else:
+            rank, score = rng.randint(1, 500_000), rng.randint(1, 2_000)
+        activities.append(
+            {"id": activity_id, "name": name, "rank": rank, "score": score}
+        )
+
+    return {"skills": skills, "activities": activities}
+
+
+@functools.lru_cache(maxsize=4096)
+def overall_xp(rsn: str) -> int:
+    return hiscore_payload(rsn)["skills"][0]["xp"]
+
+
+def _player_id(username: str) -> int:
+    return zlib.crc32(username.lower().encode("utf-8")) or 1
+
+
+def wom_player(username: str, now: datetime.datetime) -> models.Player:
+    rng = player_rng(username, "wom")
+    overall = overall_xp(username)
+    return models.Player(
+        id=_player_id(username),
+        username=username.lower(),
+        display_name=username,
+        type=wom.PlayerType.Regular,
+        build=wom.PlayerBuild.Main,
+        country=None,
+        status=wom.PlayerStatus.Active,
+        exp=overall,
+        ehp=round(rng.uniform(10, 1500), 2),
+        ehb=round(rng.uniform(0, 800), 2),
+        ttm=round(rng.uniform(0, 1500), 2),
+        tt200m=round(rng.uniform(1500, 20000), 2),
+        registered_at=_EPOCH,
+        updated_at=now,
+        last_changed_at=now - datetime.timedelta(days=rng.randint(0, 30)),
+        last_imported_at=None,
+    )
+
+
+def monthly_xp_gained(username: str) -> int:
+    """Overall xp gained this month, with a share of nearly inactive members."""
+    rng = player_rng(username, "gains")
+    if rng.random() < 0.15:
+        return rng.randint(0, 50_000)
+    return int(rng.lognormvariate(13.5, 1.0))
+
+
+def _gains(gained: float, end: float) -> models.Gains:
+    return models.Gains(gained=gained, start=end - gained, end=end)
+
+
+def wom_group_details(
+    group_id: int, usernames: Sequence[str], now: datetime.datetime
+) -> models.GroupDetail:
+    memberships = [
+        models.GroupMembership(
+            player_id=_player_id(username),
+            group_id=group_id,
+            role=wom.GroupRole.Member,
+            created_at=_EPOCH,
+            updated_at=now,
+            player=wom_player(username, now),
+        )
+        for username in usernames
+    ]
+    return models.GroupDetail(
+        id=group_id,
+        name="Iron Forged",
+        clan_chat="Iron Forged",
+        description="Load test group",
+        homeworld=None,
+        verified=True,
+        patron=False,
+        profile_image=None,
+        banner_image=None,
+        score=0,
+        created_at=_EPOCH,
+        updated_at=now,
+        member_count=len(memberships),
+        memberships=memberships,
+        social_links=models.SocialLinks(),
+    )
+
+
+def wom_player_gains(username: str, now: datetime.datetime) -> models.PlayerGains:
+    rng = player_rng(username, "skill-gains")
+    overall_end = float(overall_xp(username))
+    overall_gained = float(monthly_xp_gained(username))
+
+    skills = {
+        wom.Metric.Overall: models.SkillGains(
+            metric=wom.Metric.Overall,
+            experience=_gains(overall_gained, overall_end),
+            ehp=_gains(0.0, 0.0),
+            rank=_gains(0.0, 0.0),
+            level=_gains(0.0, 0.0),
+        )
+    }
+    remaining = overall_gained
+    for name in HISCORE_SKILLS[1:]:
+        metric = wom.Metric(name.lower())
+        gained = float(int(remaining * rng.random() * 0.3))
+        remaining -= gained
+        skills[metric] = models.SkillGains(
+            metric=metric,
+            experience=_gains(gained, gained),
+            ehp=_gains(0.0, 0.0),
+            rank=_gains(0.0, 0.0),
+            level=_gains(0.0, 0.0),
+        )
+
+    return models.PlayerGains(
+        starts_at=now - datetime.timedelta(days=30),
+        ends_at=now,
+        data=models.PlayerGainsData(
+            skills=skills, bosses={}, activities={}, computed={}
+        ),
+    )
+
+
+def wom_group_gains(
+    usernames: Sequence[str], now: datetime.datetime
+) -> List[models.GroupMemberGains]:
+    gains = [
+        models.GroupMemberGains(
+            start_date=now - datetime.timedelta(days=30),
+            end_date=now,
+            player=wom_player(username, now),
+            data=_gains(
+                float(monthly_xp_gained(username)),
+                float(overall_xp(username)),
+            ),
+        )
+        for username in usernames
+    ]
+    return sorted(gains, key=lambda entry: entry.data.gained, reverse=True)
+
+
+def wom_snapshot_timeline(
+    username: str, now: datetime.datetime, days: int = 30
+) -> List[models.SnapshotTimelineEntry]:
+    """Daily overall xp for the last `days` days, newest first like the API."""
+    rng = player_rng(username, "timeline")
+    value = overall_xp(username)
+    daily = monthly_xp_gained(username) / 30
+    entries = []
+    for day in range(days):
+        entries.append(
+            models.SnapshotTimelineEntry(
+                value=int(value),
+                rank=rng.randint(1, 2_000_000),
+                date=now - datetime.timedelta(days=day),
+            )
+        )
+        value = max(value - daily * rng.uniform(0, 2), 0)
+    return entries
+
+
+def wom_name_changes(username: str, now: datetime.datetime) -> List[models.NameChange]:
+    rng = player_rng(username, "names")
+    changes, new_name = [], username
+    for i in range(rng.choice((0, 0, 0, 1, 2))):
+        old_name = f"{username[:9]}old{i}"
+        changed_at = now - datetime.timedelta(days=rng.randint(30, 900))
+        changes.append(
+            models.NameChange(
+                id=_player_id(old_name),
+                player_id=_player_id(username),
+                old_name=old_name,
+                new_name=new_name,
+                status=wom.NameChangeStatus.Approved,
+                review_context=None,
+                resolved_at=changed_at,
+                updated_at=changed_at,
+                created_at=changed_at,
+            )
+        )
+        new_name = old_name
+    return changes
+
+
+def encode(obj: Any) -> bytes:
+    """JSON bytes for wom.py models, as the WOM API would send them."""
+    return _SERIALIZER.encode(obj)
+
+
+def decode(data: bytes, model_type: Any) -> Any:
+    return _SERIALIZER.decode(data, model_type)
+
+
+@dataclass
+class UpstreamProfile:
+    """Latency and failure behaviour of a stand-in upstream.
+
+    Each call waits `latency_ms` plus up to `latency_jitter_ms`, then fails
+    with probability `error_rate`, is rate limited with probability
+    `rate_limit_rate`, or (hiscores only) reports the player as missing with
+    probability `not_found_rate`. A fixed `seed` makes a run repeatable.
+    """
+
+    latency_ms: float = 150.0
+    latency_jitter_ms: float = 100.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    not_found_rate: float = 0.0
+    seed: Optional[int] = 0
+    _rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self):
+        for name in ("error_rate", "rate_limit_rate", "not_found_rate"):
+            value = getattr(self, name)
+            if not 0 <= value <= 1:
+                raise ValueError(f"{name} must be between 0 and 1, got {value}")
+        self._rng = random.Random(self.seed)
+
+    def delay_s(self) -> float:
+        return (self.latency_ms + self._rng.random() * self.latency_jitter_ms) / 1000
+
+    def outcome(self, can_be_missing: bool = False) -> str:
+        roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return OUTCOME_RATE_LIMITED
+        roll -= self.rate_limit_rate
+        if roll < self.error_rate:
+            return OUTCOME_ERROR
+        roll -= self.error_rate
+        if can_be_missing and roll < self.not_found_rate:
+            return OUTCOME_NOT_FOUND
+        return OUTCOME_OK
+
+    async def respond(self, can_be_missing: bool = False) -> str:
+        """Waits the simulated latency and returns the call's outcome."""
+        await asyncio.sleep(self.delay_s())
+        return self.outcome(can_be_missing)
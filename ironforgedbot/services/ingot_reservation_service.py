@@ -0,0 +1,115 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ironforgedcore.common.logging_utils import log_database_operation
+from ironforgedcore.models.changelog import Changelog, ChangeType
+from ironforgedcore.models.member import Member
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngotReservation:
+    status: bool
+    new_total: int
+
+
+class IngotReservationService:
+    """Charges and refunds pay-per-use commands with conditional updates.
+
+    The balance check and the deduction are a single `UPDATE ... WHERE
+    ingots >= quantity`, so concurrent commands can never overdraw a member.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _select_balance(self, discord_id: int) -> tuple[str, int] | None:
+        result = await self.db.execute(
+            select(Member.id, Member.ingots).where(Member.discord_id == discord_id)
+        )
+        row = result.first()
+        return (row.id, row.ingots) if row else None
+
+    @log_database_operation(logger)
+    async def reserve(
+        self, discord_id: int, quantity: int, comment: str
+    ) -> IngotReservation:
+        """Deducts `quantity` ingots if the member can afford it."""
+        now = datetime.now(timezone.utc)
+
+        result = await self.db.execute(
+            update(Member)
+            .where(
+                Member.discord_id == discord_id,
+                Member.active.is_(True),
+                Member.ingots >= quantity,
+            )
+            .values(ingots=Member.ingots - quantity, last_changed_date=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        # MariaDB has no UPDATE ... RETURNING; the row is locked by the update
+        # so reading it back in the same transaction sees our write.
+        balance = await self._select_balance(discord_id)
+
+        if result.rowcount != 1 or balance is None:
+            await self.db.rollback()
+            return IngotReservation(False, balance[1] if balance else 0)
+
+        member_id, new_total = balance
+        self.db.add(
+            Changelog(
+                member_id=member_id,
+                admin_id=None,
+                change_type=ChangeType.REMOVE_INGOTS,
+                previous_value=new_total + quantity,
+                new_value=new_total,
+                comment=comment,
+                timestamp=now,
+            )
+        )
+        await self.db.commit()
+
+        return IngotReservation(True, new_total)
+
+    @log_database_operation(logger)
+    async def refund(
+        self, discord_id: int, quantity: int, comment: str
+    ) -> IngotReservation:
+        """Returns `quantity` ingots taken by an earlier reservation."""
+        now = datetime.now(timezone.utc)
+
+        result = await self.db.execute(
+            update(Member)
+            .where(Member.discord_id == discord_id)
+            .values(ingots=Member.ingots + quantity, last_changed_date=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        balance = await self._select_balance(discord_id)
+
+        if result.rowcount != 1 or balance is None:
+            await self.db.rollback()
+            logger.error(f"Unable to refund {quantity} ingots to {discord_id}")
+            return IngotReservation(False, 0)
+
+        member_id, new_total = balance
+        self.db.add(
+            Changelog(
+                member_id=member_id,
+                admin_id=None,
+                change_type=ChangeType.ADD_INGOTS,
+                previous_value=new_total - quantity,
+                new_value=new_total,
+                comment=comment,
+                timestamp=now,
+            )
+        )
+        await self.db.commit()
+
+        return IngotReservation(True, new_total)
@@ -0,0 +1,208 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+DEFAULT_NETWORK_SLOTS = 1
+
+
+@dataclass(frozen=True)
+class JobPolicy:
+    """How a job is scheduled and shares the network budget.
+
+    Lower `priority` values are granted a network slot first. `coalesce` and
+    `misfire_grace_time` are handed to APScheduler, so runs missed while the
+    bot was busy or offline collapse into a single late run. `jitter_s` and
+    `estimated_duration_s` feed the schedule planner.
+    """
+
+    priority: int = PRIORITY_NORMAL
+    uses_network: bool = False
+    coalesce: bool = True
+    misfire_grace_time: int = 300
+    jitter_s: int = 0
+    estimated_duration_s: int = 60
+
+    def scheduler_kwargs(self) -> Dict[str, Any]:
+        return {
+            "coalesce": self.coalesce,
+            "misfire_grace_time": self.misfire_grace_time,
+            "max_instances": 1,
+        }
+
+
+@dataclass
+class JobTicket:
+    job: str
+    policy: JobPolicy
+    seq: int
+    queued_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    holds_slot: bool = False
+    released: bool = False
+    _granted: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def wait_s(self) -> float:
+        end = self.started_at if self.started_at is not None else time.monotonic()
+        return end - self.queued_at
+
+
+class JobCoordinator:
+    """Decides when scheduled and manually triggered jobs may run.
+
+    Only one run of a job can be queued or running at a time, a second
+    request is skipped rather than stacked up. Jobs that call hiscores or
+    Wise Old Man share `network_slots`, granted in priority order so a short
+    job is not stuck behind a long refresh.
+    """
+
+    def __init__(
+        self,
+        network_slots: int = DEFAULT_NETWORK_SLOTS,
+        policies: Optional[Mapping[str, JobPolicy]] = None,
+    ):
+        self.network_slots = network_slots
+        self._policies: Dict[str, JobPolicy] = dict(policies or {})
+        self._active: Dict[str, JobTicket] = {}
+        self._waiting: list[tuple[int, int, JobTicket]] = []
+        self._network_in_use = 0
+        self._seq = itertools.count()
+        self._counters: Dict[str, Dict[str, float]] = {}
+
+    def register(self, job: str, policy: JobPolicy) -> None:
+        self._policies[job] = policy
+
+    def policy(self, job: str) -> JobPolicy:
+        return self._policies.get(job, JobPolicy())
+
+    def is_active(self, job: str) -> bool:
+        return job in self._active
+
+    def reserve(self, job: str) -> Optional[JobTicket]:
+        """Claims the job's single run, or returns None if one is in flight."""
+        counters = self._job_counters(job)
+        if job in self._active:
+            counters["skipped"] += 1
+            logger.info(f"Skipping {job}, a run is already queued or running")
+            return None
+
+        ticket = JobTicket(job=job, policy=self.policy(job), seq=next(self._seq))
+        self._active[job] = ticket
+        counters["submitted"] += 1
+        return ticket
+
+    @asynccontextmanager
+    async def run(self, ticket: JobTicket) -> AsyncIterator[JobTicket]:
+        """Waits for the job's turn, then holds its slot for the enclosed block."""
+        try:
+            if ticket.policy.uses_network:
+                await self._acquire_slot(ticket)
+
+            ticket.started_at = time.monotonic()
+            counters = self._job_counters(ticket.job)
+            counters["started"] += 1
+            counters["last_wait_s"] = round(ticket.wait_s, 3)
+            counters["max_wait_s"] = max(
+                counters["max_wait_s"], counters["last_wait_s"]
+            )
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def release(self, ticket: JobTicket) -> None:
+        """Frees the job and its network slot. Safe to call more than once."""
+        if ticket.released:
+            return
+        ticket.released = True
+
+        if self._active.get(ticket.job) is ticket:
+            del self._active[ticket.job]
+
+        if ticket.holds_slot:
+            ticket.holds_slot = False
+            self._network_in_use -= 1
+        else:
+            self._remove_waiter(ticket)
+
+        self._grant()
+
+    async def _acquire_slot(self, ticket: JobTicket) -> None:
+        heapq.heappush(self._waiting, (ticket.policy.priority, ticket.seq, ticket))
+        self._grant()
+        if not ticket.holds_slot:
+            logger.info(
+                f"{ticket.job} waiting for a network slot "
+                f"({self._network_in_use}/{self.network_slots} in use)"
+            )
+        await ticket._granted.wait()
+
+    def _grant(self) -> None:
+        while self._waiting and self._network_in_use < self.network_slots:
+            _, _, ticket = heapq.heappop(self._waiting)
+            ticket.holds_slot = True
+            self._network_in_use += 1
+            ticket._granted.set()
+
+    def _remove_waiter(self, ticket: JobTicket) -> None:
+        waiting = [entry for entry in self._waiting if entry[2] is not ticket]
+        if len(waiting) != len(self._waiting):
+            heapq.heapify(waiting)
+            self._waiting = waiting
+
+    def _job_counters(self, job: str) -> Dict[str, float]:
+        return self._counters.setdefault(
+            job,
+            {
+                "submitted": 0,
+                "started": 0,
+                "skipped": 0,
+                "last_wait_s": 0.0,
+                "max_wait_s": 0.0,
+            },
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns running and queued jobs, and per job counters."""
+        now = time.monotonic()
+        tickets = sorted(
+            self._active.values(), key=lambda t: (t.policy.priority, t.seq)
+        )
+        return {
+            "network_slots": self.network_slots,
+            "network_in_use": self._network_in_use,
+            "running": [
+                {
+                    "job": ticket.job,
+                    "priority": ticket.policy.priority,
+                    "uses_network": ticket.policy.uses_network,
+                    "running_s": round(now - ticket.started_at, 1),
+                    "waited_s": round(ticket.wait_s, 1),
+                }
+                for ticket in tickets
+                if ticket.started_at is not None
+            ],
+            "queued": [
+                {
+                    "job": ticket.job,
+                    "priority": ticket.policy.priority,
+                    "waiting_s": round(ticket.wait_s, 1),
+                }
+                for ticket in tickets
+                if ticket.started_at is None
+            ],
+            "jobs": {job: dict(counters) for job, counters in self._counters.items()},
+        }
+
+
+JOB_COORDINATOR = JobCoordinator()
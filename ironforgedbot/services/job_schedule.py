@@ -0,0 +1,254 @@
+import bisect
+import datetime
+import logging
+import statistics
+from dataclasses import dataclass, replace
+from typing import Iterable, List, Optional, Tuple
+
+from apscheduler.triggers.cron import CronTrigger
+from tabulate import tabulate
+
+from ironforgedbot.services.job_coordinator import JobPolicy
+from ironforgedbot.storage.job_history import JOB_HISTORY, OUTCOME_OK
+
+logger = logging.getLogger(__name__)
+
+PLAN_HORIZON = datetime.timedelta(days=14)  # covers the weekly jobs twice
+SHIFT_STEP_SECONDS = 5 * 60
+MAX_SHIFT_SECONDS = 2 * 60 * 60
+MAX_FIRE_TIMES = 500
+ESTIMATE_FROM_RUNS = 10  # recent successful runs used to estimate duration
+
+Window = Tuple[datetime.datetime, datetime.datetime]
+
+
+class OffsetCronTrigger(CronTrigger):
+    """CronTrigger whose fire times are moved later by a fixed offset."""
+
+    def __init__(self, *args, offset_s: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.offset = datetime.timedelta(seconds=offset_s)
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        if previous_fire_time is not None:
+            previous_fire_time -= self.offset
+        next_fire_time = super().get_next_fire_time(
+            previous_fire_time, now - self.offset
+        )
+        return next_fire_time + self.offset if next_fire_time else None
+
+
+def build_cron_trigger(
+    expr: str, offset_s: int = 0, jitter_s: int = 0
+) -> OffsetCronTrigger:
+    """Same parsing as CronTrigger.from_crontab, plus an offset and jitter."""
+    values = expr.split()
+    if len(values) != 5:
+        raise ValueError(f"Wrong number of fields; got {len(values)}, expected 5")
+
+    return OffsetCronTrigger(
+        minute=values[0],
+        hour=values[1],
+        day=values[2],
+        month=values[3],
+        day_of_week=values[4],
+        timezone=datetime.timezone.utc,
+        jitter=jitter_s or None,
+        offset_s=offset_s,
+    )
+
+
+@dataclass(frozen=True)
+class ScheduleRequest:
+    job_id: str
+    name: str
+    cron: str
+    job: str  # job function name, the key of its policy and history
+    policy: JobPolicy
+
+
+@dataclass(frozen=True)
+class PlannedJob:
+    job_id: str
+    name: str
+    cron: str
+    job: str
+    policy: JobPolicy
+    offset_s: int
+    estimate_s: float
+
+    def trigger(self) -> OffsetCronTrigger:
+        return build_cron_trigger(self.cron, self.offset_s, self.policy.jitter_s)
+
+    def fire_times(
+        self, start: datetime.datetime, horizon: datetime.timedelta = PLAN_HORIZON
+    ) -> List[datetime.datetime]:
+        """Planned start times, before jitter, from `start` over `horizon`."""
+        return _fire_times(self.cron, self.offset_s, start, horizon)
+
+    def windows(self, start: datetime.datetime) -> List[Window]:
+        """When the job may be running: its start, plus jitter and estimate."""
+        busy = datetime.timedelta(seconds=self.policy.jitter_s + self.estimate_s)
+        return [(time, time + busy) for time in self.fire_times(start)]
+
+
+def _fire_times(
+    cron: str,
+    offset_s: int,
+    start: datetime.datetime,
+    horizon: datetime.timedelta,
+) -> List[datetime.datetime]:
+    trigger = build_cron_trigger(cron, offset_s)
+    end = start + horizon
+    times: List[datetime.datetime] = []
+    previous = None
+    while len(times) < MAX_FIRE_TIMES:
+        next_time = trigger.get_next_fire_time(previous, previous or start)
+        if next_time is None or next_time > end:
+            break
+        times.append(next_time)
+        previous = next_time
+    return times
+
+
+def _overlap_s(windows: Iterable[Window], taken: List[Window]) -> float:
+    """Total seconds `windows` overlap `taken`, which must be sorted by start."""
+    if not taken:
+        return 0.0
+
+    starts = [start for start, _ in taken]
+    longest = max(end - start for start, end in taken)
+    total = 0.0
+    for start, end in windows:
+        i = bisect.bisect_left(starts, start - longest)
+        while i < len(taken) and taken[i][0] < end:
+            overlap = (min(end, taken[i][1]) - max(start, taken[i][0])).total_seconds()
+            if overlap > 0:
+                total += overlap
+            i += 1
+    return total
+
+
+def estimate_duration_s(job: str, policy: JobPolicy) -> float:
+    """Expected run time: the policy estimate, or recent runs if they are longer."""
+    durations = [
+        run.duration_s for run in JOB_HISTORY.runs(job) if run.outcome == OUTCOME_OK
+    ][-ESTIMATE_FROM_RUNS:]
+    if not durations:
+        return float(policy.estimated_duration_s)
+    return max(float(policy.estimated_duration_s), statistics.median(durations))
+
+
+class JobSchedule:
+    """Plans cron slots so network heavy jobs do not run on top of each other.
+
+    Every job keeps its configured cron expression. Jobs that use the network
+    are placed in priority order and, when a job's expected busy window
+    (jitter plus estimated duration) would overlap one already placed, its
+    fire times are moved later in `SHIFT_STEP_SECONDS` steps. The jitter
+    itself is applied by APScheduler, so instances sharing the default crons
+    do not all call hiscores and WOM at the same second.
+    """
+
+    def __init__(self):
+        self.planned: List[PlannedJob] = []
+        self.planned_at: Optional[datetime.datetime] = None
+
+    def plan(
+        self,
+        requests: Iterable[ScheduleRequest],
+        now: Optional[datetime.datetime] = None,
+    ) -> List[PlannedJob]:
+        requests = list(requests)
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+
+        taken: List[Window] = []
+        planned = {}
+        for request in sorted(
+            requests, key=lambda r: (not r.policy.uses_network, r.policy.priority)
+        ):
+            estimate = estimate_duration_s(request.job, request.policy)
+            job = PlannedJob(
+                job_id=request.job_id,
+                name=request.name,
+                cron=request.cron,
+                job=request.job,
+                policy=request.policy,
+                offset_s=0,
+                estimate_s=estimate,
+            )
+
+            if request.policy.uses_network:
+                job = self._place(job, taken, now)
+                taken = sorted(taken + job.windows(now))
+
+            planned[request.job_id] = job
+
+        self.planned = [planned[request.job_id] for request in requests]
+        self.planned_at = now
+        return self.planned
+
+    def _place(
+        self, job: PlannedJob, taken: List[Window], now: datetime.datetime
+    ) -> PlannedJob:
+        best, best_overlap = job, None
+        for offset_s in range(0, MAX_SHIFT_SECONDS + 1, SHIFT_STEP_SECONDS):
+            candidate = replace(job, offset_s=offset_s)
+            overlap = _overlap_s(candidate.windows(now), taken)
+            if overlap == 0:
+                if offset_s:
+                    logger.info(
+                        f"Moved {job.job_id} {offset_s // 60}m later "
+                        "to avoid overlapping network jobs"
+                    )
+                return candidate
+            if best_overlap is None or overlap < best_overlap:
+                best, best_overlap = candidate, overlap
+
+        logger.warning(
+            f"No free slot for {job.job_id} within {MAX_SHIFT_SECONDS // 60}m, "
+            f"using the least busy offset (+{best.offset_s // 60}m)"
+        )
+        return best
+
+    def format_timetable(self, upcoming: int = 3) -> str:
+        """Planned cron slots and the next start times of every job."""
+        if not self.planned:
+            return "No jobs scheduled yet."
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        rows = [
+            [
+                job.job_id,
+                job.cron,
+                f"+{job.offset_s // 60}m",
+                f"{job.policy.jitter_s // 60}m",
+                f"{job.estimate_s / 60:.1f}m",
+                "yes" if job.policy.uses_network else "no",
+                ", ".join(
+                    time.strftime("%a %d %H:%M")
+                    for time in job.fire_times(now)[:upcoming]
+                ),
+            ]
+            for job in self.planned
+        ]
+        return (
+            "Planned job timetable (UTC). Runs start at the listed time plus up "
+            "to the jitter, network jobs are shifted so their busy windows do "
+            "not overlap.\n\n"
+            + tabulate(
+                rows,
+                headers=[
+                    "Job",
+                    "Cron",
+                    "Shift",
+                    "Jitter",
+                    "Estimate",
+                    "Network",
+                    "Next runs",
+                ],
+            )
+        )
+
+
+JOB_SCHEDULE = JobSchedule()
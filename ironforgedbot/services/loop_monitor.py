@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional, Set
+
+from ironforgedbot.common.latency import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL_SECONDS = 0.1
+DEFAULT_THRESHOLD_MS = 250
+REPORT_COOLDOWN_SECONDS = 600
+RECENT_STALLS = 20
+STACK_LINES = 12  # innermost frames kept for reports
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+Reporter = Callable[[str], Awaitable[None]]
+
+
+@dataclass
+class LoopStall:
+    at: str
+    lag_ms: float
+    stack: Optional[str]
+
+
+class LoopMonitor:
+    """Samples event loop lag and captures what was blocking it.
+
+    A task on the loop sleeps for a short interval and measures how late it
+    woke up. A watchdog thread notices when that wake up is overdue by more
+    than `threshold_ms` and snapshots the loop thread's stack while it is
+    still blocked, so the report points at the offending code rather than at
+    the monitor. asyncio's own slow_callback_duration only reports in debug
+    mode, which is too costly to run in production.
+    """
+
+    def __init__(
+        self,
+        interval: float = SAMPLE_INTERVAL_SECONDS,
+        report_cooldown: float = REPORT_COOLDOWN_SECONDS,
+    ):
+        self.interval = interval
+        self.report_cooldown = report_cooldown
+        self.threshold_ms: float = DEFAULT_THRESHOLD_MS
+        self.last_lag_ms: Optional[float] = None
+        self.lag = LatencyHistogram(buckets_ms=LAG_BUCKETS_MS)
+        self.stalls = 0
+        self.recent: deque[LoopStall] = deque(maxlen=RECENT_STALLS)
+        self._reporter: Optional[Reporter] = None
+        self._last_report: Optional[float] = None
+        self._report_tasks: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._loop_thread_id: Optional[int] = None
+        self._deadline: Optional[float] = None
+        self._captured_stack: Optional[str] = None
+
+    def start(
+        self,
+        threshold_ms: float = DEFAULT_THRESHOLD_MS,
+        reporter: Optional[Reporter] = None,
+    ) -> None:
+        """Starts sampling on the running loop. Stalls go to the log and `reporter`."""
+        if self._task is not None:
+            return
+
+        self.threshold_ms = threshold_ms
+        self._reporter = reporter
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._sample())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(f"Event loop monitor started (threshold {threshold_ms}ms)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        self._task.cancel()
+        await asyncio.gather(self._task, *self._report_tasks, return_exceptions=True)
+        self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _sample(self) -> None:
+        while True:
+            with self._lock:
+                self._deadline = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+
+            lag_ms = max(time.monotonic() - self._deadline, 0.0) * 1000
+            with self._lock:
+                stack, self._captured_stack = self._captured_stack, None
+
+            self.last_lag_ms = lag_ms
+            self.lag.record(lag_ms)
+            if lag_ms >= self.threshold_ms:
+                self._on_stall(lag_ms, stack)
+
+    def _watch(self) -> None:
+        """Watchdog thread, grabs the loop thread's stack during a stall."""
+        while not self._stopping.wait(self.interval):
+            with self._lock:
+                if self._deadline is None or self._captured_stack is not None:
+                    continue
+                overdue_ms = (time.monotonic() - self._deadline) * 1000
+                if overdue_ms < self.threshold_ms:
+                    continue
+
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is not None:
+                    lines = traceback.format_stack(frame)[-STACK_LINES:]
+                    self._captured_stack = "".join(lines)
+
+    def _on_stall(self, lag_ms: float, stack: Optional[str]) -> None:
+        self.stalls += 1
+        stall = LoopStall(
+            at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            lag_ms=round(lag_ms, 1),
+            stack=stack,
+        )
+        self.recent.append(stall)
+        logger.warning(
+            f"Event loop blocked for {lag_ms:.0f}ms"
+            + (f", blocking stack:\n{stack}" if stack else "")
+        )
+
+        now = time.monotonic()
+        if self._reporter is None or (
+            self._last_report is not None
+            and now - self._last_report < self.report_cooldown
+        ):
+            return
+
+        self._last_report = now
+        task = asyncio.create_task(self._report(stall))
+        self._report_tasks.add(task)
+        task.add_done_callback(self._report_tasks.discard)
+
+    async def _report(self, stall: LoopStall) -> None:
+        message = (
+            f":warning: Event loop was blocked for **{stall.lag_ms:.0f}ms** "
+            f"(threshold {self.threshold_ms}ms)."
+        )
+        if stall.stack:
+            message += f"\n```\n{stall.stack[-1800:]}\n```"
+
+        try:
+            await self._reporter(message)
+        except Exception as e:
+            logger.error(f"Unable to report event loop stall: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the lag distribution and the most recent stalls."""
+        return {
+            "threshold_ms": self.threshold_ms,
+            "lag": self.lag.snapshot(),
+            "stalls": self.stalls,
+            "recent_stalls": [asdict(stall) for stall in reversed(self.recent)],
+        }
+
+
+LOOP_MONITOR = LoopMonitor()
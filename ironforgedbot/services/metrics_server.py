@@ -0,0 +1,313 @@
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from ironforgedbot.common.latency import (
+    COMMAND_LATENCIES,
+    TASK_LATENCIES,
+    LatencyRegistry,
+)
+from ironforgedbot.decorators.rate_limit import RATE_LIMITER
+from ironforgedbot.events.member_update_debouncer import member_update_debouncer
+from ironforgedbot.events.member_update_emitter import member_update_emitter
+from ironforgedbot.services.loop_monitor import LOOP_MONITOR
+from ironforgedbot.services.render_service import RENDER_SERVICE
+from ironforgedbot.state import STATE
+from ironforgedbot.storage.data_files import DATA_FILES
+from ironforgedcore.database import db
+
+if TYPE_CHECKING:
+    import discord
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "ironforgedbot"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_STARTUP_TIMEOUT = 10.0  # seconds to wait for the port to be bound
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _histogram_lines(
+    metric: str, label: str, registry: LatencyRegistry, help_text: str
+) -> Iterator[str]:
+    name = f"{METRIC_PREFIX}_{metric}_seconds"
+    yield f"# HELP {name} {help_text}"
+    yield f"# TYPE {name} histogram"
+    for key, histogram in registry.items():
+        cumulative = 0
+        for bound, count in zip(histogram.buckets_ms, histogram.bucket_counts):
+            cumulative += count
+            le = f"{bound / 1000:g}"
+            yield f"{name}_bucket{_labels(**{label: key, 'le': le})} {cumulative}"
+        yield f"{name}_bucket{_labels(**{label: key, 'le': '+Inf'})} {histogram.count}"
+        yield f"{name}_sum{_labels(**{label: key})} {histogram.sum_ms / 1000:.6f}"
+        yield f"{name}_count{_labels(**{label: key})} {histogram.count}"
+
+
+def _counter_lines(
+    metric: str, help_text: str, samples: list[tuple[dict[str, Any], float]]
+) -> Iterator[str]:
+    name = f"{METRIC_PREFIX}_{metric}"
+    yield f"# HELP {name} {help_text}"
+    yield f"# TYPE {name} counter"
+    for labels, value in samples:
+        yield f"{name}{_labels(**labels)} {value}"
+
+
+def _gauge_lines(
+    metric: str, help_text: str, samples: list[tuple[dict[str, Any], float]]
+) -> Iterator[str]:
+    name = f"{METRIC_PREFIX}_{metric}"
+    yield f"# HELP {name} {help_text}"
+    yield f"# TYPE {name} gauge"
+    for labels, value in samples:
+        yield f"{name}{_labels(**labels)} {value}"
+
+
+def _db_pool_samples() -> list[tuple[dict[str, Any], float]]:
+    """Connection pool usage, when the database exposes its engine pool."""
+    pool = getattr(getattr(db, "engine", None), "pool", None)
+    samples = []
+    for state in ("checkedout", "checkedin", "overflow", "size"):
+        reader = getattr(pool, state, None)
+        if not callable(reader):
+            continue
+        try:
+            samples.append(({"state": state}, float(reader())))
+        except Exception:
+            continue
+    return samples
+
+
+def render_metrics(loop_lag_ms: Optional[float] = None) -> str:
+    """Renders every in-process counter in the Prometheus text format."""
+    lines: list[str] = []
+
+    lines.extend(
+        _histogram_lines(
+            "command_duration",
+            "command",
+            COMMAND_LATENCIES,
+            "Slash command duration.",
+        )
+    )
+    lines.extend(
+        _histogram_lines(
+            "job_duration", "job", TASK_LATENCIES, "Scheduled job duration."
+        )
+    )
+    lines.extend(
+        _histogram_lines(
+            "member_update_handler_duration",
+            "handler",
+            member_update_emitter.latencies,
+            "Member update handler duration.",
+        )
+    )
+
+    data_files = DATA_FILES.stats()
+    lines.extend(
+        _counter_lines(
+            "data_file_hits_total",
+            "Data file cache hits.",
+            [({"file": path}, entry["hits"]) for path, entry in data_files.items()],
+        )
+    )
+    lines.extend(
+        _counter_lines(
+            "data_file_loads_total",
+            "Data file loads from disk.",
+            [({"file": path}, entry["loads"]) for path, entry in data_files.items()],
+        )
+    )
+
+    rate_limit = RATE_LIMITER.stats()
+    lines.extend(
+        _counter_lines(
+            "rate_limit_total",
+            "Rate limited command calls by outcome.",
+            [
+                ({"command": command, "outcome": outcome}, counts[outcome])
+                for command, counts in rate_limit.items()
+                for outcome in ("allowed", "throttled")
+            ],
+        )
+    )
+
+    render = RENDER_SERVICE.stats()
+    lines.extend(
+        _counter_lines(
+            "render_jobs_total",
+            "Render jobs by outcome.",
+            [
+                ({"outcome": outcome}, render[outcome])
+                for outcome in ("completed", "failed", "rejected", "timed_out")
+            ],
+        )
+    )
+    lines.extend(
+        _gauge_lines(
+            "render_in_flight",
+            "Render jobs running or queued.",
+            [({}, render["in_flight"])],
+        )
+    )
+
+    updates = member_update_debouncer.stats()
+    lines.extend(
+        _counter_lines(
+            "member_updates_total",
+            "Member update events by debouncer outcome.",
+            [
+                ({"outcome": outcome}, updates[outcome])
+                for outcome in ("received", "merged", "dispatched", "dropped")
+            ],
+        )
+    )
+
+    pool = _db_pool_samples()
+    if pool:
+        lines.extend(_gauge_lines("db_connections", "Database pool connections.", pool))
+
+    lines.extend(
+        _counter_lines(
+            "event_loop_stalls_total",
+            "Event loop stalls over the lag threshold.",
+            [({}, LOOP_MONITOR.stalls)],
+        )
+    )
+    if loop_lag_ms is not None:
+        lines.extend(
+            _gauge_lines(
+                "event_loop_lag_seconds",
+                "Lateness of the loop monitor's last wake up.",
+                [({}, round(loop_lag_ms / 1000, 6))],
+            )
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def _build_server(config):
+    """uvicorn server that leaves SIGINT/SIGTERM to the bot's own handlers."""
+    import uvicorn
+
+    class EmbeddedServer(uvicorn.Server):
+        @contextlib.contextmanager
+        def capture_signals(self) -> Iterator[None]:
+            yield
+
+    return EmbeddedServer(config)
+
+
+class MetricsServer:
+    """Serves /metrics and /health from inside the bot process.
+
+    fastapi and uvicorn are only imported when the server starts, so a bot
+    with metrics disabled does not pay for them.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.client: Optional["discord.Client"] = None
+        self._server = None
+        self._task: Optional[asyncio.Task] = None
+
+    def build_app(self):
+        from fastapi import FastAPI, Response
+
+        app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+        @app.get("/metrics")
+        async def metrics() -> Response:
+            return Response(
+                render_metrics(LOOP_MONITOR.last_lag_ms), media_type=CONTENT_TYPE
+            )
+
+        @app.get("/health")
+        async def health(response: Response) -> dict[str, Any]:
+            ready = bool(self.client and self.client.is_ready())
+            shutting_down = bool(STATE.state.get("is_shutting_down"))
+            if not ready or shutting_down:
+                response.status_code = 503
+            return {
+                "status": "ok" if response.status_code != 503 else "unavailable",
+                "discord_ready": ready,
+                "shutting_down": shutting_down,
+                "loop_lag_ms": LOOP_MONITOR.last_lag_ms,
+            }
+
+        return app
+
+    async def start(self, client: Optional["discord.Client"] = None) -> None:
+        if self._server is not None:
+            return
+
+        try:
+            import uvicorn
+
+            config = uvicorn.Config(
+                self.build_app(),
+                host=self.host,
+                port=self.port,
+                log_level="warning",
+                access_log=False,
+                lifespan="off",
+            )
+        except ImportError as e:
+            logger.error(f"Metrics server unavailable: {e}")
+            return
+
+        self.client = client
+        server = _build_server(config)
+        self._server = server
+        self._task = asyncio.create_task(self._serve(server))
+
+        # uvicorn only reports a failed bind by exiting, so wait to see
+        # whether it got as far as listening
+        deadline = asyncio.get_running_loop().time() + METRICS_STARTUP_TIMEOUT
+        while not server.started and not self._task.done():
+            if asyncio.get_running_loop().time() > deadline:
+                server.should_exit = True
+                break
+            await asyncio.sleep(0.05)
+
+        if not server.started:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._server = None
+            self._task = None
+            logger.error(
+                f"Metrics server failed to start on {self.host}:{self.port}, "
+                "continuing without metrics"
+            )
+            return
+
+        logger.info(f"Metrics server listening on {self.host}:{self.port}")
+
+    async def _serve(self, server) -> None:
+        try:
+            await server.serve()
+        except (SystemExit, OSError) as e:
+            # Raised from a task, SystemExit would stop the whole bot
+            logger.error(f"Metrics server exited: {e!r}")
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+
+        self._server.should_exit = True
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._server = None
+        self._task = None
+        logger.info("Metrics server stopped")
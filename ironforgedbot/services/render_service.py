@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from ironforgedbot.common.spans import PHASE_RENDER, span_phase
+from ironforgedcore.event_emitter import event_emitter
+
+logger = logging.getLogger(__name__)
+
+RENDER_WORKERS = 2
+RENDER_QUEUE_LIMIT = 4  # jobs allowed to wait once every worker is busy
+RENDER_TIMEOUT_SECONDS = 60.0
+
+
+class RenderBusyError(Exception):
+    def __init__(self, message="Image renderer is busy, please try again shortly"):
+        self.message = message
+        super().__init__(self.message)
+
+
+def _warm_worker() -> None:
+    """Process initializer, loads shared render assets before the first job."""
+    from ironforgedbot.commands.raffle import build_winner_image
+    from ironforgedbot.commands.spin import build_spin_gif
+
+    try:
+        build_spin_gif._get_font()
+        build_spin_gif._get_background()
+        build_winner_image.preload_assets()
+    except Exception as e:
+        logger.warning(f"Unable to preload render assets: {e}")
+
+
+def _noop() -> None:
+    return None
+
+
+class RenderService:
+    """Runs CPU bound image rendering in a bounded pool of worker processes.
+
+    Keeps PIL work off the event loop (and out of its GIL) so large renders
+    cannot stall gateway heartbeats. Jobs beyond `max_workers + queue_limit`
+    are rejected with RenderBusyError, and a job that exceeds its timeout
+    recycles the pool so a wedged worker cannot hold a slot forever.
+
+    Jobs must be picklable module level functions returning picklable values.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = RENDER_WORKERS,
+        queue_limit: int = RENDER_QUEUE_LIMIT,
+        timeout: float = RENDER_TIMEOUT_SECONDS,
+        initializer: Optional[Callable[[], None]] = _warm_worker,
+    ):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._initializer = initializer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+        event_emitter.on("shutdown", self.shutdown, priority=80)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn keeps the discord client, db pool and loop out of workers
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self._initializer,
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """Spawns and warms every worker ahead of the first render."""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _noop) for _ in range(self.max_workers))
+        )
+        logger.info(f"Render service started with {self.max_workers} workers")
+
+    async def run(
+        self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None
+    ) -> Any:
+        """Runs `func(*args)` in a worker process and returns its result.
+
+        Raises RenderBusyError when the queue is full and asyncio.TimeoutError
+        when the job takes longer than `timeout` seconds.
+        """
+        if self._in_flight >= self.max_workers + self.queue_limit:
+            self._rejected += 1
+            raise RenderBusyError()
+
+        executor = self._get_executor()
+        timeout = timeout or self.timeout
+
+        self._in_flight += 1
+        try:
+            with span_phase(PHASE_RENDER):
+                result = await asyncio.wait_for(
+                    asyncio.wrap_future(executor.submit(func, *args)), timeout
+                )
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            logger.error(
+                f"Render job {func.__name__} exceeded {timeout}s, recycling workers"
+            )
+            self._recycle(executor)
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+        self._completed += 1
+        return result
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is executor:
+            self._executor = None
+
+        # A running job cannot be cancelled, only its process killed. Any
+        # other jobs on this pool fail with BrokenProcessPool.
+        terminate = getattr(executor, "terminate_workers", None)
+        if terminate is not None:
+            terminate()
+        else:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def shutdown(self) -> None:
+        """Cancels queued jobs and stops the worker processes."""
+        if self._executor is None:
+            return
+
+        executor, self._executor = self._executor, None
+        logger.info("Stopping render workers...")
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def stats(self) -> dict[str, int]:
+        """Returns queue depth and job outcome counters."""
+        return {
+            "workers": self.max_workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+        }
+
+
+RENDER_SERVICE = RenderService()
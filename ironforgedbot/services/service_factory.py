@@ -1,7 +1,8 @@
 """Bot-side service factory: re-exports core factories and adds bot-specific.
 
 Bot-only `absent_service` stays in ironforgedbot because it depends on
-gspread Sheets.
+gspread Sheets. `get_score_service` and `get_wom_service` wrap the core
+factories to apply the HISCORES_URL and WOM_BASE_URL overrides.
 """
 
 import logging
@@ -20,10 +21,16 @@ from ironforgedcore.services.service_factory import (
     create_member_service,
     create_raffle_service,
     create_score_history_service,
-    get_wom_service,
 )
-from ironforgedcore.services.score_service import ScoreService, get_score_service
+from ironforgedcore.services.service_factory import (
+    get_wom_service as core_get_wom_service,
+)
+from ironforgedcore.services.score_service import ScoreService
+from ironforgedcore.services.score_service import (
+    get_score_service as core_get_score_service,
+)
 from ironforgedcore.services.wom_service import WomService
+from ironforgedbot.config import CONFIG
 from ironforgedbot.services.absent_service import AbsentMemberService
 
 __all__ = [
@@ -84,3 +91,18 @@ class ServiceFactory:
 def create_absent_service(session: AsyncSession) -> AbsentMemberService:
     """Create AbsentMemberService instance (bot-only — uses Google Sheets)."""
     return AbsentMemberService(session)
+
+
+def get_score_service(http_client: Optional[AsyncHttpClient] = None) -> ScoreService:
+    """Core ScoreService, fetching from HISCORES_URL when it is set."""
+    service = core_get_score_service(http_client)
+    if CONFIG.HISCORES_URL:
+        service.hiscores_url = CONFIG.HISCORES_URL
+    return service
+
+
+def get_wom_service() -> WomService:
+    """Core WomService for the clan group, using WOM_BASE_URL when it is set."""
+    if CONFIG.WOM_BASE_URL:
+        return WomService(base_url=CONFIG.WOM_BASE_URL, group_id=CONFIG.WOM_GROUP_ID)
+    return core_get_wom_service()
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import logging
 import os
 import sys
-from typing import TypedDict
+import time
+from typing import Any, Callable, Optional, TypedDict
 
 import aiofiles
 
@@ -10,19 +12,113 @@ from ironforgedcore.event_emitter import event_emitter
 
 logger = logging.getLogger(__name__)
 
+# Keys that only describe the running process and are never persisted.
+VOLATILE_KEYS = {"is_shutting_down"}
+
 
 class BotStateDict(TypedDict):
     is_shutting_down: bool
     rate_limit: dict
     trick_or_treat_jackpot_claimed: bool
     double_or_nothing_offers: dict
+    command_reservations: dict
     raffle_on: bool
     raffle_price: int
+    command_tree_hash: dict
+
+
+def _default_state() -> BotStateDict:
+    return {
+        "is_shutting_down": False,
+        "rate_limit": dict(),
+        "trick_or_treat_jackpot_claimed": False,
+        "double_or_nothing_offers": dict(),
+        "command_reservations": dict(),
+        "raffle_on": False,
+        "raffle_price": 5_000,
+        "command_tree_hash": dict(),
+    }
+
+
+class _JournaledDict(dict):
+    """Dict that reports every mutation to the top level key that owns it.
+
+    Nested dicts are wrapped as they are assigned, so a write such as
+    `STATE.state["double_or_nothing_offers"][user_id] = {...}` marks
+    `double_or_nothing_offers` dirty without callers knowing about the journal.
+    """
+
+    def __init__(
+        self,
+        data: dict,
+        on_change: Callable[[str], None],
+        root_key: Optional[str] = None,
+    ):
+        super().__init__()
+        self._on_change = on_change
+        self._root_key = root_key
+        for key, value in data.items():
+            dict.__setitem__(self, key, self._wrap(key, value))
+
+    def _wrap(self, key: str, value: Any) -> Any:
+        if isinstance(value, dict):
+            return _JournaledDict(value, self._on_change, self._root_key or key)
+        return value
+
+    def _changed(self, key: str) -> None:
+        self._on_change(self._root_key or key)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, self._wrap(key, value))
+        self._changed(key)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._changed(key)
+
+    def pop(self, key, *args):
+        had_key = key in self
+        value = dict.pop(self, key, *args)
+        if had_key:
+            self._changed(key)
+        return value
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self._changed(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        keys = list(self.keys())
+        dict.clear(self)
+        for key in keys:
+            self._changed(key)
 
 
 class BotState:
+    """Process wide bot state with write-ahead persistence.
+
+    Mutations mark their top level key dirty. Dirty keys are appended to an
+    append-only journal after a short debounce, so hot paths never wait on
+    disk. The journal is folded into a snapshot once it grows past
+    `_compact_threshold` entries, and on load the snapshot is read and the
+    journal replayed on top of it.
+    """
+
     _instance = None
     _file_path = "state.json"
+    _journal_path = "state.journal"
+    _flush_delay = 1.0  # seconds to coalesce bursts of writes
+    _compact_threshold = 500  # journal entries before writing a new snapshot
 
     def __new__(cls):
         if cls._instance is None:
@@ -30,47 +126,218 @@ class BotState:
         return cls._instance
 
     def __init__(self):
-        self.state: BotStateDict = {
-            "is_shutting_down": False,
-            "rate_limit": dict(),
-            "trick_or_treat_jackpot_claimed": False,
-            "double_or_nothing_offers": dict(),
-            "raffle_on": False,
-            "raffle_price": 5_000,
-        }
+        self._dirty: set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._io_lock = asyncio.Lock()
+        self._seq = 0
+        self._journal_entries = 0
+
+        self.state = _default_state()
 
         event_emitter.on("shutdown", self._save_state, priority=90)
 
-    async def _save_state(self):
+    @property
+    def state(self) -> BotStateDict:
+        return self._state  # type: ignore[return-value]
+
+    @state.setter
+    def state(self, value: dict) -> None:
+        self._state = _JournaledDict(value, self._mark_dirty)
+
+    def _mark_dirty(self, key: str) -> None:
+        """Record that a top level key changed and schedule a journal flush."""
+        if key in VOLATILE_KEYS:
+            return
+
+        self._dirty.add(key)
+
         try:
-            async with aiofiles.open(self._file_path, "w") as file:
-                # reset shut down flag so we don't get stuck
-                self.state["is_shutting_down"] = False
-                await file.write(json.dumps(self.state))
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet, the key is written by the next flush or at shutdown
+            return
 
-            logger.debug(f"State saved to {self._file_path}")
-        except Exception as e:
-            logger.critical(f"Error saving state: {e}")
+        if self._flush_handle is not None and self._flush_loop is loop:
+            return
+
+        self._flush_loop = loop
+        self._flush_handle = loop.call_later(self._flush_delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self.flush())
+
+    def _snapshot(self) -> dict:
+        state = json.loads(json.dumps(self._state))
+        # reset shut down flag so we don't get stuck
+        state["is_shutting_down"] = False
+        return {"seq": self._seq, "state": state}
+
+    async def flush(self) -> None:
+        """Append the current value of every dirty key to the journal."""
+        async with self._io_lock:
+            if not self._dirty:
+                return
+
+            keys = sorted(self._dirty)
+            self._dirty.clear()
+
+            entries = []
+            for key in keys:
+                self._seq += 1
+                entries.append(
+                    json.dumps(
+                        {
+                            "seq": self._seq,
+                            "ts": time.time(),
+                            "key": key,
+                            "value": self._state[key],
+                        }
+                    )
+                )
 
-    async def load_state(self):
-        if os.path.exists(self._file_path):
             try:
-                async with aiofiles.open(self._file_path, "r") as file:
-                    content = json.loads(await file.read())
+                async with aiofiles.open(self._journal_path, "a") as file:
+                    await file.write("\n".join(entries) + "\n")
+            except Exception as e:
+                self._dirty.update(keys)
+                logger.error(f"Error writing state journal: {e}")
+                return
 
-                    if content.keys() != self.state.keys():
-                        logger.warning("Invalid state file, using default state object")
-                        return
+            self._journal_entries += len(entries)
+            logger.debug(f"Journaled {len(entries)} state change(s)")
 
-                    self.state = content
+        if self._journal_entries >= self._compact_threshold:
+            await self.compact()
 
-                logger.info(f"State loaded from: {self._file_path}")
+    async def compact(self) -> None:
+        """Write a fresh snapshot and truncate the journal it supersedes.
+
+        Keys dirtied and journal entries appended while the snapshot is being
+        written are newer than it, so they are kept for the next flush.
+        """
+        async with self._io_lock:
+            temp_path = f"{self._file_path}.tmp"
+            snapshot = self._snapshot()
+            # The snapshot covers every change pending at this point
+            snapshot_dirty, self._dirty = self._dirty, set()
+            journal_offset = (
+                os.path.getsize(self._journal_path)
+                if os.path.exists(self._journal_path)
+                else 0
+            )
+
+            try:
+                async with aiofiles.open(temp_path, "w") as file:
+                    await file.write(json.dumps(snapshot))
+                os.replace(temp_path, self._file_path)
+
+                async with aiofiles.open(self._journal_path, "ab+") as file:
+                    await file.seek(journal_offset)
+                    newer = await file.read()
+                async with aiofiles.open(self._journal_path, "wb") as file:
+                    await file.write(newer)
+                self._journal_entries = len(newer.splitlines())
+
+                logger.debug(f"State compacted to {self._file_path}")
             except Exception as e:
-                logger.critical(f"Error loading state: {e}")
-        else:
+                self._dirty |= snapshot_dirty
+                logger.critical(f"Error compacting state: {e}")
+
+    async def _save_state(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        await self.flush()
+        await self.compact()
+        logger.debug(f"State saved to {self._file_path}")
+
+    async def _read_snapshot(self, state: dict) -> int:
+        """Merge the snapshot file into `state`, returning its journal sequence."""
+        if not os.path.exists(self._file_path):
             logger.debug(
                 f"No previous state file found at {self._file_path}, using defaults"
             )
+            return 0
+
+        try:
+            async with aiofiles.open(self._file_path, "r") as file:
+                content = json.loads(await file.read())
+        except Exception as e:
+            logger.critical(f"Error loading state: {e}")
+            return 0
+
+        seq = 0
+        # Files written before journaling are the bare state dict
+        if "state" in content and "seq" in content:
+            seq = int(content["seq"])
+            content = content["state"]
+
+        if content.keys() != state.keys():
+            logger.warning("State file keys differ from defaults, merging known keys")
+
+        for key in state.keys() & content.keys():
+            if key not in VOLATILE_KEYS:
+                state[key] = content[key]
+
+        return seq
+
+    async def _replay_journal(self, state: dict, seq: int) -> tuple[int, int]:
+        """Apply journal entries newer than `seq` to `state`."""
+        if not os.path.exists(self._journal_path):
+            return seq, 0
+
+        try:
+            async with aiofiles.open(self._journal_path, "r") as file:
+                lines = (await file.read()).splitlines()
+        except Exception as e:
+            logger.critical(f"Error reading state journal: {e}")
+            return seq, 0
+
+        replayed = 0
+        for line in lines:
+            if not line.strip():
+                continue
+
+            try:
+                entry = json.loads(line)
+                entry_seq = int(entry["seq"])
+                key = entry["key"]
+                value = entry["value"]
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                # A crash mid-append leaves a torn final line
+                logger.warning("Skipping unreadable state journal entry")
+                continue
+
+            if entry_seq <= seq or key not in state or key in VOLATILE_KEYS:
+                continue
+
+            state[key] = value
+            seq = entry_seq
+            replayed += 1
+
+        return seq, replayed
+
+    async def load_state(self):
+        state = dict(_default_state())
+
+        seq = await self._read_snapshot(state)
+        seq, replayed = await self._replay_journal(state, seq)
+
+        self.state = state
+        self._seq = seq
+        self._dirty.clear()
+
+        logger.info(
+            f"State loaded from: {self._file_path} "
+            f"({replayed} journal entries replayed)"
+        )
+
+        if replayed:
+            await self.compact()
 
 
 try:
@@ -0,0 +1,118 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def freeze(value: Any) -> Any:
+    """Returns a read-only copy of parsed JSON/YAML data.
+
+    Dicts become MappingProxyType views and lists become tuples, recursively,
+    so a cached file can be shared between callers without being mutated.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@dataclass
+class _DataFileEntry:
+    value: Any
+    mtime: float
+    loaded_at: float
+    load_ms: float
+    loads: int = 1
+    hits: int = 0
+
+
+class DataFileRegistry:
+    """Loads each data file once and reloads it when its mtime changes.
+
+    The loader passed to `get` is responsible for parsing and validating the
+    file and is only called on first use or after the file changes on disk.
+    If a reload fails the previously loaded version keeps being served.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, Callable], _DataFileEntry] = {}
+
+    def get(self, file_path: str, loader: Callable[[str], Any]) -> Any:
+        """Returns the frozen result of `loader(file_path)`, loading if stale."""
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
+            # Let the loader raise its own descriptive error
+            return freeze(loader(file_path))
+
+        key = (file_path, loader)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime == mtime:
+                entry.hits += 1
+                return entry.value
+
+            start = time.perf_counter()
+            try:
+                value = freeze(loader(file_path))
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.error(
+                    f"Failed to reload {file_path}, keeping previous version: {e}"
+                )
+                entry.mtime = mtime
+                return entry.value
+
+            load_ms = (time.perf_counter() - start) * 1000
+            loads = entry.loads + 1 if entry is not None else 1
+            self._entries[key] = _DataFileEntry(
+                value=value,
+                mtime=mtime,
+                loaded_at=time.time(),
+                load_ms=load_ms,
+                loads=loads,
+            )
+
+        if loads > 1:
+            logger.info(f"Reloaded {file_path} in {load_ms:.1f}ms")
+        else:
+            logger.debug(f"Loaded {file_path} in {load_ms:.1f}ms")
+
+        return value
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Returns load timings and cache hits per file."""
+        with self._lock:
+            return {
+                file_path: {
+                    "loads": entry.loads,
+                    "hits": entry.hits,
+                    "last_load_ms": round(entry.load_ms, 2),
+                    "loaded_at": int(entry.loaded_at),
+                }
+                for (file_path, _), entry in sorted(
+                    self._entries.items(), key=lambda item: item[0][0]
+                )
+            }
+
+    def clear(self, file_path: Optional[str] = None) -> None:
+        """Drops cached files so the next `get` reloads them."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[0] == file_path]:
+                del self._entries[key]
+
+
+DATA_FILES = DataFileRegistry()
@@ -0,0 +1,314 @@
+import asyncio
+import json
+import logging
+import statistics
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiofiles
+from tabulate import tabulate
+
+logger = logging.getLogger(__name__)
+
+JOB_HISTORY_PATH = "job_runs.jsonl"
+JOB_HISTORY_KEEP = 100  # runs kept in memory and on disk, for each job
+
+OUTCOME_OK = "ok"
+OUTCOME_FAILED = "failed"
+OUTCOME_CANCELLED = "cancelled"
+
+
+@dataclass
+class JobRun:
+    job: str
+    started_at: float
+    finished_at: Optional[float] = None
+    items: int = 0
+    errors: int = 0
+    outcome: str = "running"
+    waited_s: float = 0.0  # queued before the coordinator let it start
+
+    @property
+    def duration_s(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return max(end - self.started_at, 0.0)
+
+    @property
+    def items_per_second(self) -> Optional[float]:
+        if not self.items or not self.duration_s:
+            return None
+        return self.items / self.duration_s
+
+    def to_dict(self) -> Dict[str, Any]:
+        rate = self.items_per_second
+        return {
+            **asdict(self),
+            "duration_s": round(self.duration_s, 3),
+            "items_per_second": round(rate, 3) if rate is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobRun":
+        return cls(
+            job=data["job"],
+            started_at=data["started_at"],
+            finished_at=data.get("finished_at"),
+            items=data.get("items", 0),
+            errors=data.get("errors", 0),
+            outcome=data.get("outcome", OUTCOME_OK),
+            waited_s=data.get("waited_s", 0.0),
+        )
+
+
+_current_run: ContextVar[Optional[JobRun]] = ContextVar("job_run", default=None)
+
+
+def record_job_items(count: int = 1) -> None:
+    """Adds to the items processed by the job running in this context, if any."""
+    run = _current_run.get()
+    if run is not None:
+        run.items += count
+
+
+def record_job_error(count: int = 1) -> None:
+    """Counts an error the running job handled without failing."""
+    run = _current_run.get()
+    if run is not None:
+        run.errors += count
+
+
+class JobRunHistory:
+    """Append-only history of scheduled job runs.
+
+    Each finished run is appended to a JSON lines file so trends survive
+    restarts. The newest `keep` runs of each job are kept, so a job that runs
+    every few minutes can't push a weekly job out of the history. The file is
+    rewritten with only the kept runs once it has grown to twice that size.
+    """
+
+    def __init__(self, path: str = JOB_HISTORY_PATH, keep: int = JOB_HISTORY_KEEP):
+        self.path = path
+        self.keep = keep
+        self._runs: defaultdict[str, deque[JobRun]] = defaultdict(
+            lambda: deque(maxlen=self.keep)
+        )
+        self._running: Dict[str, JobRun] = {}
+        self._lines_on_disk = 0
+        self._io_lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        try:
+            async with aiofiles.open(self.path, "r") as file:
+                lines = (await file.read()).splitlines()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Unable to read job history: {e}")
+            return
+
+        self._runs.clear()
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                run = JobRun.from_dict(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Skipping malformed job history line")
+                continue
+            self._runs[run.job].append(run)
+
+        self._lines_on_disk = len(lines)
+        logger.info(f"Loaded {self._kept()} job runs from history")
+
+    @asynccontextmanager
+    async def track(self, job: str, waited_s: float = 0.0) -> AsyncIterator[JobRun]:
+        """Records a run of `job` covering the enclosed block."""
+        run = JobRun(job=job, started_at=time.time(), waited_s=round(waited_s, 3))
+        token = _current_run.set(run)
+        self._running[job] = run
+        try:
+            yield run
+            run.outcome = OUTCOME_OK
+        except asyncio.CancelledError:
+            run.outcome = OUTCOME_CANCELLED
+            raise
+        except BaseException:
+            run.outcome = OUTCOME_FAILED
+            raise
+        finally:
+            run.finished_at = time.time()
+            _current_run.reset(token)
+            if self._running.get(job) is run:
+                del self._running[job]
+            await self.append(run)
+
+    async def append(self, run: JobRun) -> None:
+        async with self._io_lock:
+            self._runs[run.job].append(run)
+            try:
+                if self._lines_on_disk >= max(self._kept(), self.keep) * 2:
+                    await self._rewrite()
+                else:
+                    async with aiofiles.open(self.path, "a") as file:
+                        await file.write(json.dumps(run.to_dict()) + "\n")
+                    self._lines_on_disk += 1
+            except Exception as e:
+                logger.error(f"Unable to write job history: {e}")
+
+    async def _rewrite(self) -> None:
+        runs = self.runs()
+        content = "".join(json.dumps(run.to_dict()) + "\n" for run in runs)
+        async with aiofiles.open(self.path, "w") as file:
+            await file.write(content)
+        self._lines_on_disk = len(runs)
+
+    def _kept(self) -> int:
+        return sum(len(runs) for runs in self._runs.values())
+
+    def running(self, job: str) -> Optional[JobRun]:
+        """The in-progress run of `job`, for progress reporting."""
+        return self._running.get(job)
+
+    def runs(
+        self, job: Optional[str] = None, last: Optional[int] = None
+    ) -> List[JobRun]:
+        """Returns finished runs oldest first, optionally for one job only."""
+        if job is not None:
+            runs = list(self._runs.get(job, ()))
+        else:
+            runs = sorted(
+                (run for job_runs in self._runs.values() for run in job_runs),
+                key=lambda run: run.finished_at or run.started_at,
+            )
+        return runs[-last:] if last else runs
+
+    def trends(self, last: int = 20) -> Dict[str, Dict[str, Any]]:
+        """Summarises the last `last` runs of every job.
+
+        `duration_trend` compares the median duration of the newer half of the
+        runs with the older half, so 1.5 means runs have become 50% slower.
+        """
+        summary = {}
+        for job in sorted(self._runs):
+            runs = self.runs(job, last)
+            if not runs:
+                continue
+            durations = [run.duration_s for run in runs]
+            rates = [
+                run.items_per_second for run in runs if run.items_per_second is not None
+            ]
+
+            trend = None
+            half = len(durations) // 2
+            if half:
+                older = statistics.median(durations[:half])
+                newer = statistics.median(durations[-half:])
+                trend = round(newer / older, 2) if older else None
+
+            summary[job] = {
+                "runs": len(runs),
+                "last_run": datetime.fromtimestamp(
+                    runs[-1].started_at, timezone.utc
+                ).isoformat(timespec="seconds"),
+                "last_outcome": runs[-1].outcome,
+                "last_duration_s": round(durations[-1], 2),
+                "median_duration_s": round(statistics.median(durations), 2),
+                "max_duration_s": round(max(durations), 2),
+                "duration_trend": trend,
+                "median_items_per_second": (
+                    round(statistics.median(rates), 2) if rates else None
+                ),
+                "errors": sum(run.errors for run in runs),
+                "failures": sum(
+                    run.outcome in (OUTCOME_FAILED, OUTCOME_CANCELLED) for run in runs
+                ),
+            }
+        return summary
+
+    def format_trends(self, last: int = 20) -> str:
+        """Table of per job trends followed by the most recent runs."""
+        trends = self.trends(last)
+        if not trends:
+            return "No job runs recorded yet."
+
+        def _value(value: Any) -> Any:
+            return "-" if value is None else value
+
+        trend_rows = [
+            [
+                job,
+                entry["runs"],
+                entry["last_run"],
+                entry["last_outcome"],
+                entry["last_duration_s"],
+                entry["median_duration_s"],
+                entry["max_duration_s"],
+                _value(entry["duration_trend"]),
+                _value(entry["median_items_per_second"]),
+                entry["errors"],
+                entry["failures"],
+            ]
+            for job, entry in trends.items()
+        ]
+        recent_rows = [
+            [
+                run.job,
+                datetime.fromtimestamp(run.started_at, timezone.utc).strftime(
+                    "%m-%d %H:%M:%S"
+                ),
+                f"{run.waited_s:.1f}",
+                f"{run.duration_s:.2f}",
+                run.items,
+                _value(
+                    round(run.items_per_second, 2)
+                    if run.items_per_second is not None
+                    else None
+                ),
+                run.errors,
+                run.outcome,
+            ]
+            for run in reversed(self.runs(last=last))
+        ]
+
+        return (
+            f"Job trends over the last {last} runs of each job. Trend is the "
+            "median duration of the newer half over the older half.\n\n"
+            + tabulate(
+                trend_rows,
+                headers=[
+                    "Job",
+                    "Runs",
+                    "Last run (UTC)",
+                    "Outcome",
+                    "Last s",
+                    "Median s",
+                    "Max s",
+                    "Trend",
+                    "Items/s",
+                    "Errors",
+                    "Failures",
+                ],
+            )
+            + f"\n\nLast {len(recent_rows)} runs\n\n"
+            + tabulate(
+                recent_rows,
+                headers=[
+                    "Job",
+                    "Started (UTC)",
+                    "Waited s",
+                    "Seconds",
+                    "Items",
+                    "Items/s",
+                    "Errors",
+                    "Outcome",
+                ],
+            )
+        )
+
+
+JOB_HISTORY = JobRunHistory()
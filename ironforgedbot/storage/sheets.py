@@ -1,12 +1,15 @@
 import asyncio
 import logging
 from typing import Any, Iterable
-import gspread
 
-from google.oauth2 import service_account
+from ironforgedbot.common.lazy_import import lazy_module
 from ironforgedbot.config import CONFIG
 from threading import Lock
 
+# gspread and google-auth take longer to import than the rest of the bot
+gspread = lazy_module("gspread")
+service_account = lazy_module("google.oauth2.service_account")
+
 logging.getLogger("googleapiclient").setLevel(logging.ERROR)
 logger = logging.getLogger(__name__)
 
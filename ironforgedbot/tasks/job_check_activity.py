@@ -20,10 +20,11 @@ from ironforgedbot.config import CONFIG
 from ironforgedcore.database import db
 from ironforgedbot.services.service_factory import (
     create_absent_service,
+    get_wom_service,
 )
+from ironforgedbot.storage.job_history import record_job_error, record_job_items
 from ironforgedcore.services.wom_service import (
     WomService,
-    get_wom_service,
     WomServiceError,
     WomRateLimitError,
     WomTimeoutError,
@@ -73,8 +74,11 @@ async def job_check_activity(
                 logger.warning(
                     f"Activity check {execution_id} failed to fetch WOM data"
                 )
+                record_job_error()
                 return
 
+            record_job_items(len(check_results))
+
             if not check_results:
                 logger.info(f"Activity check {execution_id} returned no results")
                 await report_channel.send(
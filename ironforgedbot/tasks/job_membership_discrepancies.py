@@ -10,8 +10,9 @@ from ironforgedbot.common.helpers import (
 )
 from ironforgedcore.common.normalize import normalize_discord_string, normalize_rsn
 from ironforgedbot.common.logging_utils import log_task_execution
+from ironforgedbot.storage.job_history import record_job_items
+from ironforgedbot.services.service_factory import get_wom_service
 from ironforgedcore.services.wom_service import (
-    get_wom_service,
     WomServiceError,
     WomRateLimitError,
     WomTimeoutError,
@@ -66,6 +67,8 @@ async def job_check_membership_discrepancies(
         f"Wise Old Man: **{len(wom_members)}** members\n\n_Computing discrepancies..._"
     )
 
+    record_job_items(len(set(discord_members) | set(wom_members)))
+
     only_discord = sorted(list(set(discord_members) - set(wom_members)))
     only_wom = sorted(list(set(wom_members) - set(discord_members)))
 
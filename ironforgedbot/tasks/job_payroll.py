@@ -15,6 +15,7 @@ from ironforgedbot.services.service_factory import (
     create_ingot_service,
     create_member_service,
 )
+from ironforgedbot.storage.job_history import record_job_error, record_job_items
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,7 @@ async def pay_group(
             )
         except Exception as e:
             logger.error(f"Failed to pay {member.nickname}: {e}")
+            record_job_error()
             continue
 
         if not payment_result:
@@ -56,6 +58,7 @@ async def pay_group(
             logger.error(
                 f"Payment response invalid for {member.nickname}: {payment_result}"
             )
+            record_job_error()
             continue
 
         if not payment_result.status:
@@ -72,6 +75,7 @@ async def pay_group(
             continue
 
         logger.debug(f"Paid {member.nickname} {payment} ingots: {reason}")
+        record_job_items()
         output.append(
             [
                 member.nickname,
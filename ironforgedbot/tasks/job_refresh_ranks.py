@@ -20,14 +20,13 @@ from ironforgedbot.common.ranks_discord import get_rank_from_member
 from ironforgedbot.common.text_formatters import text_bold, text_h2
 from ironforgedcore.exceptions.score_exceptions import HiscoresNotFound
 from ironforgedcore.http import HTTP
-from ironforgedcore.services.score_service import (
-    ScoreService,
-    get_score_service,
-)
+from ironforgedcore.services.score_service import ScoreService
 from ironforgedbot.services.service_factory import (
     create_member_service,
     create_score_history_service,
+    get_score_service,
 )
+from ironforgedbot.storage.job_history import record_job_error, record_job_items
 
 logger = logging.getLogger(__name__)
 
@@ -291,6 +290,7 @@ async def job_refresh_ranks(
                 await asyncio.sleep(round(random.uniform(0.1, 1), 2))
 
             logger.debug(f"Processing member: {member.nickname}")
+            record_job_items()
 
             _ = await progress_message.edit(
                 content=primary_message_str
@@ -321,6 +321,7 @@ async def job_refresh_ranks(
 
             if error_message:
                 logger.debug("...error fetching points")
+                record_job_error()
                 issues.append(error_message)
                 continue
 
@@ -11,6 +11,7 @@ from ironforgedbot.common.helpers import datetime_to_discord_relative
 from ironforgedcore.common.numbers import format_duration
 from ironforgedbot.common.logging_utils import log_task_execution
 from ironforgedbot.common.text_formatters import text_h2
+from ironforgedbot.storage.job_history import record_job_error, record_job_items
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,14 @@ async def job_sync_members(
         changes = await sync_members(guild)
     except Exception as e:
         logger.error(f"Member sync failed: {e}", exc_info=True)
+        record_job_error()
         await report_channel.send(
             "🚨 An unhandled error occurred during member sync. Please check the logs."
         )
         return
 
     end_time = time.perf_counter()
+    record_job_items(len(changes))
 
     if len(changes) < 1:
         await report_channel.send(
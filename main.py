@@ -19,24 +19,13 @@ from ironforgedbot.command_tree import IronForgedCommands, IronForgedCommandTree
 from ironforgedbot.config import CONFIG
 from ironforgedcore.http import HTTP
 from ironforgedbot.state import STATE
-from ironforgedcore.storage.data import load_and_set
-from ironforgedcore.storage import data
 
 logger = logging.getLogger(__name__)
 
 
 def init_bot() -> None:
-    load_and_set("data")
-
-    if (
-        CONFIG
-        and STATE
-        and HTTP
-        and data.BOSSES
-        and data.CLUES
-        and data.RAIDS
-        and data.SKILLS
-    ):
+    # Data files load in the background once the client starts, see setup_hook
+    if CONFIG and STATE and HTTP:
         logger.info("Requirements loaded")
 
     create_temp_dir(CONFIG.TEMP_DIR)
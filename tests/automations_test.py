@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import unittest
 import warnings
 from unittest.mock import AsyncMock, Mock, patch
@@ -8,6 +10,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from ironforgedbot.automations import IronForgedAutomations
+from ironforgedbot.services.job_coordinator import JobCoordinator
+from ironforgedbot.storage.job_history import JobRunHistory, record_job_items
 from tests.helpers import create_mock_discord_guild
 
 
@@ -35,6 +39,11 @@ class TestIronForgedAutomations(unittest.IsolatedAsyncioTestCase):
             message="coroutine.*_safe_job_wrapper.*was never awaited",
             category=RuntimeWarning,
         )
+        warnings.filterwarnings(
+            "ignore",
+            message="coroutine.*_run_job.*was never awaited",
+            category=RuntimeWarning,
+        )
 
     def setUp(self):
         self.mock_guild = create_mock_discord_guild()
@@ -45,6 +54,24 @@ class TestIronForgedAutomations(unittest.IsolatedAsyncioTestCase):
 
         self.automations_to_cleanup = []
 
+        self.history_dir = tempfile.TemporaryDirectory()
+        self.job_history = JobRunHistory(
+            path=os.path.join(self.history_dir.name, "job_runs.jsonl")
+        )
+        history_patcher = patch(
+            "ironforgedbot.automations.JOB_HISTORY", self.job_history
+        )
+        history_patcher.start()
+        self.addCleanup(history_patcher.stop)
+        self.addCleanup(self.history_dir.cleanup)
+
+        self.coordinator = JobCoordinator()
+        coordinator_patcher = patch(
+            "ironforgedbot.automations.JOB_COORDINATOR", self.coordinator
+        )
+        coordinator_patcher.start()
+        self.addCleanup(coordinator_patcher.stop)
+
     def tearDown(self):
         for automation in self.automations_to_cleanup:
             try:
@@ -71,6 +98,7 @@ class TestIronForgedAutomations(unittest.IsolatedAsyncioTestCase):
             mock_config.ENVIRONMENT = "test"
             mock_config.WOM_API_KEY = "test_key"
             mock_config.WOM_GROUP_ID = "test_group"
+            mock_config.JOB_NETWORK_CONCURRENCY = 1
             mock_get_channel.return_value = self.mock_channel
 
             mock_task = Mock()
@@ -396,6 +424,85 @@ class TestIronForgedAutomations(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(call_args, (("arg1",), {"kwarg1": "value1"}))
 
+    async def test_tracked_job_records_job_run(self):
+        automation = self.create_automation_with_mocks()
+
+        async def mock_job_func():
+            pass
+
+        await (await automation.track_job(mock_job_func))
+
+        runs = self.job_history.runs("mock_job_func")
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0].outcome, "ok")
+
+    async def test_tracked_job_records_failed_job_run(self):
+        automation = self.create_automation_with_mocks()
+
+        async def mock_job_func():
+            raise ValueError("Test error")
+
+        task = await automation.track_job(mock_job_func)
+        with self.assertRaises(ValueError):
+            await task
+
+        self.assertEqual(self.job_history.runs("mock_job_func")[0].outcome, "failed")
+
+    async def test_submit_job_returns_in_flight_run_for_duplicates(self):
+        automation = self.create_automation_with_mocks()
+        release = asyncio.Event()
+
+        async def mock_job_func():
+            await release.wait()
+
+        first = await automation.submit_job(mock_job_func)
+        await asyncio.sleep(0)
+        second = await automation.submit_job(mock_job_func)
+
+        self.assertFalse(first.duplicate)
+        self.assertTrue(second.duplicate)
+        self.assertIs(second.task, first.task)
+        self.assertEqual(first.status, "running")
+        self.assertIn(first.task, automation._running_jobs)
+
+        release.set()
+        await first.task
+        self.assertEqual(first.status, "completed")
+        third = await automation.submit_job(mock_job_func)
+        self.assertFalse(third.duplicate)
+        await third.task
+
+    async def test_submit_job_reports_progress(self):
+        automation = self.create_automation_with_mocks()
+        release = asyncio.Event()
+
+        async def mock_job_func():
+            record_job_items(3)
+            await release.wait()
+
+        handle = await automation.submit_job(mock_job_func)
+        await asyncio.sleep(0)
+
+        self.assertEqual(handle.progress.items, 3)
+        self.assertIn("**3** items processed", handle.describe())
+
+        release.set()
+        await handle.task
+        self.assertIsNone(handle.progress)
+
+    async def test_submit_job_refused_while_shutting_down(self):
+        automation = self.create_automation_with_mocks()
+
+        async def mock_job_func():
+            pass
+
+        with patch("ironforgedbot.automations.STATE") as mock_state:
+            mock_state.state = {"is_shutting_down": True}
+            handle = await automation.submit_job(mock_job_func)
+
+        self.assertIsNone(handle)
+        self.assertFalse(self.coordinator.is_active("mock_job_func"))
+
     async def test_safe_job_wrapper_handles_cancelled_error(self):
         automation = self.create_automation_with_mocks()
 
@@ -508,8 +615,14 @@ class TestIronForgedAutomations(unittest.IsolatedAsyncioTestCase):
         automation = self.create_automation_with_mocks()
         automation._running_jobs.clear()
 
-        async def mock_job_func(delay):
-            pass
+        job_funcs = []
+        for i in range(6):
+
+            async def mock_job_func(delay):
+                pass
+
+            mock_job_func.__name__ = f"mock_job_{i}"
+            job_funcs.append(mock_job_func)
 
         mock_tasks = [Mock() for _ in range(6)]
 
@@ -517,14 +630,64 @@ class TestIronForgedAutomations(unittest.IsolatedAsyncioTestCase):
             "ironforgedbot.automations.asyncio.create_task", side_effect=mock_tasks
         ):
             tasks = []
-            for i in range(6):
-                task = await automation.track_job(mock_job_func, 0.01)
+            for job_func in job_funcs:
+                task = await automation.track_job(job_func, 0.01)
                 tasks.append(task)
 
         self.assertEqual(len(tasks), 6)
         for mock_task in mock_tasks:
             self.assertIn(mock_task, automation._running_jobs)
 
+    async def test_track_job_skips_job_already_in_flight(self):
+        automation = self.create_automation_with_mocks()
+
+        async def mock_job_func():
+            pass
+
+        with patch(
+            "ironforgedbot.automations.asyncio.create_task", return_value=Mock()
+        ) as mock_create_task:
+            first = await automation.track_job(mock_job_func)
+            second = await automation.track_job(mock_job_func)
+
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        mock_create_task.assert_called_once()
+        self.assertEqual(
+            self.coordinator.stats()["jobs"]["mock_job_func"]["skipped"], 1
+        )
+
+    async def test_job_done_callback_releases_job(self):
+        automation = self.create_automation_with_mocks()
+
+        async def mock_job_func():
+            pass
+
+        mock_task = Mock()
+        mock_task.cancelled.return_value = True
+
+        with patch(
+            "ironforgedbot.automations.asyncio.create_task", return_value=mock_task
+        ):
+            await automation.track_job(mock_job_func)
+
+        self.assertTrue(self.coordinator.is_active("mock_job_func"))
+        automation._job_done_callback(mock_task)
+        self.assertFalse(self.coordinator.is_active("mock_job_func"))
+
+    async def test_tracked_job_runs_to_completion(self):
+        automation = self.create_automation_with_mocks()
+        ran = asyncio.Event()
+
+        async def mock_job_func():
+            ran.set()
+
+        task = await automation.track_job(mock_job_func)
+        await task
+
+        self.assertTrue(ran.is_set())
+        self.assertFalse(self.coordinator.is_active("mock_job_func"))
+
     @patch("ironforgedbot.automations.CONFIG")
     def test_cron_trigger_from_config(self, mock_config):
         mock_config.CRON_SYNC_MEMBERS = "50 3,15 * * *"
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 import discord
 
 from ironforgedbot.client import DiscordClient
+from ironforgedbot.events.member_update_debouncer import member_update_debouncer
 
 
 class ClientTest(unittest.IsolatedAsyncioTestCase):
@@ -77,6 +78,7 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
 
         self.assertFalse(result)
 
+    @patch("ironforgedbot.client.refund_open_reservations")
     @patch("ironforgedbot.client.STATE")
     @patch("ironforgedbot.client.event_emitter")
     @patch("ironforgedbot.client.db")
@@ -91,6 +93,7 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
         mock_db,
         mock_emitter,
         mock_state,
+        mock_refund_reservations,
     ):
         mock_state.state = {}
         mock_current_task.return_value = Mock()
@@ -107,6 +110,7 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(mock_state.state["is_shutting_down"])
         # automations.stop() must be called before db.dispose and event_emitter
         self.client.automations.stop.assert_called_once()
+        mock_refund_reservations.assert_awaited_once()
         mock_db.dispose.assert_called_once()
         mock_emitter.emit.assert_called_once_with("shutdown")
         self.client.close.assert_called_once()
@@ -153,12 +157,24 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
 
         pending.cancel.assert_called_once()
 
+    @patch("ironforgedbot.client.refund_open_reservations")
+    @patch("ironforgedbot.client.JOB_HISTORY")
+    @patch("ironforgedbot.client.LOOP_MONITOR")
+    @patch("ironforgedbot.client.RENDER_SERVICE")
     @patch("ironforgedbot.client.STATE")
     @patch("ironforgedbot.client.populate_emoji_cache")
     async def test_setup_hook_loads_state_and_syncs_commands(
-        self, mock_populate_emoji, mock_state
+        self,
+        mock_populate_emoji,
+        mock_state,
+        mock_render_service,
+        mock_loop_monitor,
+        mock_job_history,
+        mock_refund_reservations,
     ):
         mock_state.load_state = AsyncMock()
+        mock_job_history.load = AsyncMock()
+        mock_render_service.start = AsyncMock()
         mock_tree = Mock()
         mock_tree.copy_global_to = Mock()
         mock_tree.sync = AsyncMock()
@@ -169,16 +185,31 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
         await self.client.setup_hook()
 
         mock_state.load_state.assert_called_once()
+        mock_job_history.load.assert_awaited_once()
+        mock_refund_reservations.assert_awaited_once()
         mock_tree.copy_global_to.assert_called_once_with(guild=self.mock_guild)
         mock_tree.sync.assert_called_once_with(guild=self.mock_guild)
         mock_populate_emoji.assert_called_once_with(mock_emojis)
+        await self.client._render_warmup
+        mock_render_service.start.assert_awaited_once()
+        mock_loop_monitor.start.assert_called_once()
 
+    @patch("ironforgedbot.client.JOB_HISTORY")
+    @patch("ironforgedbot.client.LOOP_MONITOR")
+    @patch("ironforgedbot.client.RENDER_SERVICE")
     @patch("ironforgedbot.client.STATE")
     @patch("ironforgedbot.client.populate_emoji_cache")
     async def test_setup_hook_skips_sync_when_upload_false(
-        self, mock_populate_emoji, mock_state
+        self,
+        mock_populate_emoji,
+        mock_state,
+        mock_render_service,
+        mock_loop_monitor,
+        mock_job_history,
     ):
         mock_state.load_state = AsyncMock()
+        mock_job_history.load = AsyncMock()
+        mock_render_service.start = AsyncMock()
         mock_tree = Mock()
         mock_tree.copy_global_to = Mock()
         mock_tree.sync = AsyncMock()
@@ -192,6 +223,151 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
         mock_tree.copy_global_to.assert_not_called()
         mock_tree.sync.assert_not_called()
 
+    @patch("ironforgedbot.client.JOB_HISTORY")
+    @patch("ironforgedbot.client.LOOP_MONITOR")
+    @patch("ironforgedbot.client.MetricsServer")
+    @patch("ironforgedbot.client.CONFIG")
+    @patch("ironforgedbot.client.RENDER_SERVICE")
+    @patch("ironforgedbot.client.STATE")
+    @patch("ironforgedbot.client.populate_emoji_cache")
+    async def test_setup_hook_starts_metrics_server_when_enabled(
+        self,
+        mock_populate_emoji,
+        mock_state,
+        mock_render_service,
+        mock_config,
+        mock_metrics_server,
+        mock_loop_monitor,
+        mock_job_history,
+    ):
+        mock_state.load_state = AsyncMock()
+        mock_job_history.load = AsyncMock()
+        mock_render_service.start = AsyncMock()
+        mock_config.METRICS_ENABLED = True
+        mock_config.METRICS_HOST = "127.0.0.1"
+        mock_config.METRICS_PORT = 9108
+        mock_metrics_server.return_value.start = AsyncMock()
+        self.client.upload = False
+        self.client._tree = Mock()
+        self.client.fetch_application_emojis = AsyncMock(return_value=[])
+
+        await self.client.setup_hook()
+
+        mock_metrics_server.assert_called_once_with("127.0.0.1", 9108)
+        mock_metrics_server.return_value.start.assert_awaited_once_with(self.client)
+        self.assertIs(self.client.metrics_server, mock_metrics_server.return_value)
+
+    @patch("ironforgedbot.client.STATE")
+    async def test_sync_commands_skips_unchanged_tree(self, mock_state):
+        mock_state.state = {"command_tree_hash": {"123456789": "abc"}}
+        mock_tree = Mock()
+        mock_tree.schema_hash.return_value = "abc"
+        mock_tree.sync = AsyncMock()
+        self.client._tree = mock_tree
+
+        result = await self.client.sync_commands()
+
+        self.assertFalse(result)
+        mock_tree.copy_global_to.assert_called_once_with(guild=self.mock_guild)
+        mock_tree.schema_hash.assert_called_once_with(self.mock_guild)
+        mock_tree.sync.assert_not_awaited()
+
+    @patch("ironforgedbot.client.STATE")
+    async def test_sync_commands_uploads_changed_tree(self, mock_state):
+        mock_state.state = {"command_tree_hash": {"123456789": "abc"}}
+        mock_tree = Mock()
+        mock_tree.schema_hash.return_value = "def"
+        mock_tree.sync = AsyncMock()
+        self.client._tree = mock_tree
+
+        result = await self.client.sync_commands()
+
+        self.assertTrue(result)
+        mock_tree.sync.assert_awaited_once_with(guild=self.mock_guild)
+        self.assertEqual(mock_state.state["command_tree_hash"], {"123456789": "def"})
+
+    @patch("ironforgedbot.client.STATE")
+    async def test_sync_commands_uploads_to_guild_not_synced_yet(self, mock_state):
+        mock_state.state = {"command_tree_hash": {"987654321": "abc"}}
+        mock_tree = Mock()
+        mock_tree.schema_hash.return_value = "abc"
+        mock_tree.sync = AsyncMock()
+        self.client._tree = mock_tree
+
+        result = await self.client.sync_commands()
+
+        self.assertTrue(result)
+        mock_tree.sync.assert_awaited_once_with(guild=self.mock_guild)
+        self.assertEqual(
+            mock_state.state["command_tree_hash"],
+            {"987654321": "abc", "123456789": "abc"},
+        )
+
+    @patch("ironforgedbot.client.STATE")
+    async def test_sync_commands_force_uploads_unchanged_tree(self, mock_state):
+        mock_state.state = {"command_tree_hash": {"123456789": "abc"}}
+        mock_tree = Mock()
+        mock_tree.schema_hash.return_value = "abc"
+        mock_tree.sync = AsyncMock()
+        self.client._tree = mock_tree
+
+        result = await self.client.sync_commands(force=True)
+
+        self.assertTrue(result)
+        mock_tree.sync.assert_awaited_once_with(guild=self.mock_guild)
+
+    @patch("ironforgedbot.client.STATE")
+    async def test_sync_commands_keeps_hash_when_sync_fails(self, mock_state):
+        mock_state.state = {"command_tree_hash": {"123456789": "abc"}}
+        mock_tree = Mock()
+        mock_tree.schema_hash.return_value = "def"
+        mock_tree.sync = AsyncMock(side_effect=RuntimeError("rate limited"))
+        self.client._tree = mock_tree
+
+        with self.assertRaises(RuntimeError):
+            await self.client.sync_commands()
+
+        self.assertEqual(mock_state.state["command_tree_hash"], {"123456789": "abc"})
+
+    @patch("ironforgedbot.client.load_and_set")
+    @patch("ironforgedbot.client.JOB_HISTORY")
+    @patch("ironforgedbot.client.LOOP_MONITOR")
+    @patch("ironforgedbot.client.RENDER_SERVICE")
+    @patch("ironforgedbot.client.STATE")
+    @patch("ironforgedbot.client.populate_emoji_cache")
+    async def test_setup_hook_loads_data_in_background(
+        self,
+        mock_populate_emoji,
+        mock_state,
+        mock_render_service,
+        mock_loop_monitor,
+        mock_job_history,
+        mock_load_and_set,
+    ):
+        mock_state.load_state = AsyncMock()
+        mock_job_history.load = AsyncMock()
+        mock_render_service.start = AsyncMock()
+        self.client.upload = False
+        self.client._tree = Mock()
+        self.client.fetch_application_emojis = AsyncMock(return_value=[])
+
+        await self.client.setup_hook()
+        await self.client.wait_for_data()
+
+        mock_load_and_set.assert_called_once_with("data")
+
+    async def test_wait_for_data_returns_before_setup(self):
+        await self.client.wait_for_data()
+
+    async def test_wait_for_data_raises_load_error(self):
+        async def fail():
+            raise FileNotFoundError("data/skills.json")
+
+        self.client._data_load = asyncio.create_task(fail())
+
+        with self.assertRaises(FileNotFoundError):
+            await self.client.wait_for_data()
+
     @patch("ironforgedbot.client.logger")
     async def test_on_connect_logs_message(self, mock_logger):
         await self.client.on_connect()
@@ -256,6 +432,32 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
             )
             mock_exit.assert_called_once_with(1)
 
+    @patch("ironforgedbot.client.IronForgedAutomations")
+    @patch("ironforgedbot.client.sys.exit")
+    @patch("ironforgedbot.client.logger")
+    async def test_on_ready_exits_when_data_fails_to_load(
+        self, mock_logger, mock_exit, mock_automations_class
+    ):
+        async def fail():
+            raise FileNotFoundError("data/skills.json")
+
+        self.client._data_load = asyncio.create_task(fail())
+        mock_exit.side_effect = SystemExit(1)
+
+        with patch.object(
+            DiscordClient, "user", new_callable=PropertyMock
+        ) as mock_user_prop:
+            mock_user_prop.return_value = Mock()
+
+            with self.assertRaises(SystemExit):
+                await self.client.on_ready()
+
+        mock_logger.critical.assert_called_once_with(
+            "Unable to load data files: data/skills.json"
+        )
+        mock_exit.assert_called_once_with(1)
+        mock_automations_class.assert_not_called()
+
     @patch("ironforgedbot.client.CONFIG")
     @patch("ironforgedbot.client.get_text_channel")
     @patch("ironforgedbot.client.member_update_emitter")
@@ -277,6 +479,8 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
         mock_after.roles = []
 
         await self.client.on_member_update(mock_before, mock_after)
+        mock_emitter.emit.assert_not_called()
+        await member_update_debouncer.flush()
 
         mock_emitter.emit.assert_called_once()
         context = mock_emitter.emit.call_args[0][0]
@@ -297,6 +501,6 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
         mock_before.guild = Mock()
         mock_after = Mock(spec=discord.Member)
 
-        await self.client.on_member_update(mock_before, mock_after)
+        await self.client._emit_member_update(mock_before, mock_after)
 
         mock_logger.error.assert_called_once_with("Unable to select report channel")
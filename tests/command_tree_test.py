@@ -0,0 +1,141 @@
+import sys
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import discord
+
+from ironforgedbot.command_tree import (
+    COMMANDS,
+    CommandSpec,
+    IronForgedCommands,
+    IronForgedCommandTree,
+)
+from ironforgedbot.common.import_profile import profile_import
+from tests.helpers import VALID_CONFIG
+
+# Imported only when a command that needs them runs
+DEFERRED_MODULES = ["gspread", "PIL.Image", "reactionmenu", "yaml"]
+
+
+class TestCommandSpec(unittest.TestCase):
+    def test_load_resolves_callback(self):
+        spec = CommandSpec("x", "x", "ironforgedbot.common.text_formatters:text_bold")
+
+        from ironforgedbot.common.text_formatters import text_bold
+
+        self.assertIs(spec.load(), text_bold)
+
+    def test_command_names_are_unique(self):
+        names = [spec.name for spec in COMMANDS]
+
+        self.assertEqual(len(names), len(set(names)))
+
+
+class TestIronForgedCommands(unittest.TestCase):
+    @patch("ironforgedbot.command_tree.discord.app_commands.Command")
+    def test_registers_only_enabled_commands(self, mock_command):
+        callback = Mock()
+        enabled = Mock(spec=CommandSpec)
+        enabled.name, enabled.description = "on", "enabled"
+        enabled.enabled.return_value = True
+        enabled.load.return_value = callback
+        disabled = Mock(spec=CommandSpec)
+        disabled.enabled.return_value = False
+        tree = Mock()
+
+        with patch("ironforgedbot.command_tree.COMMANDS", [enabled, disabled]):
+            IronForgedCommands(tree, Mock())
+
+        mock_command.assert_called_once_with(
+            name="on", description="enabled", callback=callback
+        )
+        tree.add_command.assert_called_once_with(mock_command.return_value)
+        disabled.load.assert_not_called()
+
+
+class TestIronForgedCommandTree(unittest.IsolatedAsyncioTestCase):
+    async def test_interaction_check_waits_for_data(self):
+        client = Mock()
+        client.wait_for_data = AsyncMock()
+        tree = Mock(spec=IronForgedCommandTree)
+        tree.client = client
+
+        result = await IronForgedCommandTree.interaction_check(tree, Mock())
+
+        self.assertTrue(result)
+        client.wait_for_data.assert_awaited_once()
+
+
+class TestSchemaHash(unittest.TestCase):
+    def setUp(self):
+        self.client = discord.Client(intents=discord.Intents.default())
+        self.tree = IronForgedCommandTree(self.client)
+        self.guild = discord.Object(id=1234)
+
+        async def callback(interaction: discord.Interaction, player: str):
+            pass
+
+        self.callback = callback
+        self.tree.add_command(
+            discord.app_commands.Command(
+                name="score", description="Score.", callback=callback
+            ),
+            guild=self.guild,
+        )
+
+    def test_hash_is_stable(self):
+        self.assertEqual(
+            self.tree.schema_hash(self.guild), self.tree.schema_hash(self.guild)
+        )
+
+    def test_hash_ignores_registration_order(self):
+        other = IronForgedCommandTree(self.client)
+        for name in ["b", "a"]:
+            other.add_command(
+                discord.app_commands.Command(
+                    name=name, description=name, callback=self.callback
+                ),
+                guild=self.guild,
+            )
+        expected = other.schema_hash(self.guild)
+
+        other.clear_commands(guild=self.guild)
+        for name in ["a", "b"]:
+            other.add_command(
+                discord.app_commands.Command(
+                    name=name, description=name, callback=self.callback
+                ),
+                guild=self.guild,
+            )
+
+        self.assertEqual(other.schema_hash(self.guild), expected)
+
+    def test_hash_changes_with_schema(self):
+        before = self.tree.schema_hash(self.guild)
+
+        self.tree.get_command("score", guild=self.guild).description = "Changed."
+
+        self.assertNotEqual(self.tree.schema_hash(self.guild), before)
+
+
+# Registers every enabled command, importing each command module as startup does
+BUILD_COMMAND_TREE = """
+import discord
+from ironforgedbot.command_tree import IronForgedCommands, IronForgedCommandTree
+
+client = discord.Client(intents=discord.Intents.none())
+IronForgedCommands(IronForgedCommandTree(client), client)
+"""
+
+
+class TestStartupImports(unittest.TestCase):
+    def test_command_tree_defers_heavy_dependencies(self):
+        profile = profile_import(
+            "ironforgedbot.command_tree",
+            env={**VALID_CONFIG, "ENVIRONMENT": "prod"},
+            then=BUILD_COMMAND_TREE,
+        )
+        print(f"\n{profile.format_report()}", file=sys.stderr)
+
+        loaded = [module for module in DEFERRED_MODULES if module in profile.modules]
+        self.assertEqual(loaded, [], profile.format_report())
@@ -14,20 +14,21 @@ class TestCheckActivityCmd(unittest.IsolatedAsyncioTestCase):
         self.mock_interaction = create_mock_discord_interaction()
         self.mock_channel = Mock()
 
+    @patch(
+        "ironforgedbot.commands.admin.check_activity.submit_manual_job",
+        new_callable=AsyncMock,
+    )
     @patch("ironforgedbot.commands.admin.check_activity.job_check_activity")
-    @patch("ironforgedbot.commands.admin.check_activity.CONFIG")
-    async def test_cmd_check_activity_success(
-        self, mock_config, mock_job_check_activity
+    async def test_cmd_check_activity_submits_job(
+        self, mock_job_check_activity, mock_submit
     ):
-        mock_config.WOM_API_KEY = "test_api_key"
-        mock_config.WOM_GROUP_ID = "test_group_id"
-        mock_job_check_activity.return_value = None
-
         await self.cmd_check_activity(self.mock_interaction, self.mock_channel)
 
-        self.mock_interaction.response.send_message.assert_called_once()
-        call_args = self.mock_interaction.response.send_message.call_args
-        self.assertIn("Manually initiating activity check job", call_args.args[0])
-        self.assertTrue(call_args.kwargs["ephemeral"])
-
-        mock_job_check_activity.assert_called_once_with(self.mock_channel)
+        mock_submit.assert_awaited_once_with(
+            self.mock_interaction,
+            self.mock_channel,
+            "activity check",
+            mock_job_check_activity,
+            self.mock_channel,
+        )
+        mock_job_check_activity.assert_not_called()
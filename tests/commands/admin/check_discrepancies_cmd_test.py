@@ -18,25 +18,30 @@ class TestCheckDiscrepanciesCmd(unittest.IsolatedAsyncioTestCase):
         self.mock_channel = Mock()
         self.mock_channel.send = AsyncMock()
 
+    @patch(
+        "ironforgedbot.commands.admin.check_discrepancies.submit_manual_job",
+        new_callable=AsyncMock,
+    )
     @patch(
         "ironforgedbot.commands.admin.check_discrepancies.job_check_membership_discrepancies"
     )
     @patch("ironforgedbot.commands.admin.check_discrepancies.CONFIG")
-    async def test_cmd_check_discrepancies_success(self, mock_config, mock_job_check):
+    async def test_cmd_check_discrepancies_submits_job(
+        self, mock_config, mock_job_check, mock_submit
+    ):
         mock_config.WOM_API_KEY = "test_api_key"
         mock_config.WOM_GROUP_ID = "test_group_id"
-        mock_job_check.return_value = None
 
         await self.cmd_check_discrepancies(self.mock_interaction, self.mock_channel)
 
-        self.mock_interaction.response.send_message.assert_called_once()
-        call_args = self.mock_interaction.response.send_message.call_args
-        self.assertIn("Manually initiating member discrepancy job", call_args.args[0])
-        self.assertTrue(call_args.kwargs["ephemeral"])
-
-        mock_job_check.assert_called_once_with(
+        mock_submit.assert_awaited_once_with(
+            self.mock_interaction,
+            self.mock_channel,
+            "member discrepancy",
+            mock_job_check,
             self.mock_interaction.guild,
             self.mock_channel,
             "test_api_key",
             "test_group_id",
         )
+        mock_job_check.assert_not_called()
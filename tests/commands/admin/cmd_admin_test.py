@@ -181,6 +181,17 @@ class TestAdminMenuView(unittest.IsolatedAsyncioTestCase):
         self.menu.clear_parent.assert_called_once()
         mock_cmd_view_state.assert_called_once_with(self.mock_interaction)
 
+    @patch("ironforgedbot.commands.admin.admin_menu_view.cmd_sync_commands")
+    async def test_sync_commands_button(self, mock_cmd_sync_commands):
+        mock_cmd_sync_commands.return_value = None
+        self.menu.clear_parent = AsyncMock()
+        mock_button = Mock()
+
+        await self.menu.sync_commands_button(self.mock_interaction, mock_button)
+
+        self.menu.clear_parent.assert_called_once()
+        mock_cmd_sync_commands.assert_called_once_with(self.mock_interaction)
+
     @patch("ironforgedbot.commands.admin.admin_menu_view.cmd_process_absentees")
     async def test_process_absentee_list_button(self, mock_cmd_process_absentees):
         mock_cmd_process_absentees.return_value = None
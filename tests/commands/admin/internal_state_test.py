@@ -177,3 +177,39 @@ class TestInternalState(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(result.filename, "state.json")
         self.assertIsInstance(result.fp, io.BytesIO)
+
+    @patch("ironforgedbot.commands.admin.internal_state.format_slowest_report")
+    def test_get_slowest_commands(self, mock_report):
+        mock_report.return_value = "cmd_score 1200ms"
+
+        from ironforgedbot.commands.admin.internal_state import get_slowest_commands
+
+        result = get_slowest_commands(5)
+
+        mock_report.assert_called_once_with(5)
+        self.assertEqual(result.filename, "slowest_commands.txt")
+        self.assertEqual(result.fp.read().decode("utf-8"), "cmd_score 1200ms")
+
+    @patch("ironforgedbot.commands.admin.internal_state.JOB_HISTORY")
+    def test_get_job_history(self, mock_history):
+        mock_history.format_trends.return_value = "job_refresh_ranks 42s"
+
+        from ironforgedbot.commands.admin.internal_state import get_job_history
+
+        result = get_job_history(10)
+
+        mock_history.format_trends.assert_called_once_with(10)
+        self.assertEqual(result.filename, "job_history.txt")
+        self.assertEqual(result.fp.read().decode("utf-8"), "job_refresh_ranks 42s")
+
+    @patch("ironforgedbot.commands.admin.internal_state.JOB_SCHEDULE")
+    def test_get_job_schedule(self, mock_schedule):
+        mock_schedule.format_timetable.return_value = "refresh_ranks +30m"
+
+        from ironforgedbot.commands.admin.internal_state import get_job_schedule
+
+        result = get_job_schedule()
+
+        mock_schedule.format_timetable.assert_called_once_with()
+        self.assertEqual(result.filename, "job_schedule.txt")
+        self.assertEqual(result.fp.read().decode("utf-8"), "refresh_ranks +30m")
@@ -5,6 +5,22 @@ from ironforgedbot.commands.admin.latest_log import get_latest_log_file
 
 
 class TestLatestLog(unittest.TestCase):
+    def setUp(self):
+        # No log file handler is known, so the log directory is scanned
+        patcher = patch("ironforgedbot.commands.admin.latest_log.CURRENT_LOG_FILE")
+        self.mock_current_log_file = patcher.start()
+        self.mock_current_log_file.path = None
+        self.addCleanup(patcher.stop)
+
+    @patch("discord.File")
+    def test_get_latest_log_file_uses_current_log_file(self, mock_discord_file):
+        self.mock_current_log_file.path = "./logs/bot_prod.log"
+
+        result = get_latest_log_file()
+
+        mock_discord_file.assert_called_once_with("./logs/bot_prod.log")
+        self.assertEqual(result, mock_discord_file.return_value)
+
     @patch("ironforgedbot.commands.admin.latest_log.get_logger_instance")
     @patch("os.listdir")
     @patch("os.path.isfile")
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from ironforgedbot.commands.admin.manual_job import submit_manual_job
+from tests.helpers import create_mock_discord_interaction
+
+
+class TestSubmitManualJob(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_interaction = create_mock_discord_interaction()
+        self.mock_interaction.client = Mock()
+        self.automations = self.mock_interaction.client.automations
+        self.automations.submit_job = AsyncMock()
+
+        self.mock_channel = Mock()
+        self.mock_channel.id = 123
+
+        self.job_func = AsyncMock()
+
+    def _handle(self, duplicate: bool = False):
+        handle = Mock()
+        handle.duplicate = duplicate
+        handle.describe.return_value = "running for **5s**"
+        return handle
+
+    def _sent(self) -> str:
+        call_args = self.mock_interaction.response.send_message.call_args
+        self.assertTrue(call_args.kwargs["ephemeral"])
+        return call_args.args[0]
+
+    async def test_submits_job_through_automations(self):
+        handle = self._handle()
+        self.automations.submit_job.return_value = handle
+
+        result = await submit_manual_job(
+            self.mock_interaction, self.mock_channel, "rank check", self.job_func, 1, 2
+        )
+
+        self.assertIs(result, handle)
+        self.automations.submit_job.assert_awaited_once_with(self.job_func, 1, 2)
+        self.job_func.assert_not_called()
+        self.assertIn("Manually initiating rank check job", self._sent())
+        self.assertIn("<#123>", self._sent())
+
+    async def test_reports_run_already_in_flight(self):
+        self.automations.submit_job.return_value = self._handle(duplicate=True)
+
+        await submit_manual_job(
+            self.mock_interaction, self.mock_channel, "rank check", self.job_func
+        )
+
+        self.assertIn("Rank check job is already in progress", self._sent())
+        self.assertIn("running for **5s**", self._sent())
+
+    async def test_reports_when_job_cannot_start(self):
+        self.automations.submit_job.return_value = None
+
+        result = await submit_manual_job(
+            self.mock_interaction, self.mock_channel, "rank check", self.job_func
+        )
+
+        self.assertIsNone(result)
+        self.assertIn("Unable to start rank check job", self._sent())
+
+    async def test_reports_when_automations_not_running(self):
+        self.mock_interaction.client.automations = None
+
+        result = await submit_manual_job(
+            self.mock_interaction, self.mock_channel, "rank check", self.job_func
+        )
+
+        self.assertIsNone(result)
+        self.assertIn("Automations are not running yet", self._sent())
+        self.job_func.assert_not_called()
@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import discord
+from tests.helpers import create_mock_discord_interaction
+
+
+class TestSyncCommandsCmd(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        from ironforgedbot.commands.admin.sync_commands import cmd_sync_commands
+
+        self.cmd_sync_commands = cmd_sync_commands
+
+        self.mock_interaction = create_mock_discord_interaction()
+        self.mock_interaction.client.sync_commands = AsyncMock(return_value=True)
+
+    @patch("ironforgedbot.commands.admin.sync_commands.send_error_response")
+    async def test_cmd_sync_commands_forces_sync(self, mock_send_error_response):
+        await self.cmd_sync_commands(self.mock_interaction)
+
+        self.mock_interaction.response.defer.assert_called_once_with(
+            thinking=True, ephemeral=True
+        )
+        self.mock_interaction.client.sync_commands.assert_awaited_once_with(force=True)
+        self.mock_interaction.followup.send.assert_called_once_with(
+            content="## Command Tree Synced"
+        )
+        mock_send_error_response.assert_not_called()
+
+    @patch("ironforgedbot.commands.admin.sync_commands.send_error_response")
+    async def test_cmd_sync_commands_reports_http_error(self, mock_send_error_response):
+        self.mock_interaction.client.sync_commands.side_effect = discord.HTTPException(
+            Mock(status=429, reason="Too Many Requests"), ""
+        )
+
+        await self.cmd_sync_commands(self.mock_interaction)
+
+        mock_send_error_response.assert_called_once_with(
+            self.mock_interaction, "Error syncing commands."
+        )
+        self.mock_interaction.followup.send.assert_not_called()
@@ -16,17 +16,22 @@ class TestSyncMembersCmd(unittest.IsolatedAsyncioTestCase):
 
         self.mock_channel = Mock()
 
+    @patch(
+        "ironforgedbot.commands.admin.manual_job.submit_manual_job",
+        new_callable=AsyncMock,
+    )
     @patch("ironforgedbot.tasks.job_sync_members.job_sync_members")
-    async def test_cmd_sync_members_success(self, mock_job_sync_members):
-        mock_job_sync_members.return_value = None
-
+    async def test_cmd_sync_members_submits_job(
+        self, mock_job_sync_members, mock_submit
+    ):
         await self.cmd_sync_members(self.mock_interaction, self.mock_channel)
 
-        self.mock_interaction.response.send_message.assert_called_once()
-        call_args = self.mock_interaction.response.send_message.call_args
-        self.assertIn("Manually initiating member sync job", call_args.args[0])
-        self.assertTrue(call_args.kwargs["ephemeral"])
-
-        mock_job_sync_members.assert_called_once_with(
-            self.mock_interaction.guild, self.mock_channel
+        mock_submit.assert_awaited_once_with(
+            self.mock_interaction,
+            self.mock_channel,
+            "member sync",
+            mock_job_sync_members,
+            self.mock_interaction.guild,
+            self.mock_channel,
         )
+        mock_job_sync_members.assert_not_called()
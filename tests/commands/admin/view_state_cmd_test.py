@@ -14,10 +14,29 @@ class TestViewStateCmd(unittest.IsolatedAsyncioTestCase):
         self.mock_interaction.response.defer = AsyncMock()
         self.mock_interaction.followup.send = AsyncMock()
 
+    @patch("ironforgedbot.commands.admin.view_state.get_job_schedule")
+    @patch("ironforgedbot.commands.admin.view_state.get_job_history")
+    @patch("ironforgedbot.commands.admin.view_state.get_slowest_commands")
+    @patch("ironforgedbot.commands.admin.view_state.get_runtime_stats")
     @patch("ironforgedbot.commands.admin.view_state.get_internal_state")
-    async def test_cmd_view_state_success(self, mock_get_internal_state):
+    async def test_cmd_view_state_success(
+        self,
+        mock_get_internal_state,
+        mock_get_runtime_stats,
+        mock_get_slowest,
+        mock_get_job_history,
+        mock_get_job_schedule,
+    ):
         mock_file = Mock()
+        mock_stats_file = Mock()
+        mock_slowest_file = Mock()
         mock_get_internal_state.return_value = mock_file
+        mock_get_runtime_stats.return_value = mock_stats_file
+        mock_get_slowest.return_value = mock_slowest_file
+        mock_job_history_file = Mock()
+        mock_get_job_history.return_value = mock_job_history_file
+        mock_job_schedule_file = Mock()
+        mock_get_job_schedule.return_value = mock_job_schedule_file
 
         await self.cmd_view_state(self.mock_interaction)
 
@@ -25,6 +44,14 @@ class TestViewStateCmd(unittest.IsolatedAsyncioTestCase):
             thinking=True, ephemeral=True
         )
         mock_get_internal_state.assert_called_once()
+        mock_get_runtime_stats.assert_called_once()
         self.mock_interaction.followup.send.assert_called_once_with(
-            content="## Current Internal State", file=mock_file
+            content="## Current Internal State",
+            files=[
+                mock_file,
+                mock_stats_file,
+                mock_slowest_file,
+                mock_job_history_file,
+                mock_job_schedule_file,
+            ],
         )
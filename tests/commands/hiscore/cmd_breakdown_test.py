@@ -656,7 +656,7 @@ class TestCmdBreakdown(unittest.IsolatedAsyncioTestCase):
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.get_rank_color_from_points")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.find_emoji")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.build_response_embed")
-    @patch("ironforgedbot.commands.hiscore.cmd_breakdown.ViewMenu")
+    @patch("reactionmenu.ViewMenu")
     async def test_cmd_breakdown_success_regular_rank(
         self,
         mock_view_menu,
@@ -703,7 +703,7 @@ class TestCmdBreakdown(unittest.IsolatedAsyncioTestCase):
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.get_god_alignment_from_member")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.find_emoji")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.build_response_embed")
-    @patch("ironforgedbot.commands.hiscore.cmd_breakdown.ViewMenu")
+    @patch("reactionmenu.ViewMenu")
     async def test_cmd_breakdown_success_god_rank(
         self,
         mock_view_menu,
@@ -749,7 +749,7 @@ class TestCmdBreakdown(unittest.IsolatedAsyncioTestCase):
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.get_rank_color_from_points")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.find_emoji")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.build_response_embed")
-    @patch("ironforgedbot.commands.hiscore.cmd_breakdown.ViewMenu")
+    @patch("reactionmenu.ViewMenu")
     async def test_cmd_breakdown_default_player_uses_display_name(
         self,
         mock_view_menu,
@@ -793,7 +793,7 @@ class TestCmdBreakdown(unittest.IsolatedAsyncioTestCase):
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.get_rank_color_from_points")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.find_emoji")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.build_response_embed")
-    @patch("ironforgedbot.commands.hiscore.cmd_breakdown.ViewMenu")
+    @patch("reactionmenu.ViewMenu")
     async def test_cmd_breakdown_boss_pagination(
         self,
         mock_view_menu,
@@ -843,7 +843,7 @@ class TestCmdBreakdown(unittest.IsolatedAsyncioTestCase):
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.get_rank_color_from_points")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.find_emoji")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.build_response_embed")
-    @patch("ironforgedbot.commands.hiscore.cmd_breakdown.ViewMenu")
+    @patch("reactionmenu.ViewMenu")
     async def test_cmd_breakdown_empty_score_data(
         self,
         mock_view_menu,
@@ -886,7 +886,7 @@ class TestCmdBreakdown(unittest.IsolatedAsyncioTestCase):
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.get_rank_color_from_points")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.find_emoji")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.build_response_embed")
-    @patch("ironforgedbot.commands.hiscore.cmd_breakdown.ViewMenu")
+    @patch("reactionmenu.ViewMenu")
     async def test_cmd_breakdown_menu_start_raises_sends_error_response(
         self,
         mock_view_menu,
@@ -933,7 +933,7 @@ class TestCmdBreakdown(unittest.IsolatedAsyncioTestCase):
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.get_rank_color_from_points")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.find_emoji")
     @patch("ironforgedbot.commands.hiscore.cmd_breakdown.build_response_embed")
-    @patch("ironforgedbot.commands.hiscore.cmd_breakdown.ViewMenu")
+    @patch("reactionmenu.ViewMenu")
     async def test_cmd_breakdown_menu_start_raises_stop_also_raises(
         self,
         mock_view_menu,
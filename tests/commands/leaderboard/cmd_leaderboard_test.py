@@ -126,7 +126,7 @@ class TestCmdLeaderboard(unittest.IsolatedAsyncioTestCase):
             return [discord.Embed(description="placeholder")]
 
         with patch.object(LEADERBOARD_TYPES["ingots"], "fetcher", mock_fetcher), patch(
-            "ironforgedbot.commands.leaderboard.cmd_leaderboard.build_leaderboard_menu",
+            "ironforgedbot.commands.leaderboard.leaderboard_menu.build_leaderboard_menu",
             return_value=mock_menu,
         ), patch(
             "ironforgedbot.commands.leaderboard.cmd_leaderboard.build_leaderboard_embeds",
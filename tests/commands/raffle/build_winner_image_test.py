@@ -3,8 +3,13 @@ import unittest
 from PIL import ImageFont
 
 from ironforgedbot.commands.raffle.build_winner_image import (
+    _build_winner_image_sync,
     _calculate_position,
+    _get_base_image,
+    _get_font,
+    _get_ingot_icon,
     build_winner_image_file,
+    preload_assets,
 )
 
 
@@ -59,3 +64,30 @@ class TestBuildWinnerImage(unittest.IsolatedAsyncioTestCase):
         image.fp.seek(0)
         magic_bytes = image.fp.read(8)
         self.assertEqual(magic_bytes, b"\x89PNG\r\n\x1a\n")
+
+    async def test_webp_image_generation(self):
+        image = await build_winner_image_file("oxore", 5123456, image_format="webp")
+
+        self.assertEqual(image.filename, "raffle_winner.webp")
+        magic_bytes = image.fp.read(12)
+        self.assertEqual(magic_bytes[:4], b"RIFF")
+        self.assertEqual(magic_bytes[8:], b"WEBP")
+
+    async def test_unsupported_format_raises(self):
+        with self.assertRaises(ValueError):
+            await build_winner_image_file("oxore", 1, image_format="bmp")
+
+    def test_assets_are_cached(self):
+        preload_assets()
+
+        self.assertIs(_get_base_image(), _get_base_image())
+        self.assertIs(_get_font(85), _get_font(85))
+        self.assertIs(_get_ingot_icon(), _get_ingot_icon())
+        self.assertEqual(_get_ingot_icon().size, (35, 35))
+
+    def test_render_does_not_modify_cached_base_image(self):
+        before = _get_base_image().tobytes()
+
+        _build_winner_image_sync("oxore", 100)
+
+        self.assertEqual(_get_base_image().tobytes(), before)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
@@ -122,6 +123,117 @@ class TestEndRaffle(unittest.IsolatedAsyncioTestCase):
         self.assertIn("50,000", content)
         self.assertEqual(call_args.kwargs["file"], mock_image)
 
+    def _setup_paid_winner(
+        self,
+        mock_db,
+        mock_create_raffle_service,
+        mock_create_member_service,
+        mock_create_ingot_service,
+        mock_random,
+    ) -> AsyncMock:
+        mock_db.get_session.return_value.__aenter__.return_value = AsyncMock()
+
+        mock_ticket = Mock()
+        mock_ticket.member_id = "winner-id-123"
+        mock_ticket.quantity = 10
+        mock_raffle_service = AsyncMock()
+        mock_raffle_service.get_raffle_ticket_total.return_value = 20
+        mock_raffle_service.get_all_valid_raffle_tickets.return_value = [mock_ticket]
+        mock_create_raffle_service.return_value = mock_raffle_service
+        mock_random.choices.return_value = ["winner-id-123"]
+
+        mock_winning_member = Mock()
+        mock_winning_member.nickname = "WinnerUser"
+        mock_winning_member.discord_id = 67890
+        mock_member_service = AsyncMock()
+        mock_member_service.get_member_by_id.return_value = mock_winning_member
+        mock_create_member_service.return_value = mock_member_service
+
+        mock_ingot_service = AsyncMock()
+        mock_ingot_service.try_add_ingots.return_value = Mock(status=True)
+        mock_create_ingot_service.return_value = mock_ingot_service
+
+        self.mock_interaction.guild.get_member.return_value = Mock(mention="<@67890>")
+        return mock_raffle_service
+
+    @patch("ironforgedbot.commands.raffle.end_raffle.find_emoji")
+    @patch("ironforgedbot.commands.raffle.end_raffle.build_winner_image_file")
+    @patch("ironforgedbot.commands.raffle.end_raffle.db")
+    @patch("ironforgedbot.commands.raffle.end_raffle.create_ingot_service")
+    @patch("ironforgedbot.commands.raffle.end_raffle.create_member_service")
+    @patch("ironforgedbot.commands.raffle.end_raffle.create_raffle_service")
+    @patch("ironforgedbot.commands.raffle.end_raffle.random")
+    @patch("ironforgedbot.commands.raffle.end_raffle.STATE")
+    async def test_handle_end_raffle_render_timeout_announces_without_image(
+        self,
+        mock_state,
+        mock_random,
+        mock_create_raffle_service,
+        mock_create_member_service,
+        mock_create_ingot_service,
+        mock_db,
+        mock_build_image,
+        mock_find_emoji,
+    ):
+        mock_state.state = {"raffle_on": True, "raffle_price": 5000}
+        mock_find_emoji.return_value = "🎫"
+        mock_raffle_service = self._setup_paid_winner(
+            mock_db,
+            mock_create_raffle_service,
+            mock_create_member_service,
+            mock_create_ingot_service,
+            mock_random,
+        )
+        mock_build_image.side_effect = asyncio.TimeoutError()
+
+        await handle_end_raffle(self.mock_parent_message, self.mock_interaction)
+
+        self.mock_interaction.followup.send.assert_called_once()
+        call_args = self.mock_interaction.followup.send.call_args
+        self.assertIn("Congratulations <@67890>!!", call_args.args[0])
+        self.assertIs(call_args.kwargs["file"], discord.utils.MISSING)
+        self.assertFalse(mock_state.state["raffle_on"])
+        self.assertEqual(mock_state.state["raffle_price"], 0)
+        mock_raffle_service.delete_all_tickets.assert_awaited_once()
+
+    @patch("ironforgedbot.commands.raffle.end_raffle.find_emoji")
+    @patch("ironforgedbot.commands.raffle.end_raffle.build_winner_image_file")
+    @patch("ironforgedbot.commands.raffle.end_raffle.db")
+    @patch("ironforgedbot.commands.raffle.end_raffle.create_ingot_service")
+    @patch("ironforgedbot.commands.raffle.end_raffle.create_member_service")
+    @patch("ironforgedbot.commands.raffle.end_raffle.create_raffle_service")
+    @patch("ironforgedbot.commands.raffle.end_raffle.random")
+    @patch("ironforgedbot.commands.raffle.end_raffle.STATE")
+    async def test_handle_end_raffle_closes_raffle_when_announcement_fails(
+        self,
+        mock_state,
+        mock_random,
+        mock_create_raffle_service,
+        mock_create_member_service,
+        mock_create_ingot_service,
+        mock_db,
+        mock_build_image,
+        mock_find_emoji,
+    ):
+        mock_state.state = {"raffle_on": True, "raffle_price": 5000}
+        mock_find_emoji.return_value = "🎫"
+        mock_raffle_service = self._setup_paid_winner(
+            mock_db,
+            mock_create_raffle_service,
+            mock_create_member_service,
+            mock_create_ingot_service,
+            mock_random,
+        )
+        self.mock_interaction.followup.send.side_effect = discord.HTTPException(
+            Mock(status=500, reason="Server Error"), ""
+        )
+
+        with self.assertRaises(discord.HTTPException):
+            await handle_end_raffle(self.mock_parent_message, self.mock_interaction)
+
+        self.assertFalse(mock_state.state["raffle_on"])
+        mock_raffle_service.delete_all_tickets.assert_awaited_once()
+
     @patch("ironforgedbot.commands.raffle.end_raffle.find_emoji")
     @patch("ironforgedbot.commands.raffle.end_raffle.db")
     @patch("ironforgedbot.commands.raffle.end_raffle.create_raffle_service")
@@ -0,0 +1,69 @@
+import os
+import time
+import unittest
+
+from ironforgedbot.commands.spin.build_spin_gif import (
+    FRAME_COUNT,
+    FRAME_DURATION_MS,
+    MAX_GIF_SIZE,
+    _encode_spin_gif,
+)
+from tests.commands.spin.spin_benchmark import CASES, build_options, run_case
+
+
+class TestSpinGifBenchmark(unittest.TestCase):
+    """Generation time and encoded size for small, typical and large spins."""
+
+    OPTION_COUNTS = (3, 20, 200)
+    MAX_SECONDS = 15.0
+
+    def test_generation_time_and_size(self):
+        for count in self.OPTION_COUNTS:
+            with self.subTest(options=count):
+                options = [f"Option {i}" for i in range(count)]
+
+                start = time.perf_counter()
+                gif = _encode_spin_gif(options, count // 2)
+                elapsed = time.perf_counter() - start
+
+                size = gif.getbuffer().nbytes
+                self.assertLess(size, MAX_GIF_SIZE)
+                self.assertLess(elapsed, self.MAX_SECONDS)
+
+    def test_seeded_output_is_deterministic(self):
+        options, selected_index = build_options(CASES[0])
+
+        first = _encode_spin_gif(options, selected_index).getvalue()
+        second = _encode_spin_gif(list(options), selected_index).getvalue()
+
+        self.assertEqual(first, second)
+        self.assertEqual(build_options(CASES[0]), (options, selected_index))
+
+
+@unittest.skipUnless(
+    os.getenv("RUN_BENCHMARKS") == "1",
+    "Slow benchmark, set RUN_BENCHMARKS=1 to run",
+)
+class TestSpinGifBenchmarkGrid(unittest.TestCase):
+    """Seeded spins across option counts and name lengths, one process each."""
+
+    MAX_SECONDS = 15.0
+
+    @classmethod
+    def setUpClass(cls):
+        cls.results = {case.name: run_case(case) for case in CASES}
+
+    def test_within_limits(self):
+        for case in CASES:
+            with self.subTest(case=case.name):
+                result = self.results[case.name]
+
+                self.assertLessEqual(result.frame_count, FRAME_COUNT)
+                # GIF delays are stored in centiseconds
+                self.assertAlmostEqual(
+                    result.duration_ms,
+                    FRAME_COUNT * FRAME_DURATION_MS,
+                    delta=FRAME_COUNT * 10,
+                )
+                self.assertLess(result.size_bytes, MAX_GIF_SIZE)
+                self.assertLess(result.wall_ms, self.MAX_SECONDS * 1000)
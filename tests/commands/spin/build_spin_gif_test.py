@@ -1,16 +1,27 @@
+import io
 import unittest
+from unittest.mock import patch
 
 import discord
+from PIL import Image, ImageChops
 
 from ironforgedbot.commands.spin.build_spin_gif import (
     FRAME_COUNT,
+    FRAME_DURATION_MS,
     GIF_HEIGHT,
     GIF_WIDTH,
     ITEM_HEIGHT,
+    MAX_GIF_SIZE,
+    QUALITY_TIERS,
+    TRANSPARENT_INDEX,
+    _build_spin_gif_sync,
+    _delta_frames,
     _ease_out_cubic,
+    _encode_spin_gif,
     _get_text_alpha,
     build_spin_frames,
     build_spin_gif_file,
+    select_quality,
 )
 
 
@@ -77,3 +88,111 @@ class TestBuildSpinGifFile(unittest.IsolatedAsyncioTestCase):
         options = ["red", "blue", "green", "yellow"]
         _, winner = await build_spin_gif_file(options)
         self.assertIn(winner, options)
+
+
+class TestDeltaFrames(unittest.TestCase):
+    def _frame(self, fill: int, box: tuple[int, int, int, int] | None = None):
+        frame = Image.new("P", (40, 20), fill)
+        frame.putpalette([i for i in range(256) for _ in range(3)])
+        if box:
+            frame.paste(fill + 1, box)
+        return frame
+
+    def test_unchanged_pixels_become_transparent(self):
+        frames = [self._frame(10), self._frame(10, (5, 5, 10, 10))]
+
+        output, _ = _delta_frames(frames)
+
+        self.assertEqual(output[1].getpixel((0, 0)), TRANSPARENT_INDEX)
+        self.assertEqual(output[1].getpixel((6, 6)), 11)
+
+    def test_identical_frames_are_merged(self):
+        frames = [self._frame(10), self._frame(10), self._frame(10, (0, 0, 2, 2))]
+
+        output, durations = _delta_frames(frames)
+
+        self.assertEqual(len(output), 2)
+        self.assertEqual(durations, [FRAME_DURATION_MS * 2, FRAME_DURATION_MS])
+
+    def test_decoded_gif_matches_input_frames(self):
+        frames = [
+            self._frame(10),
+            self._frame(10, (5, 5, 10, 10)),
+            self._frame(10, (20, 2, 30, 12)),
+        ]
+        output, durations = _delta_frames(frames)
+
+        gif = io.BytesIO()
+        output[0].save(
+            gif,
+            format="GIF",
+            save_all=True,
+            append_images=output[1:],
+            duration=durations,
+            disposal=1,
+            transparency=TRANSPARENT_INDEX,
+            optimize=False,
+        )
+
+        decoded = Image.open(gif)
+        for index, frame in enumerate(frames):
+            decoded.seek(index)
+            diff = ImageChops.difference(decoded.convert("RGB"), frame.convert("RGB"))
+            self.assertIsNone(diff.getbbox())
+
+
+class TestQualityTiers(unittest.TestCase):
+    def test_small_spin_uses_best_tier(self):
+        self.assertEqual(select_quality(3), 0)
+
+    def test_large_spin_drops_tier(self):
+        self.assertEqual(select_quality(200), 0)
+        self.assertGreater(select_quality(1000), 0)
+
+    @patch("ironforgedbot.commands.spin.build_spin_gif.RENDER_TIME_BUDGET", 2.0)
+    def test_slow_prediction_drops_tier(self):
+        self.assertGreater(select_quality(200), 0)
+
+    @patch("ironforgedbot.commands.spin.build_spin_gif.RENDER_TIME_BUDGET", 0.0)
+    def test_falls_back_to_lowest_tier(self):
+        self.assertEqual(select_quality(3), len(QUALITY_TIERS) - 1)
+
+    def test_tiers_predict_decreasing_cost(self):
+        predictions = [quality.predict(200) for quality in QUALITY_TIERS]
+
+        self.assertEqual(predictions, sorted(predictions, reverse=True))
+
+    def test_lower_tier_encodes_fewer_smaller_frames(self):
+        quality = QUALITY_TIERS[-1]
+        gif = _encode_spin_gif(["red", "blue", "green"], 1, quality)
+
+        decoded = Image.open(gif)
+        self.assertEqual(decoded.size, quality.size)
+        self.assertLessEqual(decoded.n_frames, len(quality.frame_indices))
+
+    @patch("ironforgedbot.commands.spin.build_spin_gif.select_quality")
+    @patch("ironforgedbot.commands.spin.build_spin_gif._encode_spin_gif")
+    def test_oversized_gif_is_reencoded_at_lower_tier(
+        self, mock_encode, mock_select_quality
+    ):
+        mock_select_quality.return_value = 0
+        mock_encode.side_effect = [
+            io.BytesIO(b"\0" * (MAX_GIF_SIZE + 1)),
+            io.BytesIO(b"GIF89a"),
+        ]
+
+        data, _ = _build_spin_gif_sync(["red", "blue", "green"])
+
+        self.assertEqual(data, b"GIF89a")
+        self.assertEqual(mock_encode.call_args_list[1][0][2], QUALITY_TIERS[1])
+
+    @patch("ironforgedbot.commands.spin.build_spin_gif.select_quality")
+    @patch("ironforgedbot.commands.spin.build_spin_gif._encode_spin_gif")
+    def test_raises_when_lowest_tier_is_oversized(
+        self, mock_encode, mock_select_quality
+    ):
+        mock_select_quality.return_value = len(QUALITY_TIERS) - 1
+        mock_encode.return_value = io.BytesIO(b"\0" * (MAX_GIF_SIZE + 1))
+
+        with self.assertRaises(ValueError):
+            _build_spin_gif_sync(["red", "blue", "green"])
@@ -1,8 +1,11 @@
+import asyncio
 import unittest
 from unittest.mock import Mock, patch
 
 import discord
 
+from ironforgedbot.decorators.command_price import CommandRefundError
+from ironforgedbot.services.render_service import RenderBusyError
 from ironforgedcore.common.roles import ROLE
 from tests.helpers import (
     create_mock_discord_interaction,
@@ -84,16 +87,36 @@ class TestCmdSpin(unittest.IsolatedAsyncioTestCase):
         mock_build.assert_called_once_with(["red", "blue", "green"])
         self.mock_interaction.followup.send.assert_called_once_with(file=mock_file)
 
-    @patch("ironforgedbot.commands.spin.cmd_spin.send_error_response")
     @patch("ironforgedbot.commands.spin.cmd_spin.build_spin_gif_file")
-    async def test_build_gif_exception_sends_error(self, mock_build, mock_error):
+    async def test_build_gif_exception_refunds(self, mock_build):
         mock_build.side_effect = Exception("test error")
 
-        await cmd_spin(self.mock_interaction, options="red,blue,green")
+        with self.assertRaises(CommandRefundError) as ctx:
+            await cmd_spin(self.mock_interaction, options="red,blue,green")
 
-        mock_error.assert_called_once()
+        self.assertEqual(
+            ctx.exception.message,
+            "Failed to generate spin animation. Please try again later.",
+        )
         self.mock_interaction.followup.send.assert_not_called()
 
+    @patch("ironforgedbot.commands.spin.cmd_spin.build_spin_gif_file")
+    async def test_render_busy_refunds(self, mock_build):
+        mock_build.side_effect = RenderBusyError()
+
+        with self.assertRaises(CommandRefundError) as ctx:
+            await cmd_spin(self.mock_interaction, options="red,blue,green")
+
+        self.assertEqual(ctx.exception.message, RenderBusyError().message)
+        self.mock_interaction.followup.send.assert_not_called()
+
+    @patch("ironforgedbot.commands.spin.cmd_spin.build_spin_gif_file")
+    async def test_render_timeout_refunds(self, mock_build):
+        mock_build.side_effect = asyncio.TimeoutError()
+
+        with self.assertRaises(CommandRefundError):
+            await cmd_spin(self.mock_interaction, options="red,blue,green")
+
     @patch("ironforgedbot.commands.spin.cmd_spin.build_spin_gif_file")
     async def test_valid_options_no_embed(self, mock_build):
         mock_file = Mock(spec=discord.File)
@@ -0,0 +1,123 @@
+"""Seeded spin GIF benchmark.
+
+Renders a fixed grid of spins (option count x option name length) from seeded
+inputs, each in a fresh process so peak RSS is per case.
+
+Run from the repository root (the bundled font and background are loaded from
+the data/ submodule). The grid test in build_spin_gif_benchmark_test.py is
+slow, so it only runs with RUN_BENCHMARKS=1. To print results:
+
+    python -m tests.commands.spin.spin_benchmark
+"""
+
+import hashlib
+import io
+import multiprocessing
+import random
+import resource
+import string
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from PIL import Image
+from tabulate import tabulate
+
+from ironforgedbot.commands.spin.build_spin_gif import _encode_spin_gif
+
+SEED = 1337
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    option_count: int
+    name_length: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.option_count}x{self.name_length}"
+
+
+@dataclass
+class BenchmarkResult:
+    wall_ms: float
+    peak_rss_kb: int
+    frame_count: int
+    duration_ms: int
+    size_bytes: int
+    digest: str
+
+
+CASES = [
+    BenchmarkCase(option_count, name_length)
+    for option_count in (3, 20, 200)
+    for name_length in (6, 24)
+]
+
+
+def build_options(case: BenchmarkCase, seed: int = SEED) -> tuple[list[str], int]:
+    """Returns seeded option names and winner index for a case."""
+    rng = random.Random(f"{seed}:{case.name}")
+    alphabet = string.ascii_letters + string.digits + " "
+    options = [
+        "".join(rng.choice(alphabet) for _ in range(case.name_length)).strip() or "x"
+        for _ in range(case.option_count)
+    ]
+    return options, rng.randrange(case.option_count)
+
+
+def _measure(case: BenchmarkCase) -> BenchmarkResult:
+    options, selected_index = build_options(case)
+
+    start = time.perf_counter()
+    gif = _encode_spin_gif(options, selected_index)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    data = gif.getvalue()
+    duration_ms = 0
+    with Image.open(io.BytesIO(data)) as img:
+        # Identical frames are merged, so this can be below FRAME_COUNT
+        frame_count = img.n_frames
+        for index in range(frame_count):
+            img.seek(index)
+            duration_ms += img.info["duration"]
+
+    return BenchmarkResult(
+        wall_ms=round(wall_ms, 1),
+        peak_rss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        frame_count=frame_count,
+        duration_ms=duration_ms,
+        size_bytes=len(data),
+        digest=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def run_case(case: BenchmarkCase) -> BenchmarkResult:
+    """Renders a case in a fresh process so peak RSS is not shared."""
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_measure, case).result()
+
+
+def main() -> int:
+    rows = []
+    for case in CASES:
+        result = run_case(case)
+        rows.append(
+            [
+                case.name,
+                result.wall_ms,
+                result.peak_rss_kb,
+                result.frame_count,
+                result.size_bytes,
+            ]
+        )
+
+    print(tabulate(rows, headers=["case", "wall ms", "peak rss kb", "frames", "bytes"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
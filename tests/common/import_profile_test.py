@@ -0,0 +1,65 @@
+import unittest
+
+from ironforgedbot.common.import_profile import (
+    ImportProfile,
+    ImportTiming,
+    parse_importtime,
+    profile_import,
+)
+
+SAMPLE_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        45 |        165 | io
+import time:       300 |        300 |     yaml.error
+import time:       900 |       1500 |   yaml.reader
+import time:      2000 |       3500 | yaml
+Traceback lines and warnings are ignored
+"""
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_parses_timings_and_depth(self):
+        timings = parse_importtime(SAMPLE_OUTPUT)
+
+        self.assertEqual(len(timings), 5)
+        self.assertEqual(
+            timings[0],
+            ImportTiming(module="_io", self_us=120, cumulative_us=120, depth=1),
+        )
+        self.assertEqual(timings[2].module, "yaml.error")
+        self.assertEqual(timings[2].depth, 2)
+        self.assertEqual(timings[4].depth, 0)
+
+    def test_skips_header_and_unrelated_lines(self):
+        self.assertEqual(parse_importtime("import time: self [us] | x | y\nhello"), [])
+
+
+class TestImportProfile(unittest.TestCase):
+    def setUp(self):
+        self.profile = ImportProfile("yaml", parse_importtime(SAMPLE_OUTPUT))
+
+    def test_total_is_sum_of_self_times(self):
+        self.assertAlmostEqual(self.profile.total_ms, 3.365)
+
+    def test_cumulative_ms(self):
+        self.assertEqual(self.profile.cumulative_ms("yaml"), 3.5)
+        self.assertIsNone(self.profile.cumulative_ms("PIL"))
+
+    def test_report_lists_packages_by_cost(self):
+        report = self.profile.format_report()
+
+        self.assertIn("import yaml: 3ms over 5 modules", report)
+        self.assertLess(report.index("yaml "), report.index("io "))
+        self.assertNotIn("yaml.reader", report)
+
+
+class TestProfileImport(unittest.TestCase):
+    def test_profiles_imports_made_by_then(self):
+        profile = profile_import("json", then="import csv")
+
+        self.assertIn("json", profile.modules)
+        self.assertIn("csv", profile.modules)
+
+    def test_raises_when_then_fails(self):
+        with self.assertRaises(RuntimeError):
+            profile_import("json", then="raise SystemExit(1)")
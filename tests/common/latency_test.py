@@ -0,0 +1,66 @@
+import unittest
+
+from ironforgedbot.common.latency import LatencyHistogram, LatencyRegistry
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot["count"], 0)
+        self.assertIsNone(snapshot["mean_ms"])
+        self.assertIsNone(snapshot["p95_ms"])
+
+    def test_nearest_rank_percentiles(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        self.assertEqual(histogram.percentile(50), 50)
+        self.assertEqual(histogram.percentile(95), 95)
+        self.assertEqual(histogram.percentile(100), 100)
+        self.assertEqual(histogram.percentile(0), 1)
+
+    def test_percentiles_use_recent_window(self):
+        histogram = LatencyHistogram(window=10)
+        for _ in range(10):
+            histogram.record(1000)
+        for _ in range(10):
+            histogram.record(1)
+
+        self.assertEqual(histogram.percentile(99), 1)
+        self.assertEqual(histogram.count, 20)
+        self.assertEqual(histogram.window_size, 10)
+
+    def test_buckets_are_upper_bounds(self):
+        histogram = LatencyHistogram(buckets_ms=(10, 100))
+        histogram.record(10)
+        histogram.record(50)
+        histogram.record(500)
+
+        self.assertEqual(
+            histogram.snapshot()["buckets"], {"le_10": 1, "le_100": 1, "le_inf": 1}
+        )
+
+
+class TestLatencyRegistry(unittest.TestCase):
+    def test_record_creates_named_histograms(self):
+        registry = LatencyRegistry()
+
+        registry.record("b", 5)
+        registry.record("a", 1)
+        registry.record("a", 3)
+
+        self.assertEqual(registry.get("a").count, 2)
+        self.assertIsNone(registry.get("missing"))
+        self.assertEqual(list(registry.snapshot()), ["a", "b"])
+
+    def test_reset_clears_histograms(self):
+        registry = LatencyRegistry()
+        registry.record("a", 1)
+
+        registry.reset()
+
+        self.assertEqual(registry.snapshot(), {})
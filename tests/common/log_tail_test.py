@@ -0,0 +1,146 @@
+import logging
+import logging.handlers
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ironforgedbot.common.log_tail import CurrentLogFile, tail_lines
+
+LOG = (
+    "2025-01-01 10:00:00 - ironforgedbot.client - INFO - Bot connected\n"
+    "2025-01-01 10:00:01 - ironforgedbot.commands.score - ERROR - Lookup failed\n"
+    "Traceback (most recent call last):\n"
+    '  File "cmd_score.py", line 10, in cmd_score\n'
+    "ValueError: bad\n"
+    "2025-01-01 10:00:02 - ironforgedbot.automations - WARNING - Job slow\n"
+    "2025-01-01 10:00:03 - ironforgedbot.commands.check - DEBUG - Checked\n"
+    "2025-01-01 10:00:04 - ironforgedbot.client - INFO - Heartbeat\n"
+)
+
+
+class TestTailLines(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = self._write("bot.log", LOG)
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_returns_last_lines_oldest_first(self):
+        expected = LOG.splitlines()[-3:]
+
+        for block_size in (1, 7, 64, 8192):
+            with self.subTest(block_size=block_size):
+                self.assertEqual(
+                    tail_lines(self.path, 3, block_size=block_size), expected
+                )
+
+    def test_count_larger_than_file(self):
+        self.assertEqual(tail_lines(self.path, 500), LOG.splitlines())
+
+    def test_file_without_trailing_newline(self):
+        path = self._write("partial.log", "first\nsecond\nthird")
+
+        self.assertEqual(tail_lines(path, 2, block_size=4), ["second", "third"])
+
+    def test_empty_file_and_zero_count(self):
+        path = self._write("empty.log", "")
+
+        self.assertEqual(tail_lines(path, 10), [])
+        self.assertEqual(tail_lines(self.path, 0), [])
+
+    def test_keeps_blank_lines(self):
+        path = self._write("blank.log", "a\n\nb\n")
+
+        self.assertEqual(tail_lines(path, 3), ["a", "", "b"])
+
+    def test_handles_multibyte_characters_split_across_blocks(self):
+        path = self._write("utf8.log", "ingots 💰 won\nspin 🎲 done\n")
+
+        self.assertEqual(
+            tail_lines(path, 2, block_size=3), ["ingots 💰 won", "spin 🎲 done"]
+        )
+
+    def test_filter_by_min_level_keeps_continuation_lines(self):
+        lines = tail_lines(self.path, 10, min_level="WARNING", block_size=16)
+
+        self.assertEqual(lines, LOG.splitlines()[1:6])
+
+    def test_filter_by_logger_name_includes_children(self):
+        lines = tail_lines(self.path, 10, logger_name="ironforgedbot.commands")
+
+        self.assertEqual(len(lines), 5)
+        self.assertIn("Lookup failed", lines[0])
+        self.assertIn("Checked", lines[-1])
+
+    def test_filter_by_logger_name_does_not_match_prefix_of_other_name(self):
+        self.assertEqual(
+            tail_lines(self.path, 10, logger_name="ironforgedbot.comm"), []
+        )
+
+    def test_filtered_count_stops_at_limit(self):
+        lines = tail_lines(self.path, 1, logger_name="ironforgedbot.client")
+
+        self.assertEqual(len(lines), 1)
+        self.assertIn("Heartbeat", lines[0])
+
+    def test_filter_matches_json_lines(self):
+        path = self._write(
+            "bot.json.log",
+            '{"levelname": "INFO", "name": "ironforgedbot.client", "message": "a"}\n'
+            '{"levelname": "ERROR", "name": "ironforgedbot.state", "message": "b"}\n',
+        )
+
+        lines = tail_lines(path, 5, logger_name="ironforgedbot.state", min_level=40)
+
+        self.assertEqual(len(lines), 1)
+        self.assertIn('"message": "b"', lines[0])
+
+    def test_unknown_level_raises(self):
+        with self.assertRaises(ValueError):
+            tail_lines(self.path, 5, min_level="LOUD")
+
+
+class TestCurrentLogFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = logging.getLogger()
+
+    def _use_handler(self, handler: logging.Handler) -> None:
+        patcher = patch.object(self.root, "handlers", [handler])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(handler.close)
+
+    def test_none_without_file_handler(self):
+        current = CurrentLogFile()
+
+        with patch.object(self.root, "handlers", []):
+            self.assertIsNone(current.path)
+
+    def test_resolves_file_handler_path(self):
+        path = os.path.join(self.tmp.name, "bot_dev.log")
+        self._use_handler(logging.FileHandler(path, delay=True))
+        current = CurrentLogFile()
+
+        open(path, "w").close()
+
+        self.assertEqual(current.path, path)
+
+    def test_rollover_updates_path(self):
+        path = os.path.join(self.tmp.name, "bot_dev.log")
+        handler = logging.handlers.RotatingFileHandler(path, backupCount=1)
+        self._use_handler(handler)
+        current = CurrentLogFile()
+        self.assertEqual(current.path, path)
+
+        handler.baseFilename = os.path.join(self.tmp.name, "bot_dev_2.log")
+        handler.doRollover()
+
+        self.assertEqual(current.path, handler.baseFilename)
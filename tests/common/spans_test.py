@@ -0,0 +1,107 @@
+import asyncio
+import unittest
+
+from sqlalchemy import create_engine, text
+
+from ironforgedbot.common.spans import (
+    PHASE_DB,
+    PHASE_HTTP,
+    SPANS,
+    command_span,
+    current_span,
+    format_slowest_report,
+    install_db_timing,
+    span_phase,
+)
+
+
+class TestCommandSpans(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        SPANS.clear()
+
+    async def test_span_records_phases_and_total(self):
+        with command_span("cmd_score", "user#1") as span:
+            with span_phase(PHASE_HTTP):
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(span.outcome, "ok")
+        self.assertGreaterEqual(span.phases[PHASE_HTTP], 20)
+        self.assertEqual(span.calls[PHASE_HTTP], 1)
+        self.assertGreaterEqual(span.total_ms, 30)
+        self.assertGreaterEqual(span.other_ms, 5)
+        self.assertIsNone(current_span())
+        self.assertEqual(SPANS.slowest(), [span])
+
+    async def test_inner_span_joins_outer(self):
+        with command_span("cmd_score") as outer:
+            with command_span("cmd_score") as inner:
+                self.assertIs(inner, outer)
+
+        self.assertEqual(len(SPANS), 1)
+
+    async def test_failed_command_outcome(self):
+        with self.assertRaises(ValueError):
+            with command_span("cmd_score") as span:
+                raise ValueError("boom")
+
+        self.assertEqual(span.outcome, "error")
+        self.assertEqual(len(SPANS), 1)
+
+    async def test_phase_outside_command_is_ignored(self):
+        with span_phase(PHASE_HTTP):
+            pass
+
+        self.assertEqual(len(SPANS), 0)
+
+    async def test_concurrent_phase_sections_count_once(self):
+        async def fetch():
+            with span_phase(PHASE_HTTP):
+                await asyncio.sleep(0.02)
+
+        with command_span("cmd_check") as span:
+            await asyncio.gather(fetch(), fetch())
+
+        self.assertEqual(span.calls[PHASE_HTTP], 1)
+        self.assertLess(span.phases[PHASE_HTTP], span.total_ms + 1)
+
+    async def test_spans_are_isolated_between_tasks(self):
+        async def command(name, delay):
+            with command_span(name) as span:
+                with span_phase(PHASE_HTTP):
+                    await asyncio.sleep(delay)
+                return span
+
+        fast, slow = await asyncio.gather(
+            command("cmd_fast", 0.01), command("cmd_slow", 0.05)
+        )
+
+        self.assertIsNot(fast, slow)
+        self.assertEqual([s.command for s in SPANS.slowest()], ["cmd_slow", "cmd_fast"])
+
+    async def test_report_lists_slowest_first(self):
+        for name, delay in (("cmd_fast", 0.0), ("cmd_slow", 0.02)):
+            with command_span(name, "user#1"):
+                await asyncio.sleep(delay)
+
+        report = format_slowest_report(1)
+
+        self.assertIn("cmd_slow", report)
+        self.assertNotIn("cmd_fast", report)
+        self.assertIn("Slowest 1 of the last 2 commands", report)
+
+    def test_empty_report(self):
+        self.assertEqual(format_slowest_report(), "No commands recorded yet.")
+
+    def test_db_timing_attributes_statements(self):
+        install_db_timing()
+        install_db_timing()
+        engine = create_engine("sqlite://")
+
+        with command_span("cmd_ingots") as span:
+            with engine.connect() as conn:
+                conn.execute(text("select 1"))
+                conn.execute(text("select 2"))
+
+        self.assertEqual(span.calls[PHASE_DB], 2)
+        self.assertGreaterEqual(span.phases[PHASE_DB], 0)
@@ -129,3 +129,29 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(result.CRON_REFRESH_RANKS, "10 4,16 * * *")
         self.assertEqual(result.CRON_CHECK_ACTIVITY, "0 1 * * 1")
         self.assertEqual(result.CRON_PAYROLL, "0 6 1 * *")
+
+    @patch.dict(
+        "os.environ",
+        {
+            **VALID_CONFIG,
+            "HISCORES_URL": "http://127.0.0.1:8765/index_lite.json?player={rsn}",
+            "WOM_BASE_URL": "http://127.0.0.1:8765/v2",
+        },
+    )
+    @patch("ironforgedcore.config.load_dotenv")
+    def test_loads_upstream_overrides(self, mock_dotenv):
+        result = Config()
+
+        self.assertEqual(
+            result.HISCORES_URL, "http://127.0.0.1:8765/index_lite.json?player={rsn}"
+        )
+        self.assertEqual(result.WOM_BASE_URL, "http://127.0.0.1:8765/v2")
+
+    def test_hiscores_url_must_contain_rsn(self):
+        with patch.dict(
+            "os.environ", {**VALID_CONFIG, "HISCORES_URL": "http://127.0.0.1:8765"}
+        ):
+            with self.assertRaises(ValueError) as context:
+                Config()
+
+            self.assertIn("HISCORES_URL", str(context.exception))
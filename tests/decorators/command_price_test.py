@@ -3,8 +3,16 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import discord
 
+from ironforgedbot.services.ingot_reservation_service import IngotReservation
+
 
 class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = patch("ironforgedbot.decorators.command_price.STATE")
+        self.mock_state = patcher.start()
+        self.mock_state.state = {"command_reservations": {}}
+        self.addCleanup(patcher.stop)
+
     @patch("ironforgedbot.decorators.command_price._load_flavor_text")
     @patch("ironforgedbot.decorators.command_price.time.time")
     @patch("ironforgedbot.decorators.command_price.db.get_session")
@@ -29,11 +37,9 @@ class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
 
         mock_time.return_value = 1000.0
 
-        mock_member = Mock()
-        mock_member.ingots = 500
-        mock_member_service = Mock()
-        mock_member_service.get_member_by_discord_id = AsyncMock(
-            return_value=mock_member
+        mock_reservation_service = Mock()
+        mock_reservation_service.reserve = AsyncMock(
+            return_value=IngotReservation(True, 400)
         )
 
         mock_session = AsyncMock()
@@ -72,8 +78,8 @@ class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
         )
 
         with patch(
-            "ironforgedbot.decorators.command_price.MemberService",
-            return_value=mock_member_service,
+            "ironforgedbot.decorators.command_price.IngotReservationService",
+            return_value=mock_reservation_service,
         ):
             await test_command(mock_interaction)
 
@@ -86,6 +92,12 @@ class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
         mock_embed.set_thumbnail.assert_called_once_with(
             url="https://oldschool.runescape.wiki/images/thumb/Coins_detail.png/120px-Coins_detail.png"
         )
+        mock_reservation_service.reserve.assert_called_once_with(
+            12345, 100, "Command usage: test_command"
+        )
+        mock_embed.add_field.assert_any_call(
+            name="Your Balance", value="<:Ingot:123> 500", inline=True
+        )
         self.assertEqual(mock_embed.add_field.call_count, 3)
         mock_interaction.original_response.assert_called_once()
         mock_channel.send.assert_called_once_with(
@@ -119,11 +131,9 @@ class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
 
         mock_time.return_value = 1000.0
 
-        mock_member = Mock()
-        mock_member.ingots = 500
-        mock_member_service = Mock()
-        mock_member_service.get_member_by_discord_id = AsyncMock(
-            return_value=mock_member
+        mock_reservation_service = Mock()
+        mock_reservation_service.reserve = AsyncMock(
+            return_value=IngotReservation(True, 400)
         )
 
         mock_session = AsyncMock()
@@ -162,8 +172,8 @@ class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
         )
 
         with patch(
-            "ironforgedbot.decorators.command_price.MemberService",
-            return_value=mock_member_service,
+            "ironforgedbot.decorators.command_price.IngotReservationService",
+            return_value=mock_reservation_service,
         ):
             await my_expensive_command(mock_interaction)
 
@@ -175,6 +185,66 @@ class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(call_kwargs["user_id"], 12345)
         self.assertEqual(mock_view.confirmation_message, mock_message)
 
+        reservations = self.mock_state.state["command_reservations"]
+        self.assertEqual(
+            reservations[call_kwargs["reservation_id"]],
+            {
+                "user_id": 12345,
+                "cost": 250,
+                "command": "my_expensive_command",
+                "expires_at": 1030.0,
+            },
+        )
+
+    @patch("ironforgedbot.decorators.command_price.db.get_session")
+    @patch("ironforgedbot.common.responses.build_response_embed")
+    @patch("ironforgedbot.common.helpers.find_emoji")
+    async def test_command_price_insufficient_funds_skips_confirmation(
+        self, mock_find_emoji, mock_build_embed, mock_get_session
+    ):
+        """Test that a failed reservation reports insufficient funds without prompting."""
+        from ironforgedbot.decorators.command_price import command_price
+
+        mock_reservation_service = Mock()
+        mock_reservation_service.reserve = AsyncMock(
+            return_value=IngotReservation(False, 25)
+        )
+
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_get_session.return_value = mock_session
+
+        mock_find_emoji.return_value = "<:Ingot:123>"
+        mock_embed = Mock()
+        mock_build_embed.return_value = mock_embed
+        mock_func = AsyncMock()
+
+        @command_price(100)
+        async def test_command(interaction):
+            await mock_func(interaction)
+
+        mock_interaction = AsyncMock(spec=discord.Interaction)
+        mock_interaction.user = Mock()
+        mock_interaction.user.id = 12345
+        mock_interaction.channel = AsyncMock()
+        mock_interaction.followup = AsyncMock()
+
+        with patch(
+            "ironforgedbot.decorators.command_price.IngotReservationService",
+            return_value=mock_reservation_service,
+        ):
+            await test_command(mock_interaction)
+
+        mock_build_embed.assert_called_once_with(
+            title="❌ Insufficient Funds",
+            description="This command costs <:Ingot:123> **100**.\n\nAnd you only have <:Ingot:123> **25**.",
+            color=discord.Colour.red(),
+        )
+        mock_interaction.followup.send.assert_called_once_with(embed=mock_embed)
+        mock_interaction.channel.send.assert_not_called()
+        mock_func.assert_not_called()
+
     async def test_command_price_raises_error_for_non_interaction(self):
         """Test that command_price raises error if first argument is not an Interaction."""
         from ironforgedbot.decorators.command_price import command_price
@@ -212,3 +282,48 @@ class TestCommandPriceDecorator(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(cmd_a.ingot_cost, 999)
         self.assertEqual(cmd_b.ingot_cost, 3499)
+
+
+@patch("ironforgedbot.decorators.command_price.STATE")
+class TestCommandPriceReservations(unittest.IsolatedAsyncioTestCase):
+    def test_reservation_can_only_be_closed_once(self, mock_state):
+        from ironforgedbot.decorators.command_price import (
+            close_reservation,
+            open_reservation,
+        )
+
+        mock_state.state = {"command_reservations": {}}
+
+        reservation_id = open_reservation(12345, 100, "cmd_spin")
+
+        self.assertTrue(close_reservation(reservation_id))
+        self.assertFalse(close_reservation(reservation_id))
+        self.assertEqual(mock_state.state["command_reservations"], {})
+
+    @patch("ironforgedbot.decorators.command_price.IngotReservationService")
+    @patch("ironforgedbot.decorators.command_price.db")
+    async def test_refund_open_reservations(
+        self, mock_db, mock_service_class, mock_state
+    ):
+        from ironforgedbot.decorators.command_price import refund_open_reservations
+
+        mock_state.state = {
+            "command_reservations": {
+                "a": {
+                    "user_id": 1,
+                    "cost": 100,
+                    "command": "cmd_spin",
+                    "expires_at": 0,
+                },
+                "b": {"user_id": 2, "cost": 50, "command": "cmd_spin", "expires_at": 0},
+            }
+        }
+        mock_service = AsyncMock()
+        mock_service_class.return_value = mock_service
+
+        refunded = await refund_open_reservations()
+
+        self.assertEqual(refunded, 2)
+        mock_service.refund.assert_any_await(1, 100, "Command refund: cmd_spin")
+        mock_service.refund.assert_any_await(2, 50, "Command refund: cmd_spin")
+        self.assertEqual(mock_state.state["command_reservations"], {})
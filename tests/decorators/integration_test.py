@@ -14,6 +14,11 @@ from tests.helpers import (
 class TestDecoratorIntegration(unittest.IsolatedAsyncioTestCase):
     """Test that decorators integrate properly and work together."""
 
+    def setUp(self):
+        from ironforgedbot.decorators.rate_limit import RATE_LIMITER
+
+        RATE_LIMITER.reset()
+
     async def test_require_role_decorator_preserves_function_metadata(self):
         """Test that require_role preserves function metadata via functools.wraps"""
 
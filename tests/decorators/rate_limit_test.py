@@ -0,0 +1,135 @@
+import unittest
+from unittest.mock import patch
+
+from ironforgedbot.decorators.rate_limit import RateLimiter
+
+
+@patch("ironforgedbot.decorators.rate_limit.STATE")
+class TestRateLimiter(unittest.TestCase):
+    def test_allows_up_to_rate_within_window(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter()
+
+        self.assertIsNone(limiter.hit("cmd", "1", 2, 60, 100.0))
+        self.assertIsNone(limiter.hit("cmd", "1", 2, 60, 110.0))
+        self.assertEqual(limiter.hit("cmd", "1", 2, 60, 120.0), 160.0)
+
+    def test_window_slides(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter()
+
+        limiter.hit("cmd", "1", 1, 60, 100.0)
+
+        self.assertIsNotNone(limiter.hit("cmd", "1", 1, 60, 159.0))
+        self.assertIsNone(limiter.hit("cmd", "1", 1, 60, 160.0))
+
+    def test_users_are_independent(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter()
+
+        limiter.hit("cmd", "1", 1, 60, 100.0)
+
+        self.assertIsNone(limiter.hit("cmd", "2", 1, 60, 100.0))
+
+    def test_allowed_hits_are_persisted(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter()
+
+        limiter.hit("cmd", "1", 1, 60, 100.0)
+        limiter.hit("cmd", "1", 1, 60, 101.0)
+
+        self.assertEqual(
+            mock_state.state["rate_limit"],
+            {"cmd": {"1": {"timestamps": [100.0], "expires_at": 160.0}}},
+        )
+
+    def test_seeds_from_persisted_state(self, mock_state):
+        mock_state.state = {
+            "rate_limit": {"cmd": {"1": {"timestamps": [100.0], "expires_at": 160.0}}}
+        }
+        limiter = RateLimiter()
+
+        self.assertEqual(limiter.hit("cmd", "1", 1, 60, 130.0), 160.0)
+
+    def test_seeds_from_timestamp_list(self, mock_state):
+        mock_state.state = {"rate_limit": {"cmd": {"1": [100.0]}}}
+        limiter = RateLimiter()
+
+        self.assertEqual(limiter.hit("cmd", "1", 1, 60, 130.0), 160.0)
+
+    def test_evicts_least_recently_used_key_past_capacity(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter(max_keys=2)
+
+        limiter.hit("cmd", "1", 1, 60, 100.0)
+        limiter.hit("cmd", "2", 1, 60, 100.0)
+        limiter.hit("cmd", "3", 1, 60, 100.0)
+
+        self.assertEqual(len(limiter._windows), 2)
+        self.assertNotIn(("cmd", "1"), limiter._windows)
+        # An evicted key is still limited through its persisted window
+        self.assertIsNotNone(limiter.hit("cmd", "1", 1, 60, 110.0))
+
+    def test_sweep_drops_expired_windows(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter()
+
+        limiter.hit("cmd", "1", 1, 60, 100.0)
+        limiter.hit("cmd", "2", 1, 60, 150.0)
+
+        removed = limiter.sweep(170.0)
+
+        self.assertEqual(removed, 1)
+        self.assertEqual(list(limiter._windows), [("cmd", "2")])
+        self.assertEqual(
+            mock_state.state["rate_limit"],
+            {"cmd": {"2": {"timestamps": [150.0], "expires_at": 210.0}}},
+        )
+
+    def test_sweep_removes_empty_commands(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter()
+
+        limiter.hit("cmd", "1", 1, 60, 100.0)
+        limiter.sweep(200.0)
+
+        self.assertEqual(mock_state.state["rate_limit"], {})
+
+    def test_sweep_drops_expired_entries_of_commands_not_run(self, mock_state):
+        mock_state.state = {
+            "rate_limit": {
+                "old": {"1": {"timestamps": [100.0], "expires_at": 160.0}},
+                "new": {"1": {"timestamps": [150.0], "expires_at": 210.0}},
+            }
+        }
+        limiter = RateLimiter()
+
+        removed = limiter.sweep(170.0)
+
+        self.assertEqual(removed, 1)
+        self.assertEqual(list(mock_state.state["rate_limit"]), ["new"])
+
+    def test_sweep_keeps_timestamp_lists_until_period_is_known(self, mock_state):
+        mock_state.state = {"rate_limit": {"cmd": {"1": [100.0]}}}
+        limiter = RateLimiter()
+
+        self.assertEqual(limiter.sweep(1000.0), 0)
+
+        limiter.hit("cmd", "2", 1, 60, 1000.0)
+
+        self.assertEqual(limiter.sweep(1001.0), 1)
+        self.assertNotIn("1", mock_state.state["rate_limit"]["cmd"])
+
+    def test_stats_counts_allowed_and_throttled(self, mock_state):
+        mock_state.state = {"rate_limit": {}}
+        limiter = RateLimiter()
+
+        limiter.hit("cmd", "1", 1, 60, 100.0)
+        limiter.hit("cmd", "1", 1, 60, 101.0)
+        limiter.hit("cmd", "1", 1, 60, 102.0)
+        limiter.hit("cmd", "2", 1, 60, 102.0)
+
+        self.assertEqual(
+            limiter.stats(),
+            {"cmd": {"allowed": 2, "throttled": 2, "tracked_users": 2}},
+        )
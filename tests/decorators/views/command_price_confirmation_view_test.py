@@ -3,14 +3,29 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import discord
 
+from ironforgedbot.decorators.command_price import CommandRefundError
 from ironforgedbot.decorators.views.command_price_confirmation_view import (
     CommandPriceConfirmationView,
 )
-from ironforgedcore.services.ingot_service import IngotServiceResponse
+from ironforgedbot.services.ingot_reservation_service import IngotReservation
 
 
 class TestCommandPriceConfirmationView(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
+        patcher = patch("ironforgedbot.decorators.command_price.STATE")
+        self.mock_state = patcher.start()
+        self.mock_state.state = {
+            "command_reservations": {
+                "reservation": {
+                    "user_id": 12345,
+                    "cost": 100,
+                    "command": "test_command",
+                    "expires_at": 0,
+                }
+            }
+        }
+        self.addCleanup(patcher.stop)
+
         self.mock_wrapped_function = AsyncMock()
         self.mock_interaction = Mock(spec=discord.Interaction)
         self.mock_interaction.user = Mock()
@@ -29,120 +44,104 @@ class TestCommandPriceConfirmationView(unittest.IsolatedAsyncioTestCase):
             original_kwargs={},
             command_name="test_command",
             user_id=12345,
+            reservation_id="reservation",
         )
         self.view.confirmation_message = self.mock_confirmation_message
 
-    @patch("ironforgedbot.decorators.views.command_price_confirmation_view.find_emoji")
-    @patch(
-        "ironforgedbot.decorators.views.command_price_confirmation_view.build_response_embed"
-    )
-    @patch("ironforgedbot.decorators.views.command_price_confirmation_view.db")
-    @patch(
-        "ironforgedbot.decorators.views.command_price_confirmation_view.IngotService"
-    )
-    async def test_on_confirm_with_sufficient_ingots(
-        self, mock_ingot_service_class, mock_db, mock_build_embed, mock_find_emoji
-    ):
-        """Test confirm button with sufficient ingots passes original interaction to command."""
+    async def test_on_confirm_runs_command_without_charging(self):
+        """Test confirm button runs the command, the price was reserved up front."""
         mock_button_interaction = AsyncMock(spec=discord.Interaction)
         mock_button_interaction.user.id = 12345
         mock_button_interaction.response.defer = AsyncMock()
 
-        mock_session = AsyncMock()
-        mock_db.get_session.return_value.__aenter__.return_value = mock_session
-
-        mock_ingot_service = AsyncMock()
-        mock_ingot_service.try_remove_ingots.return_value = IngotServiceResponse(
-            status=True, message="Success", new_total=50
-        )
-        mock_ingot_service_class.return_value = mock_ingot_service
-
-        await self.view.on_confirm(mock_button_interaction)
+        with patch(
+            "ironforgedbot.decorators.views.command_price_confirmation_view.IngotReservationService"
+        ) as mock_service_class:
+            await self.view.on_confirm(mock_button_interaction)
 
+        mock_service_class.assert_not_called()
         mock_button_interaction.response.defer.assert_called_once_with(ephemeral=True)
-        mock_ingot_service.try_remove_ingots.assert_called_once_with(
-            12345, -100, None, "Command usage: test_command"
-        )
-
         self.assertEqual(len(self.view.children), 0)
         self.mock_confirmation_message.delete.assert_called_once()
         self.mock_interaction.delete_original_response.assert_not_called()
         self.mock_wrapped_function.assert_called_once_with(self.mock_interaction)
 
-    async def test_on_confirm_wrong_user(self):
-        """Test confirm button rejects wrong user."""
+    @patch("ironforgedbot.common.responses.send_error_response")
+    @patch("ironforgedbot.decorators.views.command_price_confirmation_view.db")
+    @patch(
+        "ironforgedbot.decorators.views.command_price_confirmation_view.IngotReservationService"
+    )
+    async def test_on_confirm_refunds_when_command_raises_refund_error(
+        self, mock_service_class, mock_db, mock_send_error
+    ):
+        """Test a command failing with CommandRefundError gets its price back."""
         mock_button_interaction = AsyncMock(spec=discord.Interaction)
-        mock_button_interaction.user.id = 99999
-        mock_button_interaction.response.send_message = AsyncMock()
+        mock_button_interaction.user.id = 12345
+        mock_button_interaction.response.defer = AsyncMock()
+        mock_service = AsyncMock()
+        mock_service_class.return_value = mock_service
+        self.mock_wrapped_function.side_effect = CommandRefundError("Renderer busy")
 
         await self.view.on_confirm(mock_button_interaction)
 
-        mock_button_interaction.response.send_message.assert_called_once_with(
-            "This confirmation is not for you.", ephemeral=True
+        mock_service.refund.assert_called_once_with(
+            12345, 100, "Command refund: test_command"
+        )
+        mock_send_error.assert_called_once_with(
+            self.mock_interaction, "Renderer busy\nYour 100 ingots have been refunded."
         )
-        self.mock_wrapped_function.assert_not_called()
 
-    @patch("ironforgedbot.decorators.views.command_price_confirmation_view.find_emoji")
-    @patch(
-        "ironforgedbot.decorators.views.command_price_confirmation_view.build_response_embed"
-    )
     @patch("ironforgedbot.decorators.views.command_price_confirmation_view.db")
     @patch(
-        "ironforgedbot.decorators.views.command_price_confirmation_view.IngotService"
+        "ironforgedbot.decorators.views.command_price_confirmation_view.IngotReservationService"
     )
-    async def test_on_confirm_with_insufficient_ingots(
-        self,
-        mock_ingot_service_class,
-        mock_db,
-        mock_build_embed,
-        mock_find_emoji,
+    async def test_on_confirm_does_not_refund_other_errors(
+        self, mock_service_class, mock_db
     ):
-        """Test confirm button with insufficient ingots edits confirmation to show error."""
+        """Test unexpected command errors propagate without a refund."""
         mock_button_interaction = AsyncMock(spec=discord.Interaction)
         mock_button_interaction.user.id = 12345
         mock_button_interaction.response.defer = AsyncMock()
+        self.mock_wrapped_function.side_effect = ValueError("boom")
 
-        mock_session = AsyncMock()
-        mock_db.get_session.return_value.__aenter__.return_value = mock_session
+        with self.assertRaises(ValueError):
+            await self.view.on_confirm(mock_button_interaction)
 
-        mock_ingot_service = AsyncMock()
-        mock_ingot_service.try_remove_ingots.return_value = IngotServiceResponse(
-            status=False, message="Insufficient ingots", new_total=25
-        )
-        mock_ingot_service_class.return_value = mock_ingot_service
+        mock_service_class.assert_not_called()
 
-        mock_find_emoji.return_value = "<:Ingot:123>"
-        mock_embed = Mock()
-        mock_build_embed.return_value = mock_embed
+    async def test_on_confirm_wrong_user(self):
+        """Test confirm button rejects wrong user."""
+        mock_button_interaction = AsyncMock(spec=discord.Interaction)
+        mock_button_interaction.user.id = 99999
+        mock_button_interaction.response.send_message = AsyncMock()
 
         await self.view.on_confirm(mock_button_interaction)
 
-        mock_button_interaction.response.defer.assert_called_once_with(ephemeral=True)
-        mock_ingot_service.try_remove_ingots.assert_called_once_with(
-            12345, -100, None, "Command usage: test_command"
-        )
-
-        self.assertEqual(len(self.view.children), 0)
-
-        mock_build_embed.assert_called_once_with(
-            title="❌ Insufficient Funds",
-            description="This command costs <:Ingot:123> **100**.\n\nAnd you only have <:Ingot:123> **25**.",
-            color=discord.Colour.red(),
+        mock_button_interaction.response.send_message.assert_called_once_with(
+            "This confirmation is not for you.", ephemeral=True
         )
-
-        self.mock_interaction.followup.send.assert_called_once_with(embed=mock_embed)
-        self.mock_confirmation_message.delete.assert_called_once()
         self.mock_wrapped_function.assert_not_called()
 
-    async def test_on_cancel(self):
-        """Test cancel button deletes both messages."""
+    @patch("ironforgedbot.decorators.views.command_price_confirmation_view.db")
+    @patch(
+        "ironforgedbot.decorators.views.command_price_confirmation_view.IngotReservationService"
+    )
+    async def test_on_cancel(self, mock_service_class, mock_db):
+        """Test cancel button refunds the reservation and deletes both messages."""
         mock_button_interaction = AsyncMock(spec=discord.Interaction)
         mock_button_interaction.user.id = 12345
         mock_button_interaction.response.defer = AsyncMock()
 
+        mock_service = AsyncMock()
+        mock_service.refund.return_value = IngotReservation(True, 500)
+        mock_service_class.return_value = mock_service
+
         await self.view.on_cancel(mock_button_interaction)
 
         mock_button_interaction.response.defer.assert_called_once_with(ephemeral=True)
+        mock_service.refund.assert_called_once_with(
+            12345, 100, "Command refund: test_command"
+        )
 
         self.mock_confirmation_message.delete.assert_called_once()
         self.mock_interaction.delete_original_response.assert_called_once()
@@ -161,9 +160,49 @@ class TestCommandPriceConfirmationView(unittest.IsolatedAsyncioTestCase):
         )
         self.mock_wrapped_function.assert_not_called()
 
-    async def test_on_timeout(self):
-        """Test timeout deletes both messages."""
+    @patch("ironforgedbot.decorators.views.command_price_confirmation_view.db")
+    @patch(
+        "ironforgedbot.decorators.views.command_price_confirmation_view.IngotReservationService"
+    )
+    async def test_on_timeout(self, mock_service_class, mock_db):
+        """Test timeout refunds the reservation and deletes both messages."""
+        mock_service = AsyncMock()
+        mock_service_class.return_value = mock_service
+
         await self.view.on_timeout()
 
+        mock_service.refund.assert_called_once_with(
+            12345, 100, "Command refund: test_command"
+        )
         self.mock_confirmation_message.delete.assert_called_once()
         self.mock_interaction.delete_original_response.assert_called_once()
+
+    @patch("ironforgedbot.decorators.views.command_price_confirmation_view.db")
+    @patch(
+        "ironforgedbot.decorators.views.command_price_confirmation_view.IngotReservationService"
+    )
+    async def test_on_confirm_after_shutdown_refund_does_not_run(
+        self, mock_service_class, mock_db
+    ):
+        """Test a reservation already refunded can't be confirmed or refunded again."""
+        self.mock_state.state["command_reservations"].clear()
+        mock_button_interaction = AsyncMock(spec=discord.Interaction)
+        mock_button_interaction.user.id = 12345
+        mock_button_interaction.response.send_message = AsyncMock()
+
+        await self.view.on_confirm(mock_button_interaction)
+        await self.view.on_timeout()
+
+        self.mock_wrapped_function.assert_not_called()
+        mock_service_class.assert_not_called()
+        mock_button_interaction.response.send_message.assert_called_once()
+
+    async def test_on_confirm_settles_the_reservation(self):
+        """Test confirming removes the reservation so it isn't refunded later."""
+        mock_button_interaction = AsyncMock(spec=discord.Interaction)
+        mock_button_interaction.user.id = 12345
+        mock_button_interaction.response.defer = AsyncMock()
+
+        await self.view.on_confirm(mock_button_interaction)
+
+        self.assertEqual(self.mock_state.state["command_reservations"], {})
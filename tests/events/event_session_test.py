@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from ironforgedbot.events.event_session import EventSession
+from ironforgedcore.services.member_service import MemberService
+
+
+class TestEventSession(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_session = AsyncMock()
+        self.savepoint = AsyncMock()
+        self.savepoint.is_active = True
+        self.mock_session.begin_nested.return_value = self.savepoint
+        self.session_context = AsyncMock()
+        self.session_context.__aenter__.return_value = self.mock_session
+        self.session_context.__aexit__.return_value = None
+        self.factory = Mock(return_value=self.session_context)
+
+    async def test_session_not_opened_until_used(self):
+        async with EventSession(self.factory):
+            pass
+
+        self.factory.assert_not_called()
+
+    async def test_concurrent_open_shares_one_session(self):
+        async with EventSession(self.factory) as event_session:
+            first, second = await asyncio.gather(
+                event_session.open(), event_session.open()
+            )
+
+        self.factory.assert_called_once()
+        self.assertIs(first[0], self.mock_session)
+        self.assertIs(first[1], second[1])
+        self.assertIsInstance(first[1], MemberService)
+        self.session_context.__aexit__.assert_called_once_with(None, None, None)
+
+    async def test_exit_passes_exception_to_session(self):
+        error = ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            async with EventSession(self.factory) as event_session:
+                await event_session.open()
+                raise error
+
+        self.assertIs(self.session_context.__aexit__.call_args[0][1], error)
+
+    async def test_service_calls_are_serialized(self):
+        running = []
+        overlapped = []
+
+        async def operation(self_, value):
+            running.append(value)
+            if len(running) > 1:
+                overlapped.append(value)
+            await asyncio.sleep(0.01)
+            running.remove(value)
+            return value
+
+        MemberService.operation = operation
+        self.addCleanup(delattr, MemberService, "operation")
+
+        async with EventSession(self.factory) as event_session:
+            _, service = await event_session.open()
+            results = await asyncio.gather(service.operation(1), service.operation(2))
+
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(overlapped, [])
+
+    async def test_nested_service_calls_do_not_deadlock(self):
+        async def inner(self_):
+            return "inner"
+
+        async def outer(self_):
+            return await self_.inner()
+
+        MemberService.inner = inner
+        MemberService.outer = outer
+        self.addCleanup(delattr, MemberService, "inner")
+        self.addCleanup(delattr, MemberService, "outer")
+
+        async with EventSession(self.factory) as event_session:
+            _, service = await event_session.open()
+            result = await asyncio.wait_for(service.outer(), timeout=1)
+
+        self.assertEqual(result, "inner")
+
+    async def test_service_call_runs_in_a_savepoint(self):
+        async def operation(self_):
+            return "done"
+
+        MemberService.operation = operation
+        self.addCleanup(delattr, MemberService, "operation")
+
+        async with EventSession(self.factory) as event_session:
+            _, service = await event_session.open()
+            result = await service.operation()
+
+        self.assertEqual(result, "done")
+        self.mock_session.begin_nested.assert_awaited_once()
+        self.savepoint.commit.assert_awaited_once()
+        self.savepoint.rollback.assert_not_awaited()
+
+    async def test_failed_service_call_only_rolls_back_its_savepoint(self):
+        async def failing(self_):
+            raise ValueError("boom")
+
+        MemberService.failing = failing
+        self.addCleanup(delattr, MemberService, "failing")
+
+        async with EventSession(self.factory) as event_session:
+            _, service = await event_session.open()
+            with self.assertRaises(ValueError):
+                await service.failing()
+
+        self.savepoint.rollback.assert_awaited_once()
+        self.mock_session.rollback.assert_not_awaited()
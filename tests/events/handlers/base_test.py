@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import discord
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ironforgedbot.events.event_session import EventSession
 from ironforgedbot.events.handlers.base import BaseMemberUpdateHandler
 from ironforgedbot.events.member_events import MemberUpdateContext
 from ironforgedcore.services.member_service import MemberService
@@ -286,3 +287,47 @@ class TestBaseMemberUpdateHandlerCustomOnError(unittest.IsolatedAsyncioTestCase)
             await handler.handle(context)
 
         self.report_channel.send.assert_not_called()
+
+    @patch("ironforgedbot.events.handlers.base.db")
+    async def test_handle_uses_shared_event_session(self, mock_db):
+        """handle() reuses the event's session instead of opening its own."""
+        mock_session = AsyncMock()
+        session_context = AsyncMock()
+        session_context.__aenter__.return_value = mock_session
+        session_context.__aexit__.return_value = None
+        factory = Mock(return_value=session_context)
+
+        handler = ConcreteHandler()
+        context = self._create_context()
+
+        async with EventSession(factory) as event_session:
+            with patch.object(
+                handler, "_execute", new_callable=AsyncMock
+            ) as mock_execute:
+                mock_execute.return_value = None
+                await handler.handle(context, event_session)
+                await handler.handle(context, event_session)
+
+        factory.assert_called_once()
+        mock_db.get_session.assert_not_called()
+        self.assertIs(mock_execute.call_args_list[0][0][1], mock_session)
+        self.assertIs(
+            mock_execute.call_args_list[0][0][2], mock_execute.call_args_list[1][0][2]
+        )
+
+    @patch("ironforgedbot.events.handlers.base.db")
+    async def test_handle_leaves_shared_session_on_error(self, mock_db):
+        """handle() doesn't roll back the session other handlers are using."""
+        mock_session = AsyncMock()
+        session_context = AsyncMock()
+        session_context.__aenter__.return_value = mock_session
+        session_context.__aexit__.return_value = None
+
+        handler = ConcreteHandler(execute_error=ValueError("Test error"))
+        context = self._create_context()
+
+        async with EventSession(Mock(return_value=session_context)) as event_session:
+            with self.assertRaises(ValueError):
+                await handler.handle(context, event_session)
+
+        mock_session.rollback.assert_not_awaited()
@@ -127,6 +127,39 @@ class TestMemberUpdateContext(unittest.TestCase):
 
         self.assertFalse(context.roles_changed)
 
+    def test_roles_touched_combines_added_and_removed(self):
+        """roles_touched returns roles that were either added or removed."""
+        self.before.roles = [create_mock_discord_role("Member")]
+        self.after.roles = [create_mock_discord_role("Iron")]
+
+        context = MemberUpdateContext(
+            before=self.before,
+            after=self.after,
+            report_channel=self.report_channel,
+        )
+
+        self.assertEqual(context.roles_touched, frozenset({"Member", "Iron"}))
+
+    def test_role_diff_is_computed_once(self):
+        """Role diffs are cached frozensets and do not re-read member roles."""
+        self.before.roles = [create_mock_discord_role("Member")]
+        self.after.roles = [
+            create_mock_discord_role("Member"),
+            create_mock_discord_role("Iron"),
+        ]
+
+        context = MemberUpdateContext(
+            before=self.before,
+            after=self.after,
+            report_channel=self.report_channel,
+        )
+        added = context.roles_added
+        self.after.roles = []
+
+        self.assertIsInstance(added, frozenset)
+        self.assertIs(context.roles_added, added)
+        self.assertEqual(context.roles_removed, frozenset())
+
     def test_nickname_changed_true_when_nick_different(self):
         """nickname_changed returns True when nickname changed."""
         self.before.nick = "OldNick"
@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from ironforgedbot.events.member_update_debouncer import MemberUpdateDebouncer
+from tests.helpers import create_mock_discord_role, create_test_member
+
+
+class TestMemberUpdateDebouncer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.debouncer = MemberUpdateDebouncer(window_ms=20, max_delay_ms=60)
+        self.dispatch = AsyncMock()
+        self.roles = [create_mock_discord_role("Member")]
+
+    def _member(self, nick: str, member_id: int = 1):
+        member = create_test_member("TestUser", [], nick)
+        member.id = member_id
+        member.roles = list(self.roles)
+        return member
+
+    async def test_single_update_is_dispatched_after_window(self):
+        before, after = self._member("Old"), self._member("New")
+
+        self.debouncer.submit(before, after, self.dispatch)
+        self.dispatch.assert_not_called()
+        await asyncio.sleep(0.05)
+
+        self.dispatch.assert_awaited_once_with(before, after)
+
+    async def test_burst_is_merged_into_net_change(self):
+        first, middle, last = self._member("A"), self._member("B"), self._member("C")
+
+        self.debouncer.submit(first, middle, self.dispatch)
+        self.debouncer.submit(middle, last, self.dispatch)
+        await self.debouncer.flush()
+
+        self.dispatch.assert_awaited_once_with(first, last)
+        stats = self.debouncer.stats()
+        self.assertEqual(stats["received"], 2)
+        self.assertEqual(stats["merged"], 1)
+        self.assertEqual(stats["dispatched"], 1)
+        self.assertEqual(stats["pending"], 0)
+
+    async def test_members_are_debounced_separately(self):
+        self.debouncer.submit(self._member("A", 1), self._member("B", 1), self.dispatch)
+        self.debouncer.submit(self._member("A", 2), self._member("B", 2), self.dispatch)
+        await self.debouncer.flush()
+
+        self.assertEqual(self.dispatch.await_count, 2)
+
+    async def test_burst_that_cancels_out_is_dropped(self):
+        before, changed = self._member("A"), self._member("B")
+        reverted = self._member("A")
+
+        self.debouncer.submit(before, changed, self.dispatch)
+        self.debouncer.submit(changed, reverted, self.dispatch)
+        await self.debouncer.flush()
+
+        self.dispatch.assert_not_called()
+        self.assertEqual(self.debouncer.stats()["dropped"], 1)
+
+    async def test_role_change_counts_as_net_change(self):
+        before = self._member("A")
+        after = self._member("A")
+        after.roles = before.roles + [create_mock_discord_role("Prospect")]
+
+        self.debouncer.submit(before, after, self.dispatch)
+        await self.debouncer.flush()
+
+        self.dispatch.assert_awaited_once()
+
+    async def test_continuous_updates_dispatch_after_max_delay(self):
+        before = self._member("Start")
+
+        for i in range(10):
+            self.debouncer.submit(before, self._member(f"Nick {i}"), self.dispatch)
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.03)
+
+        self.assertGreaterEqual(self.dispatch.await_count, 1)
+
+    async def test_dispatch_errors_are_contained(self):
+        self.dispatch.side_effect = ValueError("boom")
+
+        self.debouncer.submit(self._member("A"), self._member("B"), self.dispatch)
+        await self.debouncer.flush()
+
+        self.assertEqual(self.debouncer.stats()["dispatched"], 1)
@@ -1,10 +1,15 @@
+import asyncio
 import unittest
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import discord
 
+from ironforgedbot.events.event_session import EventSession
 from ironforgedbot.events.member_events import HandlerResult, MemberUpdateContext
-from ironforgedbot.events.member_update_emitter import MemberUpdateEmitter
+from ironforgedbot.events.member_update_emitter import (
+    SLOW_HANDLER_MIN_SAMPLES,
+    MemberUpdateEmitter,
+)
 from tests.helpers import create_mock_discord_role, create_test_member
 
 
@@ -32,11 +37,16 @@ class TestMemberUpdateEmitter(unittest.IsolatedAsyncioTestCase):
         )
 
     def _create_mock_handler(
-        self, name: str, priority: int = 50, should_handle: bool = True
+        self,
+        name: str,
+        priority: int = 50,
+        should_handle: bool = True,
+        watched_roles=None,
     ):
         handler = Mock()
         handler.name = name
         handler.priority = priority
+        handler.watched_roles = watched_roles
         handler.should_handle = Mock(return_value=should_handle)
         handler.handle = AsyncMock()
         return handler
@@ -187,7 +197,7 @@ class TestMemberUpdateEmitter(unittest.IsolatedAsyncioTestCase):
 
         await self.emitter.emit(context)
 
-        handler1.handle.assert_called_once_with(context)
+        handler1.handle.assert_called_once_with(context, ANY)
         handler2.handle.assert_not_called()
 
     async def test_emit_executes_in_priority_order(self):
@@ -197,17 +207,17 @@ class TestMemberUpdateEmitter(unittest.IsolatedAsyncioTestCase):
 
         handler1 = self._create_mock_handler("Handler1", priority=50)
         handler1.handle = AsyncMock(
-            side_effect=lambda c: execution_order.append("Handler1")
+            side_effect=lambda c, s: execution_order.append("Handler1")
         )
 
         handler2 = self._create_mock_handler("Handler2", priority=10)
         handler2.handle = AsyncMock(
-            side_effect=lambda c: execution_order.append("Handler2")
+            side_effect=lambda c, s: execution_order.append("Handler2")
         )
 
         handler3 = self._create_mock_handler("Handler3", priority=30)
         handler3.handle = AsyncMock(
-            side_effect=lambda c: execution_order.append("Handler3")
+            side_effect=lambda c, s: execution_order.append("Handler3")
         )
 
         self.emitter.register(handler1)
@@ -232,7 +242,7 @@ class TestMemberUpdateEmitter(unittest.IsolatedAsyncioTestCase):
 
         results = await self.emitter.emit(context)
 
-        handler2.handle.assert_called_once_with(context)
+        handler2.handle.assert_called_once_with(context, ANY)
         self.assertEqual(len(results), 2)
 
     async def test_emit_returns_handler_results(self):
@@ -270,7 +280,7 @@ class TestMemberUpdateEmitter(unittest.IsolatedAsyncioTestCase):
         """emit() measures handler execution time in milliseconds."""
         context = self._create_context()
 
-        async def slow_handle(c):
+        async def slow_handle(c, s):
             import asyncio
 
             await asyncio.sleep(0.01)  # 10ms
@@ -309,6 +319,202 @@ class TestMemberUpdateEmitter(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(results, [])
 
+    async def test_emit_runs_same_priority_handlers_concurrently(self):
+        """emit() runs handlers sharing a priority at the same time."""
+        context = self._create_context()
+        both_started = asyncio.Event()
+        started = []
+
+        async def handle(c, s):
+            started.append(c)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+
+        handler1 = self._create_mock_handler("Handler1", priority=20)
+        handler1.handle = handle
+        handler2 = self._create_mock_handler("Handler2", priority=20)
+        handler2.handle = handle
+        self.emitter.register(handler1)
+        self.emitter.register(handler2)
+
+        results = await self.emitter.emit(context)
+
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual([r.handler_name for r in results], ["Handler1", "Handler2"])
+
+    async def test_emit_finishes_tier_before_next(self):
+        """emit() waits for a whole tier before starting the next one."""
+        context = self._create_context()
+        execution_order = []
+
+        async def slow(c, s):
+            await asyncio.sleep(0.01)
+            execution_order.append("slow")
+
+        handler1 = self._create_mock_handler("Slow", priority=10)
+        handler1.handle = slow
+        handler2 = self._create_mock_handler("Fast", priority=10)
+        handler2.handle = AsyncMock(
+            side_effect=lambda c, s: execution_order.append("fast")
+        )
+        handler3 = self._create_mock_handler("Next", priority=20)
+        handler3.handle = AsyncMock(
+            side_effect=lambda c, s: execution_order.append("next")
+        )
+        for handler in (handler1, handler2, handler3):
+            self.emitter.register(handler)
+
+        await self.emitter.emit(context)
+
+        self.assertEqual(execution_order, ["fast", "slow", "next"])
+
+    async def test_emit_shares_event_session_between_handlers(self):
+        """emit() passes the same EventSession to every handler of an event."""
+        context = self._create_context()
+        handler1 = self._create_mock_handler("Handler1", priority=10)
+        handler2 = self._create_mock_handler("Handler2", priority=20)
+        self.emitter.register(handler1)
+        self.emitter.register(handler2)
+
+        await self.emitter.emit(context)
+
+        session = handler1.handle.call_args[0][1]
+        self.assertIsInstance(session, EventSession)
+        self.assertIs(handler2.handle.call_args[0][1], session)
+
+    async def test_emit_serializes_events_for_same_member(self):
+        """emit() handles one event at a time per member."""
+        running = []
+        overlapped = []
+
+        async def handle(c, s):
+            running.append(c.discord_id)
+            if running.count(c.discord_id) > 1:
+                overlapped.append(c.discord_id)
+            await asyncio.sleep(0.01)
+            running.remove(c.discord_id)
+
+        handler = self._create_mock_handler("Handler")
+        handler.handle = handle
+        self.emitter.register(handler)
+
+        await asyncio.gather(
+            self.emitter.emit(self._create_context()),
+            self.emitter.emit(self._create_context()),
+        )
+
+        self.assertEqual(overlapped, [])
+        self.assertEqual(self.emitter._member_locks, {})
+
+    async def test_emit_runs_different_members_concurrently(self):
+        """emit() does not block one member's event on another's."""
+        other_before = create_test_member("Other", ["Member"], "Other")
+        other_after = create_test_member("Other", ["Member"], "Other")
+        other_after.id = other_before.id = self.after.id + 1
+        other_context = MemberUpdateContext(
+            before=other_before, after=other_after, report_channel=self.report_channel
+        )
+        both_started = asyncio.Event()
+        started = []
+
+        async def handle(c, s):
+            started.append(c.discord_id)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+
+        handler = self._create_mock_handler("Handler")
+        handler.handle = handle
+        self.emitter.register(handler)
+
+        results = await asyncio.gather(
+            self.emitter.emit(self._create_context()),
+            self.emitter.emit(other_context),
+        )
+
+        self.assertTrue(all(r[0].success for r in results))
+
+    async def test_emit_only_asks_handlers_watching_changed_roles(self):
+        """emit() skips handlers whose watched roles did not change."""
+        self.after = create_test_member("TestUser", ["Member", "Booster"], "TestNick")
+        self.after.id = self.before.id
+        booster = self._create_mock_handler(
+            "Booster", watched_roles=frozenset({"Booster"})
+        )
+        banned = self._create_mock_handler(
+            "Banned", watched_roles=frozenset({"Banned"})
+        )
+        always = self._create_mock_handler("Always", priority=60)
+        self.emitter.register(always)
+        self.emitter.register(banned)
+        self.emitter.register(booster)
+
+        results = await self.emitter.emit(self._create_context())
+
+        banned.should_handle.assert_not_called()
+        booster.should_handle.assert_called_once()
+        self.assertEqual([r.handler_name for r in results], ["Booster", "Always"])
+
+    async def test_emit_without_role_change_asks_unindexed_handlers(self):
+        """emit() only asks handlers watching no roles when roles are unchanged."""
+        watching = self._create_mock_handler(
+            "Watching", watched_roles=frozenset({"Member"})
+        )
+        always = self._create_mock_handler("Always")
+        self.emitter.register(watching)
+        self.emitter.register(always)
+
+        await self.emitter.emit(self._create_context())
+
+        watching.should_handle.assert_not_called()
+        always.should_handle.assert_called_once()
+
+    async def test_emit_records_handler_latency(self):
+        """emit() records each handler's duration under its name."""
+        handler = self._create_mock_handler("TestHandler")
+        self.emitter.register(handler)
+
+        await self.emitter.emit(self._create_context())
+        await self.emitter.emit(self._create_context())
+
+        histogram = self.emitter.latencies.get("TestHandler")
+        self.assertEqual(histogram.count, 2)
+        self.assertIn("TestHandler", self.emitter.latencies.snapshot())
+
+    @patch("ironforgedbot.events.member_update_emitter.CONFIG")
+    async def test_emit_reports_handler_over_p95_budget(self, mock_config):
+        """emit() reports a handler whose p95 exceeds the budget once per cooldown."""
+        mock_config.HANDLER_P95_BUDGET_MS = 2000
+        self.report_channel.send = AsyncMock()
+        handler = self._create_mock_handler("SlowHandler")
+        self.emitter.register(handler)
+        for _ in range(SLOW_HANDLER_MIN_SAMPLES):
+            self.emitter.latencies.record("SlowHandler", 5000)
+
+        await self.emitter.emit(self._create_context())
+        await self.emitter.emit(self._create_context())
+
+        self.report_channel.send.assert_awaited_once()
+        self.assertIn("SlowHandler", self.report_channel.send.call_args[0][0])
+
+    @patch("ironforgedbot.events.member_update_emitter.CONFIG")
+    async def test_emit_does_not_report_with_few_samples(self, mock_config):
+        """emit() waits for enough samples before judging a handler's p95."""
+        mock_config.HANDLER_P95_BUDGET_MS = 1
+        self.report_channel.send = AsyncMock()
+
+        async def slow_handle(c, s):
+            await asyncio.sleep(0.01)
+
+        handler = self._create_mock_handler("SlowHandler")
+        handler.handle = slow_handle
+        self.emitter.register(handler)
+
+        await self.emitter.emit(self._create_context())
+
+        self.report_channel.send.assert_not_awaited()
+
 
 class TestMemberUpdateEmitterSingleton(unittest.TestCase):
     def test_singleton_instance_exists(self):
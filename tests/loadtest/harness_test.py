@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+
+import discord
+
+from ironforgedbot.loadtest.fakes import build_guild
+from ironforgedbot.loadtest.harness import (
+    RESULT_ERROR_RESPONSE,
+    RESULT_EXCEPTION,
+    RESULT_OK,
+    LoadTestOptions,
+    Scenario,
+    run_load,
+)
+
+
+async def _ok(interaction, rng):
+    await interaction.response.defer(thinking=True)
+    await interaction.followup.send(embed=discord.Embed(title="Score"))
+
+
+async def _error_reply(interaction, rng):
+    await interaction.followup.send(embed=discord.Embed(title=":exclamation: Error"))
+
+
+async def _raises(interaction, rng):
+    raise RuntimeError("boom")
+
+
+async def _slow(interaction, rng):
+    await asyncio.sleep(0.05)
+
+
+class TestRunLoad(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.guild = build_guild(0.1)
+
+    async def test_outcomes_are_classified_per_scenario(self):
+        result = await run_load(
+            self.guild,
+            [
+                Scenario("ok", 1, _ok),
+                Scenario("error", 1, _error_reply),
+                Scenario("raises", 1, _raises),
+            ],
+            LoadTestOptions(rate=300, duration_s=0.2, discord_latency_ms=0),
+        )
+
+        self.assertGreater(result.total, 0)
+        self.assertEqual(set(result.results["ok"]), {RESULT_OK})
+        self.assertEqual(set(result.results["error"]), {RESULT_ERROR_RESPONSE})
+        self.assertEqual(set(result.results["raises"]), {RESULT_EXCEPTION})
+        self.assertEqual(
+            result.exceptions["raises: RuntimeError"],
+            result.results["raises"][RESULT_EXCEPTION],
+        )
+
+    async def test_arrivals_do_not_wait_for_earlier_requests(self):
+        result = await run_load(
+            self.guild,
+            [Scenario("slow", 1, _slow)],
+            LoadTestOptions(rate=400, duration_s=0.2, discord_latency_ms=0),
+        )
+
+        self.assertGreater(result.max_in_flight, 1)
+        self.assertGreaterEqual(result.latencies.get("slow").percentile(50), 50)
+
+    async def test_mix_overrides_weights(self):
+        result = await run_load(
+            self.guild,
+            [Scenario("ok", 1, _ok), Scenario("raises", 1, _raises)],
+            LoadTestOptions(
+                rate=300, duration_s=0.1, discord_latency_ms=0, mix={"raises": 0}
+            ),
+        )
+
+        self.assertNotIn("raises", result.results)
+
+    async def test_report_lists_every_scenario(self):
+        result = await run_load(
+            self.guild,
+            [Scenario("ok", 1, _ok)],
+            LoadTestOptions(rate=100, duration_s=0.1, discord_latency_ms=0),
+        )
+
+        report = result.format_report()
+        self.assertIn("ok", report)
+        self.assertIn("p95 ms", report)
+        self.assertEqual(result.summary()["requests"], result.total)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            LoadTestOptions(rate=0)
@@ -0,0 +1,96 @@
+import unittest
+
+import aiohttp
+import wom
+
+from ironforgedbot.loadtest import upstream
+from ironforgedbot.loadtest.server import UpstreamServer
+from ironforgedbot.loadtest.upstream import UpstreamProfile
+
+MEMBERS = [upstream.member_nickname(i) for i in range(30)]
+
+
+def _profile(**rates) -> UpstreamProfile:
+    return UpstreamProfile(latency_ms=0, latency_jitter_ms=0, **rates)
+
+
+class TestUpstreamServer(unittest.IsolatedAsyncioTestCase):
+    async def _start(self, **profiles) -> str:
+        server = UpstreamServer(
+            MEMBERS,
+            hiscores=profiles.get("hiscores", _profile()),
+            wom=profiles.get("wom", _profile()),
+        )
+        base_url = await server.start()
+        self.addAsyncCleanup(server.stop)
+        self.server = server
+        return base_url
+
+    async def _wom_client(self, base_url: str) -> wom.Client:
+        client = wom.Client(api_base_url=UpstreamServer.wom_base_url(base_url))
+        await client.start()
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def test_serves_hiscores_in_the_score_service_shape(self):
+        base_url = await self._start()
+        url = UpstreamServer.hiscores_url(base_url).format(rsn="Member00001")
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                body = await response.json()
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, upstream.hiscore_payload("Member00001"))
+
+    async def test_wom_client_decodes_every_endpoint(self):
+        client = await self._wom_client(await self._start())
+
+        group = await client.groups.get_details(1)
+        gains = await client.groups.get_gains(
+            1, wom.Metric.Overall, period=wom.Period.Month, limit=50
+        )
+        player_gains = await client.players.get_gains(
+            "Member00001", period=wom.Period.Month
+        )
+        timeline = await client.players.get_snapshots_timeline(
+            "Member00001", wom.Metric.Overall, period=wom.Period.Month
+        )
+        names = await client.players.get_name_changes("Member00001")
+
+        for result in (group, gains, player_gains, timeline, names):
+            self.assertTrue(result.is_ok, result)
+        self.assertEqual(group.unwrap().member_count, len(MEMBERS))
+        self.assertEqual(len(gains.unwrap()), len(MEMBERS))
+        self.assertEqual(
+            player_gains.unwrap().data.skills[wom.Metric.Overall].experience.gained,
+            upstream.monthly_xp_gained("Member00001"),
+        )
+        self.assertEqual(len(timeline.unwrap()), 30)
+
+    async def test_group_gains_are_paginated(self):
+        client = await self._wom_client(await self._start())
+
+        first = await client.groups.get_gains(1, wom.Metric.Overall, limit=20)
+        rest = await client.groups.get_gains(1, wom.Metric.Overall, limit=20, offset=20)
+
+        self.assertEqual(len(first.unwrap()), 20)
+        self.assertEqual(len(rest.unwrap()), len(MEMBERS) - 20)
+
+    async def test_injects_rate_limits_and_errors(self):
+        base_url = await self._start(
+            hiscores=_profile(error_rate=1.0), wom=_profile(rate_limit_rate=1.0)
+        )
+        client = await self._wom_client(base_url)
+
+        result = await client.groups.get_details(1)
+        async with aiohttp.ClientSession() as session:
+            url = UpstreamServer.hiscores_url(base_url).format(rsn="Member00001")
+            async with session.get(url) as response:
+                hiscores_status = response.status
+
+        self.assertTrue(result.is_err)
+        self.assertEqual(result.unwrap_err().status, 429)
+        self.assertEqual(hiscores_status, 503)
+        self.assertEqual(self.server.requests["group_details"], 1)
+        self.assertEqual(self.server.requests["hiscores"], 1)
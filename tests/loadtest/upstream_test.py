@@ -0,0 +1,121 @@
+import datetime
+import unittest
+from typing import List
+
+from wom import models
+
+from ironforgedbot.loadtest import upstream
+from ironforgedbot.loadtest.upstream import (
+    HISCORE_SKILLS,
+    OUTCOME_ERROR,
+    OUTCOME_NOT_FOUND,
+    OUTCOME_OK,
+    OUTCOME_RATE_LIMITED,
+    UpstreamProfile,
+)
+
+NOW = datetime.datetime(2026, 1, 5, tzinfo=datetime.timezone.utc)
+
+
+class TestHiscorePayload(unittest.TestCase):
+    def test_same_player_gets_the_same_payload(self):
+        self.assertEqual(
+            upstream.hiscore_payload("Member00001"),
+            upstream.hiscore_payload("member00001"),
+        )
+        self.assertNotEqual(
+            upstream.hiscore_payload("Member00001"),
+            upstream.hiscore_payload("Member00002"),
+        )
+
+    def test_overall_totals_the_skills(self):
+        skills = upstream.hiscore_payload("Member00001")["skills"]
+
+        self.assertEqual([skill["name"] for skill in skills], list(HISCORE_SKILLS))
+        self.assertEqual(skills[0]["xp"], sum(skill["xp"] for skill in skills[1:]))
+        self.assertEqual(
+            skills[0]["level"], sum(skill["level"] for skill in skills[1:])
+        )
+
+    def test_level_for_xp(self):
+        self.assertEqual(upstream.level_for_xp(0), 1)
+        self.assertEqual(upstream.level_for_xp(83), 2)
+        self.assertEqual(upstream.level_for_xp(13_034_431), 99)
+        self.assertEqual(upstream.level_for_xp(200_000_000), 99)
+
+
+class TestWomPayloads(unittest.TestCase):
+    def _roundtrip(self, obj, model_type):
+        return upstream.decode(upstream.encode(obj), model_type)
+
+    def test_models_survive_the_serializer(self):
+        usernames = ["Member00001", "Member00002"]
+        cases = [
+            (upstream.wom_group_details(1, usernames, NOW), models.GroupDetail),
+            (upstream.wom_player_gains("Member00001", NOW), models.PlayerGains),
+            (
+                upstream.wom_group_gains(usernames, NOW),
+                List[models.GroupMemberGains],
+            ),
+            (
+                upstream.wom_snapshot_timeline("Member00001", NOW),
+                List[models.SnapshotTimelineEntry],
+            ),
+            (
+                upstream.wom_name_changes("Member00001", NOW),
+                List[models.NameChange],
+            ),
+        ]
+
+        for obj, model_type in cases:
+            with self.subTest(model_type=model_type):
+                self.assertEqual(self._roundtrip(obj, model_type), obj)
+
+    def test_gains_match_the_hiscores_total(self):
+        gains = upstream.wom_player_gains("Member00001", NOW)
+        overall = gains.data.skills[upstream.wom.Metric.Overall].experience
+
+        self.assertEqual(overall.end, upstream.overall_xp("Member00001"))
+        self.assertEqual(overall.gained, upstream.monthly_xp_gained("Member00001"))
+
+    def test_timeline_is_newest_first(self):
+        timeline = upstream.wom_snapshot_timeline("Member00001", NOW, days=10)
+
+        self.assertEqual(len(timeline), 10)
+        self.assertEqual(timeline[0].date, NOW)
+        values = [entry.value for entry in timeline]
+        self.assertEqual(values, sorted(values, reverse=True))
+
+
+class TestUpstreamProfile(unittest.TestCase):
+    def test_rates_must_be_shares(self):
+        with self.assertRaises(ValueError):
+            UpstreamProfile(error_rate=1.5)
+
+    def test_outcomes_follow_the_rates(self):
+        profile = UpstreamProfile(
+            error_rate=0.1, rate_limit_rate=0.2, not_found_rate=0.3, seed=1
+        )
+
+        outcomes = [profile.outcome(can_be_missing=True) for _ in range(10_000)]
+
+        self.assertAlmostEqual(outcomes.count(OUTCOME_ERROR) / 10_000, 0.1, delta=0.02)
+        self.assertAlmostEqual(
+            outcomes.count(OUTCOME_RATE_LIMITED) / 10_000, 0.2, delta=0.02
+        )
+        self.assertAlmostEqual(
+            outcomes.count(OUTCOME_NOT_FOUND) / 10_000, 0.3, delta=0.02
+        )
+
+    def test_not_found_only_when_allowed(self):
+        profile = UpstreamProfile(not_found_rate=1.0)
+
+        self.assertEqual(profile.outcome(), OUTCOME_OK)
+        self.assertEqual(profile.outcome(can_be_missing=True), OUTCOME_NOT_FOUND)
+
+    def test_same_seed_same_behaviour(self):
+        first, second = UpstreamProfile(seed=3), UpstreamProfile(seed=3)
+
+        self.assertEqual(
+            [first.delay_s() for _ in range(5)], [second.delay_s() for _ in range(5)]
+        )
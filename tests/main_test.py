@@ -91,16 +91,8 @@ class MainTest(unittest.IsolatedAsyncioTestCase):
     @patch("main.CONFIG")
     @patch("main.STATE")
     @patch("main.HTTP")
-    @patch("main.data.BOSSES")
-    @patch("main.data.CLUES")
-    @patch("main.data.RAIDS")
-    @patch("main.data.SKILLS")
     def test_init_bot_initializes_all_components(
         self,
-        mock_skills,
-        mock_raids,
-        mock_clues,
-        mock_bosses,
         mock_http,
         mock_state,
         mock_config,
@@ -139,11 +131,7 @@ class MainTest(unittest.IsolatedAsyncioTestCase):
         mock_config.BOT_VERSION = "1.0.0"
         mock_config.BOT_TOKEN = "test_token"
 
-        with patch("main.STATE", None), patch("main.HTTP", Mock()), patch(
-            "main.data.BOSSES", Mock()
-        ), patch("main.data.CLUES", Mock()), patch("main.data.RAIDS", Mock()), patch(
-            "main.data.SKILLS", Mock()
-        ):
+        with patch("main.STATE", None), patch("main.HTTP", Mock()):
 
             mock_intents = Mock()
             mock_create_intents.return_value = mock_intents
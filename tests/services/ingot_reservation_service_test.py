@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import Mock
+
+from ironforgedcore.models.changelog import Changelog, ChangeType
+from ironforgedbot.services.ingot_reservation_service import (
+    IngotReservation,
+    IngotReservationService,
+)
+from tests.helpers import create_mock_db_session
+
+
+class TestIngotReservationService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_db = create_mock_db_session()
+        self.service = IngotReservationService(self.mock_db)
+
+    def _set_results(self, rowcount: int, balance: tuple[str, int] | None):
+        update_result = Mock()
+        update_result.rowcount = rowcount
+
+        select_result = Mock()
+        if balance is None:
+            select_result.first.return_value = None
+        else:
+            select_result.first.return_value = Mock(id=balance[0], ingots=balance[1])
+
+        self.mock_db.execute.side_effect = [update_result, select_result]
+
+    async def test_reserve_success(self):
+        self._set_results(1, ("member-id", 900))
+
+        result = await self.service.reserve(12345, 100, "Command usage: test")
+
+        self.assertEqual(result, IngotReservation(True, 900))
+        self.mock_db.commit.assert_called_once()
+        self.mock_db.rollback.assert_not_called()
+
+        changelog = self.mock_db.add.call_args[0][0]
+        self.assertIsInstance(changelog, Changelog)
+        self.assertEqual(changelog.member_id, "member-id")
+        self.assertEqual(changelog.change_type, ChangeType.REMOVE_INGOTS)
+        self.assertEqual(changelog.previous_value, 1000)
+        self.assertEqual(changelog.new_value, 900)
+        self.assertEqual(changelog.comment, "Command usage: test")
+
+    async def test_reserve_insufficient_funds(self):
+        self._set_results(0, ("member-id", 25))
+
+        result = await self.service.reserve(12345, 100, "Command usage: test")
+
+        self.assertEqual(result, IngotReservation(False, 25))
+        self.mock_db.add.assert_not_called()
+        self.mock_db.commit.assert_not_called()
+        self.mock_db.rollback.assert_called_once()
+
+    async def test_reserve_member_not_found(self):
+        self._set_results(0, None)
+
+        result = await self.service.reserve(12345, 100, "Command usage: test")
+
+        self.assertEqual(result, IngotReservation(False, 0))
+        self.mock_db.add.assert_not_called()
+
+    async def test_refund_success(self):
+        self._set_results(1, ("member-id", 1000))
+
+        result = await self.service.refund(12345, 100, "Command refund: test")
+
+        self.assertEqual(result, IngotReservation(True, 1000))
+        self.mock_db.commit.assert_called_once()
+
+        changelog = self.mock_db.add.call_args[0][0]
+        self.assertEqual(changelog.change_type, ChangeType.ADD_INGOTS)
+        self.assertEqual(changelog.previous_value, 900)
+        self.assertEqual(changelog.new_value, 1000)
+        self.assertEqual(changelog.comment, "Command refund: test")
+
+    async def test_refund_member_not_found(self):
+        self._set_results(0, None)
+
+        result = await self.service.refund(12345, 100, "Command refund: test")
+
+        self.assertEqual(result, IngotReservation(False, 0))
+        self.mock_db.commit.assert_not_called()
+        self.mock_db.rollback.assert_called_once()
@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+
+from ironforgedbot.services.job_coordinator import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    JobCoordinator,
+    JobPolicy,
+)
+
+
+class TestJobCoordinator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.coordinator = JobCoordinator(
+            network_slots=1,
+            policies={
+                "refresh": JobPolicy(priority=PRIORITY_LOW, uses_network=True),
+                "activity": JobPolicy(uses_network=True),
+                "discrepancies": JobPolicy(priority=PRIORITY_HIGH, uses_network=True),
+                "sync": JobPolicy(priority=PRIORITY_HIGH),
+            },
+        )
+
+    async def _hold(self, job: str, started: list, release: asyncio.Event):
+        ticket = self.coordinator.reserve(job)
+        async with self.coordinator.run(ticket):
+            started.append(job)
+            await release.wait()
+
+    async def test_second_reservation_is_skipped_until_released(self):
+        ticket = self.coordinator.reserve("sync")
+
+        self.assertIsNone(self.coordinator.reserve("sync"))
+
+        self.coordinator.release(ticket)
+        self.assertIsNotNone(self.coordinator.reserve("sync"))
+        self.assertEqual(self.coordinator.stats()["jobs"]["sync"]["skipped"], 1)
+
+    async def test_network_slots_are_granted_by_priority(self):
+        started, release = [], asyncio.Event()
+
+        first = asyncio.create_task(self._hold("activity", started, release))
+        await asyncio.sleep(0)
+        low = asyncio.create_task(self._hold("refresh", started, asyncio.Event()))
+        high = asyncio.create_task(self._hold("discrepancies", started, release))
+        await asyncio.sleep(0)
+
+        self.assertEqual(started, ["activity"])
+        self.assertEqual(
+            [job["job"] for job in self.coordinator.stats()["queued"]],
+            ["discrepancies", "refresh"],
+        )
+
+        release.set()
+        await asyncio.gather(first, high)
+        await asyncio.sleep(0)
+
+        self.assertEqual(started, ["activity", "discrepancies", "refresh"])
+        low.cancel()
+        await asyncio.gather(low, return_exceptions=True)
+        self.assertEqual(self.coordinator.stats()["network_in_use"], 0)
+
+    async def test_jobs_without_network_do_not_wait_for_a_slot(self):
+        started, release = [], asyncio.Event()
+
+        network = asyncio.create_task(self._hold("refresh", started, release))
+        await asyncio.sleep(0)
+        local = asyncio.create_task(self._hold("sync", started, release))
+        await asyncio.sleep(0)
+
+        self.assertEqual(started, ["refresh", "sync"])
+        release.set()
+        await asyncio.gather(network, local)
+
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        started, release = [], asyncio.Event()
+
+        holder = asyncio.create_task(self._hold("refresh", started, release))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(self._hold("activity", started, release))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        self.assertFalse(self.coordinator.is_active("activity"))
+        self.assertEqual(self.coordinator.stats()["queued"], [])
+        release.set()
+        await holder
+        self.assertEqual(self.coordinator.stats()["network_in_use"], 0)
+
+    def test_policy_defaults_for_unknown_jobs(self):
+        policy = self.coordinator.policy("unknown")
+
+        self.assertFalse(policy.uses_network)
+        self.assertEqual(
+            policy.scheduler_kwargs(),
+            {"coalesce": True, "misfire_grace_time": 300, "max_instances": 1},
+        )
@@ -0,0 +1,150 @@
+import datetime
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ironforgedbot.services.job_coordinator import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    JobPolicy,
+)
+from ironforgedbot.services.job_schedule import (
+    SHIFT_STEP_SECONDS,
+    JobSchedule,
+    ScheduleRequest,
+    build_cron_trigger,
+)
+from ironforgedbot.storage.job_history import JobRun, JobRunHistory
+
+NOW = datetime.datetime(2026, 1, 5, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def _request(job_id: str, cron: str, **policy) -> ScheduleRequest:
+    return ScheduleRequest(
+        job_id=job_id,
+        name=job_id,
+        cron=cron,
+        job=f"job_{job_id}",
+        policy=JobPolicy(**policy),
+    )
+
+
+class TestBuildCronTrigger(unittest.TestCase):
+    def test_offset_moves_every_fire_time(self):
+        trigger = build_cron_trigger("0 6 * * *", offset_s=15 * 60)
+
+        first = trigger.get_next_fire_time(None, NOW)
+        second = trigger.get_next_fire_time(first, first)
+
+        self.assertEqual(first, NOW.replace(hour=6, minute=15))
+        self.assertEqual(second, first + datetime.timedelta(days=1))
+
+    def test_offset_does_not_skip_a_run_due_before_the_shifted_time(self):
+        trigger = build_cron_trigger("0 6 * * *", offset_s=15 * 60)
+
+        next_time = trigger.get_next_fire_time(None, NOW.replace(hour=6, minute=5))
+
+        self.assertEqual(next_time, NOW.replace(hour=6, minute=15))
+
+    def test_jitter_is_passed_to_apscheduler(self):
+        self.assertEqual(build_cron_trigger("0 6 * * *", jitter_s=600).jitter, 600)
+        self.assertIsNone(build_cron_trigger("0 6 * * *").jitter)
+
+    def test_invalid_expression_raises(self):
+        with self.assertRaises(ValueError):
+            build_cron_trigger("invalid cron")
+
+
+class TestJobSchedule(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.history = JobRunHistory(
+            path=os.path.join(self.temp_dir.name, "job_runs.jsonl")
+        )
+        patcher = patch("ironforgedbot.services.job_schedule.JOB_HISTORY", self.history)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.schedule = JobSchedule()
+
+    def test_network_jobs_are_shifted_apart_by_priority(self):
+        planned = self.schedule.plan(
+            [
+                _request(
+                    "refresh",
+                    "0 6 * * *",
+                    priority=PRIORITY_LOW,
+                    uses_network=True,
+                    estimated_duration_s=20 * 60,
+                ),
+                _request(
+                    "activity",
+                    "0 6 * * 1",
+                    uses_network=True,
+                    jitter_s=300,
+                    estimated_duration_s=10 * 60,
+                ),
+            ],
+            now=NOW,
+        )
+
+        refresh, activity = planned
+        self.assertEqual([job.job_id for job in planned], ["refresh", "activity"])
+        self.assertEqual(activity.offset_s, 0)
+        self.assertEqual(refresh.offset_s, 3 * SHIFT_STEP_SECONDS)
+
+    def test_local_jobs_keep_their_cron_slot(self):
+        planned = self.schedule.plan(
+            [
+                _request("refresh", "0 6 * * *", uses_network=True),
+                _request("sync", "0 6 * * *", priority=PRIORITY_HIGH),
+            ],
+            now=NOW,
+        )
+
+        self.assertEqual([job.offset_s for job in planned], [0, 0])
+
+    def test_estimate_uses_recent_runs_when_slower_than_policy(self):
+        for i in range(3):
+            start = i * 10_000.0
+            self.history._runs["job_refresh"].append(
+                JobRun("job_refresh", start, start + 1800, outcome="ok")
+            )
+        self.history._runs["job_refresh"].append(
+            JobRun("job_refresh", 0.0, 9000.0, outcome="failed")
+        )
+
+        (planned,) = self.schedule.plan(
+            [_request("refresh", "0 6 * * *", uses_network=True)], now=NOW
+        )
+
+        self.assertEqual(planned.estimate_s, 1800)
+
+    def test_busiest_schedule_falls_back_to_least_overlap(self):
+        planned = self.schedule.plan(
+            [
+                _request(
+                    "first",
+                    "*/5 * * * *",
+                    priority=PRIORITY_HIGH,
+                    uses_network=True,
+                    estimated_duration_s=240,
+                ),
+                _request("second", "*/5 * * * *", uses_network=True),
+            ],
+            now=NOW,
+        )
+
+        self.assertEqual(len(planned), 2)
+        self.assertEqual(planned[1].offset_s, 0)
+
+    def test_format_timetable(self):
+        self.assertEqual(self.schedule.format_timetable(), "No jobs scheduled yet.")
+
+        self.schedule.plan([_request("refresh", "0 6 * * *", uses_network=True)])
+
+        timetable = self.schedule.format_timetable()
+        self.assertIn("refresh", timetable)
+        self.assertIn("0 6 * * *", timetable)
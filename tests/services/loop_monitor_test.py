@@ -0,0 +1,69 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock
+
+from ironforgedbot.services.loop_monitor import LoopMonitor
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestLoopMonitor(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.reporter = AsyncMock()
+        self.monitor = LoopMonitor(interval=0.01)
+        self.monitor.start(threshold_ms=50, reporter=self.reporter)
+        self.addAsyncCleanup(self.monitor.stop)
+        await asyncio.sleep(0.05)
+
+    async def test_no_stall_when_loop_is_free(self):
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(self.monitor.stalls, 0)
+        self.assertIsNotNone(self.monitor.last_lag_ms)
+        self.assertGreater(self.monitor.lag.count, 0)
+        self.reporter.assert_not_awaited()
+
+    async def test_stall_captures_blocking_stack(self):
+        _block_the_loop(0.2)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.monitor.stalls, 1)
+        stall = self.monitor.recent[-1]
+        self.assertGreaterEqual(stall.lag_ms, 150)
+        self.assertIn("_block_the_loop", stall.stack)
+
+    async def test_stall_is_reported_once_per_cooldown(self):
+        _block_the_loop(0.1)
+        await asyncio.sleep(0.05)
+        _block_the_loop(0.1)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.monitor.stalls, 2)
+        self.reporter.assert_awaited_once()
+        message = self.reporter.await_args[0][0]
+        self.assertIn("Event loop was blocked", message)
+        self.assertIn("_block_the_loop", message)
+
+    async def test_reporter_errors_are_contained(self):
+        self.reporter.side_effect = RuntimeError("channel gone")
+
+        _block_the_loop(0.1)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.monitor.stalls, 1)
+
+    async def test_stats_lists_recent_stalls_newest_first(self):
+        _block_the_loop(0.1)
+        await asyncio.sleep(0.05)
+        _block_the_loop(0.2)
+        await asyncio.sleep(0.05)
+
+        stats = self.monitor.stats()
+
+        self.assertEqual(stats["threshold_ms"], 50)
+        self.assertEqual(stats["stalls"], 2)
+        self.assertGreater(stats["recent_stalls"][0]["lag_ms"], 150)
+        self.assertIn("p95_ms", stats["lag"])
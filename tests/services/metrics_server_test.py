@@ -0,0 +1,123 @@
+import socket
+import unittest
+from unittest.mock import Mock, patch
+
+from fastapi.testclient import TestClient
+
+from ironforgedbot.common.latency import LatencyRegistry
+from ironforgedbot.services.metrics_server import MetricsServer, render_metrics
+
+
+class TestRenderMetrics(unittest.TestCase):
+    def setUp(self):
+        self.commands = LatencyRegistry()
+        patcher = patch(
+            "ironforgedbot.services.metrics_server.COMMAND_LATENCIES", self.commands
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_histogram_buckets_are_cumulative_seconds(self):
+        self.commands.record("cmd_score", 3)
+        self.commands.record("cmd_score", 40)
+        self.commands.record("cmd_score", 20000)
+
+        text = render_metrics()
+
+        name = "ironforgedbot_command_duration_seconds"
+        self.assertIn(f"# TYPE {name} histogram", text)
+        self.assertIn(f'{name}_bucket{{command="cmd_score",le="0.005"}} 1', text)
+        self.assertIn(f'{name}_bucket{{command="cmd_score",le="0.05"}} 2', text)
+        self.assertIn(f'{name}_bucket{{command="cmd_score",le="10"}} 2', text)
+        self.assertIn(f'{name}_bucket{{command="cmd_score",le="+Inf"}} 3', text)
+        self.assertIn(f'{name}_count{{command="cmd_score"}} 3', text)
+        self.assertIn(f'{name}_sum{{command="cmd_score"}} 20.043000', text)
+
+    def test_label_values_are_escaped(self):
+        self.commands.record('odd"name', 1)
+
+        self.assertIn('command="odd\\"name"', render_metrics())
+
+    def test_loop_lag_only_reported_once_sampled(self):
+        self.assertNotIn("event_loop_lag", render_metrics())
+        self.assertIn(
+            "ironforgedbot_event_loop_lag_seconds 0.25", render_metrics(250.0)
+        )
+
+    def test_includes_service_counters(self):
+        text = render_metrics()
+
+        self.assertIn('ironforgedbot_render_jobs_total{outcome="completed"}', text)
+        self.assertIn('ironforgedbot_member_updates_total{outcome="received"}', text)
+
+
+class TestMetricsServerApp(unittest.TestCase):
+    def setUp(self):
+        self.server = MetricsServer("127.0.0.1", 0)
+        self.http = TestClient(self.server.build_app())
+
+    def test_metrics_endpoint_serves_text_format(self):
+        response = self.http.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn(
+            "# TYPE ironforgedbot_job_duration_seconds histogram", response.text
+        )
+
+    @patch("ironforgedbot.services.metrics_server.STATE")
+    def test_health_ok_when_client_ready(self, mock_state):
+        mock_state.state = {"is_shutting_down": False}
+        self.server.client = Mock()
+        self.server.client.is_ready.return_value = True
+
+        response = self.http.get("/health")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "ok")
+
+    @patch("ironforgedbot.services.metrics_server.STATE")
+    def test_health_unavailable_before_ready(self, mock_state):
+        mock_state.state = {"is_shutting_down": False}
+
+        response = self.http.get("/health")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.json()["discord_ready"])
+
+    @patch("ironforgedbot.services.metrics_server.STATE")
+    def test_health_unavailable_while_shutting_down(self, mock_state):
+        mock_state.state = {"is_shutting_down": True}
+        self.server.client = Mock()
+        self.server.client.is_ready.return_value = True
+
+        response = self.http.get("/health")
+
+        self.assertEqual(response.status_code, 503)
+
+
+class TestMetricsServerLifecycle(unittest.IsolatedAsyncioTestCase):
+    async def test_start_and_stop(self):
+        server = MetricsServer("127.0.0.1", 0)
+
+        await server.start()
+
+        self.assertTrue(server._server.started)
+        await server.stop()
+        self.assertIsNone(server._server)
+
+    async def test_port_in_use_does_not_stop_the_bot(self):
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+            port = taken.getsockname()[1]
+            server = MetricsServer("127.0.0.1", port)
+
+            with self.assertLogs(
+                "ironforgedbot.services.metrics_server", "ERROR"
+            ) as logs:
+                await server.start()
+
+        self.assertIsNone(server._server)
+        self.assertIsNone(server._task)
+        self.assertIn("failed to start", logs.output[-1])
@@ -0,0 +1,50 @@
+import asyncio
+import time
+import unittest
+
+from ironforgedbot.services.render_service import RenderBusyError, RenderService
+
+
+class TestRenderService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = RenderService(
+            max_workers=1, queue_limit=1, timeout=10, initializer=None
+        )
+
+    async def asyncTearDown(self):
+        await self.service.shutdown()
+
+    async def test_run_returns_result(self):
+        result = await self.service.run(pow, 2, 10)
+
+        self.assertEqual(result, 1024)
+        self.assertEqual(self.service.stats()["completed"], 1)
+        self.assertEqual(self.service.stats()["in_flight"], 0)
+
+    async def test_run_propagates_worker_errors(self):
+        with self.assertRaises(ValueError):
+            await self.service.run(int, "not a number")
+
+        self.assertEqual(self.service.stats()["failed"], 1)
+
+    async def test_rejects_when_queue_full(self):
+        await self.service.start()
+        running = asyncio.create_task(self.service.run(time.sleep, 0.5))
+        queued = asyncio.create_task(self.service.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(RenderBusyError):
+            await self.service.run(pow, 2, 2)
+
+        await asyncio.gather(running, queued)
+        self.assertEqual(self.service.stats()["rejected"], 1)
+
+    async def test_timeout_recycles_workers(self):
+        await self.service.start()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.service.run(time.sleep, 5, timeout=0.5)
+
+        self.assertEqual(self.service.stats()["timed_out"], 1)
+        # A fresh pool picks up the next job
+        self.assertEqual(await self.service.run(pow, 3, 2), 9)
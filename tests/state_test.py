@@ -0,0 +1,187 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ironforgedbot.state import BotState
+
+
+class BotStateTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state = BotState()
+        self.state._file_path = os.path.join(self.temp_dir.name, "state.json")
+        self.state._journal_path = os.path.join(self.temp_dir.name, "state.journal")
+        self.state._seq = 0
+        self.state._journal_entries = 0
+        self.state._flush_handle = None
+        self.state._dirty.clear()
+
+    def tearDown(self):
+        if self.state._flush_handle is not None:
+            self.state._flush_handle.cancel()
+            self.state._flush_handle = None
+        self.state._dirty.clear()
+        self.temp_dir.cleanup()
+
+    def _read_journal(self) -> list[dict]:
+        with open(self.state._journal_path) as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    async def test_nested_mutation_marks_top_level_key_dirty(self):
+        await self.state.load_state()
+
+        self.state.state["double_or_nothing_offers"]["123"] = {
+            "amount": 100,
+            "expires_at": 1,
+        }
+        self.state.state["double_or_nothing_offers"]["123"]["amount"] = 200
+
+        self.assertEqual(self.state._dirty, {"double_or_nothing_offers"})
+
+    async def test_volatile_keys_are_not_journaled(self):
+        await self.state.load_state()
+
+        self.state.state["is_shutting_down"] = True
+
+        self.assertEqual(self.state._dirty, set())
+
+    async def test_flush_appends_only_dirty_keys(self):
+        await self.state.load_state()
+
+        self.state.state["raffle_on"] = True
+        self.state.state["raffle_price"] = 10
+        self.state.state["raffle_price"] = 20
+        await self.state.flush()
+
+        entries = self._read_journal()
+        self.assertEqual(
+            [(e["key"], e["value"]) for e in entries],
+            [("raffle_on", True), ("raffle_price", 20)],
+        )
+        self.assertEqual(self.state._dirty, set())
+
+    async def test_load_state_replays_journal_over_snapshot(self):
+        await self.state.load_state()
+        self.state.state["raffle_price"] = 42
+        await self.state.compact()
+
+        self.state.state["raffle_on"] = True
+        self.state.state["double_or_nothing_offers"]["1"] = {"amount": 5}
+        await self.state.flush()
+
+        self.state.state = {**self.state.state, "raffle_on": False}
+        await self.state.load_state()
+
+        self.assertEqual(self.state.state["raffle_price"], 42)
+        self.assertTrue(self.state.state["raffle_on"])
+        self.assertEqual(
+            self.state.state["double_or_nothing_offers"], {"1": {"amount": 5}}
+        )
+
+    async def test_load_state_skips_torn_journal_line(self):
+        await self.state.load_state()
+        self.state.state["raffle_price"] = 7
+        await self.state.flush()
+
+        with open(self.state._journal_path, "a") as file:
+            file.write('{"seq": 99, "key": "raffle_pr')
+
+        await self.state.load_state()
+
+        self.assertEqual(self.state.state["raffle_price"], 7)
+
+    async def test_load_state_ignores_entries_older_than_snapshot(self):
+        await self.state.load_state()
+        self.state.state["raffle_price"] = 1
+        await self.state.flush()
+        stale_journal = open(self.state._journal_path).read()
+
+        self.state.state["raffle_price"] = 2
+        await self.state.compact()
+
+        # Simulate a crash between writing the snapshot and truncating the journal
+        with open(self.state._journal_path, "w") as file:
+            file.write(stale_journal)
+
+        await self.state.load_state()
+
+        self.assertEqual(self.state.state["raffle_price"], 2)
+
+    async def test_compact_writes_snapshot_and_truncates_journal(self):
+        await self.state.load_state()
+        self.state.state["raffle_on"] = True
+        await self.state.flush()
+
+        await self.state.compact()
+
+        self.assertEqual(self._read_journal(), [])
+        with open(self.state._file_path) as file:
+            snapshot = json.load(file)
+        self.assertTrue(snapshot["state"]["raffle_on"])
+        self.assertFalse(snapshot["state"]["is_shutting_down"])
+
+    async def test_compact_keeps_changes_made_during_snapshot_write(self):
+        await self.state.load_state()
+        real_replace = os.replace
+
+        def replace_after_change(src, dst):
+            # Runs after the snapshot was taken, while compact is still writing
+            self.state.state["raffle_on"] = True
+            real_replace(src, dst)
+
+        with patch("ironforgedbot.state.os.replace", replace_after_change):
+            await self.state.compact()
+
+        self.assertEqual(self.state._dirty, {"raffle_on"})
+        await self.state.flush()
+
+        await self.state.load_state()
+
+        self.assertTrue(self.state.state["raffle_on"])
+
+    async def test_compact_keeps_journal_entries_newer_than_snapshot(self):
+        await self.state.load_state()
+        self.state.state["raffle_price"] = 1
+        await self.state.flush()
+        real_replace = os.replace
+
+        def replace_after_append(src, dst):
+            with open(self.state._journal_path, "a") as file:
+                file.write(
+                    json.dumps({"seq": 99, "key": "raffle_on", "value": True}) + "\n"
+                )
+            real_replace(src, dst)
+
+        with patch("ironforgedbot.state.os.replace", replace_after_append):
+            await self.state.compact()
+
+        self.assertEqual([entry["seq"] for entry in self._read_journal()], [99])
+        self.assertEqual(self.state._journal_entries, 1)
+
+        await self.state.load_state()
+
+        self.assertTrue(self.state.state["raffle_on"])
+        self.assertEqual(self.state.state["raffle_price"], 1)
+
+    async def test_flush_compacts_past_threshold(self):
+        await self.state.load_state()
+        self.state._compact_threshold = 2
+
+        self.state.state["raffle_on"] = True
+        self.state.state["raffle_price"] = 1
+        await self.state.flush()
+
+        self.assertEqual(self.state._journal_entries, 0)
+        self.assertTrue(os.path.exists(self.state._file_path))
+
+    async def test_load_state_merges_legacy_snapshot_with_defaults(self):
+        with open(self.state._file_path, "w") as file:
+            json.dump({"raffle_on": True, "unknown": 1}, file)
+
+        await self.state.load_state()
+
+        self.assertTrue(self.state.state["raffle_on"])
+        self.assertEqual(self.state.state["raffle_price"], 5_000)
+        self.assertNotIn("unknown", self.state.state)
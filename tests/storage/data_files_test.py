@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import unittest
+from types import MappingProxyType
+from unittest.mock import Mock
+
+from ironforgedbot.storage.data_files import DataFileRegistry, freeze
+
+
+def _json_loader(file_path: str) -> dict:
+    with open(file_path) as f:
+        return json.load(f)
+
+
+class TestDataFileRegistry(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "data.json")
+        self._write({"items": ["a", "b"]}, mtime=1_000)
+        self.registry = DataFileRegistry()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, data: dict, mtime: int):
+        with open(self.file_path, "w") as f:
+            json.dump(data, f)
+        os.utime(self.file_path, (mtime, mtime))
+
+    def test_loads_file_once(self):
+        loader = Mock(side_effect=_json_loader)
+
+        first = self.registry.get(self.file_path, loader)
+        second = self.registry.get(self.file_path, loader)
+
+        loader.assert_called_once_with(self.file_path)
+        self.assertIs(first, second)
+        self.assertEqual(self.registry.stats()[self.file_path]["hits"], 1)
+
+    def test_returns_immutable_view(self):
+        data = self.registry.get(self.file_path, _json_loader)
+
+        self.assertIsInstance(data, MappingProxyType)
+        self.assertEqual(data["items"], ("a", "b"))
+        with self.assertRaises(TypeError):
+            data["items"] = []
+
+    def test_reloads_when_mtime_changes(self):
+        self.registry.get(self.file_path, _json_loader)
+        self._write({"items": ["c"]}, mtime=2_000)
+
+        data = self.registry.get(self.file_path, _json_loader)
+
+        self.assertEqual(data["items"], ("c",))
+        self.assertEqual(self.registry.stats()[self.file_path]["loads"], 2)
+
+    def test_keeps_previous_version_when_reload_fails(self):
+        self.registry.get(self.file_path, _json_loader)
+        with open(self.file_path, "w") as f:
+            f.write("{not json")
+        os.utime(self.file_path, (2_000, 2_000))
+
+        data = self.registry.get(self.file_path, _json_loader)
+
+        self.assertEqual(data["items"], ("a", "b"))
+
+    def test_first_load_error_is_raised(self):
+        loader = Mock(side_effect=KeyError("missing"))
+
+        with self.assertRaises(KeyError):
+            self.registry.get(self.file_path, loader)
+
+    def test_missing_file_defers_to_loader(self):
+        loader = Mock(side_effect=FileNotFoundError("nope"))
+
+        with self.assertRaises(FileNotFoundError):
+            self.registry.get(os.path.join(self.temp_dir.name, "missing"), loader)
+
+    def test_clear_forces_reload(self):
+        loader = Mock(side_effect=_json_loader)
+        self.registry.get(self.file_path, loader)
+
+        self.registry.clear(self.file_path)
+        self.registry.get(self.file_path, loader)
+
+        self.assertEqual(loader.call_count, 2)
+
+
+class TestFreeze(unittest.TestCase):
+    def test_freezes_nested_structures(self):
+        frozen = freeze({"a": [{"b": 1}], "c": "d"})
+
+        self.assertIsInstance(frozen, MappingProxyType)
+        self.assertIsInstance(frozen["a"], tuple)
+        self.assertIsInstance(frozen["a"][0], MappingProxyType)
+        self.assertEqual(frozen["c"], "d")
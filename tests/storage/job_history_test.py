@@ -0,0 +1,116 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from ironforgedbot.storage.job_history import (
+    JobRun,
+    JobRunHistory,
+    record_job_error,
+    record_job_items,
+)
+
+
+class TestJobRunHistory(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "job_runs.jsonl")
+        self.history = JobRunHistory(path=self.file_path, keep=5)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _lines(self) -> list[dict]:
+        with open(self.file_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    async def test_track_records_items_and_errors(self):
+        async with self.history.track("job_refresh_ranks"):
+            record_job_items(3)
+            record_job_items()
+            record_job_error()
+
+        run = self.history.runs()[0]
+        self.assertEqual(run.job, "job_refresh_ranks")
+        self.assertEqual(run.items, 4)
+        self.assertEqual(run.errors, 1)
+        self.assertEqual(run.outcome, "ok")
+        self.assertIsNotNone(run.finished_at)
+        self.assertEqual(self._lines()[0]["items"], 4)
+
+    async def test_running_run_is_visible_until_finished(self):
+        async with self.history.track("job_check_activity", waited_s=2.5) as run:
+            record_job_items(2)
+            self.assertIs(self.history.running("job_check_activity"), run)
+
+        self.assertIsNone(self.history.running("job_check_activity"))
+        self.assertEqual(self._lines()[0]["waited_s"], 2.5)
+
+    async def test_track_records_failures_and_cancellations(self):
+        with self.assertRaises(ValueError):
+            async with self.history.track("job_payroll"):
+                raise ValueError("boom")
+
+        with self.assertRaises(asyncio.CancelledError):
+            async with self.history.track("job_payroll"):
+                raise asyncio.CancelledError()
+
+        outcomes = [run.outcome for run in self.history.runs("job_payroll")]
+        self.assertEqual(outcomes, ["failed", "cancelled"])
+
+    def test_counters_outside_a_run_are_ignored(self):
+        record_job_items(10)
+        record_job_error()
+
+    async def test_load_restores_runs_and_skips_bad_lines(self):
+        with open(self.file_path, "w") as f:
+            f.write(json.dumps(JobRun("job_sync_members", 100.0, 160.0, 30).to_dict()))
+            f.write("\nnot json\n")
+
+        await self.history.load()
+
+        runs = self.history.runs()
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0].duration_s, 60.0)
+        self.assertEqual(runs[0].items_per_second, 0.5)
+
+    async def test_file_is_trimmed_when_it_grows(self):
+        for i in range(11):
+            await self.history.append(JobRun("job", float(i), float(i) + 1))
+
+        self.assertEqual(len(self.history.runs()), 5)
+        self.assertEqual(len(self._lines()), 5)
+        self.assertEqual(self._lines()[-1]["started_at"], 10.0)
+
+    async def test_frequent_job_does_not_evict_other_jobs(self):
+        await self.history.append(JobRun("job_payroll", 0.0, 60.0))
+        for i in range(20):
+            start = 100.0 + i
+            await self.history.append(JobRun("job_clear_caches", start, start + 1))
+
+        self.assertEqual(len(self.history.runs("job_payroll")), 1)
+        self.assertEqual(len(self.history.runs("job_clear_caches")), 5)
+
+        reloaded = JobRunHistory(path=self.file_path, keep=5)
+        await reloaded.load()
+
+        self.assertEqual(len(reloaded.runs("job_payroll")), 1)
+        self.assertEqual(reloaded.runs()[0].job, "job_payroll")
+
+    async def test_trends_compare_newer_runs_with_older(self):
+        history = JobRunHistory(path=self.file_path, keep=50)
+        for i, duration in enumerate([10, 10, 20, 20]):
+            start = i * 100.0
+            await history.append(JobRun("job", start, start + duration, items=10))
+
+        trend = history.trends()["job"]
+
+        self.assertEqual(trend["runs"], 4)
+        self.assertEqual(trend["duration_trend"], 2.0)
+        self.assertEqual(trend["median_duration_s"], 15)
+        self.assertEqual(trend["failures"], 0)
+        self.assertIn("job", history.format_trends())
+
+    def test_format_trends_without_runs(self):
+        self.assertEqual(self.history.format_trends(), "No job runs recorded yet.")